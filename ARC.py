@@ -10,7 +10,6 @@ import logging
 import os
 
 from arc.common import read_yaml_file
-from arc.main import ARC
 
 
 def parse_command_line_arguments(command_line_args=None):
@@ -61,6 +60,8 @@ def main():
     input_dict['verbose'] = input_dict['verbose'] if 'verbose' in input_dict else verbose
     if 'project_directory' not in input_dict or not input_dict['project_directory']:
         input_dict['project_directory'] = project_directory
+    # ARC's modules and their heavy dependencies are only imported once the input was read and checked
+    from arc.main import ARC
     arc_object = ARC(**input_dict)
     arc_object.execute()
 
@@ -1,16 +1,9 @@
-import arc.exceptions
-import arc.main
-from arc.main import ARC
-import arc.common
-import arc.imports
-import arc.level
-import arc.parser
-import arc.plotter
-import arc.processor
-import arc.scheduler
-import arc.utils
+from arc.lazy import lazy_package_attributes
 
-import arc.job
-import arc.settings
-import arc.species
-import arc.statmech
+# Submodules are only imported on first access, so that importing ARC or running its utilities is fast
+__getattr__, __dir__ = lazy_package_attributes(
+    package=__name__,
+    submodules=['artefacts', 'common', 'exceptions', 'imports', 'job', 'level', 'main', 'parser', 'plotter',
+                'processor', 'reaction', 'rmgdb', 'scheduler', 'settings', 'species', 'statmech', 'ts', 'utils'],
+    attributes={'ARC': 'arc.main'},
+)
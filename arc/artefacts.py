@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""
+A module for writing output artefacts (plots and geometry files) off the Scheduler thread.
+
+The Scheduler submits render/write tasks of the ``arc.plotter`` functions to an ``ArtefactWriter``,
+which runs them in a background process using the non-interactive Agg matplotlib backend.
+A task replaces a pending task of the same function and key which did not start yet,
+so only the most recent version of an artefact is rendered.
+"""
+
+import multiprocessing
+import pickle
+from concurrent.futures import ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
+
+import arc.plotter as plotter
+from arc.common import get_logger, is_notebook
+from arc.imports import settings
+
+
+logger = get_logger()
+
+artefact_writer = settings['artefact_writer']
+
+# The plotter functions which could be submitted to the artefact writer
+ARTEFACT_FUNCTIONS = ['draw_structure',
+                      'plot_1d_rotor_scan',
+                      'plot_2d_rotor_scan',
+                      'plot_torsion_angles',
+                      'save_conformers_file',
+                      'save_geo',
+                      ]
+
+
+class ArtefactWriter(object):
+    """
+    A queue of artefact render/write tasks, executed by a single background process.
+    Tasks are executed inline if the writer is not asynchronous (e.g., in testing mode or in a notebook,
+    where plots are also displayed), and not at all if the writer is disabled.
+
+    Args:
+        enabled (bool, optional): Whether to write artefacts, the ``artefact_writer`` setting is used if ``None``.
+        asynchronous (bool, optional): Whether to write artefacts in a background process,
+                                       the ``artefact_writer`` setting is used if ``None``.
+
+    Attributes:
+        enabled (bool): Whether to write artefacts.
+        asynchronous (bool): Whether artefacts are written in a background process.
+        executor (ProcessPoolExecutor): The background process, started on the first asynchronous task.
+        pending (dict): Keys are (function name, key) tuples, values are the futures of the respective latest tasks.
+        superseded (list): Futures of tasks which were already running when a task with the same key was submitted.
+        coalesced (int): The number of tasks which were replaced by a more recent task before starting.
+    """
+
+    def __init__(self,
+                 enabled: Optional[bool] = None,
+                 asynchronous: Optional[bool] = None,
+                 ):
+        self.enabled = enabled if enabled is not None else artefact_writer['enabled']
+        asynchronous = asynchronous if asynchronous is not None else artefact_writer['asynchronous']
+        self.asynchronous = self.enabled and asynchronous and not is_notebook()
+        self.executor = None
+        self.pending = dict()
+        self.superseded = list()
+        self.coalesced = 0
+        self._counter = 0
+
+    def submit(self,
+               function_name: str,
+               key: Optional[str] = None,
+               **kwargs,
+               ):
+        """
+        Submit an artefact task.
+        The arguments are serialized upon submission, so later changes to them (e.g., to a species being
+        processed by the Scheduler) are not reflected in the artefact.
+        Display-only tasks (``draw_structure`` without a ``project_directory``) are dropped if the writer is
+        asynchronous.
+
+        Args:
+            function_name (str): The name of the ``arc.plotter`` function to call.
+            key (str, optional): A key identifying the artefact (e.g., the species label).
+                                 Pending tasks of the same function and key are replaced. Tasks are never replaced
+                                 if not given.
+            kwargs: The keyword arguments of the ``arc.plotter`` function.
+        """
+        if not self.enabled:
+            return
+        if function_name not in ARTEFACT_FUNCTIONS:
+            raise ValueError(f'The artefact function must be one of {ARTEFACT_FUNCTIONS}, got: {function_name}')
+        if self.asynchronous and function_name == 'draw_structure' and kwargs.get('project_directory') is None:
+            # without a project directory the structure is only displayed, which a background process cannot do
+            return
+        if self.asynchronous:
+            try:
+                payload = pickle.dumps(kwargs, protocol=pickle.HIGHEST_PROTOCOL)
+            except (pickle.PicklingError, TypeError, AttributeError) as e:
+                logger.debug(f'Could not serialize the arguments of {function_name}, writing inline. Got:\n{e}')
+            else:
+                self._counter += 1
+                task_key = (function_name, key if key is not None else self._counter)
+                previous_future = self.pending.pop(task_key, None)
+                if previous_future is not None:
+                    if previous_future.cancel():
+                        self.coalesced += 1
+                    else:
+                        self.superseded.append(previous_future)
+                try:
+                    if self.executor is None:
+                        # a forkserver (rather than forking this multi-threaded process) avoids deadlocks
+                        self.executor = ProcessPoolExecutor(max_workers=1,
+                                                            mp_context=multiprocessing.get_context('forkserver'),
+                                                            initializer=use_agg_backend)
+                    self.pending[task_key] = self.executor.submit(write_artefact, function_name, payload)
+                    return
+                except (BrokenProcessPool, OSError, RuntimeError) as e:
+                    logger.warning(f'Could not submit artefacts to a background process, writing them inline. '
+                                   f'Got:\n{e}')
+                    self.asynchronous = False
+        getattr(plotter, function_name)(**kwargs)
+
+    def collect(self, block: bool = False):
+        """
+        Collect the terminated artefact tasks and report their errors.
+
+        Args:
+            block (bool, optional): Whether to wait for all pending tasks to terminate.
+        """
+        futures = list(self.pending.items()) + [(None, future) for future in self.superseded]
+        if block and futures:
+            wait([future for _, future in futures])
+        for task_key, future in futures:
+            if not future.done():
+                continue
+            if task_key is not None:
+                del self.pending[task_key]
+            else:
+                self.superseded.remove(future)
+            if future.cancelled():
+                continue
+            try:
+                future.result()
+            except Exception as e:
+                function_name = task_key[0] if task_key is not None else 'an artefact function'
+                logger.warning(f'Could not write an artefact using {function_name}, got:\n{e}')
+
+    def shutdown(self):
+        """
+        Wait for all pending artefact tasks to terminate, and stop the background process.
+        """
+        self.collect(block=True)
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
+        if self.coalesced:
+            logger.debug(f'Skipped {self.coalesced} artefacts which were superseded before being written')
+
+
+def use_agg_backend():
+    """
+    Use the non-interactive Agg matplotlib backend in the artefact writer process.
+    """
+    import matplotlib
+    matplotlib.use('Agg', force=True)
+
+
+def write_artefact(function_name: str,
+                   payload: bytes,
+                   ):
+    """
+    Write an artefact, executed in the artefact writer process.
+
+    Args:
+        function_name (str): The name of the ``arc.plotter`` function to call.
+        payload (bytes): The serialized keyword arguments of the function.
+    """
+    getattr(plotter, function_name)(**pickle.loads(payload))
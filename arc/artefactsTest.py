@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""
+This module contains unit tests for the arc.artefacts module
+"""
+
+import os
+import shutil
+import unittest
+
+from arc.artefacts import ArtefactWriter
+from arc.common import arc_path
+
+
+class TestArtefactWriter(unittest.TestCase):
+    """
+    Contains unit tests for the ArtefactWriter class
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        A method that is run before all unit tests in this class.
+        """
+        cls.path = os.path.join(arc_path, 'arc', 'testing', 'artefacts_test_delete_after_usage')
+        cls.xyz = {'symbols': ('O', 'H', 'H'), 'isotopes': (16, 1, 1),
+                   'coords': ((0.0, 0.0, 0.1173), (0.0, 0.7572, -0.4692), (0.0, -0.7572, -0.4692))}
+
+    def test_write_inline(self):
+        """Test writing an artefact inline"""
+        writer = ArtefactWriter(enabled=True, asynchronous=False)
+        writer.submit('save_geo', xyz=self.xyz, path=os.path.join(self.path, 'inline'), filename='water',
+                      format_='xyz')
+        self.assertTrue(os.path.isfile(os.path.join(self.path, 'inline', 'water.xyz')))
+        self.assertIsNone(writer.executor)
+        with self.assertRaises(ValueError):
+            writer.submit('rm_rf', path=self.path)
+
+    def test_disabled(self):
+        """Test that a disabled artefact writer does not write artefacts"""
+        writer = ArtefactWriter(enabled=False, asynchronous=True)
+        self.assertFalse(writer.asynchronous)
+        writer.submit('save_geo', xyz=self.xyz, path=os.path.join(self.path, 'disabled'), filename='water',
+                      format_='xyz')
+        writer.shutdown()
+        self.assertFalse(os.path.isfile(os.path.join(self.path, 'disabled', 'water.xyz')))
+
+    def test_write_asynchronously(self):
+        """Test writing artefacts in a background process"""
+        writer = ArtefactWriter(enabled=True, asynchronous=True)
+        for i in range(5):
+            # only the most recent version of an artefact with the same key must be written
+            xyz = {'symbols': self.xyz['symbols'], 'isotopes': self.xyz['isotopes'],
+                   'coords': ((0.0, 0.0, float(i)),) + self.xyz['coords'][1:]}
+            writer.submit('save_geo', key='water', xyz=xyz, path=os.path.join(self.path, 'async'),
+                          filename='water', format_='xyz')
+        writer.submit('save_geo', key='water_copy', xyz=self.xyz, path=os.path.join(self.path, 'async'),
+                      filename='water_copy', format_='xyz')
+        writer.shutdown()
+        self.assertEqual(writer.pending, dict())
+        self.assertIsNone(writer.executor)
+        self.assertTrue(os.path.isfile(os.path.join(self.path, 'async', 'water_copy.xyz')))
+        with open(os.path.join(self.path, 'async', 'water.xyz'), 'r') as f:
+            self.assertIn('4.00000000', f.read())
+
+    def test_display_only_asynchronously(self):
+        """Test that display-only tasks do not replace a pending task of the same key in a background process"""
+        writer = ArtefactWriter(enabled=True, asynchronous=True)
+        writer.submit('draw_structure', key='water', xyz=self.xyz, project_directory=os.path.join(self.path, 'draw'),
+                      method='draw_3d')
+        writer.submit('draw_structure', key='water', xyz=self.xyz)
+        self.assertEqual(list(writer.pending.keys()), [('draw_structure', 'water')])
+        self.assertEqual(writer.coalesced, 0)
+        writer.shutdown()
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        A function that is run ONCE after all unit tests in this class.
+        """
+        shutil.rmtree(cls.path, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    unittest.main(testRunner=unittest.TextTestRunner(verbosity=2))
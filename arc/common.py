@@ -17,20 +17,18 @@ import sys
 import time
 import warnings
 import yaml
-from typing import Any, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Iterator, List, Optional, Tuple, Union
 
 import numpy as np
-import pandas as pd
-import qcelemental as qcel
-
-from arkane.ess import ess_factory, GaussianLog, MolproLog, OrcaLog, QChemLog, TeraChemLog
-from rmgpy.molecule.element import get_element
-from rmgpy.qm.qmdata import QMData
-from rmgpy.qm.symmetry import PointGroupCalculator
 
 from arc.exceptions import InputError, SettingsError
 from arc.imports import settings
 
+# Heavy dependencies (Arkane, RMG, qcelemental) are imported by the functions using them, since this module
+# is imported by every ARC module, including lightweight utilities
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 logger = logging.getLogger('arc')
 
@@ -121,6 +119,7 @@ def determine_ess(log_file: str) -> str:
     Returns: str
         The ESS log class from Arkane.
     """
+    from arkane.ess import ess_factory, GaussianLog, MolproLog, OrcaLog, QChemLog, TeraChemLog
     log = ess_factory(log_file)
     if isinstance(log, GaussianLog):
         return 'gaussian'
@@ -386,6 +385,145 @@ def save_yaml_file(path: str,
         f.write(content)
 
 
+def append_to_yaml_journal(path: str,
+                           content: list or dict,
+                           ) -> None:
+    """
+    Append a YAML document to a journal file (a stream of YAML documents), creating the file if needed.
+
+    Args:
+        path (str): The YAML journal file path.
+        content (list, dict): The content to append as a single document.
+    """
+    if not isinstance(path, str):
+        raise InputError(f'path must be a string, got {path} which is a {type(path)}')
+    yaml.add_representer(str, string_representer)
+    content = yaml.dump(data=content)
+    if '/' in path and os.path.dirname(path) and not os.path.exists(os.path.dirname(path)):
+        os.makedirs(os.path.dirname(path))
+    with open(path, 'a') as f:
+        f.write('---\n' + content)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def apply_restart_journal(restart_dict: dict,
+                          journal_path: str,
+                          project_directory: Optional[str] = None,
+                          ) -> dict:
+    """
+    Update a restart dictionary (loaded from a restart.yml snapshot) with the per-species records of a restart journal.
+    Each journal document maps species labels to their ``output``, ``species``, and ``running_jobs`` entries,
+    later documents supersede earlier ones. A truncated last document (e.g., if ARC was killed while writing it)
+    is ignored.
+
+    Args:
+        restart_dict (dict): The restart dictionary to update, its species may also be ARCSpecies objects.
+        journal_path (str): The restart journal file path.
+        project_directory (str, optional): The current project directory to rebase upon.
+
+    Returns: dict
+        The updated restart dictionary.
+    """
+    if not os.path.isfile(journal_path):
+        return restart_dict
+    if project_directory is not None:
+        journal_path = globalize_paths(journal_path, project_directory)
+    species_indices = {spc['label'] if isinstance(spc, dict) else spc.label: i
+                       for i, spc in enumerate(restart_dict.get('species', list()))}
+    with open(journal_path, 'r') as f:
+        try:
+            for entry in yaml.load_all(stream=f, Loader=yaml.FullLoader):
+                for label, record in (entry or dict()).items():
+                    restart_dict.setdefault('output', dict())[label] = record['output']
+                    if label in species_indices:
+                        restart_dict['species'][species_indices[label]] = record['species']
+                    else:
+                        species_indices[label] = len(restart_dict.setdefault('species', list()))
+                        restart_dict['species'].append(record['species'])
+                    running_jobs = restart_dict.get('running_jobs') or dict()
+                    if record['running_jobs']:
+                        running_jobs[label] = record['running_jobs']
+                    else:
+                        running_jobs.pop(label, None)
+                    restart_dict['running_jobs'] = running_jobs
+        except (yaml.YAMLError, KeyError, TypeError) as e:
+            logger.warning(f'Could not read the last entry of the restart journal {journal_path}, ignoring it. '
+                           f'Got: {e}')
+    return restart_dict
+
+
+class ReversedFileLines(object):
+    """
+    A lazy sequence of the lines of a text file in reverse order (index 0 is the last line of the file).
+    The file is read backwards in chunks, only as far as the accessed lines require,
+    so that checking the end of a large log file does not load the entire file into memory.
+    Negative indices (counting from the beginning of the file) require reading the entire file.
+
+    Args:
+        path (str): The file path.
+        chunk_size (int, optional): The number of bytes to read at a time.
+
+    Attributes:
+        path (str): The file path.
+        chunk_size (int): The number of bytes to read at a time.
+    """
+
+    def __init__(self,
+                 path: str,
+                 chunk_size: int = 64 * 1024,
+                 ):
+        if not os.path.isfile(path):
+            raise InputError(f'Could not find file {path}')
+        self.path = path
+        self.chunk_size = chunk_size
+        self._position = os.path.getsize(path)  # the file offset up to which the file was not read yet
+        self._buffer = b''  # a (possibly partial) line preceding the lines already read
+        self._lines = list()  # the lines read so far, last line of the file first
+
+    def __getitem__(self, index: int) -> str:
+        if index < 0:
+            while self._read_previous_chunk():
+                pass
+        else:
+            while index >= len(self._lines) and self._read_previous_chunk():
+                pass
+        return self._lines[index]
+
+    def __iter__(self) -> Iterator[str]:
+        index = 0
+        while True:
+            try:
+                yield self[index]
+            except IndexError:
+                return
+            index += 1
+
+    def _read_previous_chunk(self) -> bool:
+        """
+        Read the chunk of the file preceding the part already read.
+
+        Returns:
+            bool: Whether a chunk was read, ``False`` if the beginning of the file was already reached.
+        """
+        if not self._position:
+            return False
+        read_size = min(self.chunk_size, self._position)
+        self._position -= read_size
+        with open(self.path, 'rb') as f:
+            f.seek(self._position)
+            buffer = f.read(read_size) + self._buffer
+        lines = buffer.splitlines(keepends=True)
+        # the first line might continue in the preceding chunk, keep it until the preceding chunk is read
+        self._buffer = lines.pop(0) if self._position and lines else b''
+        for line in reversed(lines):
+            line = line.decode('utf-8', errors='replace')
+            if line.endswith('\r\n') or line.endswith('\r'):
+                line = line.rstrip('\r\n') + '\n'  # universal newlines, as when reading the file in text mode
+            self._lines.append(line)
+        return True
+
+
 def globalize_paths(file_path: str,
                     project_directory: str,
                     ) -> str:
@@ -489,6 +627,7 @@ def get_atom_radius(symbol: str) -> float:
     """
     if not isinstance(symbol, str):
         raise TypeError(f'The symbol argument must be string, got {symbol} which is a {type(symbol)}')
+    import qcelemental as qcel
     try:
         r = qcel.covalentradii.get(symbol, units='angstrom')
     except qcel.exceptions.NotAnElementError:
@@ -519,6 +658,7 @@ def colliding_atoms(xyz: dict,
         # monoatomic
         return False
 
+    import qcelemental as qcel
     geometry = np.array([np.array(coord, np.float64) * 1.8897259886 for coord in xyz['coords']])  # convert A to Bohr
     qcel_out = qcel.molutil.guess_connectivity(symbols=xyz['symbols'], geometry=geometry, threshold=threshold)
     logger.debug(qcel_out)
@@ -579,6 +719,9 @@ def determine_symmetry(xyz: dict) -> Tuple[int, int]:
         - The external symmetry number.
         - ``1`` if no chiral centers are present, ``2`` if chiral centers are present.
     """
+    from rmgpy.molecule.element import get_element
+    from rmgpy.qm.qmdata import QMData
+    from rmgpy.qm.symmetry import PointGroupCalculator
     atom_numbers = list()  # List of atomic numbers
     for symbol in xyz['symbols']:
         atom_numbers.append(get_element(symbol).number)
@@ -936,12 +1079,12 @@ def estimate_orca_mem_cpu_requirement(num_heavy_atoms: int,
     return est_cpu, est_memory
 
 
-def check_torsion_change(torsions: pd.DataFrame,
+def check_torsion_change(torsions: 'pd.DataFrame',
                          index_1: Union[int, str],
                          index_2: Union[int, str],
                          threshold: Union[float, int] = 20.0,
                          delta: Union[float, int] = 0.0,
-                         ) -> pd.DataFrame:
+                         ) -> 'pd.DataFrame':
     """
     Compare two sets of torsions (in DataFrame) and check if any entry has a
     difference larger than threshold. The output is a DataFrame consisting of
@@ -961,19 +1104,40 @@ def check_torsion_change(torsions: pd.DataFrame,
         a DataFrame consisting of ``True``/``False``, indicating
         which torsions changed significantly. ``True`` for significant change.
     """
+    import pandas as pd
+    change = get_torsion_changes(torsions_1=torsions[index_1].to_numpy(np.float64),
+                                 torsions_2=torsions[index_2].to_numpy(np.float64),
+                                 threshold=threshold,
+                                 delta=delta)
+    return pd.Series(change, index=torsions.index)
+
+
+def get_torsion_changes(torsions_1: np.ndarray,
+                        torsions_2: np.ndarray,
+                        threshold: Union[float, int] = 20.0,
+                        delta: Union[float, int] = 0.0,
+                        ) -> np.ndarray:
+    """
+    Compare two sets of torsions and check which ones have a difference larger than threshold,
+    accounting for a -180 / 180 flip. Differences involving missing (NaN) torsions are not significant.
+
+    Args:
+        torsions_1 (np.ndarray): The torsions of the first conformer in degrees.
+        torsions_2 (np.ndarray): The respective torsions of the second conformer in degrees.
+        threshold (Union[float, int]): The threshold used to determine the difference significance.
+        delta (Union[float, int]): A known difference between torsion pairs, delta = torsions_1 - torsions_2.
+
+    Returns: np.ndarray
+        Entries are ``True`` for torsions which changed significantly, ``False`` otherwise.
+    """
+    torsions_1, torsions_2 = np.asarray(torsions_1, np.float64), np.asarray(torsions_2, np.float64)
     # First iteration without 180/-180 adjustment
-    change = (torsions[index_1] - torsions[index_2] - delta).abs() > threshold
-    # Apply 180/-180 adjustment to those shown significance
-    for label in change[change == True].index:
-        # a -180 / 180 flip causes different sign
-        if torsions.loc[label, index_1] * torsions.loc[label, index_2] < 0:
-            if torsions.loc[label, index_1] < 0 \
-              and abs(torsions.loc[label, index_1] + 360 - torsions.loc[label, index_2] - delta) < threshold:
-                change[label] = False
-            elif torsions.loc[label, index_2] < 0 \
-                    and abs(torsions.loc[label, index_1] - 360 - torsions.loc[label, index_2] - delta) < threshold:
-                change[label] = False
-    return change
+    change = np.abs(torsions_1 - torsions_2 - delta) > threshold
+    # Apply 180/-180 adjustment to those shown significance, a -180 / 180 flip causes different sign
+    flipped = change & (torsions_1 * torsions_2 < 0)
+    adjusted = ((torsions_1 < 0) & (np.abs(torsions_1 + 360 - torsions_2 - delta) < threshold)) \
+        | ((torsions_2 < 0) & (np.abs(torsions_1 - 360 - torsions_2 - delta) < threshold))
+    return change & ~(flipped & adjusted)
 
 
 def is_same_pivot(torsion1: Union[list, str],
@@ -10,6 +10,7 @@ import os
 import time
 import unittest
 
+import numpy as np
 import pandas as pd
 
 from rmgpy.molecule.molecule import Molecule
@@ -58,6 +59,53 @@ class TestCommon(unittest.TestCase):
         with self.assertRaises(InputError):
             common.read_yaml_file('nopath')
 
+    def test_apply_restart_journal(self):
+        """Test appending to a restart journal and applying it to a restart dictionary"""
+        journal_path = os.path.join(common.arc_path, 'arc', 'testing', 'restart_journal_delete_after_usage.yml')
+        restart_dict = {'output': {'H2O': {'convergence': None}},
+                        'species': [{'label': 'H2O', 'smiles': 'O'}],
+                        'running_jobs': {'H2O': [{'job_name': 'opt_a1'}]},
+                        }
+        common.append_to_yaml_journal(path=journal_path,
+                                      content={'H2O': {'output': {'convergence': None},
+                                                       'species': {'label': 'H2O', 'smiles': 'O', 'e0': 1.5},
+                                                       'running_jobs': [{'job_name': 'freq_a2'}]}})
+        common.append_to_yaml_journal(path=journal_path,
+                                      content={'H2O': {'output': {'convergence': True},
+                                                       'species': {'label': 'H2O', 'smiles': 'O', 'e0': 1.5},
+                                                       'running_jobs': list()},
+                                               'NH3': {'output': {'convergence': None},
+                                                       'species': {'label': 'NH3', 'smiles': 'N'},
+                                                       'running_jobs': [{'job_name': 'opt_a3'}]}})
+        with open(journal_path, 'a') as f:
+            f.write('---\nH2O:\n  output: {convergence')  # a truncated entry
+        restart_dict = common.apply_restart_journal(restart_dict=restart_dict, journal_path=journal_path)
+        self.assertEqual(restart_dict['output'], {'H2O': {'convergence': True}, 'NH3': {'convergence': None}})
+        self.assertEqual(restart_dict['species'], [{'label': 'H2O', 'smiles': 'O', 'e0': 1.5},
+                                                   {'label': 'NH3', 'smiles': 'N'}])
+        self.assertEqual(restart_dict['running_jobs'], {'NH3': [{'job_name': 'opt_a3'}]})
+        os.remove(journal_path)
+        self.assertIs(common.apply_restart_journal(restart_dict=restart_dict, journal_path=journal_path), restart_dict)
+
+    def test_reversed_file_lines(self):
+        """Test lazily reading the lines of a file in reverse order"""
+        path = os.path.join(common.arc_path, 'arc', 'testing', 'freq', 'C2H6_freq_QChem.out')
+        with open(path, 'r') as f:
+            lines = f.readlines()
+        for chunk_size in [7, 1024, 64 * 1024]:
+            reverse_lines = common.ReversedFileLines(path, chunk_size=chunk_size)
+            self.assertEqual(reverse_lines[0], lines[-1])
+            self.assertEqual(reverse_lines[10], lines[-11])
+            self.assertEqual(list(reverse_lines), lines[::-1])
+            self.assertEqual(reverse_lines[-1], lines[0])
+            with self.assertRaises(IndexError):
+                reverse_lines[len(lines)]
+        reverse_lines = common.ReversedFileLines(path, chunk_size=1024)
+        reverse_lines[0]
+        self.assertLess(len(reverse_lines._lines), len(lines))  # only the end of the file was read
+        with self.assertRaises(InputError):
+            common.ReversedFileLines('nopath')
+
     def test_get_git_commit(self):
         """Test the get_git_commit() function"""
         git_commit = common.get_git_commit()
@@ -575,6 +623,14 @@ H       1.98414750   -0.79355889   -0.24492049"""  # colliding atoms
         self.assertFalse(common.check_torsion_change(
             torsions, 3, 2, threshold=20.0, delta=8.0)['D1'])
 
+    def test_get_torsion_changes(self):
+        """Test checking which torsion changes are significant"""
+        torsions_1, torsions_2 = np.array([126, -174, 176, np.nan]), np.array([120, 176, 126, 100])
+        changes = common.get_torsion_changes(torsions_1, torsions_2, threshold=20.0, delta=8.0)
+        self.assertEqual(changes.tolist(), [False, False, True, False])
+        changes = common.get_torsion_changes(torsions_1, torsions_2, threshold=5.0)
+        self.assertEqual(changes.tolist(), [True, True, True, False])
+
     def test_is_same_pivot(self):
         """Test whether two torsions have the same pivot"""
         self.assertTrue(common.is_same_pivot([1, 2, 3, 4], [5, 2, 3, 4]))
@@ -1,4 +1,6 @@
-import arc.job.job
-import arc.job.local
-import arc.job.ssh
-import arc.job.trsh
+from arc.lazy import lazy_package_attributes
+
+__getattr__, __dir__ = lazy_package_attributes(
+    package=__name__,
+    submodules=['bundle', 'harvest', 'job', 'ledger', 'local', 'ssh', 'trsh'],
+)
@@ -0,0 +1,207 @@
+"""
+A module for submitting several jobs as a single bundle.
+
+Used for the grid points of brute force directed scans. The submit script and input files of each grid point job are
+written to its own folder as usual, and a single "packed runner" submission executes the submit scripts of all jobs
+in the bundle on one node, either one after the other or several at a time. All jobs in a bundle share the job ID
+of the bundle submission, and their output files are downloaded and checked individually once it terminates.
+A bundle requests the time of all its consecutive rounds of jobs, and bundles are sized so that this time does not
+exceed the maximal job time of the server (``max_job_time`` in the server's settings, if specified).
+"""
+
+import math
+import os
+from typing import TYPE_CHECKING, List, Tuple
+
+from arc.common import get_logger
+from arc.imports import settings, submit_scripts
+from arc.job.local import submit_job
+from arc.job.ssh import SSHClient
+
+if TYPE_CHECKING:
+    from arc.job.job import Job
+
+
+logger = get_logger()
+
+servers, submit_filename, t_max_format = settings['servers'], settings['submit_filename'], settings['t_max_format']
+
+
+def get_bundle_name(jobs: List['Job']) -> str:
+    """
+    Get the name of a bundle, also used as the bundle job name on the server.
+
+    Args:
+        jobs (List[Job]): The jobs in the bundle.
+
+    Returns:
+        str: The bundle name.
+    """
+    return f'{jobs[0].job_server_name}_bundle'
+
+
+def get_job_path(job: 'Job') -> str:
+    """
+    Get the absolute path to the folder of a job where it runs, local or remote.
+    Remote job paths are relative to the home folder of the user on the server.
+
+    Args:
+        job (Job): The job.
+
+    Returns:
+        str: The job folder path, to be used in a shell script.
+    """
+    if job.server == 'local':
+        return job.local_path
+    return job.remote_path if os.path.isabs(job.remote_path) else f'$HOME/{job.remote_path}'
+
+
+def get_bundle_max_job_time(jobs: List['Job'],
+                            parallel_jobs: int = 1,
+                            ) -> float:
+    """
+    Get the maximal time of a bundle, allowing each consecutive round of ``parallel_jobs`` jobs
+    the maximal job time of the bundled jobs, capped at the maximal job time of the server (if specified).
+
+    Args:
+        jobs (List[Job]): The jobs in the bundle, all for the same server.
+        parallel_jobs (int, optional): The number of jobs to run simultaneously.
+
+    Returns:
+        float: The maximal time of the bundle in hours.
+    """
+    rounds = math.ceil(len(jobs) / max(parallel_jobs, 1))
+    max_job_time = max(job.max_job_time for job in jobs) * rounds
+    server_max_job_time = servers[jobs[0].server].get('max_job_time')
+    if server_max_job_time is not None and max_job_time > server_max_job_time:
+        logger.warning(f'The {len(jobs)} jobs bundled in {get_bundle_name(jobs)} may require {max_job_time} hours, '
+                       f'more than the maximal job time of {server_max_job_time} hours on {jobs[0].server}.')
+        max_job_time = server_max_job_time
+    return max_job_time
+
+
+def get_bundle_submit_script(jobs: List['Job'],
+                             parallel_jobs: int = 1,
+                             ) -> str:
+    """
+    Get the submit script of a bundle.
+    The scheduler directives are taken from the submit script of the first job's server and software,
+    requesting the cores needed to run ``parallel_jobs`` jobs simultaneously and the time needed to run all jobs
+    (see ``get_bundle_max_job_time()``). Each job runs its own submit script from its own folder, with the job name
+    environment variables of the cluster software set to the job's server name, so that jobs running simultaneously
+    use different scratch folders.
+
+    Args:
+        jobs (List[Job]): The jobs in the bundle, all for the same server and software.
+        parallel_jobs (int, optional): The number of jobs to run simultaneously.
+
+    Returns:
+        str: The bundle submit script.
+    """
+    job = jobs[0]
+    cluster_soft = servers[job.server]['cluster_soft']
+    parallel_jobs = max(min(parallel_jobs, len(jobs)), 1)
+    script = submit_scripts[job.server][job.software.lower()].format(
+        name=get_bundle_name(jobs), un=servers[job.server]['un'],
+        t_max=job.format_max_job_time(time_format=t_max_format[cluster_soft],
+                                      max_job_time=get_bundle_max_job_time(jobs=jobs, parallel_jobs=parallel_jobs)),
+        memory=int(job.submit_script_memory), cpus=job.cpu_cores * parallel_jobs, architecture='', size=None)
+    # only keep the interpreter line and the scheduler directives
+    header = list()
+    for line in script.splitlines():
+        if line.strip() and not line.startswith('#'):
+            break
+        header.append(line)
+    content = '\n'.join(header).rstrip() + '\n\n'
+    content += f'# Run {len(jobs)} jobs, {parallel_jobs} at a time\n'
+    for i, bundled_job in enumerate(jobs):
+        name = bundled_job.job_server_name
+        content += f'(cd "{get_job_path(bundled_job)}" && SLURM_JOB_NAME={name} JOB_NAME={name} PBS_JOBNAME={name} ' \
+                   f'bash {submit_filename[cluster_soft]} > bundle.log 2>&1)'
+        if parallel_jobs > 1:
+            content += ' &'
+            if (i + 1) % parallel_jobs == 0:
+                content += '\nwait'
+        content += '\n'
+    if parallel_jobs > 1 and len(jobs) % parallel_jobs:
+        content += 'wait\n'
+    return content
+
+
+def run_job_bundle(jobs: List['Job'],
+                   parallel_jobs: int = 1,
+                   ) -> Tuple[str, int]:
+    """
+    Write the files of all jobs in a bundle, and submit the bundle.
+    The job status and job ID of all jobs are set to those of the bundle submission.
+
+    Args:
+        jobs (List[Job]): The jobs in the bundle, all for the same server and software, in the same parent folder.
+        parallel_jobs (int, optional): The number of jobs to run simultaneously.
+
+    Returns:
+        Tuple[str, int]: The server status and the job ID of the bundle submission.
+    """
+    job = jobs[0]
+    bundle_name = get_bundle_name(jobs)
+    logger.info(f'Running {len(jobs)} jobs for {job.species_name} as a single submission ({bundle_name}), '
+                f'{jobs[0].job_name} to {jobs[-1].job_name}')
+    for bundled_job in jobs:
+        bundled_job.write_submit_script()
+        bundled_job.write_input_file()
+    content = get_bundle_submit_script(jobs=jobs, parallel_jobs=parallel_jobs)
+    cluster_soft = servers[job.server]['cluster_soft']
+    local_bundle_path = os.path.join(os.path.dirname(job.local_path), bundle_name)
+    if not os.path.isdir(local_bundle_path):
+        os.makedirs(local_bundle_path)
+    with open(os.path.join(local_bundle_path, submit_filename[cluster_soft]), 'w') as f:
+        f.write(content)
+    if job.server != 'local':
+        remote_bundle_path = os.path.join(os.path.dirname(job.remote_path), bundle_name)
+        with SSHClient(job.server) as ssh:
+            ssh.upload_file(remote_file_path=os.path.join(remote_bundle_path, submit_filename[cluster_soft]),
+                            file_string=content)
+            job_status, job_id = ssh.submit_job(remote_path=remote_bundle_path)
+    else:
+        job_status, job_id = submit_job(path=local_bundle_path)
+    for bundled_job in jobs:
+        bundled_job.job_status[0], bundled_job.job_id = job_status, job_id
+    return job_status, job_id
+
+
+def split_into_bundles(jobs: List['Job'],
+                       max_jobs_per_bundle: int,
+                       parallel_jobs: int = 1,
+                       ) -> List[List['Job']]:
+    """
+    Split jobs into bundles of similar sizes.
+    Only jobs with the same server and software are bundled together, and if the server has a maximal job time,
+    bundles are limited to the number of consecutive rounds of ``parallel_jobs`` jobs that fit in it.
+
+    Args:
+        jobs (List[Job]): The jobs to bundle.
+        max_jobs_per_bundle (int): The maximal number of jobs in a bundle.
+        parallel_jobs (int, optional): The number of jobs to run simultaneously in a bundle.
+
+    Returns:
+        List[List[Job]]: The bundles, preserving the order of the jobs.
+    """
+    groups = dict()
+    for job in jobs:
+        groups.setdefault((job.server, job.software), list()).append(job)
+    bundles = list()
+    parallel_jobs = max(parallel_jobs, 1)
+    for (server, _), group in groups.items():
+        group_max_jobs_per_bundle = max(max_jobs_per_bundle, 1)
+        server_max_job_time = servers[server].get('max_job_time')
+        if server_max_job_time is not None:
+            rounds = max(int(server_max_job_time // max(job.max_job_time for job in group)), 1)
+            group_max_jobs_per_bundle = min(group_max_jobs_per_bundle, rounds * parallel_jobs)
+        number_of_bundles = math.ceil(len(group) / group_max_jobs_per_bundle)
+        bundle_size, remainder = divmod(len(group), number_of_bundles)
+        start = 0
+        for i in range(number_of_bundles):
+            end = start + bundle_size + (1 if i < remainder else 0)
+            bundles.append(group[start:end])
+            start = end
+    return bundles
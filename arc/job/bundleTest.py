@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""
+This module contains unit tests of the arc.job.bundle module
+"""
+
+import os
+import shutil
+import unittest
+
+from arc.common import arc_path
+from arc.imports import settings, submit_scripts
+from arc.job.bundle import (get_bundle_max_job_time,
+                            get_bundle_name,
+                            get_bundle_submit_script,
+                            get_job_path,
+                            split_into_bundles,
+                            )
+from arc.job.job import Job
+from arc.level import Level
+
+
+servers = settings['servers']
+
+
+class TestBundle(unittest.TestCase):
+    """
+    Contains unit tests for the bundle module
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        A method that is run before all unit tests in this class.
+        """
+        cls.maxDiff = None
+        cls.added_submit_scripts = 'server1' not in submit_scripts
+        if cls.added_submit_scripts:
+            submit_scripts['server1'] = {'gaussian': """#!/bin/bash -l
+#$ -N {name}
+#$ -l long
+#$ -l h_rt={t_max}
+#$ -pe singlenode {cpus}
+#$ -l h=!node60.cluster
+#$ -l h_vmem={memory}M
+#$ -cwd
+#$ -o out.txt
+#$ -e err.txt
+
+echo "Running on node:"
+hostname
+
+g09 < input.gjf > input.log
+
+"""}
+        cls.ess_settings = {'gaussian': ['server1'], 'molpro': ['server2']}
+        cls.project_directory = os.path.join(arc_path, 'Projects', 'arc_project_for_testing_delete_after_usage_bundle')
+
+    def get_job(self, job_num, software='gaussian', server=None, max_job_time=24):
+        """A helper function for creating sp jobs to bundle"""
+        return Job(project='arc_project_for_testing_delete_after_usage_bundle',
+                   ess_settings=self.ess_settings,
+                   species_name='spc1',
+                   xyz={'symbols': ('C',), 'isotopes': (12,), 'coords': ((0.0, 0.0, 0.0),)},
+                   job_type='sp',
+                   level=Level(repr={'method': 'b3lyp', 'basis': '6-31g', 'software': software}),
+                   multiplicity=3,
+                   server=server,
+                   job_num=job_num,
+                   max_job_time=max_job_time,
+                   testing=True,
+                   project_directory=self.project_directory,
+                   )
+
+    def test_get_job_path(self):
+        """Test getting the absolute path of a bundled job"""
+        job = self.get_job(100)
+        self.assertEqual(get_job_path(job),
+                         '$HOME/runs/ARC_Projects/arc_project_for_testing_delete_after_usage_bundle/spc1/sp_a100')
+        job = self.get_job(101, server='local')
+        self.assertEqual(get_job_path(job), os.path.join(self.project_directory, 'calcs', 'Species', 'spc1', 'sp_a101'))
+
+    def test_get_bundle_max_job_time(self):
+        """Test getting the maximal time of a bundle"""
+        jobs = [self.get_job(job_num) for job_num in range(100, 105)]
+        jobs.append(self.get_job(105, max_job_time=30))
+        self.assertEqual(get_bundle_max_job_time(jobs=jobs, parallel_jobs=1), 180)
+        self.assertEqual(get_bundle_max_job_time(jobs=jobs, parallel_jobs=4), 60)
+        self.assertEqual(get_bundle_max_job_time(jobs=jobs, parallel_jobs=10), 30)
+        server_max_job_time = servers['server1'].get('max_job_time')
+        try:
+            servers['server1']['max_job_time'] = 48
+            self.assertEqual(get_bundle_max_job_time(jobs=jobs, parallel_jobs=1), 48)
+            self.assertEqual(get_bundle_max_job_time(jobs=jobs, parallel_jobs=10), 30)
+        finally:
+            if server_max_job_time is None:
+                del servers['server1']['max_job_time']
+            else:
+                servers['server1']['max_job_time'] = server_max_job_time
+
+    def test_split_into_bundles(self):
+        """Test splitting jobs into bundles"""
+        jobs = [self.get_job(job_num) for job_num in range(100, 110)]
+        bundles = split_into_bundles(jobs=jobs, max_jobs_per_bundle=4)
+        self.assertEqual([len(bundle) for bundle in bundles], [4, 3, 3])
+        self.assertEqual([job for bundle in bundles for job in bundle], jobs)
+        jobs.append(self.get_job(110, software='molpro'))
+        self.assertEqual((jobs[-1].server, jobs[-1].software), ('server2', 'molpro'))
+        server_max_job_time = servers['server1'].get('max_job_time')
+        try:
+            servers['server1'].pop('max_job_time', None)
+            bundles = split_into_bundles(jobs=jobs, max_jobs_per_bundle=100)
+            self.assertEqual([len(bundle) for bundle in bundles], [10, 1])
+            # only 3 consecutive 24 hours jobs fit in 80 hours
+            servers['server1']['max_job_time'] = 80
+            bundles = split_into_bundles(jobs=jobs, max_jobs_per_bundle=100)
+            self.assertEqual([len(bundle) for bundle in bundles], [3, 3, 2, 2, 1])
+            bundles = split_into_bundles(jobs=jobs, max_jobs_per_bundle=100, parallel_jobs=2)
+            self.assertEqual([len(bundle) for bundle in bundles], [5, 5, 1])
+            self.assertTrue(all(get_bundle_max_job_time(jobs=bundle, parallel_jobs=2) <= 80 for bundle in bundles))
+        finally:
+            if server_max_job_time is None:
+                servers['server1'].pop('max_job_time', None)
+            else:
+                servers['server1']['max_job_time'] = server_max_job_time
+        self.assertEqual(split_into_bundles(jobs=list(), max_jobs_per_bundle=4), list())
+
+    def test_get_bundle_submit_script(self):
+        """Test getting the submit script of a bundle"""
+        jobs = [self.get_job(job_num) for job_num in range(100, 103)]
+        self.assertEqual(get_bundle_name(jobs), 'a100_bundle')
+        script = get_bundle_submit_script(jobs=jobs, parallel_jobs=1)
+        path = '$HOME/runs/ARC_Projects/arc_project_for_testing_delete_after_usage_bundle/spc1'
+        expected_script = f"""#!/bin/bash -l
+#$ -N a100_bundle
+#$ -l long
+#$ -l h_rt=72:00:00
+#$ -pe singlenode {jobs[0].cpu_cores}
+#$ -l h=!node60.cluster
+#$ -l h_vmem={int(jobs[0].submit_script_memory)}M
+#$ -cwd
+#$ -o out.txt
+#$ -e err.txt
+
+# Run 3 jobs, 1 at a time
+(cd "{path}/sp_a100" && SLURM_JOB_NAME=a100 JOB_NAME=a100 PBS_JOBNAME=a100 bash submit.sh > bundle.log 2>&1)
+(cd "{path}/sp_a101" && SLURM_JOB_NAME=a101 JOB_NAME=a101 PBS_JOBNAME=a101 bash submit.sh > bundle.log 2>&1)
+(cd "{path}/sp_a102" && SLURM_JOB_NAME=a102 JOB_NAME=a102 PBS_JOBNAME=a102 bash submit.sh > bundle.log 2>&1)
+"""
+        self.assertEqual(script, expected_script)
+
+        script = get_bundle_submit_script(jobs=jobs, parallel_jobs=2)
+        self.assertIn('#$ -l h_rt=48:00:00\n', script)
+        self.assertIn(f'#$ -pe singlenode {2 * jobs[0].cpu_cores}\n', script)
+        self.assertIn('# Run 3 jobs, 2 at a time\n', script)
+        self.assertEqual(script.count(' &\n'), 3)
+        self.assertEqual(script.count('\nwait\n'), 2)
+        self.assertTrue(script.endswith('wait\n'))
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        A function that is run ONCE after all unit tests in this class.
+        """
+        if cls.added_submit_scripts:
+            del submit_scripts['server1']
+        if os.path.isdir(cls.project_directory):
+            shutil.rmtree(cls.project_directory, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    unittest.main(testRunner=unittest.TextTestRunner(verbosity=2))
@@ -0,0 +1,86 @@
+"""
+A module for harvesting terminated jobs in bulk.
+The status of all jobs that left the queue of a server is determined using a single queue query,
+and their output files are downloaded through a single (pooled) SSH/SFTP session per server.
+"""
+
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from arc.common import get_logger
+from arc.job.local import check_jobs_status
+from arc.job.ssh import SSHClient
+
+if TYPE_CHECKING:
+    from arc.job.job import Job
+
+
+logger = get_logger()
+
+
+def group_jobs_by_server(jobs: List['Job']) -> Dict[str, List['Job']]:
+    """
+    Group jobs by the server they ran on.
+
+    Args:
+        jobs (List[Job]): The jobs to group.
+
+    Returns:
+        Dict[str, List[Job]]: Keys are server names, values are lists of jobs (in their original order).
+    """
+    jobs_by_server = dict()
+    for job in jobs:
+        jobs_by_server.setdefault(job.server, list()).append(job)
+    return jobs_by_server
+
+
+def harvest_jobs(jobs: List['Job']) -> Dict[str, Optional[IOError]]:
+    """
+    Determine the status of terminated jobs and download their output files, server by server.
+    Each server's queue is queried only once for all of its jobs.
+
+    Args:
+        jobs (List[Job]): The jobs to harvest (jobs that left the server queues).
+
+    Returns:
+        Dict[str, Optional[IOError]]: Keys are the harvested job names, values are the IOError raised while
+                                      determining the respective job status (e.g., the output file could not be
+                                      downloaded), or ``None`` if the job status was successfully determined.
+    """
+    harvested = dict()
+    for server, server_jobs in group_jobs_by_server(jobs).items():
+        # jobs submitted as a bundle share a single ID
+        job_ids = list(dict.fromkeys(job.job_id for job in server_jobs))
+        logger.debug(f'Harvesting {len(job_ids)} jobs from {server}')
+        if server == 'local':
+            statuses = check_jobs_status(job_ids)
+            harvested.update(_determine_jobs_status(server_jobs, statuses))
+        else:
+            # Keep a single session open for the queue query and all downloads (jobs reuse the pooled session)
+            with SSHClient(server) as ssh:
+                statuses = ssh.check_jobs_status(job_ids)
+                harvested.update(_determine_jobs_status(server_jobs, statuses))
+    return harvested
+
+
+def _determine_jobs_status(jobs: List['Job'],
+                           statuses: dict,
+                           ) -> Dict[str, Optional[IOError]]:
+    """
+    Determine the status of jobs given their server statuses (also downloads the output files).
+
+    Args:
+        jobs (List[Job]): The jobs to process.
+        statuses (dict): Keys are job IDs, values are the respective server statuses.
+
+    Returns:
+        Dict[str, Optional[IOError]]: Keys are job names, values are the IOError raised, if any.
+    """
+    harvested = dict()
+    for job in jobs:
+        try:
+            job.determine_job_status(server_status=statuses[job.job_id])
+        except IOError as e:
+            harvested[job.job_name] = e
+        else:
+            harvested[job.job_name] = None
+    return harvested
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""
+This module contains unit tests of the arc.job.harvest module
+"""
+
+import os
+import shutil
+import unittest
+
+import arc.job.harvest as harvest
+from arc.common import arc_path
+from arc.job.harvest import group_jobs_by_server, harvest_jobs
+from arc.job.job import Job
+from arc.level import Level
+
+
+class TestHarvest(unittest.TestCase):
+    """
+    Contains unit tests for the harvest module
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        A method that is run before all unit tests in this class.
+        """
+        cls.maxDiff = None
+        cls.ess_settings = {'gaussian': ['local', 'server1', 'server2']}
+        cls.project_directory = os.path.join(arc_path, 'Projects', 'arc_project_for_testing_delete_after_usage_harvest')
+
+    def get_job(self, job_num, server='local'):
+        """A helper function for creating freq jobs to harvest"""
+        return Job(project='arc_project_for_testing_delete_after_usage_harvest',
+                   ess_settings=self.ess_settings,
+                   species_name='CH3OO',
+                   xyz={'symbols': ('C',), 'isotopes': (12,), 'coords': ((0.0, 0.0, 0.0),)},
+                   job_type='freq',
+                   level=Level(repr={'method': 'b3lyp', 'basis': '6-31g'}),
+                   multiplicity=3,
+                   server=server,
+                   job_num=job_num,
+                   testing=True,
+                   project_directory=self.project_directory,
+                   )
+
+    def test_group_jobs_by_server(self):
+        """Test grouping jobs by server"""
+        jobs = [self.get_job(100, 'server1'), self.get_job(101, 'server2'), self.get_job(102, 'server1'),
+                self.get_job(103, 'local')]
+        jobs_by_server = group_jobs_by_server(jobs)
+        self.assertEqual(list(jobs_by_server.keys()), ['server1', 'server2', 'local'])
+        self.assertEqual([job.job_name for job in jobs_by_server['server1']], ['freq_a100', 'freq_a102'])
+        self.assertEqual([job.job_name for job in jobs_by_server['server2']], ['freq_a101'])
+        self.assertEqual(group_jobs_by_server(list()), dict())
+
+    def test_harvest_no_jobs(self):
+        """Test that no server is queried when there are no jobs to harvest"""
+        self.assertEqual(harvest_jobs(list()), dict())
+
+    def test_harvest_jobs(self):
+        """Test determining the status of terminated jobs with a single queue query"""
+        done_job, running_job, bundled_job_1, bundled_job_2, failed_job = [self.get_job(job_num)
+                                                                          for job_num in range(110, 115)]
+        done_job.job_id, running_job.job_id, failed_job.job_id = 1110, 1111, 1114
+        bundled_job_1.job_id = bundled_job_2.job_id = 1112  # jobs submitted as a bundle share a single ID
+        if not os.path.isdir(done_job.local_path):
+            os.makedirs(done_job.local_path)
+        shutil.copy(os.path.join(arc_path, 'arc', 'testing', 'freq', 'CH3OO_freq_gaussian.out'),
+                    os.path.join(done_job.local_path, 'input.log'))
+
+        def fail_to_download():
+            raise IOError('Could not download the output file')
+
+        failed_job._check_job_ess_status = fail_to_download
+        failed_job._get_additional_job_info = lambda: ''
+        queries = list()
+
+        def check_jobs_status(job_ids):
+            queries.append(job_ids)
+            return {1110: 'done', 1111: 'running', 1112: 'errored', 1114: 'done'}
+
+        original_check_jobs_status = harvest.check_jobs_status
+        harvest.check_jobs_status = check_jobs_status
+        try:
+            harvested = harvest_jobs([done_job, running_job, bundled_job_1, bundled_job_2, failed_job])
+        finally:
+            harvest.check_jobs_status = original_check_jobs_status
+        self.assertEqual(queries, [[1110, 1111, 1112, 1114]])
+        self.assertEqual(list(harvested.keys()), ['freq_a110', 'freq_a111', 'freq_a112', 'freq_a113', 'freq_a114'])
+        self.assertIsInstance(harvested['freq_a114'], IOError)
+        self.assertTrue(all(harvested[job_name] is None for job_name in list(harvested.keys())[:4]))
+        self.assertEqual(done_job.job_status[0], 'done')
+        self.assertEqual(done_job.job_status[1]['status'], 'done')
+        self.assertTrue(os.path.isfile(done_job.local_path_to_output_file))
+        self.assertEqual(running_job.job_status[0], 'running')
+        self.assertEqual(running_job.job_status[1]['status'], 'running')
+        self.assertEqual([bundled_job_1.job_status[0], bundled_job_2.job_status[0]], ['errored', 'errored'])
+        self.assertEqual(failed_job.job_status[0], 'done')
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        A function that is run ONCE after all unit tests in this class.
+        Delete all project directories created during these unit tests
+        """
+        if os.path.isdir(cls.project_directory):
+            shutil.rmtree(cls.project_directory, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    unittest.main(testRunner=unittest.TextTestRunner(verbosity=2))
@@ -2,7 +2,6 @@
 The ARC Job module
 """
 
-import csv
 import datetime
 import math
 import os
@@ -13,6 +12,7 @@ from typing import Dict, Optional, Union
 from arc.common import arc_path, get_logger
 from arc.exceptions import JobError, InputError
 from arc.imports import settings, input_files, submit_scripts
+from arc.job.ledger import allocate_job_number, record_job
 from arc.job.local import (get_last_modified_time,
                            submit_job,
                            delete_job,
@@ -339,7 +339,7 @@ class Job(object):
         if job_num is None:
             # this checks job_num and not self.job_num on purpose
             # if job_num was given, then don't save as initiated jobs, this is a restarted job
-            self._write_initiated_job_to_csv_file()
+            self._write_initiated_job_to_ledger()
 
     def as_dict(self) -> dict:
         """
@@ -424,83 +424,69 @@ class Job(object):
         """
         Used as the entry number in the database, as well as the job name on the server.
         """
-        csv_path = os.path.join(arc_path, 'initiated_jobs.csv')
-        if not os.path.isfile(csv_path):
-            # check file, make index file and write headers if file doesn't exists
-            with open(csv_path, 'w') as f:
-                writer = csv.writer(f, dialect='excel')
-                row = ['job_num', 'project', 'species_name', 'conformer', 'is_ts', 'charge', 'multiplicity', 'job_type',
-                       'job_name', 'job_id', 'server', 'software', 'memory', 'method', 'basis_set', 'comments']
-                writer.writerow(row)
-        with open(csv_path, 'r') as f:
-            reader = csv.reader(f, dialect='excel')
-            job_num = 0
-            for _ in reader:
-                job_num += 1
-                if job_num == 100000:
-                    job_num = 0
-            self.job_num = job_num
-
-    def _write_initiated_job_to_csv_file(self):
+        self.job_num = allocate_job_number()
+
+    def _get_ledger_data(self) -> dict:
         """
-        Write an initiated ARCJob into the initiated_jobs.csv file.
+        Get the data of this job recorded in the job ledger.
+
+        Returns:
+            dict: Keys are the job ledger column names.
         """
-        csv_path = os.path.join(arc_path, 'initiated_jobs.csv')
-        if self.conformer < 0:  # this is not a conformer search job
-            conformer = '-'
-        else:
-            conformer = str(self.conformer)
-        with open(csv_path, 'a') as f:
-            writer = csv.writer(f, dialect='excel')
-            row = [self.job_num, self.project, self.species_name, conformer, self.is_ts, self.charge,
-                   self.multiplicity, self.job_type, self.job_name, self.job_id, self.server, self.software,
-                   self.total_job_memory_gb, self.level.method, self.level.basis, self.comments]
-            writer.writerow(row)
-
-    def write_completed_job_to_csv_file(self):
+        return {'job_num': self.job_num,
+                'project': self.project,
+                'species_name': self.species_name,
+                'conformer': str(self.conformer) if self.conformer >= 0 else '-',  # '-' if not a conformer job
+                'is_ts': self.is_ts,
+                'charge': self.charge,
+                'multiplicity': self.multiplicity,
+                'job_type': self.job_type,
+                'job_name': self.job_name,
+                'job_id': self.job_id,
+                'server': self.server,
+                'software': self.software,
+                'memory': self.total_job_memory_gb,
+                'method': self.level.method,
+                'basis_set': self.level.basis,
+                'comments': self.comments,
+                }
+
+    def _write_initiated_job_to_ledger(self):
+        """
+        Record an initiated ARCJob in the job ledger.
+        """
+        record_job(table='initiated_jobs', job_data=self._get_ledger_data())
+
+    def write_completed_job_to_ledger(self):
         """
-        Write a completed ARCJob into the completed_jobs.csv file.
+        Record a completed ARCJob in the job ledger.
         """
         if self.job_status[0] != 'done' or self.job_status[1]['status'] != 'done':
             self.determine_job_status()
-        csv_path = os.path.join(arc_path, 'completed_jobs.csv')
-        if not os.path.isfile(csv_path):
-            # check file, make index file and write headers if file doesn't exists
-            with open(csv_path, 'w') as f:
-                writer = csv.writer(f, dialect='excel')
-                row = ['job_num', 'project', 'species_name', 'conformer', 'is_ts', 'charge', 'multiplicity', 'job_type',
-                       'job_name', 'job_id', 'server', 'software', 'memory', 'method', 'basis_set', 'initial_time',
-                       'final_time', 'run_time', 'job_status_(server)', 'job_status_(ESS)',
-                       'ESS troubleshooting methods used', 'comments']
-                writer.writerow(row)
-        csv_path = os.path.join(arc_path, 'completed_jobs.csv')
-        if self.conformer < 0:  # this is not a conformer search job
-            conformer = '-'
-        else:
-            conformer = str(self.conformer)
-        with open(csv_path, 'a') as f:
-            writer = csv.writer(f, dialect='excel')
-            job_type = self.job_type
-            if self.fine:
-                job_type += ' (fine)'
-            row = [self.job_num, self.project, self.species_name, conformer, self.is_ts, self.charge,
-                   self.multiplicity, job_type, self.job_name, self.job_id, self.server, self.software,
-                   self.total_job_memory_gb, self.level.method, self.level.basis, self.initial_time, self.final_time,
-                   self.run_time, self.job_status[0], self.job_status[1]['status'], self.ess_trsh_methods,
-                   self.comments]
-            writer.writerow(row)
-
-    def format_max_job_time(self, time_format):
+        job_data = self._get_ledger_data()
+        if self.fine:
+            job_data['job_type'] += ' (fine)'
+        job_data.update({'initial_time': str(self.initial_time) if self.initial_time is not None else None,
+                         'final_time': str(self.final_time) if self.final_time is not None else None,
+                         'run_time': str(self.run_time) if self.run_time is not None else None,
+                         'server_status': self.job_status[0],
+                         'ess_status': self.job_status[1]['status'],
+                         'ess_trsh_methods': str(self.ess_trsh_methods),
+                         })
+        record_job(table='completed_jobs', job_data=job_data)
+
+    def format_max_job_time(self, time_format, max_job_time=None):
         """
         Convert the max_job_time attribute into the format supported by the server submission script
 
         Args:
             time_format (str): Either 'days' (e.g., 5-0:00:00) or 'hours' (e.g., 120:00:00)
+            max_job_time (float, optional): A job time in hours to format instead of the max_job_time attribute.
 
         Returns: str
             The formatted maximum job time string
         """
-        t_delta = datetime.timedelta(hours=self.max_job_time)
+        t_delta = datetime.timedelta(hours=max_job_time if max_job_time is not None else self.max_job_time)
         if time_format == 'days':
             # e.g., 5-0:00:00
             t_max = '{0}-{1}'.format(t_delta.days, str(datetime.timedelta(seconds=t_delta.seconds)))
@@ -1333,16 +1319,20 @@ end
             logger.debug('deleting job locally...')
             delete_job(job_id=self.job_id)
 
-    def determine_job_status(self):
+    def determine_job_status(self, server_status: Optional[str] = None):
         """
         Determine the Job's status. Updates self.job_status.
 
+        Args:
+            server_status (str, optional): The job's server status if already known (e.g., from a batched queue
+                                           query), otherwise the server is queried for this job.
+
         Raises:
             IOError: If the output file and any additional server information cannot be found.
         """
         if self.job_status[0] == 'errored':
             return
-        self.job_status[0] = self._check_job_server_status()
+        self.job_status[0] = server_status or self._check_job_server_status()
         if self.job_status[0] == 'done':
             try:
                 self._check_job_ess_status()  # populates self.job_status[1], and downloads the output file
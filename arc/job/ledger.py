@@ -0,0 +1,251 @@
+"""
+A module for the local ARC job ledger.
+
+The ledger is an SQLite database (in WAL mode) shared by all ARC processes of an installation.
+It allocates job numbers atomically, and records the initiated and the completed jobs.
+The ``initiated_jobs.csv`` and ``completed_jobs.csv`` files used by previous ARC versions
+are imported once, when the ledger is created.
+"""
+
+import csv
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import List, Optional, Tuple
+
+from arc.common import arc_path, get_logger
+
+
+logger = get_logger()
+
+LEDGER_PATH = os.path.join(arc_path, 'job_ledger.db')
+
+# Job numbers are used in server job names (e.g., 'a4563'), and are recycled after this limit
+JOB_NUM_LIMIT = 100000
+
+INITIATED_JOBS_COLUMNS = ['job_num', 'project', 'species_name', 'conformer', 'is_ts', 'charge', 'multiplicity',
+                          'job_type', 'job_name', 'job_id', 'server', 'software', 'memory', 'method', 'basis_set',
+                          'comments']
+COMPLETED_JOBS_COLUMNS = INITIATED_JOBS_COLUMNS[:-1] + ['initial_time', 'final_time', 'run_time', 'server_status',
+                                                        'ess_status', 'ess_trsh_methods', 'comments']
+
+SCHEMA = ['CREATE TABLE IF NOT EXISTS metadata (key TEXT PRIMARY KEY, value TEXT)',
+          'CREATE TABLE IF NOT EXISTS job_counter (id INTEGER PRIMARY KEY CHECK (id = 0), value INTEGER NOT NULL)',
+          'INSERT OR IGNORE INTO job_counter (id, value) VALUES (0, 0)',
+          'CREATE TABLE IF NOT EXISTS initiated_jobs (id INTEGER PRIMARY KEY AUTOINCREMENT, job_num INTEGER, '
+          'project TEXT, species_name TEXT, conformer TEXT, is_ts INTEGER, charge INTEGER, multiplicity INTEGER, '
+          'job_type TEXT, job_name TEXT, job_id TEXT, server TEXT, software TEXT, memory REAL, method TEXT, '
+          'basis_set TEXT, comments TEXT, timestamp TEXT DEFAULT CURRENT_TIMESTAMP)',
+          'CREATE TABLE IF NOT EXISTS completed_jobs (id INTEGER PRIMARY KEY AUTOINCREMENT, job_num INTEGER, '
+          'project TEXT, species_name TEXT, conformer TEXT, is_ts INTEGER, charge INTEGER, multiplicity INTEGER, '
+          'job_type TEXT, job_name TEXT, job_id TEXT, server TEXT, software TEXT, memory REAL, method TEXT, '
+          'basis_set TEXT, initial_time TEXT, final_time TEXT, run_time TEXT, server_status TEXT, ess_status TEXT, '
+          'ess_trsh_methods TEXT, comments TEXT, timestamp TEXT DEFAULT CURRENT_TIMESTAMP)',
+          ]
+for table in ['initiated_jobs', 'completed_jobs']:
+    SCHEMA.extend([f'CREATE INDEX IF NOT EXISTS {table}_job_num ON {table} (job_num)',
+                   f'CREATE INDEX IF NOT EXISTS {table}_project ON {table} (project)',
+                   f'CREATE INDEX IF NOT EXISTS {table}_species ON {table} (project, species_name)',
+                   f'CREATE INDEX IF NOT EXISTS {table}_level ON {table} (method, basis_set)',
+                   ])
+SCHEMA.append('CREATE INDEX IF NOT EXISTS completed_jobs_status ON completed_jobs (ess_status, server_status)')
+
+_local = threading.local()
+
+
+def get_connection(path: Optional[str] = None) -> sqlite3.Connection:
+    """
+    Get a connection to the job ledger, creating the ledger if needed.
+    Connections are cached per thread and process, since SQLite connections cannot be shared between them.
+
+    Args:
+        path (str, optional): The path to the ledger file, ``LEDGER_PATH`` is used if not given.
+
+    Returns:
+        sqlite3.Connection: The connection, in autocommit mode (transactions are explicitly opened).
+    """
+    path = path or LEDGER_PATH
+    connections = getattr(_local, 'connections', None)
+    if connections is None:
+        connections = _local.connections = dict()
+    key = (os.getpid(), path)
+    if key not in connections:
+        connection = sqlite3.connect(path, timeout=60, isolation_level=None)
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute('PRAGMA synchronous=NORMAL')
+        initialize_ledger(connection, import_csv_files_from=arc_path if path == LEDGER_PATH else None)
+        connections[key] = connection
+    return connections[key]
+
+
+@contextmanager
+def transaction(connection: sqlite3.Connection):
+    """
+    A context manager for a write transaction, which is rolled back if an exception is raised.
+    The write lock is acquired upfront, so concurrent ARC processes are serialized.
+
+    Args:
+        connection (sqlite3.Connection): The ledger connection.
+    """
+    connection.execute('BEGIN IMMEDIATE')
+    try:
+        yield connection
+    except BaseException:
+        connection.execute('ROLLBACK')
+        raise
+    connection.execute('COMMIT')
+
+
+def initialize_ledger(connection: sqlite3.Connection,
+                      import_csv_files_from: Optional[str] = None,
+                      ):
+    """
+    Create the ledger tables and indices if they do not exist.
+    If the ledger is new, the initiated and completed jobs CSV files of previous ARC versions are imported.
+
+    Args:
+        connection (sqlite3.Connection): The ledger connection.
+        import_csv_files_from (str, optional): The directory of the CSV files to import if the ledger is new.
+    """
+    with transaction(connection):
+        for statement in SCHEMA:
+            connection.execute(statement)
+        created = connection.execute("SELECT value FROM metadata WHERE key = 'created'").fetchone() is None
+        if created:
+            connection.execute("INSERT INTO metadata (key, value) VALUES ('created', CURRENT_TIMESTAMP)")
+            if import_csv_files_from is not None:
+                import_csv_files(connection=connection,
+                                 initiated_csv_path=os.path.join(import_csv_files_from, 'initiated_jobs.csv'),
+                                 completed_csv_path=os.path.join(import_csv_files_from, 'completed_jobs.csv'),
+                                 )
+
+
+def import_csv_files(connection: sqlite3.Connection,
+                     initiated_csv_path: Optional[str] = None,
+                     completed_csv_path: Optional[str] = None,
+                     ) -> Tuple[int, int]:
+    """
+    Import the initiated and completed jobs CSV files written by previous ARC versions into the ledger.
+    Each file is only imported once, and the job numbers allocation continues from where the CSV files left off.
+    Should be called within a transaction.
+
+    Args:
+        connection (sqlite3.Connection): The ledger connection.
+        initiated_csv_path (str, optional): The path to the initiated jobs CSV file.
+        completed_csv_path (str, optional): The path to the completed jobs CSV file.
+
+    Returns:
+        Tuple[int, int]: The numbers of imported initiated and completed jobs.
+    """
+    imported = list()
+    for csv_path, table, columns in [(initiated_csv_path, 'initiated_jobs', INITIATED_JOBS_COLUMNS),
+                                     (completed_csv_path, 'completed_jobs', COMPLETED_JOBS_COLUMNS)]:
+        rows = list()
+        metadata_key = f'imported {os.path.abspath(csv_path)}' if csv_path is not None else None
+        if csv_path is not None and os.path.isfile(csv_path) and connection.execute(
+                'SELECT value FROM metadata WHERE key = ?', (metadata_key,)).fetchone() is None:
+            with open(csv_path, 'r') as f:
+                for row in csv.reader(f, dialect='excel'):
+                    if row and row[0] != 'job_num' and len(row) == len(columns):
+                        rows.append([row_to_value(column, value) for column, value in zip(columns, row)])
+            connection.executemany(f'INSERT INTO {table} ({", ".join(columns)}) '
+                                   f'VALUES ({", ".join("?" * len(columns))})', rows)
+            connection.execute('INSERT INTO metadata (key, value) VALUES (?, CURRENT_TIMESTAMP)', (metadata_key,))
+            logger.info(f'Imported {len(rows)} jobs from {csv_path} into the ARC job ledger')
+            if table == 'initiated_jobs':
+                # previous ARC versions numbered each job by the number of rows in the file (including the header)
+                connection.execute('UPDATE job_counter SET value = MAX(value, ?) WHERE id = 0', (len(rows),))
+        imported.append(len(rows))
+    return imported[0], imported[1]
+
+
+def row_to_value(column: str, value: str):
+    """
+    Convert a value read from a jobs CSV file into a ledger value.
+
+    Args:
+        column (str): The column name.
+        value (str): The value read from the CSV file.
+
+    Returns:
+        The ledger value.
+    """
+    if column == 'is_ts':
+        return {'True': 1, 'False': 0}.get(value, value)
+    if value in ['', 'None']:
+        return None
+    return value
+
+
+def allocate_job_number(path: Optional[str] = None) -> int:
+    """
+    Atomically allocate the next job number.
+
+    Args:
+        path (str, optional): The path to the ledger file, ``LEDGER_PATH`` is used if not given.
+
+    Returns:
+        int: The job number.
+    """
+    connection = get_connection(path)
+    with transaction(connection):
+        connection.execute('UPDATE job_counter SET value = value + 1 WHERE id = 0')
+        value = connection.execute('SELECT value FROM job_counter WHERE id = 0').fetchone()[0]
+    return value % JOB_NUM_LIMIT
+
+
+def record_job(table: str,
+               job_data: dict,
+               path: Optional[str] = None,
+               ):
+    """
+    Record a job in the ledger.
+
+    Args:
+        table (str): The table to record the job in, either 'initiated_jobs' or 'completed_jobs'.
+        job_data (dict): Keys are column names (see ``INITIATED_JOBS_COLUMNS`` and ``COMPLETED_JOBS_COLUMNS``).
+        path (str, optional): The path to the ledger file, ``LEDGER_PATH`` is used if not given.
+    """
+    columns = {'initiated_jobs': INITIATED_JOBS_COLUMNS, 'completed_jobs': COMPLETED_JOBS_COLUMNS}[table]
+    values = [job_data.get(column) for column in columns]
+    connection = get_connection(path)
+    with transaction(connection):
+        connection.execute(f'INSERT INTO {table} ({", ".join(columns)}) VALUES ({", ".join("?" * len(columns))})',
+                           values)
+
+
+def get_project_of_job(job_num: int,
+                       path: Optional[str] = None,
+                       ) -> Optional[str]:
+    """
+    Get the project of the most recently initiated job with a certain job number.
+
+    Args:
+        job_num (int): The job number.
+        path (str, optional): The path to the ledger file, ``LEDGER_PATH`` is used if not given.
+
+    Returns:
+        Optional[str]: The project name, ``None`` if the job number was not found.
+    """
+    row = get_connection(path).execute('SELECT project FROM initiated_jobs WHERE job_num = ? ORDER BY id DESC LIMIT 1',
+                                       (job_num,)).fetchone()
+    return row[0] if row is not None else None
+
+
+def get_project_job_nums(project: str,
+                         path: Optional[str] = None,
+                         ) -> List[int]:
+    """
+    Get the numbers of all jobs initiated for a project.
+
+    Args:
+        project (str): The project name.
+        path (str, optional): The path to the ledger file, ``LEDGER_PATH`` is used if not given.
+
+    Returns:
+        List[int]: The job numbers.
+    """
+    rows = get_connection(path).execute('SELECT job_num FROM initiated_jobs WHERE project = ? ORDER BY id',
+                                        (project,)).fetchall()
+    return [row[0] for row in rows]
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""
+This module contains unit tests for the arc.job.ledger module
+"""
+
+import csv
+import os
+import shutil
+import threading
+import unittest
+
+import arc.job.ledger as ledger
+from arc.common import arc_path
+
+
+class TestJobLedger(unittest.TestCase):
+    """
+    Contains unit tests for the job ledger functions
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        A method that is run before all unit tests in this class.
+        """
+        cls.directory = os.path.join(arc_path, 'arc', 'testing', 'job_ledger_test_delete_after_usage')
+        if not os.path.isdir(cls.directory):
+            os.makedirs(cls.directory)
+
+    def test_allocate_job_number(self):
+        """Test atomically allocating job numbers"""
+        path = os.path.join(self.directory, 'allocate.db')
+        self.assertEqual(ledger.allocate_job_number(path=path), 1)
+        self.assertEqual(ledger.allocate_job_number(path=path), 2)
+        job_nums = list()
+
+        def allocate():
+            for _ in range(50):
+                job_nums.append(ledger.allocate_job_number(path=path))
+
+        threads = [threading.Thread(target=allocate) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(sorted(job_nums), list(range(3, 203)))
+
+    def test_record_job(self):
+        """Test recording jobs and querying them"""
+        path = os.path.join(self.directory, 'record.db')
+        job_data = {'job_num': 7, 'project': 'project_1', 'species_name': 'H2O', 'conformer': '-', 'is_ts': False,
+                    'charge': 0, 'multiplicity': 1, 'job_type': 'opt', 'job_name': 'opt_a7', 'server': 'local',
+                    'software': 'gaussian', 'memory': 14, 'method': 'wb97xd', 'basis_set': 'def2tzvp'}
+        ledger.record_job(table='initiated_jobs', job_data=job_data, path=path)
+        ledger.record_job(table='initiated_jobs', job_data=dict(job_data, job_num=8, project='project_2'), path=path)
+        ledger.record_job(table='completed_jobs', job_data=dict(job_data, server_status='done', ess_status='done'),
+                          path=path)
+        self.assertEqual(ledger.get_project_of_job(job_num=7, path=path), 'project_1')
+        self.assertIsNone(ledger.get_project_of_job(job_num=9, path=path))
+        self.assertEqual(ledger.get_project_job_nums(project='project_2', path=path), [8])
+        rows = ledger.get_connection(path).execute(
+            'SELECT species_name, is_ts, ess_status FROM completed_jobs').fetchall()
+        self.assertEqual(rows, [('H2O', 0, 'done')])
+
+    def test_import_csv_files(self):
+        """Test importing the jobs CSV files of previous ARC versions"""
+        path = os.path.join(self.directory, 'import.db')
+        initiated_csv_path = os.path.join(self.directory, 'initiated_jobs.csv')
+        with open(initiated_csv_path, 'w') as f:
+            writer = csv.writer(f, dialect='excel')
+            writer.writerow(ledger.INITIATED_JOBS_COLUMNS)
+            for job_num in range(1, 6):
+                writer.writerow([job_num, 'project_1', 'H2O', '-', 'False', 0, 1, 'opt', f'opt_a{job_num}', 'None',
+                                 'local', 'gaussian', 14, 'wb97xd', 'def2tzvp', ''])
+        connection = ledger.get_connection(path)
+        with ledger.transaction(connection):
+            imported = ledger.import_csv_files(connection=connection, initiated_csv_path=initiated_csv_path,
+                                               completed_csv_path=os.path.join(self.directory, 'missing.csv'))
+        self.assertEqual(imported, (5, 0))
+        with ledger.transaction(connection):
+            imported = ledger.import_csv_files(connection=connection, initiated_csv_path=initiated_csv_path)
+        self.assertEqual(imported, (0, 0))  # already imported
+        self.assertEqual(ledger.get_project_job_nums(project='project_1', path=path), [1, 2, 3, 4, 5])
+        self.assertEqual(ledger.allocate_job_number(path=path), 6)
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        A function that is run ONCE after all unit tests in this class.
+        """
+        shutil.rmtree(cls.directory, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    unittest.main(testRunner=unittest.TextTestRunner(verbosity=2))
@@ -134,6 +134,22 @@ def check_job_status(job_id):
     return check_job_status_in_stdout(job_id=job_id, stdout=stdout, server=server)
 
 
+def check_jobs_status(job_ids: List[int]) -> dict:
+    """
+    Check the status of several jobs using a single queue query.
+
+    Args:
+        job_ids (List[int]): The job IDs.
+
+    Returns: dict
+        Keys are job IDs, values are statuses (`running`, `errored`, or `done`).
+    """
+    server = 'local'
+    cmd = check_status_command[servers[server]['cluster_soft']] + ' -u $USER'
+    stdout = execute_command(cmd)[0]
+    return {job_id: check_job_status_in_stdout(job_id=job_id, stdout=stdout, server=server) for job_id in job_ids}
+
+
 def delete_job(job_id):
     """
     Deletes a running job
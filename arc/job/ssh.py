@@ -9,6 +9,7 @@ Todo:
 import datetime
 import logging
 import os
+import threading
 import time
 from typing import Any, Callable, List, Optional, Tuple, Union
 
@@ -26,28 +27,28 @@ check_status_command, delete_command, list_available_nodes_command, servers, sub
     settings['check_status_command'], settings['delete_command'], settings['list_available_nodes_command'], \
     settings['servers'], settings['submit_command'], settings['submit_filename'],
 
+KEEPALIVE_INTERVAL = 60  # seconds between SSH keepalive packets sent on idle pooled sessions
+
+# Sessions are pooled per server and per thread, so that consecutive ``with SSHClient(server)`` blocks in a thread
+# (e.g., submitting or harvesting many jobs) reuse a single SSH handshake and SFTP channel. Paramiko SFTP clients
+# are not thread-safe, hence a session is never shared by threads (e.g., jobs are submitted from a thread pool).
+_connection_pool = dict()  # keys are (server name, thread ID) tuples, values are (sftp, ssh) tuples
+_connection_pool_lock = threading.Lock()
+
 
 def check_connections(function: Callable[..., Any]) -> Callable[..., Any]:
     """
     A decorator designned for ``SSHClient``to check SSH connections before
-    calling a method. It first checks if ``self._ssh`` is available in a 
-    SSHClient instance and then checks if you can send ``ls`` and get response
-    to make sure your connection still alive. If connection is bad, this
-    decorator will reconnect the SSH channel, to avoid connection related
-    error when executing the method.
+    calling a method. It first checks if ``self._ssh`` is available in a
+    SSHClient instance and then checks that the underlying transport is still active
+    (dead sessions are detected by the keepalive packets sent on the transport).
+    If connection is bad, this decorator will reconnect the SSH channel, to avoid
+    connection related error when executing the method.
     """
     def decorator(*args, **kwargs) -> Any:
         self = args[0]
-        if self._ssh is None:  # not sure if some status may cause False
-            self._sftp, self._ssh = self.connect()
-        # test connection, reference:
-        # https://stackoverflow.com/questions/
-        # 20147902/how-to-know-if-a-paramiko-ssh-channel-is-disconnected
-        # According to author, maybe no better way
-        try:
-            self._ssh.exec_command('ls')
-        except Exception as e:
-            logger.debug(f'The connection is no longer valid. {e}')
+        if self._ssh is None or not is_session_active(self._ssh):
+            logger.debug(f'The connection to {self.server} is no longer valid, reconnecting.')
             self.connect()
         return function(*args, **kwargs)
     return decorator
@@ -66,7 +67,10 @@ class SSHClient(object):
         un (str): The username to use on the server.
         key (str): A path to a file containing the RSA SSH private key to the server.
         _ssh (paramiko.SSHClient): A high-level representation of a session with an SSH server.
-        _sftp (paramiko.sftp_client.SFTPClient): SFTP client used to perform remote file operations. 
+        _sftp (paramiko.sftp_client.SFTPClient): SFTP client used to perform remote file operations.
+
+    Sessions are taken from a per-server and per-thread pool and are kept alive when the client is closed,
+    call ``close_all_connections()`` to terminate them.
     """
     def __init__(self, server: str = '') -> None:
         if server == '':
@@ -120,7 +124,8 @@ class SSHClient(object):
             _, stdout, stderr = self._ssh.exec_command(command)
         except Exception as e:  # SSHException: Timeout opening channel.
             logger.debug(f'ssh timed-out in the first trial. Got: {e}')
-            try:  # try again
+            try:  # try again on a fresh session
+                self.connect(force=True)
                 _, stdout, stderr = self._ssh.exec_command(command)
             except Exception as e:
                 logger.debug(f'ssh timed-out after two trials. Got: {e}')
@@ -236,6 +241,25 @@ class SSHClient(object):
             return f'errored: {stderr}'
         return check_job_status_in_stdout(job_id=job_id, stdout=stdout, server=self.server)
 
+    def check_jobs_status(self, job_ids: List[int]) -> dict:
+        """
+        Check the status of several jobs using a single queue query.
+
+        Args:
+            job_ids (List[int]): The jobs' IDs.
+
+        Returns: dict
+            Keys are job IDs, values are statuses (`running`, `errored`, `done`, or `errored: ...`).
+        """
+        cmd = check_status_command[servers[self.server]['cluster_soft']] + ' -u $USER'
+        stdout, stderr = self._send_command_to_server(cmd)
+        if stderr:
+            logger.info('\n\n')
+            logger.error(f'Could not check status of jobs {job_ids} due to {stderr}')
+            return {job_id: f'errored: {stderr}' for job_id in job_ids}
+        return {job_id: check_job_status_in_stdout(job_id=job_id, stdout=stdout, server=self.server)
+                for job_id in job_ids}
+
     def delete_job(self, job_id: Union[int, str]) -> None:
         """
         Deletes a running job.
@@ -321,9 +345,36 @@ class SSHClient(object):
             raise ValueError(f'Unrecognized cluster software: {cluster_soft}')
         return job_status, job_id
 
-    def connect(self) -> None:
+    def connect(self, force: bool = False) -> None:
         """
         A modulator function for _connect(). Connect to the server.
+        An active session to the server pooled by the current thread is reused if available,
+        otherwise a new session is opened and pooled for the current thread.
+
+        Args:
+            force (bool, optional): Whether to discard the session pooled by the current thread (if any)
+                                    and open a new one. Sessions of other threads are not affected.
+
+        Raises:
+            ServerError: Cannot connect to the server with maximum times to try
+        """
+        key = (self.server, threading.get_ident())
+        with _connection_pool_lock:
+            pooled_session = _connection_pool.pop(key, None)
+        if pooled_session is not None:
+            if not force and is_session_active(pooled_session[1]):
+                self._sftp, self._ssh = pooled_session
+                with _connection_pool_lock:
+                    _connection_pool[key] = pooled_session
+                return
+            close_session(*pooled_session)
+        self._connect_with_retries()
+        with _connection_pool_lock:
+            _connection_pool[key] = (self._sftp, self._ssh)
+
+    def _connect_with_retries(self) -> None:
+        """
+        Open a new session to the server, retrying for up to 24 hours.
 
         Raises:
             ServerError: Cannot connect to the server with maximum times to try
@@ -368,17 +419,20 @@ class SSHClient(object):
             # This sometimes gives "SSHException: Error reading SSH protocol banner[Error 104] Connection reset by peer"
             # Try again:
             ssh.connect(hostname=self.address, username=self.un, banner_timeout=200)
+        ssh.get_transport().set_keepalive(KEEPALIVE_INTERVAL)
         sftp = ssh.open_sftp()
         return sftp, ssh
 
     def close(self) -> None:
         """
-        Close the connection to paramiko SSHClient and SFTPClient
+        Release the connection to paramiko SSHClient and SFTPClient.
+        A pooled session is kept alive for reuse, any other session is closed.
         """
-        if self._sftp is not None:
-            self._sftp.close()
-        if self._ssh is not None:
-            self._ssh.close()
+        with _connection_pool_lock:
+            is_pooled = any(ssh is self._ssh for _, ssh in _connection_pool.values())
+        if not is_pooled:
+            close_session(self._sftp, self._ssh)
+        self._sftp, self._ssh = None, None
 
     @check_connections
     def get_last_modified_time(self, 
@@ -463,7 +517,8 @@ class SSHClient(object):
         command = f'chmod {recursive} {mode} {path}'
         self._send_command_to_server(command, remote_path)
 
-    def _check_file_exists(self, 
+    @check_connections
+    def _check_file_exists(self,
                            remote_file_path: str,
                            ) -> bool:
         """
@@ -475,10 +530,12 @@ class SSHClient(object):
         Returs:
             bool: If the file exists on the remote server. ``True`` if exist.
         """
-        command = f'[ -f "{remote_file_path}" ] && echo "File exists"'
-        stdout, _ = self._send_command_to_server(command, remote_path='')
-        if len(stdout):
-            return True
+        try:
+            # an SFTP stat is cheaper than opening a new channel to execute a shell test
+            self._sftp.stat(remote_file_path)
+        except IOError:
+            return False
+        return True
 
     def _check_dir_exists(self,
                           remote_dir_path: str,
@@ -511,6 +568,52 @@ class SSHClient(object):
                 f'Cannot create dir for the given path ({remote_path}).\nGot: {stderr}')
 
 
+def is_session_active(ssh: Optional[paramiko.SSHClient]) -> bool:
+    """
+    Check whether an SSH session is still usable without sending a command to the server.
+
+    Args:
+        ssh (paramiko.SSHClient): The SSH session to check.
+
+    Returns:
+        bool: Whether the session's transport is active.
+    """
+    if ssh is None:
+        return False
+    transport = ssh.get_transport()
+    return transport is not None and transport.is_active()
+
+
+def close_session(sftp: Optional[paramiko.sftp_client.SFTPClient],
+                  ssh: Optional[paramiko.SSHClient],
+                  ) -> None:
+    """
+    Close an SFTP client and its SSH session, ignoring errors of already broken sessions.
+
+    Args:
+        sftp (paramiko.sftp_client.SFTPClient): The SFTP client to close.
+        ssh (paramiko.SSHClient): The SSH session to close.
+    """
+    for client in [sftp, ssh]:
+        if client is not None:
+            try:
+                client.close()
+            except Exception as e:
+                logger.debug(f'Could not close an SSH session. Got: {e}')
+
+
+def close_all_connections() -> None:
+    """
+    Close the SSH sessions pooled by all threads.
+    Should only be called when no other thread is using an SSH session (e.g., once all jobs were submitted).
+    """
+    with _connection_pool_lock:
+        pooled_sessions = list(_connection_pool.values())
+        _connection_pool.clear()
+    for sftp, ssh in pooled_sessions:
+        close_session(sftp, ssh)
+
+
 def check_job_status_in_stdout(job_id: int, 
                                stdout: Union[list, str],
                                server: str,
@@ -573,5 +676,6 @@ def delete_all_arc_jobs(server_list: list,
     for server in server_list:
         with SSHClient(server) as ssh:
             ssh.delete_jobs(jobs)
+    close_all_connections()
     if server_list:
         print('\ndone.')
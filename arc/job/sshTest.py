@@ -5,8 +5,11 @@
 This module contains unit tests of the arc.job.ssh module
 """
 
+import threading
 import unittest
 
+import paramiko
+
 import arc.job.ssh as ssh
 
 
@@ -29,6 +32,60 @@ class TestSSH(unittest.TestCase):
         status3 = ssh.check_job_status_in_stdout(job_id=582600, stdout=stdout, server='server1')
         self.assertEqual(status3, 'done')
 
+    def test_is_session_active(self):
+        """Test checking whether an SSH session is usable"""
+        self.assertFalse(ssh.is_session_active(None))
+        self.assertFalse(ssh.is_session_active(paramiko.SSHClient()))  # never connected
+
+    def test_connection_pool(self):
+        """Test that pooled SSH sessions are reused within a thread and never shared by threads"""
+        opened_sessions, active_sessions = list(), set()
+
+        def connect(client):
+            session = (paramiko.SSHClient(), paramiko.SSHClient())
+            opened_sessions.append(session)
+            active_sessions.add(session[1])
+            return session
+
+        def close_session(sftp, ssh_):
+            active_sessions.discard(ssh_)
+
+        def use_sessions(thread_sessions, force=False):
+            for _ in range(2):
+                with ssh.SSHClient('server1') as client:
+                    if force:
+                        client.connect(force=True)
+                    thread_sessions.append(client._ssh)
+
+        connect_, is_session_active, close_session_ = ssh.SSHClient._connect, ssh.is_session_active, ssh.close_session
+        ssh.SSHClient._connect = connect
+        ssh.is_session_active = lambda ssh_: ssh_ in active_sessions
+        ssh.close_session = close_session
+        try:
+            main_thread_sessions, other_thread_sessions = list(), list()
+            use_sessions(main_thread_sessions)
+            self.assertEqual(len(opened_sessions), 1)
+            self.assertIs(main_thread_sessions[0], main_thread_sessions[1])  # reused in the same thread
+            thread = threading.Thread(target=use_sessions, args=(other_thread_sessions, True))
+            thread.start()
+            thread.join()
+            # the other thread opened its own session and reconnected it twice
+            self.assertEqual(len(opened_sessions), 4)
+            self.assertNotIn(main_thread_sessions[0], other_thread_sessions)
+            self.assertIsNot(other_thread_sessions[0], other_thread_sessions[1])
+            # forcing a reconnection in the other thread did not close the session of the main thread
+            self.assertIn(main_thread_sessions[0], active_sessions)
+            self.assertEqual(len(active_sessions), 2)
+            self.assertEqual(len(ssh._connection_pool), 2)
+            use_sessions(main_thread_sessions)
+            self.assertIs(main_thread_sessions[2], main_thread_sessions[0])
+            ssh.close_all_connections()
+            self.assertEqual(ssh._connection_pool, dict())
+            self.assertEqual(active_sessions, set())
+        finally:
+            ssh.SSHClient._connect, ssh.is_session_active = connect_, is_session_active
+            ssh.close_session = close_session_
+            ssh._connection_pool.clear()
 
 if __name__ == '__main__':
     unittest.main(testRunner=unittest.TextTestRunner(verbosity=2))
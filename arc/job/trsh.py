@@ -2,17 +2,18 @@
 The ARC troubleshooting ("trsh") module
 """
 
+import itertools
 import math
 import os
 from typing import Optional, Tuple, Union
 
 import numpy as np
-import pandas as pd
 
-from arc.common import (check_torsion_change,
+from arc.common import (ReversedFileLines,
                         determine_ess,
                         estimate_orca_mem_cpu_requirement,
                         get_logger,
+                        get_torsion_changes,
                         is_same_pivot,
                         is_same_sequence_sublist,
                         is_str_float,
@@ -30,10 +31,11 @@ from arc.species.converter import (ics_to_scan_constraints,
                                    )
 from arc.species.species import determine_rotor_symmetry
 from arc.species.vectors import calculate_dihedral_angle, calculate_distance
-from arc.parser import (parse_1d_scan_coords,
+from arc.parser import (cached_by_file,
+                        parse_1d_scan_coords,
                         parse_normal_displacement_modes,
                         parse_scan_args,
-                        parse_scan_conformers,
+                        parse_scan_conformers_matrix,
                         parse_xyz_from_file,
                         )
 
@@ -47,6 +49,7 @@ delete_command, inconsistency_ab, inconsistency_az, maximum_barrier, preserve_pa
                                settings['rotor_scan_resolution'], settings['servers'], settings['submit_filename']
 
 
+@cached_by_file
 def determine_ess_status(output_path: str,
                          species_label: str,
                          job_type: str,
@@ -70,346 +73,349 @@ def determine_ess_status(output_path: str,
         software = determine_ess(log_file=output_path)
 
     keywords, error, = list(), ''
-    with open(output_path, 'r') as f:
-        lines = f.readlines()
-        if len(lines) < 5:
-            return 'errored', ['NoOutput'], 'Log file could not be read', ''
-        forward_lines = tuple(lines)
-        reverse_lines = tuple(lines[::-1])
-
-        if software == 'gaussian':
-            for line in forward_lines[-1:-20:-1]:
-                if 'Normal termination' in line:
-                    return 'done', list(), '', ''
-            for i, line in enumerate(reverse_lines):
-                if 'termination' in line:
-                    if 'l9999.exe' in line or 'link 9999' in line:
-                        keywords = ['Unconverged', 'GL9999']  # GL stand for Gaussian Link
-                        error = 'Unconverged'
-                    elif 'l101.exe' in line:
-                        keywords = ['InputError', 'GL101']
-                        error = 'The blank line after the coordinate section is missing, ' \
-                                'or charge/multiplicity was not specified correctly.'
-                    elif 'l103.exe' in line:
-                        keywords = ['InternalCoordinateError', 'GL103']
-                        error = 'Internal coordinate error'
-                    elif 'l108.exe' in line:
-                        keywords = ['InputError', 'GL108']
-                        error = 'There are two blank lines between z-matrix and ' \
-                                'the variables, expected only one.'
-                    elif 'l202.exe' in line:
-                        keywords = ['OptOrientation', 'GL202']
-                        error = 'During the optimization process, either the standard ' \
-                                'orientation or the point group of the molecule has changed.'
-                    elif 'l301.exe' in line:
-                        keywords = ['GL301']
-                    elif 'l401.exe' in line:
-                        keywords = ['GL401']
-                    elif 'l502.exe' in line:
-                        keywords = ['SCF', 'GL502']
-                        error = 'Unconverged SCF.'
-                    elif 'l716.exe' in line:
-                        keywords = ['ZMat', 'GL716']
-                        error = 'Angle in z-matrix outside the allowed range 0 < x < 180.'
-                    elif 'l906.exe' in line:
-                        keywords = ['MP2', 'GL906']
-                        error = 'The MP2 calculation has failed. It may be related to pseudopotential. ' \
-                                'Basis sets (CEP-121G*) that are used with polarization functions, ' \
-                                'where no polarization functions actually exist.'
-                    elif 'l913.exe' in line:
-                        keywords = ['MaxOptCycles', 'GL913']
-                        error = 'Maximum optimization cycles reached.'
-                    if any([keyword in ['GL301', 'GL401'] for keyword in keywords]):
-                        additional_info = forward_lines[len(forward_lines) - i - 2]
-                        if 'No data on chk file' in additional_info \
-                                or 'Basis set data is not on the checkpoint file' in additional_info:
-                            keywords = ['CheckFile']
-                            error = additional_info.rstrip()
-                        elif 'GL301' in keywords:
-                            if 'Atomic number out of range for' in forward_lines[len(forward_lines) - i - 2]:
-                                keywords.append('BasisSet')
-                                error = f'The basis set {forward_lines[len(forward_lines) - i - 2].split()[6]} ' \
-                                        f'is not appropriate for the this chemistry.'
-                            else:
-                                keywords.append('InputError')
-                                error = 'Either charge, multiplicity, or basis set was not ' \
-                                        'specified correctly. Alternatively, a specified atom does not match any ' \
-                                        'standard atomic symbol.'
-                        elif 'GL401' in keywords:
+    # read the log file backwards, only as far as needed (usually just the last few lines)
+    reverse_lines = ReversedFileLines(output_path)
+    try:
+        reverse_lines[4]
+    except IndexError:
+        return 'errored', ['NoOutput'], 'Log file could not be read', ''
+
+    if software == 'gaussian':
+        for line in itertools.islice(reverse_lines, 19):
+            if 'Normal termination' in line:
+                return 'done', list(), '', ''
+        for i, line in enumerate(reverse_lines):
+            if 'termination' in line:
+                if 'l9999.exe' in line or 'link 9999' in line:
+                    keywords = ['Unconverged', 'GL9999']  # GL stand for Gaussian Link
+                    error = 'Unconverged'
+                elif 'l101.exe' in line:
+                    keywords = ['InputError', 'GL101']
+                    error = 'The blank line after the coordinate section is missing, ' \
+                            'or charge/multiplicity was not specified correctly.'
+                elif 'l103.exe' in line:
+                    keywords = ['InternalCoordinateError', 'GL103']
+                    error = 'Internal coordinate error'
+                elif 'l108.exe' in line:
+                    keywords = ['InputError', 'GL108']
+                    error = 'There are two blank lines between z-matrix and ' \
+                            'the variables, expected only one.'
+                elif 'l202.exe' in line:
+                    keywords = ['OptOrientation', 'GL202']
+                    error = 'During the optimization process, either the standard ' \
+                            'orientation or the point group of the molecule has changed.'
+                elif 'l301.exe' in line:
+                    keywords = ['GL301']
+                elif 'l401.exe' in line:
+                    keywords = ['GL401']
+                elif 'l502.exe' in line:
+                    keywords = ['SCF', 'GL502']
+                    error = 'Unconverged SCF.'
+                elif 'l716.exe' in line:
+                    keywords = ['ZMat', 'GL716']
+                    error = 'Angle in z-matrix outside the allowed range 0 < x < 180.'
+                elif 'l906.exe' in line:
+                    keywords = ['MP2', 'GL906']
+                    error = 'The MP2 calculation has failed. It may be related to pseudopotential. ' \
+                            'Basis sets (CEP-121G*) that are used with polarization functions, ' \
+                            'where no polarization functions actually exist.'
+                elif 'l913.exe' in line:
+                    keywords = ['MaxOptCycles', 'GL913']
+                    error = 'Maximum optimization cycles reached.'
+                if any([keyword in ['GL301', 'GL401'] for keyword in keywords]):
+                    additional_info = reverse_lines[i + 1]  # the preceding line in the log file
+                    if 'No data on chk file' in additional_info \
+                            or 'Basis set data is not on the checkpoint file' in additional_info:
+                        keywords = ['CheckFile']
+                        error = additional_info.rstrip()
+                    elif 'GL301' in keywords:
+                        if 'Atomic number out of range for' in additional_info:
                             keywords.append('BasisSet')
-                            error = 'The projection from the old to the new basis set has failed.'
-                elif 'Erroneous write' in line or 'Write error in NtrExt1' in line:
-                    keywords = ['DiskSpace']
-                    error = 'Ran out of disk space.'
-                    line = ''
-                elif 'NtrErr' in line:
-                    keywords = ['CheckFile']
-                    error = 'An operation on the check file was specified, but a .chk was not found or is incomplete.'
-                    line = ''
-                elif 'malloc failed' in line or 'galloc' in line:
-                    keywords = ['Memory']
-                    error = 'Memory allocation failed (did you ask for too much?)'
-                    line = ''
-                elif 'PGFIO/stdio: No such file or directory' in line:
-                    keywords = ['Scratch']
-                    error = 'Wrongly specified the scratch directory. Correct the "GAUSS_SCRDIR" ' \
-                            'variable in the submit script, it should point to an existing directory. ' \
-                            'Make sure to add "mkdir -p $GAUSS_SCRDIR" to your submit script.'
-                    line = ''
-                if 'a syntax error was detected' in line.lower():
-                    keywords = ['Syntax']
-                    error = 'There was a syntax error in the Gaussian input file. Check your Gaussian input file ' \
-                            'template under arc/job/inputs.py. Alternatively, perhaps the level of theory is not ' \
-                            'supported by Gaussian in the format it was given.'
-                    line = ''
-                if keywords:
+                            error = f'The basis set {additional_info.split()[6]} ' \
+                                    f'is not appropriate for the this chemistry.'
+                        else:
+                            keywords.append('InputError')
+                            error = 'Either charge, multiplicity, or basis set was not ' \
+                                    'specified correctly. Alternatively, a specified atom does not match any ' \
+                                    'standard atomic symbol.'
+                    elif 'GL401' in keywords:
+                        keywords.append('BasisSet')
+                        error = 'The projection from the old to the new basis set has failed.'
+            elif 'Erroneous write' in line or 'Write error in NtrExt1' in line:
+                keywords = ['DiskSpace']
+                error = 'Ran out of disk space.'
+                line = ''
+            elif 'NtrErr' in line:
+                keywords = ['CheckFile']
+                error = 'An operation on the check file was specified, but a .chk was not found or is incomplete.'
+                line = ''
+            elif 'malloc failed' in line or 'galloc' in line:
+                keywords = ['Memory']
+                error = 'Memory allocation failed (did you ask for too much?)'
+                line = ''
+            elif 'PGFIO/stdio: No such file or directory' in line:
+                keywords = ['Scratch']
+                error = 'Wrongly specified the scratch directory. Correct the "GAUSS_SCRDIR" ' \
+                        'variable in the submit script, it should point to an existing directory. ' \
+                        'Make sure to add "mkdir -p $GAUSS_SCRDIR" to your submit script.'
+                line = ''
+            if 'a syntax error was detected' in line.lower():
+                keywords = ['Syntax']
+                error = 'There was a syntax error in the Gaussian input file. Check your Gaussian input file ' \
+                        'template under arc/job/inputs.py. Alternatively, perhaps the level of theory is not ' \
+                        'supported by Gaussian in the format it was given.'
+                line = ''
+            if keywords:
+                break
+        error = error if error else 'Gaussian job terminated for an unknown reason. ' \
+                                    'It is possible there was a server node failure.'
+        keywords = keywords if keywords else ['Unknown']
+        return 'errored', keywords, error, line
+
+    elif software == 'qchem':
+        done = False
+        for line in reverse_lines:
+            if 'Thank you very much for using Q-Chem' in line:
+                done = True
+                # if this is an opt job, we must also check that the max num of cycles hasn't been reached,
+                # so don't break yet
+                if 'opt' not in job_type and 'conformer' not in job_type and 'ts' not in job_type:
                     break
-            error = error if error else 'Gaussian job terminated for an unknown reason. ' \
-                                        'It is possible there was a server node failure.'
-            keywords = keywords if keywords else ['Unknown']
-            return 'errored', keywords, error, line
-
-        elif software == 'qchem':
-            done = False
-            for line in reverse_lines:
-                if 'Thank you very much for using Q-Chem' in line:
-                    done = True
-                    # if this is an opt job, we must also check that the max num of cycles hasn't been reached,
-                    # so don't break yet
-                    if 'opt' not in job_type and 'conformer' not in job_type and 'ts' not in job_type:
-                        break
-                elif 'SCF failed' in line:
-                    keywords = ['SCF']
-                    error = 'SCF failed'
+            elif 'SCF failed' in line:
+                keywords = ['SCF']
+                error = 'SCF failed'
+                break
+            elif 'error' in line and 'DIIS' not in line:
+                # these are **normal** lines that we should not capture:
+                # "SCF converges when DIIS error is below 1.0E-08", or
+                # "Cycle       Energy         DIIS Error"
+                keywords = ['SCF', 'DIIS']
+                error = 'SCF failed'
+                break
+            elif 'Invalid charge/multiplicity combination' in line:
+                raise SpeciesError(f'The multiplicity and charge combination for species '
+                                   f'{species_label} are wrong.')
+            if 'opt' in job_type or 'conformer' in job_type or 'ts' in job_type:
+                if 'MAXIMUM OPTIMIZATION CYCLES REACHED' in line:
+                    keywords = ['MaxOptCycles']
+                    error = 'Maximum optimization cycles reached.'
                     break
-                elif 'error' in line and 'DIIS' not in line:
-                    # these are **normal** lines that we should not capture:
-                    # "SCF converges when DIIS error is below 1.0E-08", or
-                    # "Cycle       Energy         DIIS Error"
-                    keywords = ['SCF', 'DIIS']
-                    error = 'SCF failed'
+                elif 'OPTIMIZATION CONVERGED' in line and done:  # `done` should already be assigned
+                    done = True
                     break
-                elif 'Invalid charge/multiplicity combination' in line:
-                    raise SpeciesError(f'The multiplicity and charge combination for species '
-                                       f'{species_label} are wrong.')
-                if 'opt' in job_type or 'conformer' in job_type or 'ts' in job_type:
-                    if 'MAXIMUM OPTIMIZATION CYCLES REACHED' in line:
-                        keywords = ['MaxOptCycles']
-                        error = 'Maximum optimization cycles reached.'
-                        break
-                    elif 'OPTIMIZATION CONVERGED' in line and done:  # `done` should already be assigned
-                        done = True
-                        break
-            if done:
-                return 'done', keywords, '', ''
-            error = error if error else 'QChem job terminated for an unknown reason.'
-            keywords = keywords if keywords else ['Unknown']
-            return 'errored', keywords, error, line
-
-        elif software == 'orca':
-            done = False
-            for i, line in enumerate(reverse_lines):
-                if 'ORCA TERMINATED NORMALLY' in line:
-                    # not done yet, things can still go wrong (e.g., SCF energy might blow up)
-                    for j, info in enumerate(forward_lines):
+        if done:
+            return 'done', keywords, '', ''
+        error = error if error else 'QChem job terminated for an unknown reason.'
+        keywords = keywords if keywords else ['Unknown']
+        return 'errored', keywords, error, line
+
+    elif software == 'orca':
+        done = False
+        for i, line in enumerate(reverse_lines):
+            if 'ORCA TERMINATED NORMALLY' in line:
+                # not done yet, things can still go wrong (e.g., SCF energy might blow up)
+                with open(output_path, 'r') as f:
+                    for info in f:
                         if 'Starting incremental Fock matrix formation' in info:
-                            while not is_str_float(forward_lines[j + 1].split()[1]):
-                                j += 1
-                            scf_energy_initial_iteration = float(forward_lines[j + 1].split()[1])
+                            for info_ in f:
+                                if is_str_float(info_.split()[1]):
+                                    scf_energy_initial_iteration = float(info_.split()[1])
+                                    break
                         if 'TOTAL SCF ENERGY' in info:
                             # this value is very close to the scf energy at last iteration and is easier to parse
-                            scf_energy_last_iteration = float(forward_lines[j + 3].split()[3])
+                            next(f), next(f)
+                            scf_energy_last_iteration = float(next(f).split()[3])
                             break
-                    # Check if final SCF energy makes sense
-                    scf_energy_ratio = scf_energy_last_iteration / scf_energy_initial_iteration
-                    scf_energy_ratio_threshold = 2  # it is rare that this ratio > 2
-                    if scf_energy_ratio > scf_energy_ratio_threshold:
-                        keywords = ['SCF']
-                        error = f'The SCF energy seems diverged during iterations. SCF energy after initial ' \
-                                f'iteration is {scf_energy_initial_iteration}. SCF energy after final iteration ' \
-                                f'is {scf_energy_last_iteration}. The ratio between final and initial SCF energy ' \
-                                f'is {scf_energy_ratio}. This ratio is greater than the default threshold of ' \
-                                f'{scf_energy_ratio_threshold}. Please consider using alternative methods or larger ' \
-                                f'basis sets.'
-                        line = ''
-                    else:
-                        done = True
-                    break
-                elif 'ORCA finished by error termination in SCF' in line:
+                # Check if final SCF energy makes sense
+                scf_energy_ratio = scf_energy_last_iteration / scf_energy_initial_iteration
+                scf_energy_ratio_threshold = 2  # it is rare that this ratio > 2
+                if scf_energy_ratio > scf_energy_ratio_threshold:
                     keywords = ['SCF']
-                    for j, info in enumerate(reverse_lines):
-                        if 'Please increase MaxCore' in info:
-                            try:
-                                # e.g., Please increase MaxCore to more than: 289 MB
-                                estimated_mem = float(info.split()[-2]) + 500
-                            except ValueError:
-                                error = f'Insufficient Orca job memory. ARC will estimate the amount of memory ' \
-                                        f'required.'
-                                keywords.append('Memory')
-                                break
-                            keywords.append('Memory')
-                            # e.g., Error (ORCA_SCF): Not enough memory available!
-                            line = reverse_lines[j + 3].rstrip()
-                            error = f'Orca suggests to increase per cpu core memory to {estimated_mem} MB.'
-                            break
-                    else:
-                        error = f'SCF error in Orca.'
-                    break
-                elif 'ORCA finished by error termination in MDCI' in line:
-                    keywords = ['MDCI']
-                    for j, info in enumerate(reverse_lines):
-                        if 'Please increase MaxCore' in info:
-                            estimated_mem_list = []
-                            for message in reverse_lines:
-                                if 'Please increase MaxCore' in message:
-                                    try:
-                                        # e.g., Please increase MaxCore - by at least ( 9717.9 MB)
-                                        # This message appears multiple times, and suggest different memory at each
-                                        # appearance. Need to store all suggested memory values, and then pick the
-                                        # largest one. This error msg appears in Orca version 4.2.x
-                                        estimated_mem = math.ceil(float(message.split()[-2]))
-                                    except ValueError:
-                                        # e.g., Please increase MaxCore
-                                        # In old Orca versions, there is no indication on the minimum memory requirement
-                                        error = f'Insufficient Orca job memory. ARC will estimate the amount of ' \
-                                                f'memory required.'
-                                        break
-                                    estimated_mem_list.append(estimated_mem)
-                            if estimated_mem_list:
-                                estimated_max_mem = np.max(estimated_mem_list) + 500
-                                error = f'Orca suggests to increase per cpu core memory to {estimated_max_mem} MB.'
+                    error = f'The SCF energy seems diverged during iterations. SCF energy after initial ' \
+                            f'iteration is {scf_energy_initial_iteration}. SCF energy after final iteration ' \
+                            f'is {scf_energy_last_iteration}. The ratio between final and initial SCF energy ' \
+                            f'is {scf_energy_ratio}. This ratio is greater than the default threshold of ' \
+                            f'{scf_energy_ratio_threshold}. Please consider using alternative methods or larger ' \
+                            f'basis sets.'
+                    line = ''
+                else:
+                    done = True
+                break
+            elif 'ORCA finished by error termination in SCF' in line:
+                keywords = ['SCF']
+                for j, info in enumerate(reverse_lines):
+                    if 'Please increase MaxCore' in info:
+                        try:
+                            # e.g., Please increase MaxCore to more than: 289 MB
+                            estimated_mem = float(info.split()[-2]) + 500
+                        except ValueError:
+                            error = f'Insufficient Orca job memory. ARC will estimate the amount of memory ' \
+                                    f'required.'
                             keywords.append('Memory')
-                            line = info
-                            break
-                        elif 'parallel calculation exceeds number of pairs' in info:
-                            try:
-                                # e.g., Error (ORCA_MDCI): Number of processes (16) in parallel calculation exceeds
-                                # number of pairs (10) - error msg in Orca version 4.2.x
-                                max_core = int(info.split()[-1].strip('()'))
-                                error = f'Orca cannot utilize cpu cores more than electron pairs in a molecule. The ' \
-                                        f'maximum number of cpu cores can be used for this job is {max_core}.'
-                            except ValueError:
-                                # e.g., Error (ORCA_MDCI): Number of processes in parallel calculation exceeds
-                                # number of pairs - error msg in Orca version 4.1.x
-                                error = f'Orca cannot utilize cpu cores more than electron pairs in a molecule. ARC ' \
-                                        f'will estimate the number of cpu cores needed based on the number of heavy ' \
-                                        f'atoms in the molecule.'
-                            keywords.append('cpu')
-                            line = info
                             break
-                    else:
-                        error = f'MDCI error in Orca. Assuming memory allocation error.'
                         keywords.append('Memory')
-                    break
-                elif 'Error : multiplicity' in line:
-                    keywords = ['Input']
-                    error = f'The multiplicity and charge combination for species {species_label} are wrong.'
-                    break
-                elif 'UNRECOGNIZED OR DUPLICATED KEYWORD' in line:
-                    # e.g., UNRECOGNIZED OR DUPLICATED KEYWORD(S) IN SIMPLE INPUT LINE
-                    keywords = ['Syntax']
-                    line = reverse_lines[i - 1]  # this line in the log file suggests which keyword might be problematic
-                    problematic_keyword = line.split()[0]
-                    error = f'There was keyword syntax error in the Orca input file. In particular, keywords ' \
-                            f'{problematic_keyword} can either be duplicated or illegal. Please check your Orca ' \
-                            f'input file template under arc/job/inputs.py. Alternatively, perhaps the level of ' \
-                            f'theory or the job option is not supported by Orca in the format it was given.'
-                    break
-                elif 'There are no CABS' in line:
-                    # e.g., ** There are no CABS   basis functions on atom number   2 (Br) **
-                    keywords = ['Basis']
-                    problematic_atom = line.split()[-2].strip('()')
-                    error = f'There was a basis set error in the Orca input file. In particular, basis for atom type ' \
-                            f'{problematic_atom} is missing. Please check if specified basis set supports this atom.'
-                    break
-                elif 'This wavefunction IS NOT FULLY CONVERGED!' in line:
-                    keywords = ['Convergence']
-                    error = f'Specified wavefunction method is not converged. Please restart calculation with larger ' \
-                            f'max iterations or with different convergence flags.'
-                    break
-                elif 'ORCA finished by error termination in GTOInt' in line:
-                    error = f'GTOInt error in Orca. Assuming memory allocation error.'
-                    keywords.append('GTOInt')
+                        # e.g., Error (ORCA_SCF): Not enough memory available!
+                        line = reverse_lines[j + 3].rstrip()
+                        error = f'Orca suggests to increase per cpu core memory to {estimated_mem} MB.'
+                        break
+                else:
+                    error = f'SCF error in Orca.'
+                break
+            elif 'ORCA finished by error termination in MDCI' in line:
+                keywords = ['MDCI']
+                for j, info in enumerate(reverse_lines):
+                    if 'Please increase MaxCore' in info:
+                        estimated_mem_list = []
+                        for message in reverse_lines:
+                            if 'Please increase MaxCore' in message:
+                                try:
+                                    # e.g., Please increase MaxCore - by at least ( 9717.9 MB)
+                                    # This message appears multiple times, and suggest different memory at each
+                                    # appearance. Need to store all suggested memory values, and then pick the
+                                    # largest one. This error msg appears in Orca version 4.2.x
+                                    estimated_mem = math.ceil(float(message.split()[-2]))
+                                except ValueError:
+                                    # e.g., Please increase MaxCore
+                                    # In old Orca versions, there is no indication on the minimum memory requirement
+                                    error = f'Insufficient Orca job memory. ARC will estimate the amount of ' \
+                                            f'memory required.'
+                                    break
+                                estimated_mem_list.append(estimated_mem)
+                        if estimated_mem_list:
+                            estimated_max_mem = np.max(estimated_mem_list) + 500
+                            error = f'Orca suggests to increase per cpu core memory to {estimated_max_mem} MB.'
+                        keywords.append('Memory')
+                        line = info
+                        break
+                    elif 'parallel calculation exceeds number of pairs' in info:
+                        try:
+                            # e.g., Error (ORCA_MDCI): Number of processes (16) in parallel calculation exceeds
+                            # number of pairs (10) - error msg in Orca version 4.2.x
+                            max_core = int(info.split()[-1].strip('()'))
+                            error = f'Orca cannot utilize cpu cores more than electron pairs in a molecule. The ' \
+                                    f'maximum number of cpu cores can be used for this job is {max_core}.'
+                        except ValueError:
+                            # e.g., Error (ORCA_MDCI): Number of processes in parallel calculation exceeds
+                            # number of pairs - error msg in Orca version 4.1.x
+                            error = f'Orca cannot utilize cpu cores more than electron pairs in a molecule. ARC ' \
+                                    f'will estimate the number of cpu cores needed based on the number of heavy ' \
+                                    f'atoms in the molecule.'
+                        keywords.append('cpu')
+                        line = info
+                        break
+                else:
+                    error = f'MDCI error in Orca. Assuming memory allocation error.'
                     keywords.append('Memory')
-                    break
-            if done:
-                return 'done', keywords, '', ''
-            error = error if error else 'Orca job terminated for an unknown reason.'
-            keywords = keywords if keywords else ['Unknown']
-            return 'errored', keywords, error, line
-
-        elif software == 'molpro':
-            for line in reverse_lines:
-                if 'molpro calculation terminated' in line.lower() \
-                        or 'variable memory released' in line.lower():
-                    return 'done', list(), '', ''
-                elif 'No convergence' in line:
-                    keywords = ['Unconverged']
-                    error = 'Unconverged'
-                    break
-                elif 'A further' in line and 'Mwords of memory are needed' in line and 'Increase memory to' in line:
-                    # e.g.: `A further 246.03 Mwords of memory are needed for the triples to run.
-                    # Increase memory to 996.31 Mwords.` (w/o the line break)
-                    keywords = ['Memory']
-                    error = f'Additional memory required: {line.split()[2]} MW'
-                    break
-                elif 'insufficient memory available - require' in line:
-                    # e.g.: `insufficient memory available - require              228765625  have
-                    #        62928590
-                    #        the request was for real words`
-                    # add_mem = (float(line.split()[-2]) - float(prev_line.split()[0])) / 1e6
-                    keywords = ['Memory']
-                    error = f'Additional memory required: {float(line.split()[-2]) / 1e6} MW'
-                    break
-                elif 'Basis library exhausted' in line:
-                    # e.g.:
-                    # ` SETTING BASIS          =    6-311G**
-                    #
-                    #
-                    #  Using spherical harmonics
-                    #
-                    #  LIBRARY EXHAUSTED
-                    #   Searching for I  S 6-311G
-                    #   Library contains the following bases:
-                    #  ? Error
-                    #  ? Basis library exhausted
-                    #  ? The problem occurs in Binput`
-                    keywords = ['BasisSet']
-                    basis_set = None
-                    for line0 in reverse_lines:
-                        if 'SETTING BASIS' in line0:
-                            basis_set = line0.split()[-1]
-                    error = f'Unrecognized basis set {basis_set}'
-                    break
-                elif 'the problem occurs' in line:
-                    keywords = ['Unknown']
-                    error = 'Unknown'
-                    break
-            error = error if error else 'Molpro job terminated for an unknown reason.'
-            keywords = keywords if keywords else ['Unknown']
-            return 'errored', keywords, error, line
-
-        elif software == 'terachem':
-            for line in lines[::-1]:
-                if 'Job finished:' in line:
-                    return 'done', list(), '', ''
-                elif 'incorrect method' in line.lower():
-                    keywords = ['IncorrectMethod']
-                    error = 'incorrect method'
-                    break
-                elif 'error: ' in line.lower():
-                    # e.g.: "ERROR: Closed shell calculations can't have spin multiplicity 0."
-                    keywords = ['Unknown']  # Todo
-                    error = line.split()[1]
-                    break
-                elif 'unable to open file: ' in line.lower() and 'basis' in line.lower():
-                    # e.g.: "Unable to open file /<..path..>/TeraChem/basis/6-311++g[d,p]"
-                    keywords = ['MissingBasisSet']
-                    error = 'Could not find basis set {0} in TeraChem'.format(
-                             line.split('/')[-1].replace('[', '(').replace(']', ')'))
-            error = error if error else 'TeraChem job terminated for an unknown reason.'
-            keywords = keywords if keywords else ['Unknown']
-            return 'errored', keywords, error, line
+                break
+            elif 'Error : multiplicity' in line:
+                keywords = ['Input']
+                error = f'The multiplicity and charge combination for species {species_label} are wrong.'
+                break
+            elif 'UNRECOGNIZED OR DUPLICATED KEYWORD' in line:
+                # e.g., UNRECOGNIZED OR DUPLICATED KEYWORD(S) IN SIMPLE INPUT LINE
+                keywords = ['Syntax']
+                line = reverse_lines[i - 1]  # this line in the log file suggests which keyword might be problematic
+                problematic_keyword = line.split()[0]
+                error = f'There was keyword syntax error in the Orca input file. In particular, keywords ' \
+                        f'{problematic_keyword} can either be duplicated or illegal. Please check your Orca ' \
+                        f'input file template under arc/job/inputs.py. Alternatively, perhaps the level of ' \
+                        f'theory or the job option is not supported by Orca in the format it was given.'
+                break
+            elif 'There are no CABS' in line:
+                # e.g., ** There are no CABS   basis functions on atom number   2 (Br) **
+                keywords = ['Basis']
+                problematic_atom = line.split()[-2].strip('()')
+                error = f'There was a basis set error in the Orca input file. In particular, basis for atom type ' \
+                        f'{problematic_atom} is missing. Please check if specified basis set supports this atom.'
+                break
+            elif 'This wavefunction IS NOT FULLY CONVERGED!' in line:
+                keywords = ['Convergence']
+                error = f'Specified wavefunction method is not converged. Please restart calculation with larger ' \
+                        f'max iterations or with different convergence flags.'
+                break
+            elif 'ORCA finished by error termination in GTOInt' in line:
+                error = f'GTOInt error in Orca. Assuming memory allocation error.'
+                keywords.append('GTOInt')
+                keywords.append('Memory')
+                break
+        if done:
+            return 'done', keywords, '', ''
+        error = error if error else 'Orca job terminated for an unknown reason.'
+        keywords = keywords if keywords else ['Unknown']
+        return 'errored', keywords, error, line
+
+    elif software == 'molpro':
+        for line in reverse_lines:
+            if 'molpro calculation terminated' in line.lower() \
+                    or 'variable memory released' in line.lower():
+                return 'done', list(), '', ''
+            elif 'No convergence' in line:
+                keywords = ['Unconverged']
+                error = 'Unconverged'
+                break
+            elif 'A further' in line and 'Mwords of memory are needed' in line and 'Increase memory to' in line:
+                # e.g.: `A further 246.03 Mwords of memory are needed for the triples to run.
+                # Increase memory to 996.31 Mwords.` (w/o the line break)
+                keywords = ['Memory']
+                error = f'Additional memory required: {line.split()[2]} MW'
+                break
+            elif 'insufficient memory available - require' in line:
+                # e.g.: `insufficient memory available - require              228765625  have
+                #        62928590
+                #        the request was for real words`
+                # add_mem = (float(line.split()[-2]) - float(prev_line.split()[0])) / 1e6
+                keywords = ['Memory']
+                error = f'Additional memory required: {float(line.split()[-2]) / 1e6} MW'
+                break
+            elif 'Basis library exhausted' in line:
+                # e.g.:
+                # ` SETTING BASIS          =    6-311G**
+                #
+                #
+                #  Using spherical harmonics
+                #
+                #  LIBRARY EXHAUSTED
+                #   Searching for I  S 6-311G
+                #   Library contains the following bases:
+                #  ? Error
+                #  ? Basis library exhausted
+                #  ? The problem occurs in Binput`
+                keywords = ['BasisSet']
+                basis_set = None
+                for line0 in reverse_lines:
+                    if 'SETTING BASIS' in line0:
+                        basis_set = line0.split()[-1]
+                error = f'Unrecognized basis set {basis_set}'
+                break
+            elif 'the problem occurs' in line:
+                keywords = ['Unknown']
+                error = 'Unknown'
+                break
+        error = error if error else 'Molpro job terminated for an unknown reason.'
+        keywords = keywords if keywords else ['Unknown']
+        return 'errored', keywords, error, line
+
+    elif software == 'terachem':
+        for line in reverse_lines:
+            if 'Job finished:' in line:
+                return 'done', list(), '', ''
+            elif 'incorrect method' in line.lower():
+                keywords = ['IncorrectMethod']
+                error = 'incorrect method'
+                break
+            elif 'error: ' in line.lower():
+                # e.g.: "ERROR: Closed shell calculations can't have spin multiplicity 0."
+                keywords = ['Unknown']  # Todo
+                error = line.split()[1]
+                break
+            elif 'unable to open file: ' in line.lower() and 'basis' in line.lower():
+                # e.g.: "Unable to open file /<..path..>/TeraChem/basis/6-311++g[d,p]"
+                keywords = ['MissingBasisSet']
+                error = 'Could not find basis set {0} in TeraChem'.format(
+                         line.split('/')[-1].replace('[', '(').replace(']', ')'))
+        error = error if error else 'TeraChem job terminated for an unknown reason.'
+        keywords = keywords if keywords else ['Unknown']
+        return 'errored', keywords, error, line
 
 
 def trsh_negative_freq(label: str,
@@ -1238,12 +1244,12 @@ def scan_quality_check(label: str,
     actions = dict()
     used_methods = used_methods or list()
     energies = np.array(energies, np.float64)
-    scan_conformers = None
+    ic_info, ic_values = None, None
 
     # Check if the conformer based method is valid
     if log_file:
         try:
-            scan_conformers = parse_scan_conformers(log_file)
+            ic_info, ic_values = parse_scan_conformers_matrix(log_file)
         except NotImplementedError:
             message = f'Rotor scan quality check using conformer internal coordinates ' \
                       f'has not been implemented for current ESS. Using PES curve based ' \
@@ -1251,17 +1257,18 @@ def scan_quality_check(label: str,
             logger.warning(message)
 
     # 1. Check based on intermediate conformers
-    if scan_conformers is not None and (species is None or not species.is_ts):
-        bonds = scan_conformers[scan_conformers['type'] == 'R']
-        angles = scan_conformers[scan_conformers['type'] == 'A']
-        non_scan_rotor = scan_conformers[(scan_conformers['type'] == 'D') \
-                                         & (scan_conformers['scan'] == False)]
-        scan_rotor = scan_conformers[scan_conformers['scan'] == True]
+    if ic_info is not None and (species is None or not species.is_ts):
+        # the internal coordinates (rows of ic_values) of each type
+        ic_types, ic_scan = np.array(ic_info['type']), np.array(ic_info['scan'], dtype=bool)
+        bonds = np.flatnonzero(ic_types == 'R')
+        angles = np.flatnonzero(ic_types == 'A')
+        non_scan_rotor = np.flatnonzero((ic_types == 'D') & ~ic_scan)
+        scan_rotor = np.flatnonzero(ic_scan)
 
         # 1.1 Find significant changes of internal coordinates
         expected_step_num = int(360 / scan_res)
-        # 5 below refers to type, atoms, scan, redundant and initial guess
-        actual_step_num = scan_conformers.shape[1] - 5
+        # the first column is the initial guess
+        actual_step_num = ic_values.shape[1] - 1
         step_num = min(expected_step_num, actual_step_num)
         changed_ic_dict = {}
         for index_1 in range(step_num + 1):
@@ -1277,45 +1284,43 @@ def scan_quality_check(label: str,
                 # When the scan is not finished as desired
                 continue
             # Identify changes by type
-            bond_change = (2 * (bonds[index_1] - bonds[index_2]) /
-                          (bonds[index_1] + bonds[index_2])).abs() > preserve_params_in_scan['bond']
-            angle_change = (angles[index_1] - angles[index_2]).abs() > preserve_params_in_scan['angle']
-            non_scan_rotor_change = check_torsion_change(torsions=non_scan_rotor,
-                                                         index_1=index_1,
-                                                         index_2=index_2,
-                                                         threshold=preserve_params_in_scan['dihedral'])
-            scan_rotor_change = check_torsion_change(torsions=scan_rotor,
-                                                     index_1=index_1,
-                                                     index_2=index_2,
-                                                     threshold=preserve_params_in_scan['dihedral'],
-                                                     delta=delta)
+            bonds_1, bonds_2 = ic_values[bonds, index_1], ic_values[bonds, index_2]
+            bond_change = np.abs(2 * (bonds_1 - bonds_2) / (bonds_1 + bonds_2)) > preserve_params_in_scan['bond']
+            angle_change = np.abs(ic_values[angles, index_1] - ic_values[angles, index_2]) \
+                > preserve_params_in_scan['angle']
+            non_scan_rotor_change = get_torsion_changes(torsions_1=ic_values[non_scan_rotor, index_1],
+                                                        torsions_2=ic_values[non_scan_rotor, index_2],
+                                                        threshold=preserve_params_in_scan['dihedral'])
+            scan_rotor_change = get_torsion_changes(torsions_1=ic_values[scan_rotor, index_1],
+                                                    torsions_2=ic_values[scan_rotor, index_2],
+                                                    threshold=preserve_params_in_scan['dihedral'],
+                                                    delta=delta)
             # Summarize changes
-            change_sum = pd.concat([bond_change,
-                                    angle_change,
-                                    non_scan_rotor_change,
-                                    scan_rotor_change])
-            changed_ics = change_sum[change_sum == True].index.to_list()
+            changed_rows = np.concatenate([bonds[bond_change],
+                                           angles[angle_change],
+                                           non_scan_rotor[non_scan_rotor_change],
+                                           scan_rotor[scan_rotor_change]])
             # Save changes in the format of {conformer index: problematic ics}
-            if changed_ics:
+            if changed_rows.size:
                 invalidate = True
-                changed_ic_dict.update({index_1: changed_ics})
+                changed_ic_dict.update({index_1: [ic_info['label'][row] for row in changed_rows]})
 
         # 1.2 Check broken bond and any lowest conformation
         # Exclude those with broken bonds (different species)
         # Better to just freeze the broken bond when bond changing first happens
+        rows = {ic_label: row for row, ic_label in enumerate(ic_info['label'])}
         for conf_index, ics in changed_ic_dict.items():
             # R(X,Y) refers to bonds in ics
-            broken_bonds = [ic for ic in ics if 'R' in ic]
+            broken_bonds = [rows[ic] for ic in ics if 'R' in ic]
             if broken_bonds and conf_index != 0:
                 # Find the bond that changes the most, to avoid accompanied changes, like C-O transforms
                 # to C=O, which we don't want to freeze. If other bonds need to be frozen as well,
                 # it can be done in the following troubleshooting.
-                bonds = scan_conformers.loc[broken_bonds, :]
-                bond_change = (2 * (bonds[conf_index] - bonds[conf_index - 1]) /
-                              (bonds[conf_index] + bonds[conf_index - 1])).abs()
-                broken_bond_label = bond_change.sort_values().index[-1]  # the largest change
+                bonds_1, bonds_2 = ic_values[broken_bonds, conf_index], ic_values[broken_bonds, conf_index - 1]
+                bond_change = np.abs(2 * (bonds_1 - bonds_2) / (bonds_1 + bonds_2))
+                broken_bond_row = broken_bonds[int(np.argmax(bond_change))]  # the largest change
                 # Freeze the bonds, no further freezing other ics to prevent over-constraining
-                broken_bonds = [scan_conformers['atoms'][broken_bond_label]]
+                broken_bonds = [ic_info['atoms'][broken_bond_row]]
                 invalidate = True
                 invalidation_reason = f'Bond ({broken_bonds}) broke during the scan.'
                 message = f'Rotor scan of {label} between pivots {pivots} has broken bonds: ' \
@@ -1351,7 +1356,7 @@ def scan_quality_check(label: str,
                       f'and final conformers.\nInternal coordinates {changed_ic_dict[0]} are different. ' \
                       f'ARC will attempt to troubleshoot this rotor scan.'
             logger.error(message)
-            actions = {'freeze': [scan_conformers['atoms'][ic_label]
+            actions = {'freeze': [ic_info['atoms'][rows[ic_label]]
                                   for ic_label in changed_ic_dict[0]]}
             return invalidate, invalidation_reason, message, actions
         elif len(changed_ic_dict) > 0:
@@ -1371,7 +1376,7 @@ def scan_quality_check(label: str,
             # list(set()) is used to remove duplicate labels
             changed_ic_label = list(set(changed_ic_label))
             logger.error(message)
-            actions = {'freeze': [scan_conformers['atoms'][ic_label]
+            actions = {'freeze': [ic_info['atoms'][rows[ic_label]]
                                   for ic_label in changed_ic_label]}
             return invalidate, invalidation_reason, message, actions
 
@@ -0,0 +1,43 @@
+"""
+A module for lazily loading the submodules of ARC's packages.
+
+Package ``__init__`` files use ``lazy_package_attributes()`` to define the module-level ``__getattr__`` and ``__dir__``
+functions (PEP 562), so that importing a package (e.g., ``import arc``) does not import its submodules and their heavy
+dependencies (RMG, Arkane, RDKit, OpenBabel, matplotlib, pandas, etc.) until one of them is first accessed.
+This module should only import modules from the Python standard library.
+"""
+
+import importlib
+import sys
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+def lazy_package_attributes(package: str,
+                            submodules: List[str],
+                            attributes: Optional[Dict[str, str]] = None,
+                            ) -> Tuple[Callable, Callable]:
+    """
+    Get the ``__getattr__`` and ``__dir__`` functions of a package which loads its submodules on first access.
+
+    Args:
+        package (str): The name of the package, i.e., ``__name__`` in its ``__init__`` file.
+        submodules (List[str]): The names of the submodules (relative to the package) to load on first access.
+        attributes (Dict[str, str], optional): Keys are names of attributes exposed by the package,
+                                               values are the full names of the modules defining them.
+
+    Returns: Tuple[Callable, Callable]
+        The ``__getattr__`` and ``__dir__`` functions of the package.
+    """
+    attributes = attributes or dict()
+
+    def __getattr__(name: str):
+        if name in attributes:
+            return getattr(importlib.import_module(attributes[name]), name)
+        if name in submodules:
+            return importlib.import_module(f'{package}.{name}')
+        raise AttributeError(f"module '{package}' has no attribute '{name}'")
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(submodules) | set(attributes.keys()))
+
+    return __getattr__, __dir__
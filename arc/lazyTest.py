@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""
+This module contains unit tests for the arc.lazy module
+"""
+
+import subprocess
+import sys
+import unittest
+
+import arc
+import arc.species
+from arc.common import arc_path
+
+
+class TestLazy(unittest.TestCase):
+    """
+    Contains unit tests for lazily loading ARC's packages
+    """
+
+    def test_lazy_package_attributes(self):
+        """Test accessing the lazily loaded attributes of a package"""
+        self.assertIn('species', dir(arc))
+        self.assertIn('ARC', dir(arc))
+        self.assertIn('ARCSpecies', dir(arc.species))
+        from arc.species.species import ARCSpecies
+        self.assertIs(arc.species.ARCSpecies, ARCSpecies)
+        self.assertIs(arc.species.species, sys.modules['arc.species.species'])
+        with self.assertRaises(AttributeError):
+            arc.non_existing_module
+
+    def test_lightweight_imports(self):
+        """Test that importing ARC and its lightweight modules does not import heavy dependencies"""
+        code = 'import sys; import arc, arc.common, arc.job.ledger; print(" ".join(sorted(sys.modules)))'
+        modules = subprocess.run([sys.executable, '-c', code], cwd=arc_path, stdout=subprocess.PIPE,
+                                 check=True, text=True).stdout.split()
+        for module in ['arc.main', 'arc.scheduler', 'arc.species', 'arc.plotter', 'arc.processor',
+                       'arkane', 'rmgpy', 'rdkit', 'openbabel', 'matplotlib', 'pandas', 'qcelemental']:
+            self.assertNotIn(module, modules)
+        self.assertIn('arc.common', modules)
+
+
+if __name__ == '__main__':
+    unittest.main(testRunner=unittest.TextTestRunner(verbosity=2))
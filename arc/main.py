@@ -23,6 +23,7 @@ from rmgpy.species import Species
 
 import arc.rmgdb as rmgdb
 from arc.common import (VERSION,
+                        apply_restart_journal,
                         arc_path,
                         check_ess_settings,
                         get_logger,
@@ -269,6 +270,16 @@ class ARC(object):
             else os.path.join(arc_path, 'Projects', self.project)
         if not os.path.exists(self.project_directory):
             os.makedirs(self.project_directory)
+        if output is not None:
+            # restarting a project, rebuild its state from the restart snapshot and the changes journaled since
+            restart_state = apply_restart_journal(restart_dict={'output': output,
+                                                                'species': species or list(),
+                                                                'running_jobs': running_jobs or dict()},
+                                                  journal_path=os.path.join(self.project_directory,
+                                                                            'restart_journal.yml'),
+                                                  project_directory=self.project_directory)
+            output, species, running_jobs = \
+                restart_state['output'], restart_state['species'], restart_state['running_jobs']
         self.output = output
         self.standardize_output_paths()  # depends on self.project_directory
         self.running_jobs = running_jobs or dict()
@@ -1088,7 +1099,8 @@ class ARC(object):
 
     def backup_restart(self):
         """
-        Make a backup copy of the restart file if it exists (but don't save an updated one just yet)
+        Make a backup copy of the restart file and the restart journal if they exist
+        (but don't save an updated one just yet)
         """
         if os.path.isfile(os.path.join(self.project_directory, 'restart.yml')):
             if not os.path.isdir(os.path.join(self.project_directory, 'log_and_restart_archive')):
@@ -1097,6 +1109,10 @@ class ARC(object):
             restart_backup_name = 'restart.old.' + local_time + '.yml'
             shutil.copy(os.path.join(self.project_directory, 'restart.yml'),
                         os.path.join(self.project_directory, 'log_and_restart_archive', restart_backup_name))
+            if os.path.isfile(os.path.join(self.project_directory, 'restart_journal.yml')):
+                journal_backup_name = 'restart_journal.old.' + local_time + '.yml'
+                shutil.copy(os.path.join(self.project_directory, 'restart_journal.yml'),
+                            os.path.join(self.project_directory, 'log_and_restart_archive', journal_backup_name))
 
     def standardize_output_paths(self):
         """
@@ -9,7 +9,7 @@ import os
 import shutil
 import unittest
 
-from arc.common import arc_path
+from arc.common import append_to_yaml_journal, arc_path
 from arc.exceptions import InputError
 from arc.imports import settings
 from arc.main import ARC, process_adaptive_levels
@@ -192,6 +192,25 @@ class TestARC(unittest.TestCase):
         self.assertEqual(arc2.species[0].charge, 1)
         self.assertFalse(arc2.three_params)
 
+    def test_restart_journal(self):
+        """Test that restarting ARC applies the changes journaled since the last restart snapshot"""
+        project_directory = os.path.join(arc_path, 'Projects', 'arc_project_for_testing_delete_after_usage_journal')
+        append_to_yaml_journal(path=os.path.join(project_directory, 'restart_journal.yml'),
+                               content={'H2O': {'output': {'convergence': False},
+                                                'species': {'label': 'H2O', 'smiles': 'O', 'multiplicity': 1},
+                                                'running_jobs': list()},
+                                        'NH3': {'output': {'convergence': None},
+                                                'species': {'label': 'NH3', 'smiles': 'N', 'multiplicity': 1},
+                                                'running_jobs': list()}})
+        arc1 = ARC(project='arc_project_for_testing_delete_after_usage_journal',
+                   project_directory=project_directory,
+                   output={'H2O': {'convergence': None}},
+                   species=[{'label': 'H2O', 'smiles': 'O', 'multiplicity': 1}],
+                   )
+        self.assertEqual(arc1.output, {'H2O': {'convergence': False}, 'NH3': {'convergence': None}})
+        self.assertEqual([spc.label for spc in arc1.species], ['H2O', 'NH3'])
+        self.assertEqual(arc1.running_jobs, dict())
+
     def test_from_dict_specific_job(self):
         """Test the from_dict() method of ARC"""
         restart_dict = {'specific_job_type': 'bde',
@@ -425,6 +444,7 @@ class TestARC(unittest.TestCase):
         Delete all project directories created during these unit tests
         """
         projects = ['arc_project_for_testing_delete_after_usage_test_from_dict',
+                    'arc_project_for_testing_delete_after_usage_journal',
                     'arc_model_chemistry_test', 'arc_test', 'test', 'unit_test_specific_job', 'wrong']
         for project in projects:
             project_directory = os.path.join(arc_path, 'Projects', project)
@@ -2,9 +2,13 @@
 A module for parsing information from various files.
 """
 
+import copy
+import functools
+import inspect
 import os
 import re
-from typing import Dict, List, Match, Optional, Tuple, Union
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Match, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -20,7 +24,76 @@ from arc.species.converter import str_to_xyz, xyz_from_data
 
 logger = get_logger()
 
+# Parsed results are cached per file version (the file path, modification time, and size), so that an ESS output file
+# which is repeatedly checked and parsed (status, geometry, frequencies, energies, etc.) is only read once per version.
+PARSE_CACHE_SIZE = 256  # the maximal number of file versions for which parsed results are kept
+LINES_CACHE_MAX_FILE_SIZE = 100 * 1024 ** 2  # bytes, lines of larger files are never kept in memory
+_parse_cache = OrderedDict()  # keys are file versions, values are dicts of parsed results keyed by the parser call
+_lines_cache = dict()  # keys are file versions, values are lines (only the most recently read file is kept)
 
+
+def get_file_version(path: str) -> Optional[Tuple[str, int, int]]:
+    """
+    Get a key identifying the current version of a file.
+
+    Args:
+        path (str): The file path.
+
+    Returns: Optional[Tuple[str, int, int]]
+        The absolute file path, modification time in nanoseconds, and size in bytes,
+        ``None`` if the file does not exist.
+    """
+    try:
+        stat = os.stat(path)
+    except (OSError, TypeError):
+        return None
+    return os.path.abspath(path), stat.st_mtime_ns, stat.st_size
+
+
+def cached_by_file(function: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    A decorator for caching the results of a parser function per version of the parsed file.
+    The parsed file path must be the first argument of the decorated function.
+    Results are deep-copied, so callers may modify them. Exceptions are not cached.
+    """
+    signature = inspect.signature(function)
+    path_arg = next(iter(signature.parameters))
+
+    @functools.wraps(function)
+    def decorator(*args, **kwargs) -> Any:
+        bound_args = signature.bind(*args, **kwargs)
+        bound_args.apply_defaults()
+        file_version = get_file_version(bound_args.arguments[path_arg])
+        call_key = (function.__name__,) + tuple((key, val) for key, val in bound_args.arguments.items()
+                                                 if key != path_arg)
+        try:
+            hash(call_key)
+        except TypeError:
+            file_version = None
+        if file_version is None:
+            return function(*args, **kwargs)
+        if file_version in _parse_cache:
+            _parse_cache.move_to_end(file_version)
+        else:
+            _parse_cache[file_version] = dict()
+            if len(_parse_cache) > PARSE_CACHE_SIZE:
+                _parse_cache.popitem(last=False)
+        results = _parse_cache[file_version]
+        if call_key not in results:
+            results[call_key] = function(*args, **kwargs)
+        return copy.deepcopy(results[call_key])
+    return decorator
+
+
+def clear_parse_cache():
+    """
+    Clear all cached parsed results.
+    """
+    _parse_cache.clear()
+    _lines_cache.clear()
+
+
+@cached_by_file
 def parse_frequencies(path: str,
                       software: str,
                       ) -> np.ndarray:
@@ -111,6 +184,7 @@ def parse_frequencies(path: str,
     return freqs
 
 
+@cached_by_file
 def parse_normal_displacement_modes(path: str,
                                     software: Optional[str] = None,
                                     ) -> Tuple[np.ndarray, np.ndarray]:
@@ -169,6 +243,7 @@ def parse_normal_displacement_modes(path: str,
     return freqs, normal_disp_modes
 
 
+@cached_by_file
 def parse_geometry(path: str) -> Optional[Dict[str, tuple]]:
     """
     Parse the xyz geometry from an ESS log file.
@@ -208,6 +283,7 @@ def parse_geometry(path: str) -> Optional[Dict[str, tuple]]:
     return xyz_from_data(coords=coords, numbers=number)
 
 
+@cached_by_file
 def parse_t1(path: str) -> Optional[float]:
     """
     Parse the T1 parameter from a Molpro or Orca coupled cluster calculation.
@@ -229,6 +305,7 @@ def parse_t1(path: str) -> Optional[float]:
     return t1
 
 
+@cached_by_file
 def parse_e_elect(path: str,
                   zpe_scale_factor: float = 1.,
                   ) -> Optional[float]:
@@ -253,6 +330,7 @@ def parse_e_elect(path: str,
     return e_elect
 
 
+@cached_by_file
 def parse_zpe(path: str) -> Optional[float]:
     """
     Determine the calculated ZPE from a frequency output file
@@ -274,6 +352,7 @@ def parse_zpe(path: str) -> Optional[float]:
     return zpe
 
 
+@cached_by_file
 def parse_1d_scan_energies(path: str) -> Tuple[Optional[List[float]], Optional[List[float]]]:
     """
     Parse the 1D torsion scan energies from an ESS log file.
@@ -300,6 +379,7 @@ def parse_1d_scan_energies(path: str) -> Tuple[Optional[List[float]], Optional[L
     return energies, angles
 
 
+@cached_by_file
 def parse_1d_scan_coords(path: str) -> List[Dict[str, tuple]]:
     """
     Parse the 1D torsion scan coordinates from an ESS log file.
@@ -334,6 +414,7 @@ def parse_1d_scan_coords(path: str) -> List[Dict[str, tuple]]:
     return traj
 
 
+@cached_by_file
 def parse_nd_scan_energies(path: str,
                            software: Optional[str] = None,
                            return_original_dihedrals: bool = False,
@@ -516,6 +597,7 @@ def parse_nd_scan_energies(path: str,
         return results, None
 
 
+@cached_by_file
 def parse_xyz_from_file(path: str) -> Optional[Dict[str, tuple]]:
     """
     Parse xyz coordinated from:
@@ -581,6 +663,7 @@ def parse_xyz_from_file(path: str) -> Optional[Dict[str, tuple]]:
     return xyz
 
 
+@cached_by_file
 def parse_trajectory(path: str) -> List[Dict[str, tuple]]:
     """
     Parse all geometries from an xyz trajectory file or an ESS output file.
@@ -658,6 +741,7 @@ def parse_trajectory(path: str) -> List[Dict[str, tuple]]:
     return traj
 
 
+@cached_by_file
 def parse_dipole_moment(path: str) -> Optional[float]:
     """
     Parse the dipole moment in Debye from an opt job output file.
@@ -725,6 +809,7 @@ def parse_dipole_moment(path: str) -> Optional[float]:
     return dipole_moment
 
 
+@cached_by_file
 def parse_polarizability(path: str) -> Optional[float]:
     """
     Parse the polarizability from a freq job output file, returns the value in Angstrom^3.
@@ -745,9 +830,11 @@ def parse_polarizability(path: str) -> Optional[float]:
     return polarizability
 
 
-def _get_lines_from_file(path: str) -> List[str]:
+def _get_lines_from_file(path: str) -> Tuple[str, ...]:
     """
-    A helper function for getting a list of lines from a file.
+    A helper function for getting the lines of a file.
+    The lines of the most recently read file are kept, so consecutive parsers of the same file only read it once.
+    The same (immutable) lines are returned to all callers without copying them.
 
     Args:
         path (str): The file path.
@@ -755,14 +842,19 @@ def _get_lines_from_file(path: str) -> List[str]:
     Raises:
         InputError: If the file could not be read.
 
-    Returns: List[str]
+    Returns: Tuple[str, ...]
         Entries are lines from the file.
     """
-    if os.path.isfile(path):
-        with open(path, 'r') as f:
-            lines = f.readlines()
-    else:
+    file_version = get_file_version(path)
+    if file_version is None or not os.path.isfile(path):
         raise InputError(f'Could not find file {path}')
+    if file_version in _lines_cache:
+        return _lines_cache[file_version]
+    with open(path, 'r') as f:
+        lines = tuple(f.readlines())
+    _lines_cache.clear()
+    if file_version[2] <= LINES_CACHE_MAX_FILE_SIZE:
+        _lines_cache[file_version] = lines
     return lines
 
 
@@ -808,6 +900,72 @@ def process_conformers_file(conformers_path: str) -> Tuple[List[Dict[str, tuple]
     return xyzs, energies
 
 
+class _StrBlockCollector(object):
+    """
+    Collect blocks defined by a head pattern and a tail pattern from lines fed one at a time,
+    so that several kinds of blocks could be collected in a single pass over a file.
+
+    Args:
+        head_pat (str/regex): Str pattern or regular expression of the head of the block.
+        tail_pat (str/regex): Str pattern or regular expresion of the tail of the block.
+        regex (bool, optional): Use regex (True) or str pattern (False) to search.
+        tail_count (int, optional): The number of times that the tail repeats.
+        block_count (int, optional): The max number of blocks to search. -1 for any number.
+    """
+    def __init__(self,
+                 head_pat: Union[Match, str],
+                 tail_pat: Union[Match, str],
+                 regex: bool = True,
+                 tail_count: int = 1,
+                 block_count: int = 1,
+                 ):
+        self.head_pat = head_pat
+        self.tail_pat = tail_pat
+        self.regex = regex
+        self.tail_count = tail_count
+        self.block_count = block_count
+        self.blocks = list()
+        self.reading = False
+        self.tail_repeat = 0
+
+    @property
+    def done(self) -> bool:
+        """Whether enough blocks were collected"""
+        return not self.reading and len(self.blocks) == self.block_count
+
+    def search(self, pattern: Union[Match, str], line: str) -> bool:
+        """Search for a pattern in a line"""
+        return bool(re.search(pattern, line)) if self.regex else pattern in line
+
+    def feed(self, line: str):
+        """
+        Feed the next line of the file.
+
+        Args:
+            line (str): The line.
+        """
+        if self.reading:
+            self.blocks[-1].append(line)
+            if self.search(self.tail_pat, line):
+                self.tail_repeat += 1
+                # If see enough tail patterns, switch to 'search' mode
+                if self.tail_repeat == self.tail_count:
+                    self.reading = False
+        elif len(self.blocks) != self.block_count and self.search(self.head_pat, line):
+            self.tail_repeat = 0
+            self.reading = True
+            self.blocks.append([line])
+
+    def get_blocks(self) -> List[List[str]]:
+        """
+        Get the complete blocks collected so far.
+
+        Returns: List[List[str]]
+            The blocks, the last incomplete block is excluded.
+        """
+        return self.blocks[:-1] if self.reading else self.blocks
+
+
 def parse_str_blocks(file_path: str,
                      head_pat: Union[Match, str],
                      tail_pat: Union[Match, str],
@@ -834,45 +992,77 @@ def parse_str_blocks(file_path: str,
     """
     if not os.path.isfile(file_path):
         raise InputError('Could not find file {0}'.format(file_path))
+    collector = _StrBlockCollector(head_pat=head_pat, tail_pat=tail_pat, regex=regex,
+                                   tail_count=tail_count, block_count=block_count)
     with open(file_path, 'r') as f:
-        blks = []
-        # Different search mode
-        if regex:
-            def search(x, y):
-                return re.search(x, y)
-        else:
-            def search(x, y):
-                return x in y
-        # 'search' for the head or 'read' until the tail
-        mode = 'search'
-        line = f.readline()
-        while line != '':
-            if mode == 'search':
-                # Stop searching if found enough blocks
-                if (len(blks)) == block_count:
-                    break
-                # Check if matching the head pattern
-                else:
-                    match = search(head_pat, line)
-                    # Switch to 'read' mode
-                    if match:
-                        tail_repeat = 0
-                        mode = 'read'
-                        blks.append([])
-                        blks[-1].append(line)
-            elif mode == 'read':
-                blks[-1].append(line)
-                match = search(tail_pat, line)
-                if match:
-                    tail_repeat += 1
-                    # If see enough tail patterns, switch to 'search' mode
-                    if tail_repeat == tail_count:
-                        mode = 'search'
-            line = f.readline()
-        # Remove the last incomplete search
-        if len(blks) > 0 and (tail_repeat != tail_count):
-            blks.pop()
-        return blks
+        for line in f:
+            collector.feed(line)
+            if collector.done:
+                break
+    return collector.get_blocks()
+
+
+@cached_by_file
+def extract_scan_blocks(file_path: str) -> Dict[str, list]:
+    """
+    Extract the blocks needed for tabulating the internal coordinates (IC) of the intermediate conformers of a scan
+    from a Gaussian output file, all in a single pass over the file. Reading stops once the ModRedundant input
+    section, the Initial Parameters table, and the Optimized Parameters tables of all scan steps were read.
+
+    Args:
+        file_path (str): The path to a readable Gaussian output file.
+
+    Raises:
+        InputError: If the file could not be found.
+
+    Returns: Dict[str, list]
+        The extracted lines::
+
+              {'scan_args': <list, the ModRedundant input section lines (and the NAtoms line in g03)>,
+               'ic_info': <list, the rows of the Initial Parameters table>,
+               'ic_values': <list, the rows of the Optimized Parameters table of each conformer>,
+               }
+    """
+    if not os.path.isfile(file_path):
+        raise InputError(f'Could not find file {file_path}')
+    # The ModRedundant input section ends with the isotopes table in g09 and g16, and right before Berny in g03
+    scan_collector = _StrBlockCollector(head_pat='The following ModRedundant input section has been read:',
+                                        tail_pat='Isotopes and Nuclear Properties|GradGradGradGrad')
+    n_atoms_collector = _StrBlockCollector(head_pat='NAtoms=', tail_pat='One-electron integrals computed',
+                                           regex=False)
+    ic_info_collector = _StrBlockCollector(head_pat='Initial Parameters', tail_pat='-----------',
+                                           regex=False, tail_count=3)
+    ic_values_collector = _StrBlockCollector(head_pat='Optimized Parameters', tail_pat='-----------',
+                                             regex=False, tail_count=3, block_count=-1)
+    collectors = [scan_collector, n_atoms_collector, ic_info_collector, ic_values_collector]
+    scan_blk, reading = None, False
+    with open(file_path, 'r') as f:
+        for line in f:
+            # Only lines within a block or starting one are fed to the collectors
+            if not reading and 'Parameters' not in line and 'NAtoms=' not in line and 'ModRedundant' not in line:
+                continue
+            for collector in collectors:
+                collector.feed(line)
+            reading = any(collector.reading for collector in collectors)
+            if scan_blk is None and scan_collector.done:
+                scan_blk = scan_collector.get_blocks()[0]
+                if 'GradGradGradGrad' not in scan_blk[-1]:
+                    # g09, g16 (the number of atoms is given in the ModRedundant input section)
+                    scan_blk = scan_blk[1:-1]
+                    collectors.remove(n_atoms_collector)
+                ic_values_collector.block_count = get_scan_args_from_block(scan_blk)['step'] + 1
+            if all(collector.done for collector in collectors):
+                break
+    if scan_blk is None:
+        scan_blk = list()
+    elif n_atoms_collector in collectors:
+        # g03
+        scan_blk = scan_blk[1:-2] + n_atoms_collector.get_blocks()[0][:1]
+    ic_info_blocks = ic_info_collector.get_blocks()
+    return {'scan_args': scan_blk,
+            'ic_info': ic_info_blocks[0][5:-1] if ic_info_blocks else list(),
+            'ic_values': [ic_blk[5:-1] for ic_blk in ic_values_collector.get_blocks()],
+            }
 
 
 def parse_scan_args(file_path: str) -> dict:
@@ -897,38 +1087,39 @@ def parse_scan_args(file_path: str) -> dict:
                }
     """
     log = ess_factory(fullpath=file_path)
-    scan_args = {'scan': None, 'freeze': [],
-                 'step': 0, 'step_size': 0, 'n_atom': 0}
-    if isinstance(log, GaussianLog):
-        try:
-            # g09, g16
-            scan_blk = parse_str_blocks(file_path, 'The following ModRedundant input section has been read:',
-                                        'Isotopes and Nuclear Properties', regex=False)[0][1:-1]
-        except IndexError:  # Cannot find any block
-            # g03
-            scan_blk_1 = parse_str_blocks(file_path, 'The following ModRedundant input section has been read:',
-                                          'GradGradGradGrad', regex=False)[0][1:-2]
-            scan_blk_2 = parse_str_blocks(file_path, 'NAtoms=',
-                                          'One-electron integrals computed', regex=False)[0][:1]
-            scan_blk = scan_blk_1 + scan_blk_2
-        scan_pat = r'[DBA]?(\s+\d+){2,4}\s+S\s+\d+[\s\d.]+'
-        frz_pat = r'[DBA]?(\s+\d+){2,4}\s+F'
-        value_pat = r'[\d.]+'
-        for line in scan_blk:
-            if re.search(scan_pat, line.strip()):
-                values = re.findall(value_pat, line)
-                scan_len = len(values) - 2  # atom indexes + step + stepsize
-                scan_args['scan'] = [int(values[i]) for i in range(scan_len)]
-                scan_args['step'] = int(values[-2])
-                scan_args['step_size'] = float(values[-1])
-            if re.search(frz_pat, line.strip()):
-                values = re.findall(value_pat, line)
-                scan_args['freeze'].append([int(values[i]) for i in range(len(values))])
-            if 'NAtoms' in line:
-                scan_args['n_atom'] = int(line.split()[1])
-    else:
+    if not isinstance(log, GaussianLog):
         raise NotImplementedError(f'parse_scan_args() can currently only parse Gaussian output '
                                   f'files, got {log}')
+    return get_scan_args_from_block(extract_scan_blocks(file_path)['scan_args'])
+
+
+def get_scan_args_from_block(scan_blk: List[str]) -> dict:
+    """
+    Get the scan arguments from the ModRedundant input section of a Gaussian output file.
+
+    Args:
+        scan_blk (List[str]): The lines of the ModRedundant input section, and a line with the number of atoms.
+
+    Returns: dict
+        A dictionary that contains the scan arguments, see parse_scan_args().
+    """
+    scan_args = {'scan': None, 'freeze': [],
+                 'step': 0, 'step_size': 0, 'n_atom': 0}
+    scan_pat = r'[DBA]?(\s+\d+){2,4}\s+S\s+\d+[\s\d.]+'
+    frz_pat = r'[DBA]?(\s+\d+){2,4}\s+F'
+    value_pat = r'[\d.]+'
+    for line in scan_blk:
+        if re.search(scan_pat, line.strip()):
+            values = re.findall(value_pat, line)
+            scan_len = len(values) - 2  # atom indexes + step + stepsize
+            scan_args['scan'] = [int(values[i]) for i in range(scan_len)]
+            scan_args['step'] = int(values[-2])
+            scan_args['step_size'] = float(values[-1])
+        if re.search(frz_pat, line.strip()):
+            values = re.findall(value_pat, line)
+            scan_args['freeze'].append([int(values[i]) for i in range(len(values))])
+        if 'NAtoms' in line:
+            scan_args['n_atom'] = int(line.split()[1])
     return scan_args
 
 
@@ -946,57 +1137,73 @@ def parse_ic_info(file_path: str) -> pd.DataFrame:
         A DataFrame containing the information of the internal coordinates
     """
     log = ess_factory(fullpath=file_path)
-    ic_dict = {item: []
-               for item in ['label', 'type', 'atoms', 'redundant', 'scan']}
-    scan_args = parse_scan_args(file_path)
-    max_atom_ind = scan_args['n_atom']
-    if isinstance(log, GaussianLog):
-        ic_info_block = parse_str_blocks(file_path, 'Initial Parameters', '-----------', regex=False,
-                                         tail_count=3)[0][5:-1]
-        for line in ic_info_block:
-            # Line example with split() indices:
-            # 0 1     2                        3              4         5       6            7
-            # ! R1    R(1, 2)                  1.3581         calculate D2E/DX2 analytically !
-            terms = line.split()
-            ic_dict['label'].append(terms[1])
-            ic_dict['type'].append(terms[1][0])  # 'R: bond, A: angle, D: dihedral
-            atom_inds = re.split(r'[(),]', terms[2])[1:-1]
-            ic_dict['atoms'].append([int(atom_ind) for atom_ind in atom_inds])
-
-            # Identify redundant, cases like 5 atom angles or redundant atoms
-            if (ic_dict['type'][-1] == 'A' and len(atom_inds) > 3) \
-                    or (ic_dict['type'][-1] == 'R' and len(atom_inds) > 2) \
-                    or (ic_dict['type'][-1] == 'D' and len(atom_inds) > 4):
-                ic_dict['redundant'].append(True)
-            else:
-                # Sometimes, redundant atoms with weird indices are added.
-                # Reason unclear. Maybe to better define the molecule, or to
-                # solve equations more easily.
-                weird_indices = [index for index in ic_dict['atoms'][-1]
-                                 if index <= 0 or index > max_atom_ind]
-                if weird_indices:
-                    ic_dict['redundant'].append(True)
-                else:
-                    ic_dict['redundant'].append(False)
-
-            # Identify ics being scanned
-            if len(scan_args['scan']) == len(atom_inds) == 4 \
-                    and is_same_pivot(scan_args['scan'], ic_dict['atoms'][-1]):
-                ic_dict['scan'].append(True)
-            elif len(scan_args['scan']) == len(atom_inds) == 2 \
-                    and set(scan_args['scan']) == set(ic_dict['atoms'][-1]):
-                ic_dict['scan'].append(True)
-            else:
-                # Currently doesn't support scan of angles
-                ic_dict['scan'].append(False)
-    else:
+    if not isinstance(log, GaussianLog):
         raise NotImplementedError(f'parse_ic_info() can currently only parse Gaussian output '
                                   f'files, got {log}')
+    blocks = extract_scan_blocks(file_path)
+    ic_dict = get_ic_info_from_block(ic_info_block=blocks['ic_info'],
+                                     scan_args=get_scan_args_from_block(blocks['scan_args']))
     ic_info = pd.DataFrame.from_dict(ic_dict)
     ic_info = ic_info.set_index('label')
     return ic_info
 
 
+def get_ic_info_from_block(ic_info_block: List[str],
+                           scan_args: dict,
+                           ) -> Dict[str, list]:
+    """
+    Get the information of internal coordinates (ic) from the rows of the Initial Parameters table
+    of a Gaussian output file.
+
+    Args:
+        ic_info_block (List[str]): The rows of the Initial Parameters table.
+        scan_args (dict): The scan arguments, see parse_scan_args().
+
+    Returns: Dict[str, list]
+        The 'label', 'type', 'atoms', 'redundant', and 'scan' of each internal coordinate.
+    """
+    ic_dict = {item: []
+               for item in ['label', 'type', 'atoms', 'redundant', 'scan']}
+    max_atom_ind = scan_args['n_atom']
+    for line in ic_info_block:
+        # Line example with split() indices:
+        # 0 1     2                        3              4         5       6            7
+        # ! R1    R(1, 2)                  1.3581         calculate D2E/DX2 analytically !
+        terms = line.split()
+        ic_dict['label'].append(terms[1])
+        ic_dict['type'].append(terms[1][0])  # 'R: bond, A: angle, D: dihedral
+        atom_inds = re.split(r'[(),]', terms[2])[1:-1]
+        ic_dict['atoms'].append([int(atom_ind) for atom_ind in atom_inds])
+
+        # Identify redundant, cases like 5 atom angles or redundant atoms
+        if (ic_dict['type'][-1] == 'A' and len(atom_inds) > 3) \
+                or (ic_dict['type'][-1] == 'R' and len(atom_inds) > 2) \
+                or (ic_dict['type'][-1] == 'D' and len(atom_inds) > 4):
+            ic_dict['redundant'].append(True)
+        else:
+            # Sometimes, redundant atoms with weird indices are added.
+            # Reason unclear. Maybe to better define the molecule, or to
+            # solve equations more easily.
+            weird_indices = [index for index in ic_dict['atoms'][-1]
+                             if index <= 0 or index > max_atom_ind]
+            if weird_indices:
+                ic_dict['redundant'].append(True)
+            else:
+                ic_dict['redundant'].append(False)
+
+        # Identify ics being scanned
+        if len(scan_args['scan']) == len(atom_inds) == 4 \
+                and is_same_pivot(scan_args['scan'], ic_dict['atoms'][-1]):
+            ic_dict['scan'].append(True)
+        elif len(scan_args['scan']) == len(atom_inds) == 2 \
+                and set(scan_args['scan']) == set(ic_dict['atoms'][-1]):
+            ic_dict['scan'].append(True)
+        else:
+            # Currently doesn't support scan of angles
+            ic_dict['scan'].append(False)
+    return ic_dict
+
+
 def parse_ic_values(ic_block: List[str],
                     software: Optional[str] = None,
                     ) -> pd.DataFrame:
@@ -1014,23 +1221,37 @@ def parse_ic_values(ic_block: List[str],
     Returns:
         pd.DataFrame: A DataFrame containing the values of the internal coordinates
     """
-    ic_dict = {item: [] for item in ['label', 'value']}
-    if software == 'gaussian':
-        for line in ic_block:
-            # Line example with split() indices:
-            # 0 1     2                       3              4      5    6                   7
-            # ! R1    R(1,2)                  1.3602         -DE/DX =    0.0                 !
-            terms = line.split()
-            ic_dict['label'].append(terms[1])
-            ic_dict['value'].append(float(terms[3]))
-    else:
+    if software != 'gaussian':
         raise NotImplementedError(f'parse_ics() can currently only parse Gaussian output '
                                   f'files, got {software}')
+    ic_dict = get_ic_values_from_block(ic_block)
     ics = pd.DataFrame.from_dict(ic_dict)
     ics = ics.set_index('label')
     return ics
 
 
+def get_ic_values_from_block(ic_block: List[str]) -> Dict[str, list]:
+    """
+    Get the internal coordinates (ic) values from the rows of an Optimized Parameters table
+    of a Gaussian output file.
+
+    Args:
+        ic_block (List[str]): The rows of the Optimized Parameters table.
+
+    Returns: Dict[str, list]
+        The 'label' and 'value' of each internal coordinate.
+    """
+    ic_dict = {item: [] for item in ['label', 'value']}
+    for line in ic_block:
+        # Line example with split() indices:
+        # 0 1     2                       3              4      5    6                   7
+        # ! R1    R(1,2)                  1.3602         -DE/DX =    0.0                 !
+        terms = line.split()
+        ic_dict['label'].append(terms[1])
+        ic_dict['value'].append(float(terms[3]))
+    return ic_dict
+
+
 def parse_scan_conformers(file_path: str) -> pd.DataFrame:
     """
     Parse all the internal coordinates of all the scan intermediate conformers and tabulate
@@ -1047,25 +1268,61 @@ def parse_scan_conformers(file_path: str) -> pd.DataFrame:
         pd.DataFrame: a list of conformers containing the all the internal
                        coordinates information in pd.DataFrame
     """
+    ic_info, ic_values = parse_scan_conformers_matrix(file_path)
+    return scan_conformers_to_dataframe(ic_info, ic_values)
+
+
+def parse_scan_conformers_matrix(file_path: str) -> Tuple[Dict[str, list], np.ndarray]:
+    """
+    Parse all the internal coordinates of all the scan intermediate conformers into a matrix.
+    Any redundant internal coordinates are removed. Unlike parse_scan_conformers(), no DataFrame is built,
+    use scan_conformers_to_dataframe() to get one on demand.
+
+    Args:
+        file_path (str): The path to a readable output file.
+
+    Raises:
+        NotImplementedError: If files other than Gaussian log is input
+
+    Returns: Tuple[Dict[str, list], np.ndarray]
+        - The 'label', 'type', 'atoms', 'redundant', and 'scan' of the internal coordinates, indexing the matrix rows.
+        - The internal coordinate values, the rows correspond to the internal coordinates and the columns to the
+          conformers. Values of coordinates missing from the Optimized Parameters table of a conformer are NaN.
+    """
     log = ess_factory(fullpath=file_path)
-    scan_args = parse_scan_args(file_path)
-    scan_ic_info = parse_ic_info(file_path)
-    if isinstance(log, GaussianLog):
-        software = 'gaussian'
-        ic_blks = parse_str_blocks(file_path, 'Optimized Parameters', '-----------', regex=False,
-                                   tail_count=3, block_count=(scan_args['step'] + 1))
-    else:
+    if not isinstance(log, GaussianLog):
         raise NotImplementedError(f'parse_scan_conformers() can currently only parse Gaussian output '
                                   f'files, got {log}')
-    # Extract IC values for each conformer
-    conformers = []
-    for ind, ic_blk in enumerate(ic_blks):
-        ics = parse_ic_values(ic_blk[5:-1], software)
-        ics.rename(columns={'value': ind}, inplace=True)
-        conformers.append(ics)
-    # Concatenate ICs of conformers to a single table and remove redundant ICs
-    scan_conformers = pd.concat([scan_ic_info] + conformers, axis=1)
-    red_ind = scan_conformers[scan_conformers.redundant == True].index
-    if not red_ind.empty:
-        scan_conformers.drop(red_ind, inplace=True)
-    return scan_conformers
+    blocks = extract_scan_blocks(file_path)
+    ic_info = get_ic_info_from_block(ic_info_block=blocks['ic_info'],
+                                     scan_args=get_scan_args_from_block(blocks['scan_args']))
+    rows = {label: i for i, label in enumerate(ic_info['label'])}
+    ic_values = np.full((len(rows), len(blocks['ic_values'])), np.nan, dtype=np.float64)
+    for ind, ic_blk in enumerate(blocks['ic_values']):
+        ic_dict = get_ic_values_from_block(ic_blk)
+        for label, value in zip(ic_dict['label'], ic_dict['value']):
+            if label in rows:
+                ic_values[rows[label], ind] = value
+    # Remove redundant ICs
+    keep = [i for i, redundant in enumerate(ic_info['redundant']) if not redundant]
+    ic_info = {key: [val[i] for i in keep] for key, val in ic_info.items()}
+    return ic_info, ic_values[keep]
+
+
+def scan_conformers_to_dataframe(ic_info: Dict[str, list],
+                                 ic_values: np.ndarray,
+                                 ) -> pd.DataFrame:
+    """
+    Tabulate the internal coordinates of scan conformers in a single DataFrame, indexed by the coordinate labels,
+    with the 'type', 'atoms', 'redundant', and 'scan' columns followed by a column per conformer.
+
+    Args:
+        ic_info (Dict[str, list]): The internal coordinates information, see parse_scan_conformers_matrix().
+        ic_values (np.ndarray): The internal coordinate values, see parse_scan_conformers_matrix().
+
+    Returns:
+        pd.DataFrame: The internal coordinates of all conformers.
+    """
+    scan_conformers = pd.DataFrame.from_dict(ic_info).set_index('label')
+    conformers = pd.DataFrame(ic_values, index=scan_conformers.index, columns=range(ic_values.shape[1]))
+    return pd.concat([scan_conformers, conformers], axis=1)
@@ -27,6 +27,27 @@ class TestParser(unittest.TestCase):
         """
         cls.maxDiff = None
 
+    def test_cached_by_file(self):
+        """Test caching parsed results per file version"""
+        parser.clear_parse_cache()
+        path = os.path.join(arc_path, 'arc', 'testing', 'freq', 'C2H6_freq_QChem.out')
+        file_version = parser.get_file_version(path)
+        self.assertEqual(file_version[0], os.path.abspath(path))
+        self.assertEqual(file_version[2], os.path.getsize(path))
+        self.assertIsNone(parser.get_file_version('nopath'))
+
+        freqs_1 = parser.parse_frequencies(path=path, software='QChem')
+        self.assertIn(file_version, parser._parse_cache)
+        self.assertEqual(len(parser._parse_cache[file_version]), 1)
+        freqs_1[0] = 0  # modifying the returned result should not modify the cached result
+        freqs_2 = parser.parse_frequencies(path, 'QChem')  # the same call with positional arguments
+        self.assertEqual(len(parser._parse_cache[file_version]), 1)
+        self.assertAlmostEqual(freqs_2[0], 352.37)
+        parser.parse_zpe(path=path)
+        self.assertEqual(len(parser._parse_cache[file_version]), 2)
+        parser.clear_parse_cache()
+        self.assertEqual(len(parser._parse_cache), 0)
+
     def test_parse_frequencies(self):
         """Test frequency parsing"""
         no3_path = os.path.join(arc_path, 'arc', 'testing', 'freq', 'NO3_freq_QChem_fails_on_cclib.out')
@@ -535,6 +556,33 @@ H      -0.59436200   -0.94730400    0.00000000"""
         self.assertEqual(expected_conf_18, scan_conformers[18].to_list())
         self.assertEqual(expected_conf_36, scan_conformers[36].to_list())
 
+    def test_extract_scan_blocks(self):
+        """Test extracting all scan blocks in a single pass"""
+        path = os.path.join(arc_path, 'arc', 'testing', 'rotor_scans', 'H2O2.out')
+        blocks = parser.extract_scan_blocks(path)
+        self.assertEqual(blocks['scan_args'][0].split(), ['D', '3', '1', '2', '4', 'S', '36', '10.000'])
+        self.assertEqual(blocks['scan_args'][-1].split()[:2], ['NAtoms=', '4'])
+        self.assertEqual(blocks['ic_info'], parser.parse_str_blocks(path, 'Initial Parameters', '-----------',
+                                                                    regex=False, tail_count=3)[0][5:-1])
+        self.assertEqual(len(blocks['ic_values']), 37)
+        self.assertEqual(blocks['ic_values'][-1][-1].split()[:4], ['!', 'D1', 'D(3,1,2,4)', '118.8736'])
+
+        path = os.path.join(arc_path, 'arc', 'testing', 'rotor_scans', 'N2O3.out')
+        scan_args = parser.get_scan_args_from_block(parser.extract_scan_blocks(path)['scan_args'])
+        self.assertEqual(scan_args, {'scan': [1, 4, 5, 3], 'freeze': [], 'step': 45, 'step_size': 8.0, 'n_atom': 5})
+
+    def test_parse_scan_conformers_matrix(self):
+        """Test parsing internal coordinates of all intermediate conformers in a scan job into a matrix"""
+        path = os.path.join(arc_path, 'arc', 'testing', 'rotor_scans', 'H2O2.out')
+        ic_info, ic_values = parser.parse_scan_conformers_matrix(path)
+        self.assertEqual(ic_info['label'], ['R1', 'R2', 'R3', 'A1', 'A2', 'D1'])
+        self.assertEqual(ic_info['scan'], [False] * 5 + [True])
+        self.assertEqual(ic_values.shape, (6, 37))
+        self.assertEqual(ic_values[:, 18].tolist(), [1.4512, 0.9688, 0.9688, 103.2599, 103.2599, -61.1264])
+        scan_conformers = parser.scan_conformers_to_dataframe(ic_info, ic_values)
+        self.assertTrue(scan_conformers.equals(parser.parse_scan_conformers(path)))
+        self.assertEqual(scan_conformers.loc['D1', 36], 118.8736)
+
 
 if __name__ == '__main__':
     unittest.main(testRunner=unittest.TextTestRunner(verbosity=2))
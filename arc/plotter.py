@@ -46,7 +46,6 @@ from arc.species.converter import (check_xyz_dict,
                                    xyz_from_data,
                                    xyz_to_str,
                                    xyz_to_x_y_z)
-from arc.species.species import ARCSpecies
 
 
 logger = get_logger()
@@ -221,6 +220,7 @@ def check_xyz_species_for_drawing(xyz=None, species=None):
     Returns: dict
         The coordinates to plot.
     """
+    from arc.species.species import ARCSpecies  # imported here to avoid circular imports
     if xyz is None and species is None:
         raise InputError('Either xyz or species must be given.')
     if species is not None and not isinstance(species, ARCSpecies):
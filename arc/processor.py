@@ -2,22 +2,32 @@
 Processor module for computing thermodynamic properties and rate coefficients using statistical mechanics.
 """
 
+import multiprocessing
 import os
 import shutil
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, as_completed, wait
+from concurrent.futures.process import BrokenProcessPool
 from enum import Enum
-from typing import Optional, Type
+from typing import Optional, Set, Tuple, Type
 
 from rmgpy.data.rmg import RMGDatabase
 
 import arc.plotter as plotter
 import arc.rmgdb as rmgdb
 from arc.common import get_logger
+from arc.imports import settings
 from arc.level import Level
 from arc.statmech.factory import statmech_factory
 
 
 logger = get_logger()
 
+statmech_processes = settings['statmech_processes']
+
+# Species attributes set while generating the statmech input files, merged back from the worker processes
+# (E0 and thermo are assigned from the statmech cache)
+STATMECH_SPECIES_ATTRIBUTES = ['arkane_file', 'external_symmetry', 'optical_isomers', 'long_thermo_description']
+
 
 class StatmechEnum(str, Enum):
     """
@@ -50,6 +60,7 @@ def process_arc_project(thermo_adapter: str,
                         rmg_database: Optional[RMGDatabase] = None,
                         compare_to_rmg: bool = True,
                         three_params: bool = True,
+                        num_processes: Optional[int] = None,
                         ) -> None:
     """
     Process an ARC project, generate thermo and rate coefficients using statistical mechanics (statmech).
@@ -80,6 +91,9 @@ def process_arc_project(thermo_adapter: str,
         three_params (bool, optional): Compute rate coefficients using the modified three-parameter Arrhenius equation
                                        format (``True``, default) or classical two-parameter Arrhenius equation format
                                        (``False``).
+        num_processes (int, optional): The number of processes used for computing statmech, thermo, and rate
+                                       coefficients. 1 to process sequentially, 0 to use all available CPUs.
+                                       Defaults to the ``statmech_processes`` setting.
     """
     T_min = T_min or (300, 'K')
     T_max = T_max or (3000, 'K')
@@ -93,6 +107,8 @@ def process_arc_project(thermo_adapter: str,
     rxns_for_kinetics_lib, unconverged_rxns = list(), list()
     species_for_transport_lib = list()
     bde_report = dict()
+    # species statmech results, shared by all adapters so each species is processed once per level
+    statmech_cache = dict()
 
     output_directory = os.path.join(project_directory, 'output')
     libraries_path = os.path.join(output_directory, 'RMG libraries')
@@ -103,6 +119,28 @@ def process_arc_project(thermo_adapter: str,
     thermo_adapter_label = StatmechEnum(thermo_adapter)
     kinetics_adapter_label = StatmechEnum(kinetics_adapter)
 
+    num_processes = statmech_processes if num_processes is None else num_processes
+    processed_rxn_labels = set()
+    if num_processes != 1 and (compute_rates or compute_thermo):
+        # compute in parallel, the sequential processing below then assigns the results from the statmech cache
+        processed_rxn_labels = compute_statmech_in_parallel(num_processes=num_processes,
+                                                            thermo_adapter_label=thermo_adapter_label,
+                                                            kinetics_adapter_label=kinetics_adapter_label,
+                                                            output_directory=output_directory,
+                                                            output_dict=output_dict,
+                                                            species_dict=species_dict,
+                                                            reactions=reactions if compute_rates else list(),
+                                                            bac_type=bac_type,
+                                                            sp_level=sp_level,
+                                                            freq_scale_factor=freq_scale_factor,
+                                                            compute_thermo=compute_thermo,
+                                                            T_min=T_min,
+                                                            T_max=T_max,
+                                                            T_count=T_count,
+                                                            three_params=three_params,
+                                                            statmech_cache=statmech_cache,
+                                                            )
+
     # 1. Rates
     if compute_rates:
         for reaction in reactions:
@@ -123,6 +161,7 @@ def process_arc_project(thermo_adapter: str,
                                                             sp_level=sp_level,
                                                             freq_scale_factor=freq_scale_factor,
                                                             species=species,
+                                                            statmech_cache=statmech_cache,
                                                             )
                         statmech_adapter.compute_thermo(kinetics_flag=True)
                     else:
@@ -143,8 +182,10 @@ def process_arc_project(thermo_adapter: str,
                                                         T_max=T_max,
                                                         T_count=T_count,
                                                         three_params=three_params,
+                                                        statmech_cache=statmech_cache,
                                                         )
-                    statmech_adapter.compute_high_p_rate_coefficient()
+                    if reaction.label not in processed_rxn_labels:
+                        statmech_adapter.compute_high_p_rate_coefficient()
                     if reaction.kinetics is not None:
                         rxns_for_kinetics_lib.append(reaction)
                     else:
@@ -168,6 +209,7 @@ def process_arc_project(thermo_adapter: str,
                                                     sp_level=sp_level,
                                                     freq_scale_factor=freq_scale_factor,
                                                     species=species,
+                                                    statmech_cache=statmech_cache,
                                                     )
                 statmech_adapter.compute_thermo(kinetics_flag=False, e0_only=species.e0_only)
                 if species.thermo is not None:
@@ -228,6 +270,237 @@ def process_arc_project(thermo_adapter: str,
     clean_output_directory(project_directory)
 
 
+def compute_statmech_in_parallel(num_processes: int,
+                                 thermo_adapter_label: str,
+                                 kinetics_adapter_label: str,
+                                 output_directory: str,
+                                 output_dict: dict,
+                                 species_dict: dict,
+                                 reactions: list,
+                                 bac_type: Optional[str],
+                                 sp_level: Optional[Level],
+                                 freq_scale_factor: float,
+                                 compute_thermo: bool,
+                                 T_min: tuple,
+                                 T_max: tuple,
+                                 T_count: int,
+                                 three_params: bool,
+                                 statmech_cache: dict,
+                                 ) -> Set[str]:
+    """
+    Compute species statmech and thermo, and reaction rate coefficients, in a pool of local processes.
+    The statmech of each species runs in a single worker, and the rate coefficient of a reaction is computed as soon
+    as the statmech of all of its reactants and products is available. Species results are stored in
+    ``statmech_cache``, and rate coefficients are merged into the reaction objects. Calculations that fail here are
+    left for the sequential processing.
+
+    Args:
+        num_processes (int): The number of worker processes, 0 to use all available CPUs.
+        thermo_adapter_label (str): The statmech adapter for calculating thermodynamic data.
+        kinetics_adapter_label (str): The statmech adapter for calculating rate coefficients.
+        output_directory (str): The path to the ARC project output directory.
+        output_dict (dict): Keys are labels, values are output file paths.
+        species_dict (dict): Keys are labels, values are ARCSpecies objects.
+        reactions (list): The ARCReaction objects to compute rate coefficients for.
+        bac_type (str): The bond additivity correction type used for thermo, ``None`` to not use BAC.
+        sp_level (Level): The level of theory used for energy corrections.
+        freq_scale_factor (float): The harmonic frequencies scaling factor.
+        compute_thermo (bool): Whether to compute thermodynamic properties for the species.
+        T_min (tuple): The minimum temperature for kinetics computations, e.g., (500, 'K').
+        T_max (tuple): The maximum temperature for kinetics computations, e.g., (3000, 'K').
+        T_count (int): The number of temperature points between ``T_min`` and ``T_max``.
+        three_params (bool): Whether to use the modified three-parameter Arrhenius equation format.
+        statmech_cache (dict): The species statmech cache to populate.
+
+    Returns:
+        Set[str]: Labels of the reactions whose rate coefficients were computed.
+    """
+    adapter_kwargs = {'output_directory': output_directory,
+                      'output_dict': output_dict,
+                      'sp_level': sp_level,
+                      'freq_scale_factor': freq_scale_factor,
+                      }
+    rate_species, pending_reactions = dict(), list()
+    for reaction in reactions:
+        rxn_species = get_unique_reaction_species(reaction)
+        if output_dict[reaction.ts_label]['convergence'] \
+                and all(output_dict[species.label]['convergence'] for species in rxn_species):
+            pending_reactions.append(reaction)
+            rate_species.update({species.label: species for species in rxn_species})
+    thermo_species = [species for species in species_dict.values()
+                      if compute_thermo and (species.compute_thermo or species.e0_only)
+                      and output_dict[species.label]['convergence']]
+    if bac_type is None and thermo_adapter_label == kinetics_adapter_label:
+        # the rates statmech of these species is also their thermo
+        thermo_species = [species for species in thermo_species if species.label not in rate_species]
+    if not rate_species and not thermo_species:
+        return set()
+    logger.info(f'Computing statmech in parallel for {len(set(rate_species) | {spc.label for spc in thermo_species})} '
+                f'species and {len(pending_reactions)} reactions')
+
+    processed_rxn_labels, rate_cache_entries = set(), dict()
+    try:
+        # a forkserver (rather than forking this multi-threaded process) avoids deadlocks in the workers
+        with ProcessPoolExecutor(max_workers=num_processes or None,
+                                 mp_context=multiprocessing.get_context('forkserver')) as executor:
+
+            def submit_thermo(spc):
+                return executor.submit(compute_species_statmech, thermo_adapter_label,
+                                       dict(adapter_kwargs, bac_type=bac_type), spc, False, spc.e0_only)
+
+            species_futures = dict()
+            for species in rate_species.values():
+                future = executor.submit(compute_species_statmech, kinetics_adapter_label,
+                                         dict(adapter_kwargs, bac_type=None), species, True, False)
+                species_futures[future] = (species, True)
+            delayed_thermo_species = dict()
+            for species in thermo_species:
+                if species.label in rate_species:
+                    # both calculations write to the species arkane folder, run them one after the other
+                    delayed_thermo_species[species.label] = species
+                else:
+                    species_futures[submit_thermo(species)] = (species, False)
+
+            reaction_futures = dict()
+            while species_futures:
+                done, _ = wait(list(species_futures.keys()), return_when=FIRST_COMPLETED)
+                for future in done:
+                    species, kinetics_flag = species_futures.pop(future)
+                    if kinetics_flag and species.label in delayed_thermo_species:
+                        species_futures[submit_thermo(delayed_thermo_species.pop(species.label))] = (species, False)
+                    try:
+                        attributes, cache_entries = future.result()
+                    except BrokenProcessPool:
+                        raise
+                    except Exception as e:
+                        logger.warning(f'Could not compute statmech for species {species.label} in parallel, '
+                                       f'got:\n{e}')
+                        continue
+                    for attribute, value in attributes.items():
+                        setattr(species, attribute, value)
+                    statmech_cache.update(cache_entries)
+                    if not kinetics_flag or not cache_entries:
+                        continue
+                    rate_cache_entries[species.label] = cache_entries
+                    # compute the rate coefficients of reactions whose reactants and products are all ready
+                    for reaction in [rxn for rxn in pending_reactions
+                                     if all(spc.label in rate_cache_entries
+                                            for spc in get_unique_reaction_species(rxn))]:
+                        pending_reactions.remove(reaction)
+                        rxn_cache = {key: entry for spc in get_unique_reaction_species(reaction)
+                                     for key, entry in rate_cache_entries[spc.label].items()}
+                        reaction_future = executor.submit(compute_reaction_rate, kinetics_adapter_label,
+                                                          dict(adapter_kwargs, bac_type=None, T_min=T_min,
+                                                               T_max=T_max, T_count=T_count,
+                                                               three_params=three_params),
+                                                          reaction, species_dict[reaction.ts_label], rxn_cache)
+                        reaction_futures[reaction_future] = reaction
+
+            for future in as_completed(list(reaction_futures.keys())):
+                reaction = reaction_futures[future]
+                try:
+                    results = future.result()
+                except BrokenProcessPool:
+                    raise
+                except Exception as e:
+                    logger.warning(f'Could not compute the rate coefficient of reaction {reaction.label} in '
+                                   f'parallel, got:\n{e}')
+                    continue
+                reaction.kinetics, reaction.dh_rxn298 = results['kinetics'], results['dh_rxn298']
+                for attribute, value in results['ts_species'].items():
+                    setattr(species_dict[reaction.ts_label], attribute, value)
+                processed_rxn_labels.add(reaction.label)
+    except (BrokenProcessPool, OSError, RuntimeError) as e:
+        logger.warning(f'Could not compute statmech in parallel, processing sequentially. Got:\n{e}')
+    return processed_rxn_labels
+
+
+def get_unique_reaction_species(reaction) -> list:
+    """
+    Get the reactants and products of a reaction, each species considered once
+    (e.g., H2O that catalyzes a reaction appears both as a reactant and as a product).
+
+    Args:
+        reaction (ARCReaction): The reaction.
+
+    Returns:
+        list: Entries are ARCSpecies objects.
+    """
+    unique_species = dict()
+    for species in reaction.r_species + reaction.p_species:
+        unique_species.setdefault(species.label, species)
+    return list(unique_species.values())
+
+
+def compute_species_statmech(statmech_adapter_label: str,
+                             adapter_kwargs: dict,
+                             species,
+                             kinetics_flag: bool,
+                             e0_only: bool,
+                             ) -> Tuple[dict, dict]:
+    """
+    Compute the statmech (and thermo) of a species. Executed in a worker process.
+
+    Args:
+        statmech_adapter_label (str): The statmech adapter to use.
+        adapter_kwargs (dict): Arguments for the statmech factory.
+        species (ARCSpecies): The species to process.
+        kinetics_flag (bool): Whether the statmech is used for a rate coefficient calculation.
+        e0_only (bool): Whether to only compute E0.
+
+    Returns:
+        Tuple[dict, dict]:
+            - The species attributes to merge, keys are attribute names.
+            - The resulting statmech cache entries.
+    """
+    statmech_cache = dict()
+    statmech_adapter = statmech_factory(statmech_adapter_label=statmech_adapter_label,
+                                        species=species,
+                                        statmech_cache=statmech_cache,
+                                        **adapter_kwargs)
+    statmech_adapter.reset_global_state()
+    statmech_adapter.compute_thermo(kinetics_flag=kinetics_flag, e0_only=e0_only)
+    return {attribute: getattr(species, attribute) for attribute in STATMECH_SPECIES_ATTRIBUTES}, statmech_cache
+
+
+def compute_reaction_rate(statmech_adapter_label: str,
+                          adapter_kwargs: dict,
+                          reaction,
+                          ts_species,
+                          statmech_cache: dict,
+                          ) -> dict:
+    """
+    Compute the high pressure limit rate coefficient of a reaction. Executed in a worker process.
+
+    Args:
+        statmech_adapter_label (str): The statmech adapter to use.
+        adapter_kwargs (dict): Arguments for the statmech factory.
+        reaction (ARCReaction): The reaction to process.
+        ts_species (ARCSpecies): The TS species of the reaction.
+        statmech_cache (dict): The statmech cache entries of all reactants and products.
+
+    Returns:
+        dict: The reaction 'kinetics' and 'dh_rxn298', and the 'ts_species' attributes to merge.
+    """
+    for i, species in enumerate(get_unique_reaction_species(reaction)):
+        statmech_adapter = statmech_factory(statmech_adapter_label=statmech_adapter_label,
+                                            species=species,
+                                            statmech_cache=statmech_cache,
+                                            **{key: val for key, val in adapter_kwargs.items()
+                                               if key not in ['T_min', 'T_max', 'T_count', 'three_params']})
+        if not i:
+            statmech_adapter.reset_global_state()
+        statmech_adapter.compute_thermo(kinetics_flag=True)
+    statmech_adapter = statmech_factory(statmech_adapter_label=statmech_adapter_label,
+                                        reaction=reaction,
+                                        species_dict={ts_species.label: ts_species},
+                                        statmech_cache=statmech_cache,
+                                        **adapter_kwargs)
+    statmech_adapter.compute_high_p_rate_coefficient()
+    ts_attributes = {attribute: getattr(ts_species, attribute) for attribute in STATMECH_SPECIES_ATTRIBUTES + ['e0']}
+    return {'kinetics': reaction.kinetics, 'dh_rxn298': reaction.dh_rxn298, 'ts_species': ts_attributes}
+
+
 def compare_thermo(species_for_thermo_lib: list,
                    rmg_database: Type[RMGDatabase],
                    output_directory: str,
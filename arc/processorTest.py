@@ -5,10 +5,18 @@
 This module contains unit tests for the arc.processor module
 """
 
+import os
+import shutil
 import unittest
 
+import arkane.input
+
 import arc.processor as processor
+from arc.common import arc_path, read_yaml_file
+from arc.level import Level
+from arc.reaction import ARCReaction
 from arc.species.species import ARCSpecies
+from arc.statmech.factory import statmech_factory
 
 
 class TestProcessor(unittest.TestCase):
@@ -28,6 +36,8 @@ class TestProcessor(unittest.TestCase):
         cls.ch4_bde_1_2_a = ARCSpecies(label='CH4_BDE_1_2_A', smiles='[CH3]')
         cls.ch4.e0, cls.h.e0, cls.ch4_bde_1_2_a.e0 = 10, 25, 35
         cls.ch4.bdes = [(1, 2)]
+        cls.project_directory = os.path.join(arc_path, 'Projects',
+                                             'arc_project_for_testing_delete_after_usage_processor')
 
     def test_process_bdes(self):
         """Test the process_bdes method"""
@@ -38,6 +48,125 @@ class TestProcessor(unittest.TestCase):
                                                           'CH4_BDE_1_2_A': self.ch4_bde_1_2_a})
         self.assertEqual(bde_report, {(1, 2): 50})
 
+    def test_get_unique_reaction_species(self):
+        """Test getting the reactants and products of a reaction, each considered once"""
+        reaction = ARCReaction(reactants=['CH4', 'NH3'], products=['CH4_BDE_1_2_A', 'H', 'NH3'])
+        reaction.r_species = [self.ch4, self.nh3]
+        reaction.p_species = [self.ch4_bde_1_2_a, self.h, self.nh3]
+        self.assertEqual([spc.label for spc in processor.get_unique_reaction_species(reaction)],
+                         ['CH4', 'NH3', 'CH4_BDE_1_2_A', 'H'])
+
+    def test_statmech_cache(self):
+        """Test that cached species statmech results are assigned without running Arkane again"""
+        spc = ARCSpecies(label='CH4_cached', smiles='C')
+        statmech_cache = dict()
+        adapter = statmech_factory(statmech_adapter_label='arkane',
+                                   output_directory=os.path.join(arc_path, 'Projects', 'statmech_cache_test'),
+                                   output_dict=dict(),
+                                   bac_type=None,
+                                   species=spc,
+                                   statmech_cache=statmech_cache,
+                                   )
+        self.assertFalse(adapter.load_cached_statmech(kinetics_flag=True))
+        arkane_species, thermo = object(), object()
+        key = adapter.get_statmech_cache_key(bac_type=None)
+        self.assertEqual(key, ('CH4_cached', None, None, 1.0))
+        statmech_cache[key] = {'arkane_species': arkane_species, 'e0': -100.5, 'thermo': None}
+        self.assertFalse(adapter.load_cached_statmech(kinetics_flag=True))  # thermo is required
+        self.assertTrue(adapter.load_cached_statmech(kinetics_flag=True, e0_only=True))
+        self.assertEqual(spc.e0, -100.5)
+        statmech_cache[key]['thermo'] = thermo
+        adapter.compute_thermo(kinetics_flag=True)  # doesn't run Arkane
+        self.assertIs(spc.thermo, thermo)
+        self.assertIs(arkane.input.species_dict['CH4_cached'], arkane_species)
+        self.assertFalse(os.path.isdir(os.path.join(arc_path, 'Projects', 'statmech_cache_test')))
+        del arkane.input.species_dict['CH4_cached']
+
+    def test_compute_statmech_in_parallel(self):
+        """Test computing species statmech in a process pool, and assigning the merged results from the cache"""
+        restart_path = os.path.join(arc_path, 'arc', 'testing', 'restart', '2_restart_rate', 'restart.yml')
+        input_dict = read_yaml_file(path=restart_path)
+        species_dict, output_dict = dict(), dict()
+        for spc_dict in input_dict['species']:
+            if spc_dict['label'] in ['NH2', 'N2H4']:
+                species_dict[spc_dict['label']] = ARCSpecies(species_dict=spc_dict)
+                output_dict[spc_dict['label']] = input_dict['output'][spc_dict['label']]
+                output_dict[spc_dict['label']]['paths'] = \
+                    {key: os.path.join(arc_path, path) if path else ''
+                     for key, path in input_dict['output'][spc_dict['label']]['paths'].items()}
+        output_directory = os.path.join(self.project_directory, 'output')
+        sp_level = Level(repr=input_dict['arkane_level_of_theory'])
+        statmech_cache = dict()
+        processed_rxn_labels = processor.compute_statmech_in_parallel(num_processes=2,
+                                                                      thermo_adapter_label='arkane',
+                                                                      kinetics_adapter_label='arkane',
+                                                                      output_directory=output_directory,
+                                                                      output_dict=output_dict,
+                                                                      species_dict=species_dict,
+                                                                      reactions=list(),
+                                                                      bac_type=None,
+                                                                      sp_level=sp_level,
+                                                                      freq_scale_factor=input_dict['freq_scale_factor'],
+                                                                      compute_thermo=True,
+                                                                      T_min=(500, 'K'),
+                                                                      T_max=(3000, 'K'),
+                                                                      T_count=50,
+                                                                      three_params=True,
+                                                                      statmech_cache=statmech_cache,
+                                                                      )
+        self.assertEqual(processed_rxn_labels, set())
+        self.assertEqual(sorted(key[0] for key in statmech_cache.keys()), ['N2H4', 'NH2'])
+        for label, spc in species_dict.items():
+            # species attributes set in the worker processes are merged back
+            self.assertTrue(os.path.isfile(spc.arkane_file))
+            self.assertIsNotNone(spc.external_symmetry)
+            self.assertIsNotNone(spc.optical_isomers)
+            self.assertIsNone(spc.thermo)
+
+            # the sequential processing assigns the cached results without running Arkane again
+            adapter = statmech_factory(statmech_adapter_label='arkane',
+                                       output_directory=output_directory,
+                                       output_dict=output_dict,
+                                       bac_type=None,
+                                       sp_level=sp_level,
+                                       freq_scale_factor=input_dict['freq_scale_factor'],
+                                       species=spc,
+                                       statmech_cache=statmech_cache,
+                                       )
+
+            def generate_arkane_species_file(species, bac_type):
+                raise AssertionError(f'Arkane was run again for the cached species {species.label}')
+
+            adapter.generate_arkane_species_file = generate_arkane_species_file
+            adapter.compute_thermo(kinetics_flag=False)
+            cached = statmech_cache[adapter.get_statmech_cache_key(bac_type=None)]
+            self.assertIs(spc.thermo, cached['thermo'])
+            self.assertEqual(spc.e0, cached['e0'])
+
+        # the results computed in parallel are identical to those computed in this process
+        n2h4 = ARCSpecies(species_dict=[spc_dict for spc_dict in read_yaml_file(path=restart_path)['species']
+                                        if spc_dict['label'] == 'N2H4'][0])
+        statmech_factory(statmech_adapter_label='arkane',
+                         output_directory=output_directory,
+                         output_dict=output_dict,
+                         bac_type=None,
+                         sp_level=sp_level,
+                         freq_scale_factor=input_dict['freq_scale_factor'],
+                         species=n2h4,
+                         ).compute_thermo(kinetics_flag=False)
+        self.assertAlmostEqual(n2h4.e0, species_dict['N2H4'].e0, 5)
+        self.assertAlmostEqual(n2h4.thermo.get_heat_capacity(1000), species_dict['N2H4'].thermo.get_heat_capacity(1000))
+        self.assertAlmostEqual(n2h4.thermo.get_enthalpy(298), species_dict['N2H4'].thermo.get_enthalpy(298))
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        A function that is run ONCE after all unit tests in this class.
+        Delete all project directories created during these unit tests
+        """
+        if os.path.isdir(cls.project_directory):
+            shutil.rmtree(cls.project_directory, ignore_errors=True)
+
 
 if __name__ == '__main__':
     unittest.main(testRunner=unittest.TextTestRunner(verbosity=2))
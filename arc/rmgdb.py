@@ -2,8 +2,14 @@
 A module for working with the RMG database.
 """
 
+import hashlib
+import json
 import os
+import pickle
+import subprocess
+import sys
 
+import rmgpy
 from rmgpy import settings as rmg_settings
 from rmgpy.data.kinetics.common import find_degenerate_reactions
 from rmgpy.data.rmg import RMGDatabase
@@ -12,12 +18,18 @@ from rmgpy.reaction import same_species_lists, Reaction
 
 from arc.common import get_logger
 from arc.exceptions import InputError
+from arc.imports import settings
 
 
 logger = get_logger()
 
 db_path = rmg_settings['database.directory']
 
+rmg_database_snapshots = settings['rmg_database_snapshots']
+
+# Bump when the content of the snapshots changes, so that older snapshots are ignored
+RMG_DB_SNAPSHOT_VERSION = 1
+
 
 def make_rmg_database_object():
     """
@@ -43,16 +55,14 @@ def load_families_only(rmgdb, kinetics_families='default'):
             raise InputError("kinetics families should be either 'default', 'all', 'none', or a list of names, e.g.,"
                              " ['H_Abstraction','R_Recombination'] or ['!Intra_Disproportionation'].")
     logger.debug('\n\nLoading only kinetic families from the RMG database...')
-    rmgdb.load(
-        path=db_path,
-        thermo_libraries=list(),
-        transport_libraries='none',
-        reaction_libraries=list(),
-        seed_mechanisms=list(),
-        kinetics_families=kinetics_families,
-        kinetics_depositories=['training'],
-        depository=False,
-    )
+    load_database_pieces(rmgdb=rmgdb,
+                         thermo_libraries=list(),
+                         transport_libraries='none',
+                         reaction_libraries=list(),
+                         kinetics_families=kinetics_families,
+                         kinetics_depositories=['training'],
+                         train_families=False,
+                         )
 
 
 def load_rmg_database(rmgdb, thermo_libraries=None, reaction_libraries=None, kinetics_families='default',
@@ -130,24 +140,167 @@ def load_rmg_database(rmgdb, thermo_libraries=None, reaction_libraries=None, kin
     logger.info('\n\nLoading the RMG database...')
 
     kinetics_depositories = ['training', 'NIST'] if include_nist else ['training']
-    rmgdb.load(
-        path=db_path,
-        thermo_libraries=thermo_libraries,
-        transport_libraries=['PrimaryTransportLibrary', 'NOx2018', 'GRI-Mech'],
-        reaction_libraries=reaction_libraries,
-        seed_mechanisms=list(),
-        kinetics_families=kinetics_families,
-        kinetics_depositories=kinetics_depositories,
-        depository=False,
-    )
-    for family in rmgdb.kinetics.families.values():
+    load_database_pieces(rmgdb=rmgdb,
+                         thermo_libraries=thermo_libraries,
+                         transport_libraries=['PrimaryTransportLibrary', 'NOx2018', 'GRI-Mech'],
+                         reaction_libraries=reaction_libraries,
+                         kinetics_families=kinetics_families,
+                         kinetics_depositories=kinetics_depositories,
+                         train_families=True,
+                         )
+    logger.info('\n\n')
+
+
+def load_database_pieces(rmgdb,
+                         thermo_libraries,
+                         transport_libraries,
+                         reaction_libraries,
+                         kinetics_families,
+                         kinetics_depositories,
+                         train_families=False,
+                         ):
+    """
+    Load the requested pieces of the RMG database into ``rmgdb``.
+    Pieces identical to those already loaded into ``rmgdb`` are not loaded again. Otherwise, a snapshot of the same
+    pieces is loaded if one was saved by a previous run, or the pieces are loaded from the RMG-database text files and
+    saved as a new snapshot. If the RMG database version could not be determined (it is not a clean git checkout),
+    snapshots are not used and the pieces are always loaded from the text files.
+
+    Args:
+        rmgdb (RMGDatabase): The RMG database instance.
+        thermo_libraries (list): The thermodynamic libraries to load.
+        transport_libraries (list, str): The transport libraries to load, or 'none'.
+        reaction_libraries (list): The kinetics libraries to load.
+        kinetics_families (list, str): The kinetics families to load (either a list or 'default', 'all', 'none').
+        kinetics_depositories (list): The kinetics depositories to load.
+        train_families (bool, optional): Whether to train the kinetics families and fill their rules.
+    """
+    load_kwargs = {'thermo_libraries': thermo_libraries,
+                   'transport_libraries': transport_libraries,
+                   'reaction_libraries': reaction_libraries,
+                   'seed_mechanisms': list(),
+                   'kinetics_families': kinetics_families,
+                   'kinetics_depositories': kinetics_depositories,
+                   'depository': False,
+                   }
+    snapshot_key = get_snapshot_key(dict(load_kwargs, train_families=train_families))
+    if snapshot_key is not None and getattr(rmgdb, 'arc_snapshot_key', None) == snapshot_key:
+        logger.debug('The requested RMG database pieces are already loaded')
+        return
+    snapshot_path = get_snapshot_path(snapshot_key)
+    if snapshot_path is not None and os.path.isfile(snapshot_path):
         try:
-            family.add_rules_from_training(thermo_database=rmgdb.thermo)
-        except KineticsError:
-            logger.info('Could not train family {0}'.format(family))
+            with open(snapshot_path, 'rb') as f:
+                database_dict = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError) as e:
+            logger.warning(f'Could not load the RMG database snapshot {snapshot_path}, got:\n{e}\n'
+                           f'Loading the RMG database from its files.')
         else:
-            family.fill_rules_by_averaging_up(verbose=False)
-    logger.info('\n\n')
+            logger.debug(f'Loaded the RMG database from snapshot {snapshot_path}')
+            # update the object in place, it is also stored as RMG's module-level database
+            rmgdb.__dict__.update(database_dict)
+            rmgdb.arc_snapshot_key = snapshot_key
+            return
+
+    rmgdb.load(path=db_path, **load_kwargs)
+    if train_families:
+        for family in rmgdb.kinetics.families.values():
+            try:
+                family.add_rules_from_training(thermo_database=rmgdb.thermo)
+            except KineticsError:
+                logger.info('Could not train family {0}'.format(family))
+            else:
+                family.fill_rules_by_averaging_up(verbose=False)
+    rmgdb.arc_snapshot_key = snapshot_key
+    if snapshot_path is not None:
+        save_snapshot(rmgdb=rmgdb, snapshot_path=snapshot_path)
+
+
+def get_database_version():
+    """
+    Get the git commit hash of the RMG database.
+
+    Returns: Optional[str]
+        The git commit hash, ``None`` if the RMG database is not a git repository.
+    """
+    try:
+        output = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=db_path, stdout=subprocess.PIPE,
+                                stderr=subprocess.DEVNULL, universal_newlines=True, check=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    try:
+        # uncommitted changes to the database files make it a different version
+        status = subprocess.run(['git', 'status', '--porcelain', '.'], cwd=db_path, stdout=subprocess.PIPE,
+                                stderr=subprocess.DEVNULL, universal_newlines=True, check=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    if status.strip():
+        return None
+    return output.strip() or None
+
+
+def get_snapshot_key(load_kwargs):
+    """
+    Get the key of an RMG database snapshot.
+
+    Args:
+        load_kwargs (dict): The arguments used for loading the RMG database pieces.
+
+    Returns: Optional[str]
+        The snapshot key, ``None`` if the RMG database version could not be determined.
+    """
+    database_version = get_database_version()
+    if database_version is None:
+        return None
+    key = {'snapshot_version': RMG_DB_SNAPSHOT_VERSION,
+           'database_version': database_version,
+           'database_path': db_path,
+           'rmgpy_version': getattr(rmgpy, '__version__', None),
+           'python_version': sys.version_info[:2],
+           'load_kwargs': load_kwargs,
+           }
+    return hashlib.sha256(json.dumps(key, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def get_snapshot_path(snapshot_key):
+    """
+    Get the path to an RMG database snapshot.
+
+    Args:
+        snapshot_key (str): The snapshot key.
+
+    Returns: Optional[str]
+        The snapshot path, ``None`` if snapshots are disabled or the key could not be determined.
+    """
+    if not rmg_database_snapshots['enabled'] or snapshot_key is None:
+        return None
+    snapshots_path = rmg_database_snapshots['path'] \
+        or os.path.join(os.path.expanduser('~'), '.arc', 'rmg_db_snapshots')
+    return os.path.join(snapshots_path, f'rmg_db_{snapshot_key}.pkl')
+
+
+def save_snapshot(rmgdb, snapshot_path):
+    """
+    Save the loaded pieces of the RMG database as a binary snapshot.
+    The snapshot is first written to a temporary file, so concurrent ARC runs never read a partial snapshot.
+
+    Args:
+        rmgdb (RMGDatabase): The loaded RMG database instance.
+        snapshot_path (str): The path to the snapshot file.
+    """
+    database_dict = {key: val for key, val in rmgdb.__dict__.items() if key != 'arc_snapshot_key'}
+    temp_path = f'{snapshot_path}.{os.getpid()}.tmp'
+    try:
+        os.makedirs(os.path.dirname(snapshot_path), exist_ok=True)
+        with open(temp_path, 'wb') as f:
+            pickle.dump(database_dict, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, snapshot_path)
+    except (OSError, pickle.PicklingError, TypeError, AttributeError, RecursionError) as e:
+        logger.warning(f'Could not save an RMG database snapshot, got:\n{e}')
+        if os.path.isfile(temp_path):
+            os.remove(temp_path)
+    else:
+        logger.debug(f'Saved an RMG database snapshot to {snapshot_path}')
 
 
 def determine_reaction_family(rmgdb, reaction):
@@ -63,6 +63,40 @@ class TestRMGDB(unittest.TestCase):
                 found_rxn = True
         self.assertTrue(found_rxn)
 
+    def test_snapshot_key_and_path(self):
+        """Test getting the key and path of an RMG database snapshot"""
+        load_kwargs = {'thermo_libraries': ['primaryThermoLibrary'], 'kinetics_families': 'default'}
+        key_1 = rmgdb.get_snapshot_key(load_kwargs)
+        if key_1 is None:
+            # the RMG database is not a clean git repository, snapshots are not used
+            self.assertIsNone(rmgdb.get_snapshot_path(key_1))
+            return
+        self.assertEqual(rmgdb.get_snapshot_key(dict(load_kwargs)), key_1)
+        key_2 = rmgdb.get_snapshot_key(dict(load_kwargs, kinetics_families='all'))
+        self.assertNotEqual(key_1, key_2)
+        path = rmgdb.get_snapshot_path(key_1)
+        self.assertTrue(path.endswith(f'rmg_db_{key_1}.pkl'))
+        self.assertEqual(len(self.rmgdb.arc_snapshot_key), 64)
+
+    def test_load_database_pieces_without_version(self):
+        """Test loading RMG database pieces when the RMG database version could not be determined"""
+        get_database_version = rmgdb.get_database_version
+        rmgdb.get_database_version = lambda: None  # e.g., a conda installation of the RMG database
+        try:
+            rmgdb_1 = rmgdb.make_rmg_database_object()
+            for thermo_library in ['primaryThermoLibrary', 'BurkeH2O2']:
+                rmgdb.load_database_pieces(rmgdb=rmgdb_1,
+                                           thermo_libraries=[thermo_library],
+                                           transport_libraries='none',
+                                           reaction_libraries=list(),
+                                           kinetics_families='none',
+                                           kinetics_depositories=list(),
+                                           )
+                self.assertIsNone(rmgdb_1.arc_snapshot_key)
+                self.assertEqual(list(rmgdb_1.thermo.libraries.keys()), [thermo_library])
+        finally:
+            rmgdb.get_database_version = get_database_version
+
 
 if __name__ == '__main__':
     unittest.main(testRunner=unittest.TextTestRunner(verbosity=2))
@@ -3,17 +3,24 @@ A module for scheduling jobs
 Includes spawning, terminating, checking, and troubleshooting various jobs
 """
 
+import copy
 import datetime
 import itertools
 import logging
+import math
+import multiprocessing
 import os
 import shutil
+import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
 from IPython.display import display
-from typing import List, Optional, Tuple, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 from arc import parser, plotter
-from arc.common import (extermum_list,
+from arc.artefacts import ArtefactWriter
+from arc.common import (append_to_yaml_journal,
+                        extermum_list,
                         get_angle_in_180_range,
                         get_logger,
                         get_ordinal_indicator,
@@ -21,16 +28,20 @@ from arc.common import (extermum_list,
                         save_yaml_file,
                         sort_two_lists_by_the_first,
                         )
-from arc.exceptions import (InputError,
+from arc.exceptions import (ConverterError,
+                            InputError,
                             SanitizationError,
                             SchedulerError,
                             SpeciesError,
                             TrshError,
+                            ZMatError,
                             )
 from arc.imports import settings
+from arc.job.bundle import run_job_bundle, split_into_bundles
+from arc.job.harvest import harvest_jobs
 from arc.job.job import Job
 from arc.job.local import check_running_jobs_ids
-from arc.job.ssh import SSHClient
+from arc.job.ssh import SSHClient, close_all_connections
 from arc.job.trsh import (scan_quality_check,
                           trsh_conformer_isomorphism,
                           trsh_ess_job,
@@ -44,6 +55,7 @@ from arc.species.species import (ARCSpecies,
                                  TSGuess)
 from arc.species.converter import (check_isomorphism,
                                    compare_confs,
+                                   generate_dihedral_grid_xyzs,
                                    molecules_from_xyz,
                                    standardize_xyz_string,
                                    str_to_xyz,
@@ -57,9 +69,15 @@ from arc.species.vectors import get_angle, calculate_dihedral_angle
 logger = get_logger()
 
 
-default_job_settings, default_job_types, rotor_scan_resolution = settings['default_job_settings'], \
-                                                                 settings['default_job_types'], \
-                                                                 settings['rotor_scan_resolution']
+default_job_settings, default_job_types, rotor_scan_resolution, polling_intervals = \
+    settings['default_job_settings'], settings['default_job_types'], settings['rotor_scan_resolution'], \
+    settings['polling_intervals']
+job_submission_concurrency, restart_journal_compaction, conformer_generation_processes, \
+    streaming_conformer_selection, ts_guess_concurrency = \
+    settings['job_submission_concurrency'], settings['restart_journal_compaction'], \
+    settings['conformer_generation_processes'], settings['streaming_conformer_selection'], \
+    settings['ts_guess_concurrency']
+directed_scan_bundling = settings['directed_scan_bundling']
 
 
 class Scheduler(object):
@@ -158,8 +176,29 @@ class Scheduler(object):
                          values are dictionaries where keys are job names (corresponding to
                          'running_jobs' if job is running) and values are the Job objects.
         running_jobs (dict): A dictionary of currently running jobs (a subset of `job_dict`).
-                             Keys are species/TS label, values are lists of job names (e.g. 'conformer3', 'opt_a123').
-        servers_jobs_ids (list): A list of relevant job IDs currently running on the server.
+                             Keys are species/TS label, values are dictionaries where keys are job names
+                             (e.g. 'conformer3', 'opt_a123') and values are the Job objects, in order of spawning.
+        jobs_by_id (dict): An index of the running jobs which were submitted. Keys are job IDs, values are
+                           dictionaries where keys are job names and values are Job objects
+                           (the grid point jobs of a bundled directed scan share a single job ID).
+        servers_jobs_ids (set): The relevant job IDs currently running on the servers.
+        completed_jobs_ids (set): IDs of jobs which were seen running on a server and have since left its queue.
+        harvested_jobs (dict): Keys are names of terminated jobs whose status was already determined in bulk, values
+                               are the IOError raised while determining the respective status, or ``None``.
+        polling_interval (float): The current waiting time in seconds between consecutive server queue checks.
+        pending_submissions (dict): Jobs spawned but not yet submitted. Keys are species labels, values are lists of
+                                    (Job, Future) tuples.
+        submission_executor (ThreadPoolExecutor): The thread pool used for writing, uploading, and submitting jobs.
+        server_submission_locks (dict): Keys are server names, values are semaphores capping concurrent submissions.
+        pending_conformer_generation (dict): Species whose force field conformers are being generated.
+                                             Keys are species labels, values are Future objects.
+        conformer_generation_executor (ProcessPoolExecutor): The process pool used for generating conformers,
+                                                             ``None`` if conformers are generated sequentially.
+        pending_ts_guesses (dict): TS guess methods which are still running. Keys are TS labels,
+                                   values are lists of (TSGuess, Future) tuples.
+        ts_guess_executor (ThreadPoolExecutor): The thread pool used for running TS guess methods.
+        ts_guess_method_locks (dict): Keys are TS guess methods, values are semaphores capping concurrent runs.
+        artefact_writer (ArtefactWriter): The queue of plots and geometry files to write.
         output (dict): Output dictionary with status per job type and final QM file paths for all species.
         ess_settings (dict): A dictionary of available ESS and a corresponding server list.
         restart_dict (dict): A restart dictionary parsed from a YAML restart file.
@@ -167,13 +206,19 @@ class Scheduler(object):
         save_restart (bool): Whether to start saving a restart file. ``True`` only after all species are loaded
                              (otherwise saves a partial file and may cause loss of information).
         restart_path (str): Path to the `restart.yml` file to be saved.
+        restart_journal_path (str): Path to the `restart_journal.yml` file, to which changes are appended between
+                                    consecutive `restart.yml` snapshots.
+        restart_records (dict): Keys are species labels, values are the respective restart records last saved.
+        restart_dirty_labels (set): Labels of species whose restart records may have changed since the last save.
+        restart_journal_entries (int): The number of entries appended to the restart journal since the last snapshot,
+                                       ``None`` if no snapshot was saved yet.
         max_job_time (float): The maximal allowed job time on the server in hours (can be fractional).
         testing (bool): Used for internal ARC testing (generating the object w/o executing it).
         rmg_database (RMGDatabase): The RMG database object.
         allow_nonisomorphic_2d (bool): Whether to optimize species even if they do not have a 3D conformer that is
                                        isomorphic to the 2D graph representation.
-        dont_gen_confs (list): A list of species labels for which conformer jobs were loaded from a restart file,
-                               or user-requested. Additional conformer generation should be avoided for them.
+        dont_gen_confs (set): Species labels for which conformer jobs were loaded from a restart file,
+                              or user-requested. Additional conformer generation should be avoided for them.
         memory (float): The total allocated job memory in GB (14 by default).
         n_confs (int): The number of lowest force field conformers to consider.
         e_confs (float): The energy threshold in kJ/mol above the lowest energy conformer below which
@@ -238,7 +283,26 @@ class Scheduler(object):
         self.rxn_list = rxn_list if rxn_list is not None else list()
         self.max_job_time = max_job_time or default_job_settings.get('job_time_limit_hrs', 120)
         self.job_dict = dict()
-        self.servers_jobs_ids = list()
+        self.servers_jobs_ids = set()
+        self.jobs_by_id = dict()
+        self.completed_jobs_ids = set()
+        self.harvested_jobs = dict()
+        self.polling_interval = polling_intervals['min']
+        self.pending_submissions = dict()
+        self.submission_executor = ThreadPoolExecutor(max_workers=job_submission_concurrency['max_workers'])
+        self.server_submission_locks = dict()
+        self.pending_conformer_generation = dict()
+        self.conformer_generation_executor = None
+        if not testing and conformer_generation_processes != 1:
+            # a forkserver (rather than forking this multi-threaded process) avoids deadlocks in the workers
+            self.conformer_generation_executor = ProcessPoolExecutor(
+                max_workers=conformer_generation_processes or None,
+                mp_context=multiprocessing.get_context('forkserver'),
+                initializer=conformers.limit_force_field_to_single_cpu)
+        self.pending_ts_guesses = dict()
+        self.ts_guess_executor = ThreadPoolExecutor(max_workers=ts_guess_concurrency['max_workers'])
+        self.ts_guess_method_locks = dict()
+        self.artefact_writer = ArtefactWriter(asynchronous=False if testing else None)
         self.running_jobs = dict()
         self.allow_nonisomorphic_2d = allow_nonisomorphic_2d
         self.testing = testing
@@ -247,7 +311,7 @@ class Scheduler(object):
         self.adaptive_levels = adaptive_levels
         self.n_confs = n_confs
         self.e_confs = e_confs
-        self.dont_gen_confs = dont_gen_confs or list()
+        self.dont_gen_confs = set(dont_gen_confs or list())
         self.job_types = job_types if job_types is not None else default_job_types
         self.fine_only = fine_only
         self.output = dict()
@@ -262,6 +326,10 @@ class Scheduler(object):
         self.initialize_output_dict()
 
         self.restart_path = os.path.join(self.project_directory, 'restart.yml')
+        self.restart_journal_path = os.path.join(self.project_directory, 'restart_journal.yml')
+        self.restart_records = dict()
+        self.restart_dirty_labels = set()
+        self.restart_journal_entries = None
         self.report_time = time.time()  # init time for reporting status every 1 hr
         self.servers = list()
         self.composite_method = composite_method
@@ -361,8 +429,8 @@ class Scheduler(object):
                             arc_reaction=rxn,
                             project_dir=self.project_directory
                         )
-                        ts_guess.execute_ts_guess_method()
                         ts_species.ts_guesses.append(ts_guess)
+                        self.execute_ts_guess_method(label=ts_species.label, ts_guess=ts_guess)
                 rxn.check_atom_balance()
 
         for species in self.species_list:
@@ -390,7 +458,7 @@ class Scheduler(object):
                     # opt wasn't asked for, and it's not needed, declare it as converged
                     self.output[species.label]['job_types']['opt'] = True
                 if species.label not in self.running_jobs:
-                    self.running_jobs[species.label] = list()  # initialize before running the first job
+                    self.running_jobs[species.label] = dict()  # initialize before running the first job
                 if species.number_of_atoms == 1:
                     logger.debug(f'Species {species.label} is monoatomic')
                     if not self.species_dict[species.label].initial_xyz:
@@ -486,17 +554,30 @@ class Scheduler(object):
                         self.run_opt_job(species.label, fine=self.fine_only)
         self.run_conformer_jobs()
         while self.running_jobs != {}:  # loop while jobs are still running
-            logger.debug(f'Currently running jobs:\n{self.running_jobs}')
+            logger.debug(f'Currently running jobs:\n{self.get_running_jobs_names()}')
             self.timer = True
             job_list = list()
+            newly_generated = self.collect_generated_conformers() + self.collect_ts_guesses()
+            self.collect_submissions()
+            self.artefact_writer.collect()
+            # query each server only once per pass, updates `self.servers_jobs_ids`
+            newly_completed = self.get_servers_jobs_ids()
+            self.harvest_terminated_jobs()
             for label in self.unique_species_labels:
                 if self.output[label]['convergence'] is False:
                     # skip unconverged species
                     if label in self.running_jobs:
+                        for job_name in list(self.running_jobs[label]):
+                            self.remove_running_job(label=label, job_name=job_name)
                         del self.running_jobs[label]
                     continue
+                if label in self.pending_submissions:
+                    # jobs of this species were spawned in this pass and are still being submitted
+                    continue
+                if label in self.pending_conformer_generation or label in self.pending_ts_guesses:
+                    # force field conformers or TS guesses of this species are still being generated
+                    continue
                 # look for completed jobs and decide what jobs to run next
-                self.get_servers_jobs_ids()  # updates `self.servers_jobs_ids`
                 try:
                     job_list = self.running_jobs[label]
                 except KeyError:
@@ -514,21 +595,18 @@ class Scheduler(object):
                             # Are there additional conformer jobs currently running for this species?
                             for spec_jobs in job_list:
                                 if 'conformer' in spec_jobs and spec_jobs != job_name:
+                                    if self.is_conformer_selection_final(label):
+                                        # the remaining conformers are not expected to change the selection
+                                        self.delete_conformer_jobs(label)
+                                        logger.info(f'\nConformer selection for {label} is final, optimizing the '
+                                                    f'most stable conformer before all conformer jobs terminated.\n')
+                                        self.spawn_opt_on_most_stable_conformer(label)
                                     break
                             else:
                                 # All conformer jobs terminated.
                                 # Check isomorphism and run opt on most stable conformer geometry.
                                 logger.info(f'\nConformer jobs for {label} successfully terminated.\n')
-                                if self.species_dict[label].is_ts:
-                                    self.determine_most_likely_ts_conformer(label)
-                                else:
-                                    self.determine_most_stable_conformer(label)  # also checks isomorphism
-                                if self.species_dict[label].initial_xyz is not None:
-                                    # if initial_xyz is None, then we're probably troubleshooting conformers, don't opt
-                                    if not self.composite_method:
-                                        self.run_opt_job(label, fine=self.fine_only)
-                                    else:
-                                        self.run_composite_job(label)
+                                self.spawn_opt_on_most_stable_conformer(label)
                             self.timer = False
                             break
                     elif 'opt' in job_name \
@@ -679,6 +757,11 @@ class Scheduler(object):
                             self.check_md_job(label=label, job=job)
                         self.timer = False
                         break
+                else:
+                    job_name = None
+                if job_name is not None:
+                    # a job of this species terminated and was processed, save its restart record with the next update
+                    self.restart_dirty_labels.add(label)
 
                 if self.species_dict[label].is_ts and not self.species_dict[label].ts_conf_spawned \
                         and not any([tsg.success is None for tsg in self.species_dict[label].ts_guesses]):
@@ -688,6 +771,7 @@ class Scheduler(object):
                     # Todo: no need to wait for all TSGs before spawning the first opt jobs
                     self.run_ts_conformer_jobs(label=label)
                     self.species_dict[label].ts_conf_spawned = True
+                    self.restart_dirty_labels.add(label)
 
                 if not len(job_list) and not (self.species_dict[label].is_ts
                                               and not self.species_dict[label].ts_conf_spawned):
@@ -696,12 +780,34 @@ class Scheduler(object):
                         # delete the label only if it represents an empty dictionary
                         del self.running_jobs[label]
 
-            if self.timer and len(job_list):
-                time.sleep(30)  # wait 30 sec before bugging the servers again.
+            if self.timer and not newly_completed and not newly_generated and self.running_jobs:
+                # nothing changed in this pass, wait before bugging the servers again, and back off gradually
+                pending_futures = list(self.pending_conformer_generation.values()) \
+                    + [future for ts_guesses in self.pending_ts_guesses.values() for _, future in ts_guesses]
+                if pending_futures:
+                    # wake up as soon as the conformers or TS guesses of a species are ready
+                    wait(pending_futures, timeout=self.polling_interval, return_when=FIRST_COMPLETED)
+                else:
+                    time.sleep(self.polling_interval)
+                self.polling_interval = min(self.polling_interval * polling_intervals['factor'],
+                                            polling_intervals['max'])
+            else:
+                # jobs are terminating, keep checking frequently
+                self.polling_interval = polling_intervals['min']
             t = time.time() - self.report_time
             if t > 3600 and self.running_jobs:
                 self.report_time = time.time()
-                logger.info(f'Currently running jobs:\n{self.running_jobs}')
+                logger.info(f'Currently running jobs:\n{self.get_running_jobs_names()}')
+
+        # All jobs terminated, release the submission threads and the pooled SSH sessions
+        self.collect_submissions()
+        self.submission_executor.shutdown(wait=True)
+        if self.conformer_generation_executor is not None:
+            self.conformer_generation_executor.shutdown(wait=True)
+        self.ts_guess_executor.shutdown(wait=True)
+        self.artefact_writer.shutdown()
+        close_all_connections()
+        self.save_restart_dict(compact=True)
 
         # After exiting the Scheduler while loop, append all YAML species not directly calculated to the species_dict:
         for spc in self.species_list:
@@ -734,6 +840,7 @@ class Scheduler(object):
                 rotor_index: Optional[int] = None,
                 cpu_cores: Optional[int] = None,
                 irc_direction: Optional[str] = None,
+                bundle: Optional[List[Job]] = None,
                 ):
         """
         A helper function for running (all) jobs.
@@ -767,6 +874,8 @@ class Scheduler(object):
             rotor_index (int, optional): The 0-indexed rotor number (key) in the species.rotors_dict dictionary.
             cpu_cores (int, optional): The total number of cpu cores requested for a job.
             irc_direction (str, optional): The direction to run the IRC computation.
+            bundle (List[Job], optional): If given, the job is appended to this list instead of being submitted,
+                                          to be later submitted with other jobs using ``submit_job_bundles()``.
         """
         max_job_time = max_job_time or self.max_job_time  # if it's None, set to default
         ess_trsh_methods = ess_trsh_methods if ess_trsh_methods is not None else list()
@@ -815,24 +924,122 @@ class Scheduler(object):
         if job.software is not None:
             if conformer < 0:
                 # this is NOT a conformer DFT job
-                self.running_jobs[label].append(job.job_name)  # mark as a running job
+                self.running_jobs[label][job.job_name] = job  # mark as a running job
                 if job_type not in self.job_dict[label]:
                     # Jobs of this type haven't been spawned for label
                     self.job_dict[label][job_type] = dict()
                 self.job_dict[label][job_type][job.job_name] = job
-                self.job_dict[label][job_type][job.job_name].run()
             else:
                 # Running a conformer DFT job. Append differently to job_dict.
-                self.running_jobs[label].append(f'conformer{conformer}')  # mark as a running job
+                self.running_jobs[label][f'conformer{conformer}'] = job  # mark as a running job
                 self.job_dict[label]['conformers'][conformer] = job  # save job object
-                self.job_dict[label]['conformers'][conformer].run()  # run the job
-            self.save_restart_dict()
+            self.restart_dirty_labels.add(label)
+            # submit the job asynchronously, its ID is set in job_dict once submitted (see collect_submissions())
+            if bundle is not None:
+                bundle.append(job)
+            else:
+                self.submit_job(job=job, label=label)
             if job.server not in self.servers:
                 self.servers.append(job.server)
 
+    def submit_job(self, job: Job, label: str):
+        """
+        Write, upload, and submit a job using the submission thread pool,
+        without exceeding the concurrent submissions cap of the job's server.
+
+        Args:
+            job (Job): The job to run.
+            label (str): The species label.
+        """
+        if job.server not in self.server_submission_locks:
+            self.server_submission_locks[job.server] = \
+                threading.BoundedSemaphore(job_submission_concurrency['max_per_server'])
+        server_lock = self.server_submission_locks[job.server]
+
+        def run_job_with_server_cap():
+            with server_lock:
+                job.run()
+
+        future = self.submission_executor.submit(run_job_with_server_cap)
+        self.pending_submissions.setdefault(label, list()).append((job, future))
+
+    def submit_job_bundles(self, jobs: List[Job], label: str):
+        """
+        Write, upload, and submit jobs in bundles (see ``directed_scan_bundling`` in settings.py)
+        using the submission thread pool, without exceeding the concurrent submissions cap of the jobs' server.
+
+        Args:
+            jobs (List[Job]): The jobs to run.
+            label (str): The species label.
+        """
+        for bundle in split_into_bundles(jobs=jobs,
+                                         max_jobs_per_bundle=directed_scan_bundling['max_jobs_per_bundle'],
+                                         parallel_jobs=directed_scan_bundling['parallel_jobs']):
+            server = bundle[0].server
+            if server not in self.server_submission_locks:
+                self.server_submission_locks[server] = \
+                    threading.BoundedSemaphore(job_submission_concurrency['max_per_server'])
+            server_lock = self.server_submission_locks[server]
+
+            def run_bundle_with_server_cap(bundle_jobs=bundle, lock=server_lock):
+                with lock:
+                    run_job_bundle(jobs=bundle_jobs, parallel_jobs=directed_scan_bundling['parallel_jobs'])
+
+            future = self.submission_executor.submit(run_bundle_with_server_cap)
+            self.pending_submissions.setdefault(label, list()).extend((job, future) for job in bundle)
+
+    def collect_submissions(self):
+        """
+        Wait for all pending job submissions to complete, register the IDs of the submitted jobs
+        as running on the servers, and save the restart dictionary.
+        Jobs which could not be submitted (e.g., due to an SSH or an upload error) are troubleshot on their server.
+        """
+        if not self.pending_submissions:
+            return
+        pending_submissions, self.pending_submissions = self.pending_submissions, dict()
+        for label, submissions in pending_submissions.items():
+            for job, future in submissions:
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.error(f'Could not submit job {job.job_name} of {label} to {job.server}, got:\n{e}')
+                    if not self.troubleshoot_submission(job=job, label=label):
+                        continue
+                # the job is running until a server queue check says otherwise
+                self.servers_jobs_ids.add(job.job_id)
+                self.jobs_by_id.setdefault(job.job_id, dict())[job.job_name] = job
+        self.save_restart_dict()
+
+    def troubleshoot_submission(self, job: Job, label: str) -> bool:
+        """
+        Troubleshoot a job which could not be submitted to its server by re-submitting it
+        via the server troubleshooting path (see ``Job.troubleshoot_server()``).
+        A job which could not be re-submitted is no longer considered as running.
+
+        Args:
+            job (Job): The job which could not be submitted.
+            label (str): The species label.
+
+        Returns:
+            bool: Whether the job was re-submitted.
+        """
+        job.job_status[0] = 'errored'
+        try:
+            job.troubleshoot_server()
+        except Exception as e:
+            logger.error(f'Could not troubleshoot the submission of job {job.job_name} of {label} '
+                         f'on {job.server}, got:\n{e}')
+        if job.job_status[0] == 'running':
+            return True
+        job.job_status[0] = 'errored'
+        logger.error(f'Job {job.job_name} of {label} could not be submitted to {job.server}.')
+        job_name = f'conformer{job.conformer}' if job.conformer is not None and job.conformer >= 0 else job.job_name
+        self.remove_running_job(label=label, job_name=job_name)
+        return False
+
     def end_job(self, job, label, job_name):
         """
-        A helper function for checking job status, saving in csv file, and downloading output files.
+        A helper function for checking job status, recording it in the job ledger, and downloading output files.
 
         Args:
             job (Job): The job object.
@@ -843,14 +1050,19 @@ class Scheduler(object):
              bool: `True` if job terminated successfully on the server, `False` otherwise.
         """
         try:
-            job.determine_job_status()  # also downloads output file
+            if job.job_name in self.harvested_jobs:
+                # this job's status was already determined (and its output downloaded) in bulk
+                harvest_error = self.harvested_jobs.pop(job.job_name)
+                if harvest_error is not None:
+                    raise harvest_error
+            else:
+                job.determine_job_status()  # also downloads output file
         except IOError:
+            self.remove_running_job(label=label, job_name=job_name)
             if job.job_type not in ['orbitals']:
                 logger.warning(f'Tried to determine status of job {job.job_name}, but it seems like the job never ran. '
                                f'Re-running job.')
                 self._run_a_job(job=job, label=label)
-            if job_name in self.running_jobs[label]:
-                self.running_jobs[label].pop(self.running_jobs[label].index(job_name))
 
         if not os.path.exists(job.local_path_to_output_file):
             if 'restart_due_to_file_not_found' in job.ess_trsh_methods:
@@ -862,16 +1074,16 @@ class Scheduler(object):
                 job.ess_trsh_methods.append('restart_due_to_file_not_found')
                 logger.warning(f'Did not find the output file of job {job.job_name} with path '
                                f'{job.local_path_to_output_file}. Maybe the job never ran. Re-running job.')
+                self.remove_running_job(label=label, job_name=job_name)
                 self._run_a_job(job=job, label=label)
-            if job_name in self.running_jobs[label]:
-                self.running_jobs[label].pop(self.running_jobs[label].index(job_name))
+                return False
+            self.remove_running_job(label=label, job_name=job_name)
             return False
 
         if job.job_status[0] != 'running' and job.job_status[1]['status'] != 'running':
-            if job_name in self.running_jobs[label]:
-                self.running_jobs[label].pop(self.running_jobs[label].index(job_name))
+            self.remove_running_job(label=label, job_name=job_name)
             self.timer = False
-            job.write_completed_job_to_csv_file()
+            job.write_completed_job_to_ledger()
             logger.info(f'  Ending job {job_name} for {label} (run time: {job.run_time})')
             if job.job_status[0] != 'done':
                 return False
@@ -961,14 +1173,10 @@ class Scheduler(object):
                         # just embed in RDKit and use MMFF94s for opt and energies
                         if self.species_dict[label].initial_xyz is None:
                             self.species_dict[label].initial_xyz = self.species_dict[label].get_xyz()
+                        self.process_conformers(label)
                     else:
-                        # run the combinatorial method w/o fitting a force field
-                        self.species_dict[label].generate_conformers(
-                            n_confs=self.n_confs,
-                            e_confs=self.e_confs,
-                            plot_path=os.path.join(
-                                self.project_directory, 'output', 'Species', label, 'geometry', 'conformers'))
-                    self.process_conformers(label)
+                        # run the combinatorial method w/o fitting a force field (conformers are processed once ready)
+                        self.generate_conformers(label)
             elif not self.job_types['conformers']:
                 # we're not running conformer jobs
                 if self.species_dict[label].initial_xyz is not None or self.species_dict[label].final_xyz is not None:
@@ -977,6 +1185,171 @@ class Scheduler(object):
                     # the species was defined with xyz's
                     self.process_conformers(label)
 
+    def generate_conformers(self, label):
+        """
+        Generate force field conformers for a species using the combinatorial method, and process them.
+        If a process pool is available, the conformers are generated in a worker process, so that conformers of
+        several species are generated in parallel. In that case the conformers are processed (and conformer jobs are
+        spawned) by collect_generated_conformers() as soon as the respective species is done.
+
+        Args:
+            label (str): The species label.
+        """
+        plot_path = os.path.join(self.project_directory, 'output', 'Species', label, 'geometry', 'conformers')
+        if self.conformer_generation_executor is None:
+            self.species_dict[label].generate_conformers(n_confs=self.n_confs, e_confs=self.e_confs,
+                                                         plot_path=plot_path)
+            self.process_conformers(label)
+        else:
+            generation_args = self.species_dict[label].get_conformer_generation_args(n_confs=self.n_confs,
+                                                                                     e_confs=self.e_confs,
+                                                                                     plot_path=plot_path)
+            self.pending_conformer_generation[label] = \
+                self.conformer_generation_executor.submit(conformers.generate_conformers, **generation_args)
+
+    def collect_generated_conformers(self) -> int:
+        """
+        Process the conformers of species whose conformer generation completed in the process pool,
+        and spawn the respective conformer jobs.
+
+        Returns:
+            int: The number of species whose conformers were processed.
+        """
+        collected = 0
+        for label, future in list(self.pending_conformer_generation.items()):
+            if not future.done():
+                continue
+            del self.pending_conformer_generation[label]
+            try:
+                lowest_confs = future.result()
+            except Exception as e:
+                # fall back to generating the conformers in this process (re-raises errors of the conformer search)
+                logger.warning(f'Could not generate conformers for species {label} in a separate process, got:\n{e}\n'
+                               f'Generating them in the main process.')
+                self.species_dict[label].generate_conformers(
+                    n_confs=self.n_confs,
+                    e_confs=self.e_confs,
+                    plot_path=os.path.join(self.project_directory, 'output', 'Species', label, 'geometry',
+                                           'conformers'))
+            else:
+                self.species_dict[label].set_generated_conformers(lowest_confs)
+            self.process_conformers(label)
+            self.restart_dirty_labels.add(label)
+            collected += 1
+        return collected
+
+    def spawn_opt_on_most_stable_conformer(self, label):
+        """
+        Determine the most stable conformer (or the most likely TS guess) of a species,
+        and spawn a geometry optimization (or a composite job) on it.
+
+        Args:
+            label (str): The species label.
+        """
+        if self.species_dict[label].is_ts:
+            self.determine_most_likely_ts_conformer(label)
+        else:
+            self.determine_most_stable_conformer(label)  # also checks isomorphism
+        if self.species_dict[label].initial_xyz is not None:
+            # if initial_xyz is None, then we're probably troubleshooting conformers, don't opt
+            if not self.composite_method:
+                self.run_opt_job(label, fine=self.fine_only)
+            else:
+                self.run_composite_job(label)
+
+    def is_conformer_selection_final(self, label) -> bool:
+        """
+        Check whether the most stable conformer of a (non-TS) species could be selected while some of its conformer
+        jobs are still running (see ``streaming_conformer_selection`` in settings).
+        This is the case once enough conformer jobs terminated and the most stable conformer is lower in energy
+        than all other converged conformers by at least the energy margin.
+        Only conformers whose jobs terminated are compared, a conformer whose job is still running (and is deleted
+        once the selection is final) might have turned out to be lower in energy than the selected one.
+
+        Args:
+            label (str): The species label.
+
+        Returns:
+            bool: Whether the conformer selection is final, ``True`` if it is.
+        """
+        if not streaming_conformer_selection['enabled'] or self.species_dict[label].is_ts \
+                or 'conformers' not in self.job_dict[label]:
+            return False
+        num_conformers = len(self.job_dict[label]['conformers'])
+        num_running = len([job_name for job_name in self.running_jobs[label] if 'conformer' in job_name])
+        min_terminated = max(streaming_conformer_selection['min_count'],
+                             math.ceil(streaming_conformer_selection['min_fraction'] * num_conformers))
+        if num_conformers - num_running < min_terminated:
+            return False
+        energies = sorted(e for e in self.species_dict[label].conformer_energies if e is not None)
+        return len(energies) > 1 and energies[1] - energies[0] >= streaming_conformer_selection['energy_margin']
+
+    def delete_conformer_jobs(self, label):
+        """
+        Delete all running conformer jobs of a species.
+
+        Args:
+            label (str): The species label.
+        """
+        for job_name in [job_name for job_name in self.running_jobs[label] if 'conformer' in job_name]:
+            job = self.running_jobs[label][job_name]
+            logger.info(f'Deleting job {job_name} for {label}')
+            job.delete()
+            self.remove_running_job(label=label, job_name=job_name)
+        self.output[label]['conformers'] += 'Remaining conformer jobs were deleted once the selection was final; '
+
+    def execute_ts_guess_method(self, label: str, ts_guess: TSGuess):
+        """
+        Execute a TS guess method using the TS guess thread pool, without exceeding the concurrent runs cap
+        of the method. The guess is collected by collect_ts_guesses() once ready.
+        In testing mode the method is executed directly.
+
+        Args:
+            label (str): The TS species label.
+            ts_guess (TSGuess): The TS guess to generate.
+        """
+        if self.testing:
+            ts_guess.execute_ts_guess_method()
+            return
+        if ts_guess.method not in self.ts_guess_method_locks:
+            max_runs = ts_guess_concurrency['max_per_method'].get(ts_guess.method, ts_guess_concurrency['max_workers'])
+            self.ts_guess_method_locks[ts_guess.method] = threading.BoundedSemaphore(max_runs)
+        method_lock = self.ts_guess_method_locks[ts_guess.method]
+
+        def execute_with_method_cap():
+            with method_lock:
+                ts_guess.execute_ts_guess_method()
+
+        future = self.ts_guess_executor.submit(execute_with_method_cap)
+        self.pending_ts_guesses.setdefault(label, list()).append((ts_guess, future))
+
+    def collect_ts_guesses(self) -> int:
+        """
+        Collect the TS guesses of TS species whose guess methods all terminated.
+        The TS conformer jobs of these species are spawned by the main loop.
+
+        Returns:
+            int: The number of TS species whose guesses were collected.
+        """
+        collected = 0
+        for label, ts_guesses in list(self.pending_ts_guesses.items()):
+            if not all(future.done() for _, future in ts_guesses):
+                continue
+            del self.pending_ts_guesses[label]
+            for ts_guess, future in ts_guesses:
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.error(f'TS guess method {ts_guess.method} failed for {label}, got:\n{e}')
+                    ts_guess.success = False
+                if ts_guess.success is None:
+                    # not all methods report their success
+                    ts_guess.success = ts_guess.initial_xyz is not None
+            logger.info(f'TS guesses for {label} are ready')
+            self.restart_dirty_labels.add(label)
+            collected += 1
+        return collected
+
     def run_ts_conformer_jobs(self, label):
         """
         Spawn opt jobs at the ts_guesses level of theory for the TS guesses.
@@ -984,12 +1357,13 @@ class Scheduler(object):
         Args:
             label (str): The TS species label.
         """
-        plotter.save_conformers_file(project_directory=self.project_directory, label=label,
-                                     xyzs=[tsg.initial_xyz for tsg in self.species_dict[label].ts_guesses],
-                                     level_of_theory=self.ts_guess_level,
-                                     multiplicity=self.species_dict[label].multiplicity,
-                                     charge=self.species_dict[label].charge, is_ts=True,
-                                     ts_methods=[tsg.method for tsg in self.species_dict[label].ts_guesses])
+        self.artefact_writer.submit('save_conformers_file', key=f'{label} before optimization',
+                                    project_directory=self.project_directory, label=label,
+                                    xyzs=[tsg.initial_xyz for tsg in self.species_dict[label].ts_guesses],
+                                    level_of_theory=self.ts_guess_level,
+                                    multiplicity=self.species_dict[label].multiplicity,
+                                    charge=self.species_dict[label].charge, is_ts=True,
+                                    ts_methods=[tsg.method for tsg in self.species_dict[label].ts_guesses])
         successful_tsgs = [tsg for tsg in self.species_dict[label].ts_guesses if tsg.success]
         if len(successful_tsgs) > 1:
             self.job_dict[label]['conformers'] = dict()
@@ -1384,9 +1758,10 @@ class Scheduler(object):
                     self.species_list.append(bde_species)
                     self.species_dict[bde_species.label] = bde_species
                     self.unique_species_labels.append(bde_species.label)
+                    self.restart_dirty_labels.add(bde_species.label)
                     self.initialize_output_dict(label=bde_species.label)
                     self.job_dict[bde_species.label] = dict()
-                    self.running_jobs[bde_species.label] = list()
+                    self.running_jobs[bde_species.label] = dict()
                     if bde_species.number_of_atoms == 1:
                         logger.debug(f'Species {bde_species.label} is monoatomic')
                         # No need to run opt/freq jobs for a monoatomic species, only run sp (or composite if relevant)
@@ -1434,7 +1809,8 @@ class Scheduler(object):
                          pivots=pivots)
 
         elif 'brute' in directed_scan_type:
-            # spawn jobs all at once
+            # spawn jobs all at once, possibly bundling several grid points in a single submission
+            bundle = list() if directed_scan_bundling['enabled'] and not self.testing else None
             dihedrals = dict()
 
             for scan in scans:
@@ -1443,45 +1819,48 @@ class Scheduler(object):
                                                                                     index=1))
                 dihedrals[tuple(scan)] = [get_angle_in_180_range(original_dihedral + i * increment) for i in
                                                  range(int(360 / increment) + 1)]
-            modified_xyz = xyz
             if 'diagonal' not in directed_scan_type:
                 # increment dihedrals one by one (resulting in an ND scan)
-                all_dihedral_combinations = list(itertools.product(*[dihedrals[tuple(scan)] for scan in scans]))
-                for dihedral_tuple in all_dihedral_combinations:
-                    for scan, dihedral in zip(scans, dihedral_tuple):
-                        self.species_dict[label].set_dihedral(scan=scan, deg_abs=dihedral, count=False,
-                                                              xyz=modified_xyz)
-                        modified_xyz = self.species_dict[label].initial_xyz
-                    self.species_dict[label].rotors_dict[rotor_index]['number_of_running_jobs'] += 1
-                    self.run_job(label=label,
-                                 xyz=modified_xyz,
-                                 level_of_theory=self.scan_level,
-                                 job_type='directed_scan',
-                                 directed_scan_type=directed_scan_type,
-                                 directed_scans=scans,
-                                 directed_dihedrals=list(dihedral_tuple),
-                                 rotor_index=rotor_index,
-                                 pivots=pivots)
+                dihedral_tuples = list(itertools.product(*[dihedrals[tuple(scan)] for scan in scans]))
             else:
                 # increment all dihedrals at once (resulting in a unique 1D scan along several changing dimensions)
-                for i in range(len(dihedrals[tuple(scans[0])])):
-                    for scan in scans:
-                        dihedral = dihedrals[tuple(scan)][i]
+                dihedral_tuples = list(zip(*[dihedrals[tuple(scan)] for scan in scans]))
+            modified_xyzs = None
+            if self.species_dict[label].mol is not None:
+                # generate the geometries of all grid points in a single batch using a compiled zmat
+                try:
+                    modified_xyzs = generate_dihedral_grid_xyzs(xyz=xyz,
+                                                                mol=self.species_dict[label].mol,
+                                                                torsions=scans,
+                                                                dihedrals=dihedral_tuples,
+                                                                index=1,
+                                                                )
+                except (ConverterError, ZMatError) as e:
+                    logger.debug(f'Could not generate the directed scan geometries of {label} between pivots '
+                                 f'{pivots} in a batch, setting dihedrals one grid point at a time. Got:\n{e}')
+            modified_xyz = xyz
+            for i, dihedral_tuple in enumerate(dihedral_tuples):
+                if modified_xyzs is not None:
+                    modified_xyz = modified_xyzs[i]
+                else:
+                    for scan, dihedral in zip(scans, dihedral_tuple):
                         self.species_dict[label].set_dihedral(scan=scan, deg_abs=dihedral, count=False,
                                                               xyz=modified_xyz)
                         modified_xyz = self.species_dict[label].initial_xyz
-                    directed_dihedrals = [dihedrals[tuple(scan)][i] for scan in scans]
-                    self.species_dict[label].rotors_dict[rotor_index]['number_of_running_jobs'] += 1
-                    self.run_job(label=label,
-                                 xyz=modified_xyz,
-                                 level_of_theory=self.scan_level,
-                                 job_type='directed_scan',
-                                 directed_scan_type=directed_scan_type,
-                                 directed_scans=scans,
-                                 directed_dihedrals=directed_dihedrals,
-                                 rotor_index=rotor_index,
-                                 pivots=pivots,
-                                 )
+                self.species_dict[label].rotors_dict[rotor_index]['number_of_running_jobs'] += 1
+                self.run_job(label=label,
+                             xyz=modified_xyz,
+                             level_of_theory=self.scan_level,
+                             job_type='directed_scan',
+                             directed_scan_type=directed_scan_type,
+                             directed_scans=scans,
+                             directed_dihedrals=list(dihedral_tuple),
+                             rotor_index=rotor_index,
+                             pivots=pivots,
+                             bundle=bundle,
+                             )
+            if bundle:
+                self.submit_job_bundles(jobs=bundle, label=label)
 
         elif 'cont' in directed_scan_type:
             # spawn jobs one by one
@@ -1696,7 +2075,9 @@ class Scheduler(object):
                                    f'had {trshed_points} points that required optimization troubleshooting.')
                 rotor_path = os.path.join(self.project_directory, 'output', folder_name, label, 'rotors')
                 if len(results['scans']) == 1:  # plot 1D rotor
-                    plotter.plot_1d_rotor_scan(
+                    self.artefact_writer.submit(
+                        'plot_1d_rotor_scan',
+                        key=f'{label} {pivots}',
                         results=results,
                         path=rotor_path,
                         scan=rotor_dict['scan'],
@@ -1704,7 +2085,8 @@ class Scheduler(object):
                         original_dihedral=self.species_dict[label].rotors_dict[rotor_dict_index]['original_dihedrals'],
                     )
                 elif len(results['scans']) == 2:  # plot 2D rotor
-                    plotter.plot_2d_rotor_scan(results=results, path=rotor_path)
+                    self.artefact_writer.submit('plot_2d_rotor_scan', key=f'{label} {pivots}',
+                                                results=results, path=rotor_path)
                 else:
                     logger.debug('not plotting ND rotors with N > 2')
 
@@ -1716,14 +2098,16 @@ class Scheduler(object):
         Args:
             label (str): The species label.
         """
-        plotter.save_conformers_file(project_directory=self.project_directory,
-                                     label=label,
-                                     xyzs=self.species_dict[label].conformers,
-                                     level_of_theory=self.conformer_level,
-                                     multiplicity=self.species_dict[label].multiplicity,
-                                     charge=self.species_dict[label].charge,
-                                     is_ts=False,
-                                     )  # before optimization
+        self.artefact_writer.submit('save_conformers_file',
+                                    key=f'{label} before optimization',
+                                    project_directory=self.project_directory,
+                                    label=label,
+                                    xyzs=self.species_dict[label].conformers,
+                                    level_of_theory=self.conformer_level,
+                                    multiplicity=self.species_dict[label].multiplicity,
+                                    charge=self.species_dict[label].charge,
+                                    is_ts=False,
+                                    )  # before optimization
         self.species_dict[label].conformers_before_opt = tuple(self.species_dict[label].conformers)
         if self.species_dict[label].initial_xyz is None and self.species_dict[label].final_xyz is None \
                 and not self.testing:
@@ -1868,11 +2252,12 @@ class Scheduler(object):
                     xyzs.append(parser.parse_xyz_from_file(path=job.local_path_to_output_file))
             xyzs_in_original_order = xyzs
             energies, xyzs = sort_two_lists_by_the_first(self.species_dict[label].conformer_energies, xyzs)
-            plotter.save_conformers_file(project_directory=self.project_directory, label=label,
-                                         xyzs=self.species_dict[label].conformers, level_of_theory=self.conformer_level,
-                                         multiplicity=self.species_dict[label].multiplicity,
-                                         charge=self.species_dict[label].charge, is_ts=False,
-                                         energies=self.species_dict[label].conformer_energies)  # after optimization
+            self.artefact_writer.submit('save_conformers_file', key=f'{label} after optimization',
+                                        project_directory=self.project_directory, label=label,
+                                        xyzs=self.species_dict[label].conformers, level_of_theory=self.conformer_level,
+                                        multiplicity=self.species_dict[label].multiplicity,
+                                        charge=self.species_dict[label].charge, is_ts=False,
+                                        energies=self.species_dict[label].conformer_energies)  # after optimization
             # Run isomorphism checks if a 2D representation is available
             if self.species_dict[label].mol is not None:
                 for i, xyz in enumerate(xyzs):
@@ -2037,20 +2422,22 @@ class Scheduler(object):
                     logger.info(f'TS guess {tsg.index} for {label}. Method: {tsg.method}, relative energy: '
                                 f'{tsg.energy:.2f} kJ/mol, guess execution time: {tsg.execution_time}')
                     # for TSs, only use `draw_3d()`, not `show_sticks()` which gets connectivity wrong:
-                    plotter.draw_structure(xyz=tsg.initial_xyz, method='draw_3d')
+                    self.artefact_writer.submit('draw_structure', xyz=tsg.initial_xyz, method='draw_3d')
             if self.species_dict[label].chosen_ts is None:
                 raise SpeciesError(f'Could not pair most stable conformer {i_min} of {label} to a respective '
                                    f'TS guess')
-            plotter.save_conformers_file(project_directory=self.project_directory,
-                                         label=label,
-                                         xyzs=[tsg.opt_xyz for tsg in self.species_dict[label].ts_guesses],
-                                         level_of_theory=self.ts_guess_level,
-                                         multiplicity=self.species_dict[label].multiplicity,
-                                         charge=self.species_dict[label].charge,
-                                         is_ts=True,
-                                         energies=[tsg.energy for tsg in self.species_dict[label].ts_guesses],
-                                         ts_methods=[tsg.method for tsg in self.species_dict[label].ts_guesses],
-                                         )
+            self.artefact_writer.submit('save_conformers_file',
+                                        key=f'{label} after optimization',
+                                        project_directory=self.project_directory,
+                                        label=label,
+                                        xyzs=[tsg.opt_xyz for tsg in self.species_dict[label].ts_guesses],
+                                        level_of_theory=self.ts_guess_level,
+                                        multiplicity=self.species_dict[label].multiplicity,
+                                        charge=self.species_dict[label].charge,
+                                        is_ts=True,
+                                        energies=[tsg.energy for tsg in self.species_dict[label].ts_guesses],
+                                        ts_methods=[tsg.method for tsg in self.species_dict[label].ts_guesses],
+                                        )
 
     def parse_composite_geo(self, label, job):
         """
@@ -2079,15 +2466,18 @@ class Scheduler(object):
                 rxn_str = f' of reaction {self.species_dict[label].rxn_label}'
             logger.info(f'\nOptimized geometry for {label}{rxn_str} at {job.level.simple()}:\n'
                         f'{xyz_to_str(xyz_dict=self.species_dict[label].final_xyz)}\n')
-            plotter.save_geo(species=self.species_dict[label], project_directory=self.project_directory)
+            self.artefact_writer.submit('save_geo', key=label,
+                                        species=self.species_dict[label], project_directory=self.project_directory)
             if not job.is_ts:
-                plotter.draw_structure(species=self.species_dict[label],
-                                       project_directory=self.project_directory)
+                self.artefact_writer.submit('draw_structure', key=label,
+                                            species=self.species_dict[label],
+                                            project_directory=self.project_directory)
             else:
                 # for TSs, only use `draw_3d()`, not `show_sticks()` which gets connectivity wrong:
-                plotter.draw_structure(species=self.species_dict[label],
-                                       project_directory=self.project_directory,
-                                       method='draw_3d')
+                self.artefact_writer.submit('draw_structure', key=label,
+                                            species=self.species_dict[label],
+                                            project_directory=self.project_directory,
+                                            method='draw_3d')
             frequencies = parser.parse_frequencies(job.local_path_to_output_file, job.software)
             freq_ok = self.check_negative_freq(label=label, job=job, vibfreqs=frequencies)
             if freq_ok:
@@ -2144,7 +2534,8 @@ class Scheduler(object):
                 if self.job_types['fine']:
                     self.output[label]['job_types']['fine'] = True
                 self.species_dict[label].opt_level = self.opt_level.simple()
-                plotter.save_geo(species=self.species_dict[label], project_directory=self.project_directory)
+                self.artefact_writer.submit('save_geo', key=label,
+                                            species=self.species_dict[label], project_directory=self.project_directory)
                 if self.species_dict[label].is_ts:
                     rxn_str = f' of reaction {self.species_dict[label].rxn_label}'
                 else:
@@ -2174,7 +2565,9 @@ class Scheduler(object):
                 self.save_restart_dict()
                 self.output[label]['paths']['geo'] = job.local_path_to_output_file  # will be overwritten with freq
                 if not self.species_dict[label].is_ts:
-                    plotter.draw_structure(species=self.species_dict[label], project_directory=self.project_directory)
+                    self.artefact_writer.submit('draw_structure', key=label,
+                                                species=self.species_dict[label],
+                                                project_directory=self.project_directory)
                     is_isomorphic = self.species_dict[label].check_xyz_isomorphism(
                         allow_nonisomorphic_2d=self.allow_nonisomorphic_2d)
                     if is_isomorphic:
@@ -2185,8 +2578,10 @@ class Scheduler(object):
                     success &= is_isomorphic
                 else:
                     # for TSs, only use `draw_3d()`, not `show_sticks()` which gets connectivity wrong:
-                    plotter.draw_structure(species=self.species_dict[label], project_directory=self.project_directory,
-                                           method='draw_3d')
+                    self.artefact_writer.submit('draw_structure', key=label,
+                                                species=self.species_dict[label],
+                                                project_directory=self.project_directory,
+                                                method='draw_3d')
         else:
             self.troubleshoot_opt_jobs(label=label)
         if success:
@@ -2479,14 +2874,16 @@ class Scheduler(object):
         if energies is not None and len(energies):
             folder_name = 'rxns' if job.is_ts else 'Species'
             rotor_path = os.path.join(self.project_directory, 'output', folder_name, job.species_name, 'rotors')
-            plotter.plot_1d_rotor_scan(angles=angles,
-                                       energies=energies,
-                                       path=rotor_path,
-                                       scan=job.scan,
-                                       comment=message,
-                                       label=label,
-                                       original_dihedral=self.species_dict[label].rotors_dict[i]['original_dihedrals'],
-                                       )
+            self.artefact_writer.submit('plot_1d_rotor_scan',
+                                        key=f'{label} {job.scan}',
+                                        angles=angles,
+                                        energies=energies,
+                                        path=rotor_path,
+                                        scan=job.scan,
+                                        comment=message,
+                                        label=label,
+                                        original_dihedral=self.species_dict[label].rotors_dict[i]['original_dihedrals'],
+                                        )
 
         # Save the restart dictionary
         self.save_restart_dict()
@@ -2659,7 +3056,7 @@ class Scheduler(object):
         if done:
             # process conformers and DFT them
             logger.info(f'Final conformer for {label}:\n{lowest_conf[0]}')
-            plotter.draw_structure(xyz=lowest_conf[0], species=self.species_dict[label])
+            self.artefact_writer.submit('draw_structure', xyz=lowest_conf[0], species=self.species_dict[label])
             lowest_confs = conformers.get_lowest_confs(label=label,
                                                        confs=conf_list,
                                                        n=self.n_confs,
@@ -2673,7 +3070,7 @@ class Scheduler(object):
             ordinal = get_ordinal_indicator(self.species_dict[label].recent_md_conformer[2] + 1)
             logger.info(f'{self.species_dict[label].recent_md_conformer[2] + 1}{ordinal} conformer for '
                         f'{label}:\n{lowest_conf[0]}')
-            plotter.draw_structure(xyz=lowest_conf[0], species=self.species_dict[label])
+            self.artefact_writer.submit('draw_structure', xyz=lowest_conf[0], species=self.species_dict[label])
             ordinal = get_ordinal_indicator(self.species_dict[label].recent_md_conformer[2] + 2)
             logger.info(f'Spawning the {self.species_dict[label].recent_md_conformer[2] + 2}{ordinal} round of MD '
                         f'simulations for {label}')
@@ -2725,19 +3122,39 @@ class Scheduler(object):
                                if key in self.job_types and self.job_types[key]}
             logger.error(f'Species {label} did not converge. Job type status is: {job_type_status}')
         # Update restart dictionary and save the yaml restart file:
+        self.restart_dirty_labels.add(label)
         self.save_restart_dict()
 
-    def get_servers_jobs_ids(self):
+    def harvest_terminated_jobs(self):
         """
-        Check status on all active servers, return a list of relevant running job IDs
+        Determine the status of all running jobs that left the server queues and download their output files in bulk,
+        using a single queue query per server.
+        Results are stored in ``self.harvested_jobs`` and consumed by ``end_job``.
         """
-        self.servers_jobs_ids = list()
+        terminated_jobs = [job for job_id, jobs in self.jobs_by_id.items() if job_id not in self.servers_jobs_ids
+                           for job_name, job in jobs.items() if job_name not in self.harvested_jobs]
+        if terminated_jobs:
+            self.harvested_jobs.update(harvest_jobs(terminated_jobs))
+
+    def get_servers_jobs_ids(self) -> int:
+        """
+        Check status on all active servers (a single queue query per server), update the set of relevant running job
+        IDs, and record the IDs of jobs which left the queues since the previous check in ``self.completed_jobs_ids``.
+
+        Returns:
+            int: The number of jobs that left the server queues since the previous check.
+        """
+        previous_jobs_ids = self.servers_jobs_ids
+        self.servers_jobs_ids = set()
         for server in self.servers:
             if server != 'local':
                 with SSHClient(server) as ssh:
-                    self.servers_jobs_ids.extend(ssh.check_running_jobs_ids())
+                    self.servers_jobs_ids.update(ssh.check_running_jobs_ids())
             else:
-                self.servers_jobs_ids.extend(check_running_jobs_ids())
+                self.servers_jobs_ids.update(check_running_jobs_ids())
+        newly_completed_jobs_ids = previous_jobs_ids - self.servers_jobs_ids - self.completed_jobs_ids
+        self.completed_jobs_ids.update(newly_completed_jobs_ids)
+        return len(newly_completed_jobs_ids)
 
     def troubleshoot_negative_freq(self, label, job):
         """
@@ -2942,6 +3359,7 @@ class Scheduler(object):
                                           level_of_theory=self.opt_level)
         else:
             job.troubleshoot_server()
+            self.servers_jobs_ids.add(job.job_id)
 
     def troubleshoot_ess(self,
                          label: str,
@@ -2972,9 +3390,11 @@ class Scheduler(object):
 
         if 'Unknown' in job.job_status[1]['keywords'] and 'change_node' not in job.ess_trsh_methods:
             job.ess_trsh_methods.append('change_node')
+            self.remove_running_job(label=label, job_name=job.job_name)
             job.troubleshoot_server()
-            if job.job_name not in self.running_jobs[label]:
-                self.running_jobs[label].append(job.job_name)  # mark as a running job
+            self.servers_jobs_ids.add(job.job_id)
+            self.running_jobs[label][job.job_name] = job  # mark as a running job
+            self.jobs_by_id.setdefault(job.job_id, dict())[job.job_name] = job
         if job.software == 'gaussian':
             if self.species_dict[label].checkfile is None:
                 self.species_dict[label].checkfile = job.checkfile
@@ -3077,12 +3497,34 @@ class Scheduler(object):
             label (str): The species label.
         """
         logger.debug(f'Deleting all jobs for species {label}')
-        for job_dict in self.job_dict[label].values():
-            for job_name, job in job_dict.items():
-                if job_name in self.running_jobs[label]:
-                    logger.info(f'Deleted job {job_name}')
-                    job.delete()
-        self.running_jobs[label] = list()
+        for job_name, job in list(self.running_jobs[label].items()):
+            logger.info(f'Deleted job {job_name}')
+            job.delete()
+            self.remove_running_job(label=label, job_name=job_name)
+
+    def remove_running_job(self, label: str, job_name: str):
+        """
+        Stop tracking a job as running, removing it from ``self.running_jobs`` and from the job ID index.
+
+        Args:
+            label (str): The species label.
+            job_name (str): The job name from the running_jobs dict.
+        """
+        job = self.running_jobs[label].pop(job_name, None) if label in self.running_jobs else None
+        self.restart_dirty_labels.add(label)
+        if job is not None and self.jobs_by_id.get(job.job_id, dict()).get(job.job_name) is job:
+            del self.jobs_by_id[job.job_id][job.job_name]
+            if not self.jobs_by_id[job.job_id]:
+                del self.jobs_by_id[job.job_id]
+
+    def get_running_jobs_names(self) -> Dict[str, List[str]]:
+        """
+        Get the names of the currently running jobs.
+
+        Returns:
+            Dict[str, List[str]]: Keys are species labels, values are lists of running job names.
+        """
+        return {label: list(jobs.keys()) for label, jobs in self.running_jobs.items()}
 
     def restore_running_jobs(self):
         """
@@ -3098,12 +3540,8 @@ class Scheduler(object):
         else:
             for spc_label in jobs.keys():
                 if spc_label not in self.running_jobs:
-                    self.running_jobs[spc_label] = list()
+                    self.running_jobs[spc_label] = dict()
                 for job_description in jobs[spc_label]:
-                    if 'conformer' not in job_description or job_description['conformer'] < 0:
-                        self.running_jobs[spc_label].append(job_description['job_name'])
-                    else:
-                        self.running_jobs[spc_label].append(f'conformer{job_description["conformer"]}')
                     for species in self.species_list:
                         if species.label == spc_label:
                             break
@@ -3119,11 +3557,14 @@ class Scheduler(object):
                             self.job_dict[spc_label]['conformers'] = dict()
                     if 'conformer' not in job_description or job_description['conformer'] < 0:
                         self.job_dict[spc_label][job_description['job_type']][job_description['job_name']] = job
+                        self.running_jobs[spc_label][job_description['job_name']] = job
                     else:
                         self.job_dict[spc_label]['conformers'][int(job_description['conformer'])] = job
+                        self.running_jobs[spc_label][f'conformer{job_description["conformer"]}'] = job
                         # don't generate additional conformers for this species
-                        self.dont_gen_confs.append(spc_label)
-                    self.servers_jobs_ids.append(job.job_id)
+                        self.dont_gen_confs.add(spc_label)
+                    self.servers_jobs_ids.add(job.job_id)
+                    self.jobs_by_id.setdefault(job.job_id, dict())[job.job_name] = job
             if self.job_dict:
                 content = 'Restarting ARC, tracking the following jobs spawned in a previous session:'
                 for spc_label in self.job_dict.keys():
@@ -3138,24 +3579,67 @@ class Scheduler(object):
                 content += '\n\n'
                 logger.info(content)
 
-    def save_restart_dict(self):
+    def save_restart_dict(self, compact: bool = False):
         """
-        Update the restart_dict and save the restart.yml file.
+        Update the restart_dict and save the restart information.
+        Only the records of species marked in ``restart_dirty_labels`` (i.e., species whose jobs were spawned or
+        terminated, or whose state otherwise changed since the last save) are serialized,
+        and the records that actually changed are appended to the restart journal.
+        A full restart.yml snapshot of all species is saved (and the journal is cleared) the first time this method
+        is called, once the journal reaches ``restart_journal_compaction`` entries, or if ``compact`` is ``True``.
+
+        Args:
+            compact (bool, optional): Whether to save a full restart.yml snapshot.
         """
         if self.save_restart and self.restart_dict is not None:
-            logger.debug('Creating a restart file...')
-            self.restart_dict['output'] = self.output
-            self.restart_dict['species'] = [spc.as_dict() for spc in self.species_dict.values()]
-            self.restart_dict['running_jobs'] = dict()
-            for spc in self.species_dict.values():
-                if spc.label in self.running_jobs:
-                    self.restart_dict['running_jobs'][spc.label] = \
-                        [self.job_dict[spc.label][job_name.rsplit('_', 1)[0]][job_name].as_dict()
-                         for job_name in self.running_jobs[spc.label] if 'conformer' not in job_name] \
-                        + [self.job_dict[spc.label]['conformers'][int(job_name.split('mer')[1])].as_dict()
-                           for job_name in self.running_jobs[spc.label] if 'conformer' in job_name]
-            logger.debug(f'Dumping restart dictionary:\n{self.restart_dict}')
-            save_yaml_file(path=self.restart_path, content=self.restart_dict)
+            compact = compact or self.restart_journal_entries is None \
+                or self.restart_journal_entries >= restart_journal_compaction
+            labels = list(self.species_dict.keys()) if compact \
+                else [label for label in sorted(self.restart_dirty_labels) if label in self.species_dict]
+            self.restart_dirty_labels = set()
+            changed_records = dict()
+            for label in labels:
+                record = self.get_restart_record(label)
+                if record != self.restart_records.get(label):
+                    changed_records[label] = record
+                    self.restart_records[label] = copy.deepcopy(record)
+            if compact:
+                logger.debug('Creating a restart file...')
+                self.restart_dict['output'] = self.output
+                self.restart_dict['species'] = [self.restart_records[label]['species']
+                                                for label in self.species_dict.keys()]
+                self.restart_dict['running_jobs'] = {label: record['running_jobs']
+                                                     for label, record in self.restart_records.items()
+                                                     if record['running_jobs']}
+                save_yaml_file(path=self.restart_path, content=self.restart_dict)
+                if os.path.isfile(self.restart_journal_path):
+                    os.remove(self.restart_journal_path)
+                self.restart_journal_entries = 0
+            elif changed_records:
+                logger.debug(f'Appending to the restart journal:\n{changed_records}')
+                append_to_yaml_journal(path=self.restart_journal_path, content=changed_records)
+                self.restart_journal_entries += 1
+
+    def get_restart_record(self, label: str) -> dict:
+        """
+        Get the restart information of a single species.
+
+        Args:
+            label (str): The species label.
+
+        Returns: dict
+            The species ``output`` entry, ``species`` dictionary, and a list of its ``running_jobs`` dictionaries.
+        """
+        running_jobs = list()
+        if label in self.running_jobs:
+            running_jobs = [self.job_dict[label][job_name.rsplit('_', 1)[0]][job_name].as_dict()
+                            for job_name in self.running_jobs[label] if 'conformer' not in job_name] \
+                           + [self.job_dict[label]['conformers'][int(job_name.split('mer')[1])].as_dict()
+                              for job_name in self.running_jobs[label] if 'conformer' in job_name]
+        return {'output': self.output.get(label),
+                'species': self.species_dict[label].as_dict(),
+                'running_jobs': running_jobs,
+                }
 
     def make_reaction_labels_info_file(self):
         """A helper function for creating the `reactions labels.info` file"""
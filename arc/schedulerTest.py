@@ -8,7 +8,9 @@ This module contains unit tests for the arc.scheduler module
 import unittest
 import os
 import shutil
+from concurrent.futures import Future
 
+import arc.common as common
 import arc.rmgdb as rmgdb
 import arc.parser as parser
 from arc.common import arc_path, almost_equal_coords_lists
@@ -17,7 +19,7 @@ from arc.level import Level
 from arc.plotter import save_conformers_file
 from arc.scheduler import Scheduler
 from arc.imports import settings
-from arc.species.species import ARCSpecies
+from arc.species.species import ARCSpecies, TSGuess
 
 
 default_levels_of_theory = settings['default_levels_of_theory']
@@ -269,6 +271,234 @@ H      -1.82570782    0.42754384   -0.56130718"""
                          'not a torsional mode (angles = 179.91, 110.38 degrees)')
         self.assertFalse(self.sched1.species_dict['CtripCO'].rotors_dict[0]['success'])
 
+    def test_get_servers_jobs_ids(self):
+        """Test tracking jobs that left the server queues"""
+        servers, servers_jobs_ids = self.sched1.servers, self.sched1.servers_jobs_ids
+        self.sched1.servers = list()  # don't query any server
+        self.sched1.servers_jobs_ids = {'1234', '1235'}
+        self.sched1.completed_jobs_ids = {'1233'}
+        self.assertEqual(self.sched1.get_servers_jobs_ids(), 2)
+        self.assertEqual(self.sched1.servers_jobs_ids, set())
+        self.assertEqual(self.sched1.completed_jobs_ids, {'1233', '1234', '1235'})
+        self.assertEqual(self.sched1.get_servers_jobs_ids(), 0)
+        self.sched1.servers, self.sched1.servers_jobs_ids = servers, servers_jobs_ids
+
+    def test_remove_running_job(self):
+        """Test that running jobs are tracked by name and by job ID"""
+        label = 'C2H6'
+        running_jobs, jobs_by_id = self.sched1.running_jobs.get(label), self.sched1.jobs_by_id
+        self.job3.job_id = 1103
+        self.sched1.running_jobs[label] = {'conformer0': self.job1, self.job3.job_name: self.job3}
+        self.sched1.jobs_by_id = {self.job3.job_id: {self.job3.job_name: self.job3}}
+        self.assertEqual(self.sched1.get_running_jobs_names()[label], ['conformer0', self.job3.job_name])
+        self.sched1.remove_running_job(label=label, job_name=self.job3.job_name)
+        self.sched1.remove_running_job(label=label, job_name='conformer5')  # not running, nothing to remove
+        self.assertEqual(list(self.sched1.running_jobs[label].keys()), ['conformer0'])
+        self.assertEqual(self.sched1.jobs_by_id, dict())
+        self.sched1.jobs_by_id = jobs_by_id
+        if running_jobs is None:
+            del self.sched1.running_jobs[label]
+        else:
+            self.sched1.running_jobs[label] = running_jobs
+
+    def test_submit_job(self):
+        """Test submitting jobs asynchronously and collecting their IDs"""
+        xyz = {'symbols': ('C',), 'isotopes': (12,), 'coords': ((0.0, 0.0, 0.0),)}
+        jobs = [Job(project='project_test', ess_settings=self.ess_settings, species_name='methylamine', xyz=xyz,
+                    job_type='sp', level={'method': 'b3lyp', 'basis': '6-31g'}, multiplicity=1,
+                    project_directory=self.project_directory, job_num=job_num) for job_num in range(101, 111)]
+
+        def submit(job):
+            """Get a function which assigns a job its server ID instead of writing and submitting it"""
+            def run():
+                job.job_status[0], job.job_id = 'running', job.job_num
+            return run
+
+        for job in jobs:
+            job.run = submit(job)
+        servers_jobs_ids = self.sched1.servers_jobs_ids
+        self.sched1.servers_jobs_ids = set()
+        for job in jobs:
+            self.sched1.submit_job(job=job, label='methylamine')
+        self.assertIn('methylamine', self.sched1.pending_submissions)
+        self.sched1.collect_submissions()
+        self.assertEqual(self.sched1.pending_submissions, dict())
+        self.assertEqual(self.sched1.servers_jobs_ids, set(range(101, 111)))
+        self.assertEqual([job.job_id for job in jobs], list(range(101, 111)))
+        self.assertTrue(all(self.sched1.jobs_by_id[job.job_id][job.job_name] is job for job in jobs))
+        self.sched1.servers_jobs_ids = servers_jobs_ids
+        for job in jobs:
+            del self.sched1.jobs_by_id[job.job_id]
+
+    def test_collect_failed_submissions(self):
+        """Test troubleshooting jobs which could not be submitted instead of aborting the run"""
+        label = 'methylamine'
+        running_jobs, jobs_by_id = self.sched1.running_jobs.get(label), self.sched1.jobs_by_id
+        servers_jobs_ids = self.sched1.servers_jobs_ids
+        self.sched1.servers_jobs_ids, self.sched1.jobs_by_id = set(), dict()
+        self.sched1.running_jobs[label] = {'conformer0': self.job1, 'conformer1': self.job2}
+
+        def resubmit():
+            self.job1.job_status[0], self.job1.job_id = 'running', 2101
+
+        def fail_to_resubmit():
+            raise ConnectionError('No route to host')
+
+        self.job1.troubleshoot_server, self.job2.troubleshoot_server = resubmit, fail_to_resubmit
+        future1, future2 = Future(), Future()
+        future1.set_exception(OSError('Could not upload the input file'))
+        future2.set_exception(ConnectionError('No route to host'))
+        self.sched1.pending_submissions = {label: [(self.job1, future1), (self.job2, future2)]}
+        try:
+            self.sched1.collect_submissions()
+            self.assertEqual(self.sched1.pending_submissions, dict())
+            self.assertEqual(self.sched1.servers_jobs_ids, {2101})
+            self.assertIs(self.sched1.jobs_by_id[2101][self.job1.job_name], self.job1)
+            self.assertEqual(list(self.sched1.running_jobs[label].keys()), ['conformer0'])
+            self.assertEqual(self.job2.job_status[0], 'errored')
+        finally:
+            del self.job1.troubleshoot_server, self.job2.troubleshoot_server
+            self.job1.job_status[0] = self.job2.job_status[0] = 'initializing'
+            self.job1.job_id = self.job2.job_id = 0
+            self.sched1.servers_jobs_ids, self.sched1.jobs_by_id = servers_jobs_ids, jobs_by_id
+            if running_jobs is None:
+                del self.sched1.running_jobs[label]
+            else:
+                self.sched1.running_jobs[label] = running_jobs
+
+    def test_end_job_harvested(self):
+        """Test ending jobs whose status was already determined in bulk"""
+        label = 'C2H6'
+        running_jobs, harvested_jobs = self.sched1.running_jobs.get(label), self.sched1.harvested_jobs
+        xyz = {'symbols': ('C',), 'isotopes': (12,), 'coords': ((0.0, 0.0, 0.0),)}
+        done_job, failed_job = [Job(project='project_test', ess_settings=self.ess_settings, species_name=label,
+                                    xyz=xyz, job_type='freq', level={'method': 'b3lyp', 'basis': '6-31g'},
+                                    multiplicity=1, project_directory=self.project_directory, job_num=job_num)
+                                for job_num in [120, 121]]
+        done_job.local_path_to_output_file = os.path.join(arc_path, 'arc', 'testing', 'freq', 'CH3OO_freq_gaussian.out')
+        done_job.job_status = ['done', {'status': 'done', 'keywords': list(), 'error': '', 'line': ''}]
+        failed_job.job_status[0] = 'done'
+
+        def determine_job_status():
+            raise AssertionError('The status of a harvested job should not be determined again')
+
+        ledger, reruns = list(), list()
+        done_job.determine_job_status = failed_job.determine_job_status = determine_job_status
+        done_job.write_completed_job_to_ledger = lambda: ledger.append(done_job.job_name)
+        self.sched1._run_a_job = lambda job, label: reruns.append(job.job_name)
+        self.sched1.running_jobs[label] = {done_job.job_name: done_job, failed_job.job_name: failed_job}
+        self.sched1.harvested_jobs = {done_job.job_name: None,
+                                      failed_job.job_name: IOError('Could not download the output file')}
+        try:
+            self.assertTrue(self.sched1.end_job(job=done_job, label=label, job_name=done_job.job_name))
+            self.assertEqual(ledger, [done_job.job_name])
+            # the harvesting IOError is raised in end_job, where the job is considered as never ran and is re-run
+            self.assertFalse(self.sched1.end_job(job=failed_job, label=label, job_name=failed_job.job_name))
+            self.assertIn(failed_job.job_name, reruns)
+            self.assertEqual(self.sched1.harvested_jobs, dict())
+            self.assertEqual(self.sched1.running_jobs[label], dict())
+        finally:
+            del self.sched1._run_a_job
+            self.sched1.harvested_jobs = harvested_jobs
+            if running_jobs is None:
+                del self.sched1.running_jobs[label]
+            else:
+                self.sched1.running_jobs[label] = running_jobs
+
+    def test_save_restart_dict(self):
+        """Test that only the restart records of species marked as changed are serialized and journaled"""
+        attributes = ['save_restart', 'restart_dict', 'restart_path', 'restart_journal_path', 'restart_records',
+                      'restart_journal_entries', 'restart_dirty_labels']
+        values = {attribute: getattr(self.sched1, attribute) for attribute in attributes}
+        outputs = {label: self.sched1.output[label].get('conformers') for label in ['methylamine', 'C2H6']}
+        self.sched1.save_restart, self.sched1.restart_dict = True, dict()
+        self.sched1.restart_path = os.path.join(self.project_directory, 'restart_test.yml')
+        self.sched1.restart_journal_path = os.path.join(self.project_directory, 'restart_journal_test.yml')
+        self.sched1.restart_records, self.sched1.restart_journal_entries = dict(), None
+        try:
+            self.sched1.save_restart_dict()  # the first save is a full snapshot
+            self.assertTrue(os.path.isfile(self.sched1.restart_path))
+            self.assertEqual(sorted(self.sched1.restart_records.keys()), ['C2H6', 'CtripCO', 'methylamine'])
+            self.assertEqual(self.sched1.restart_dirty_labels, set())
+            self.sched1.output['methylamine']['conformers'] = 'changed, but not marked'
+            self.sched1.output['C2H6']['conformers'] = 'changed'
+            self.sched1.restart_dirty_labels.add('C2H6')
+            self.sched1.save_restart_dict()
+            self.assertEqual(self.sched1.restart_journal_entries, 1)
+            self.assertEqual(self.sched1.restart_records['C2H6']['output']['conformers'], 'changed')
+            self.assertEqual(self.sched1.restart_records['methylamine']['output']['conformers'],
+                             outputs['methylamine'])
+            journal = common.apply_restart_journal(restart_dict=dict(),
+                                                   journal_path=self.sched1.restart_journal_path)
+            self.assertEqual(list(journal['output'].keys()), ['C2H6'])
+            self.sched1.restart_dirty_labels.add('C2H6')
+            self.sched1.save_restart_dict()  # nothing changed, nothing journaled
+            self.assertEqual(self.sched1.restart_journal_entries, 1)
+            self.sched1.save_restart_dict(compact=True)  # a snapshot refreshes the records of all species
+            self.assertEqual(self.sched1.restart_records['methylamine']['output']['conformers'],
+                             'changed, but not marked')
+            self.assertFalse(os.path.isfile(self.sched1.restart_journal_path))
+        finally:
+            for label, conformers in outputs.items():
+                self.sched1.output[label]['conformers'] = conformers
+            for attribute, value in values.items():
+                setattr(self.sched1, attribute, value)
+
+    def test_collect_generated_conformers(self):
+        """Test processing conformers generated in a separate process"""
+        label = 'CtripCO'
+        num_conformers = len(self.sched1.species_dict[label].conformers)
+        pending_future, done_future = Future(), Future()
+        done_future.set_result([{'index': 0, 'xyz': self.spc3.get_xyz(), 'FF energy': -10.0, 'source': 'test'}])
+        self.sched1.pending_conformer_generation = {'methylamine': pending_future, label: done_future}
+        self.assertEqual(self.sched1.collect_generated_conformers(), 1)
+        self.assertEqual(list(self.sched1.pending_conformer_generation.keys()), ['methylamine'])
+        self.assertEqual(len(self.sched1.species_dict[label].conformers), num_conformers + 1)
+        self.assertIsNone(self.sched1.species_dict[label].conformer_energies[-1])
+        self.assertEqual(self.sched1.collect_generated_conformers(), 0)
+        self.sched1.pending_conformer_generation = dict()
+        del self.sched1.species_dict[label].conformers[num_conformers:]
+        del self.sched1.species_dict[label].conformer_energies[num_conformers:]
+
+    def test_is_conformer_selection_final(self):
+        """Test determining whether the most stable conformer could be selected before all conformer jobs terminated"""
+        label = 'methylamine'
+        job_dict, running_jobs = self.sched1.job_dict[label], self.sched1.running_jobs.get(label)
+        energies = self.sched1.species_dict[label].conformer_energies
+        selection_settings = settings['streaming_conformer_selection'].copy()
+        self.sched1.job_dict[label] = {'conformers': {i: self.job1 for i in range(4)}}
+        self.sched1.running_jobs[label] = {'conformer3': self.job1}
+        self.sched1.species_dict[label].conformer_energies = [-100.0, -80.0, -50.0, None]
+        settings['streaming_conformer_selection'].update({'enabled': False, 'min_fraction': 0.5, 'min_count': 3,
+                                                          'energy_margin': 10.0})
+        self.assertFalse(self.sched1.is_conformer_selection_final(label))  # not enabled
+        settings['streaming_conformer_selection']['enabled'] = True
+        self.assertTrue(self.sched1.is_conformer_selection_final(label))
+        settings['streaming_conformer_selection']['energy_margin'] = 30.0
+        self.assertFalse(self.sched1.is_conformer_selection_final(label))  # no clear winner
+        settings['streaming_conformer_selection'].update({'energy_margin': 10.0, 'min_fraction': 0.8})
+        self.assertFalse(self.sched1.is_conformer_selection_final(label))  # not enough terminated conformer jobs
+        settings['streaming_conformer_selection'].update(selection_settings)
+        self.sched1.job_dict[label], self.sched1.species_dict[label].conformer_energies = job_dict, energies
+        if running_jobs is None:
+            del self.sched1.running_jobs[label]
+        else:
+            self.sched1.running_jobs[label] = running_jobs
+
+    def test_collect_ts_guesses(self):
+        """Test collecting TS guesses generated in the TS guess thread pool"""
+        tsg1, tsg2, tsg3 = TSGuess(method='autotst'), TSGuess(method='gcn'), TSGuess(method='gcn')
+        future1, future2, future3 = Future(), Future(), Future()
+        future1.set_result(None)
+        future2.set_exception(RuntimeError('GCN failed'))
+        self.sched1.pending_ts_guesses = {'TS0': [(tsg1, future1), (tsg2, future2)], 'TS1': [(tsg3, future3)]}
+        self.assertEqual(self.sched1.collect_ts_guesses(), 1)
+        self.assertEqual(list(self.sched1.pending_ts_guesses.keys()), ['TS1'])
+        self.assertFalse(tsg1.success)  # AutoTST did not generate a guess
+        self.assertFalse(tsg2.success)
+        self.assertIsNone(tsg3.success)
+        self.sched1.pending_ts_guesses = dict()
+
     @classmethod
     def tearDownClass(cls):
         """
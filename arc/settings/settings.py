@@ -41,6 +41,7 @@ servers = {
         'key': 'path_to_rsa_key',
         'cpus': 24,  # number of cpu's per node, optional (default: 8)
         'memory': 256,  # amount of memory per node in GB, optional (default: 16)
+        'max_job_time': 240,  # the maximal wall time of a job in hours, optional (default: no limit)
     },
     'local': {
         'cluster_soft': 'OGE',
@@ -193,3 +194,109 @@ default_job_settings = {
     'job_time_limit_hrs': 120,
     'job_max_server_node_memory_allocation': 0.8,  # e.g., at most 80% node memory will be used
 }
+
+# Scheduler queue polling intervals (in seconds)
+# The queue of each active server is checked once per Scheduler pass. The waiting time between passes is reset to 'min'
+# whenever jobs terminate, and is multiplied by 'factor' (up to 'max') for each pass in which no job changed its status.
+# Set 'min' and 'max' to the same value to poll the servers at a fixed interval.
+polling_intervals = {
+    'min': 10,  # Default: 10 seconds
+    'max': 120,  # Default: 120 seconds
+    'factor': 1.5,  # Default: 1.5
+}
+
+# Concurrent job submission
+# Jobs are written, uploaded and submitted by a pool of worker threads, so that the Scheduler does not wait for each
+# submission before spawning the next job. 'max_workers' bounds the total number of simultaneous submissions,
+# and 'max_per_server' bounds the number of simultaneous submissions to each server.
+# Set 'max_workers' to 1 to submit jobs sequentially.
+job_submission_concurrency = {
+    'max_workers': 8,  # Default: 8
+    'max_per_server': 4,  # Default: 4
+}
+
+# Restart journal
+# Scheduler events append only the records of species that changed to 'restart_journal.yml' in the project folder.
+# The journal is compacted into a full 'restart.yml' snapshot after this many entries (and when ARC terminates).
+restart_journal_compaction = 100  # Default: 100 entries
+
+# Parallel conformer generation
+# Force field conformer searches of different species run in a pool of local processes, and the conformer jobs of
+# each species are spawned as soon as its search completes. Set to 1 to generate conformers sequentially,
+# or to 0 to use all available CPUs.
+conformer_generation_processes = 0  # Default: 0
+
+# Concurrent TS guess generation
+# TS guess methods of all reactions run in a pool of worker threads when the Scheduler starts (most methods run
+# external programs), and the conformer jobs of each TS are spawned as soon as all of its own guesses are ready.
+# 'max_workers' bounds the total number of methods running simultaneously, and 'max_per_method' bounds the number
+# of simultaneous runs of specific methods. AutoTST writes its guess to a fixed path, so it must run one at a time.
+ts_guess_concurrency = {
+    'max_workers': 8,  # Default: 8
+    'max_per_method': {'autotst': 1,  # Default: 1 (do not increase)
+                       'gcn': 4,  # Default: 4
+                       },
+}
+
+# The TS-GCN inference worker
+# GCN TS guesses are generated by a long-lived worker process which loads the network once. If the worker does not
+# respond within 'per_reaction' seconds per requested reaction (plus 'startup' seconds when the worker is started),
+# it is stopped and the GCN inference script is run separately for each reaction instead.
+gcn_worker_timeout = {
+    'startup': 600,  # Default: 600 seconds
+    'per_reaction': 120,  # Default: 120 seconds
+}
+
+# Streaming conformer selection
+# If enabled, the geometry optimization of a (non-TS) species starts before all of its conformer jobs terminate,
+# once at least 'min_fraction' of its conformer jobs (and no less than 'min_count' jobs) terminated, and the lowest
+# conformer energy is lower than all other converged conformer energies by at least 'energy_margin' (in kJ/mol).
+# The remaining conformer jobs of the species are then deleted. Note the trade-off: only the conformers of terminated
+# jobs are compared, so a conformer whose job was deleted might have been lower in energy than the selected one.
+# A larger 'min_fraction' makes this less likely, at the expense of waiting for more conformer jobs.
+streaming_conformer_selection = {
+    'enabled': False,  # Default: False (wait for all conformer jobs)
+    'min_fraction': 0.5,  # Default: 0.5
+    'min_count': 3,  # Default: 3
+    'energy_margin': 10.0,  # Default: 10 kJ/mol
+}
+
+# Parallel statmech processing
+# After all jobs terminated, species statmech and thermo (and the rate coefficients of reactions whose reactants and
+# products were already processed) are computed in a pool of local processes. Set to 1 to process sequentially,
+# or to 0 to use all available CPUs.
+statmech_processes = 0  # Default: 0
+
+# RMG database snapshots
+# The RMG database pieces loaded by ARC (thermo and kinetics libraries, and trained families) are saved as a binary
+# snapshot after loading them from the RMG-database text files, and later runs requesting the same pieces load the
+# snapshot instead. Snapshots are keyed by the requested libraries and families and by the RMG-database git commit,
+# so changes to the database are picked up. If 'path' is None, snapshots are saved under ~/.arc/rmg_db_snapshots.
+rmg_database_snapshots = {
+    'enabled': True,  # Default: True
+    'path': None,  # Default: None
+}
+
+# Output artefacts
+# Plots and geometry files (rotor scans, conformers, optimized geometries) are rendered and written by a background
+# process with the non-interactive Agg matplotlib backend, so they do not delay job harvesting. Pending artefacts are
+# replaced by more recent versions of the same artefact. Set 'asynchronous' to False to write them inline, or set
+# 'enabled' to False to skip them altogether (e.g., for headless high-throughput runs).
+artefact_writer = {
+    'enabled': True,  # Default: True
+    'asynchronous': True,  # Default: True
+}
+
+# Bundled brute force directed scans
+# If enabled, the grid point jobs of brute force directed scans ('brute_force_sp', 'brute_force_opt', and their
+# 'diagonal' variants) are submitted in bundles of up to 'max_jobs_per_bundle' jobs instead of one submission per
+# grid point. Each bundle is a single server job which runs the grid point jobs on one node, 'parallel_jobs' at a time
+# (requesting the cores of 'parallel_jobs' jobs). A bundle requests the job time limit times the number of
+# consecutive rounds of 'parallel_jobs' jobs it runs. If a server has a 'max_job_time' (in hours, see ``servers``),
+# bundles are made small enough for this time to fit in it. Running several jobs at a time requires the scratch
+# folders in the submit scripts to include the job name (as in the examples in submit.py).
+directed_scan_bundling = {
+    'enabled': False,  # Default: False
+    'max_jobs_per_bundle': 50,  # Default: 50
+    'parallel_jobs': 1,  # Default: 1
+}
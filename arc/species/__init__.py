@@ -1,5 +1,9 @@
-import arc.species.conformers
+# The converter is imported first, it resolves the circular imports of the converter, zmat, and vectors modules
 import arc.species.converter
-import arc.species.species
-import arc.species.xyz_to_2d
-from arc.species.species import ARCSpecies
+from arc.lazy import lazy_package_attributes
+
+__getattr__, __dir__ = lazy_package_attributes(
+    package=__name__,
+    submodules=['conformers', 'species', 'xyz_to_2d'],
+    attributes={'ARCSpecies': 'arc.species.species'},
+)
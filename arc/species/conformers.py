@@ -32,20 +32,29 @@ Module workflow::
         deduce_new_conformers
             get_torsion_angles, determine_torsion_symmetry, determine_torsion_sampling_points,
             change_dihedrals_and_force_field_it
+                scan_dihedral_combinations (distributed over a process pool)
         get_lowest_confs
 
 """
 
 import copy
 import logging
+import math
+import multiprocessing
+import os
+import pickle
 import sys
 import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from itertools import product
 from typing import Optional, Tuple, Union
 
+import numpy as np
 import openbabel as ob
 import pybel as pyb
 from rdkit import Chem
+from rdkit.Chem import rdMolTransforms as rdMT
 from rdkit.Chem.rdchem import EditableMol as RDMol
 
 import rmgpy.molecule.group as gr
@@ -98,6 +107,21 @@ COMBINATION_THRESHOLD = 1000
 # Consolidation tolerances for Z matrices
 CONSOLIDATION_TOLS = {'R': 1e-2, 'A': 1e-2, 'D': 1e-2}
 
+# The number of threads to use for force field optimization of embedded RDKit conformers (0 to use all available CPUs)
+FF_NUM_THREADS = 0
+
+# The maximal number of times to restart a non-converged force field optimization (each of up to 500 iterations)
+MAX_FF_OPTIMIZATION_ROUNDS = 200
+
+# The number of processes to distribute dihedral combinations over (0 to use all available CPUs, 1 to run serially)
+COMBINATION_PROCESSES = 0
+
+# The minimal number of dihedral combinations for which a process pool is used (smaller scans run serially)
+MIN_PARALLEL_COMBINATIONS = 50
+
+# The state of a dihedral combinations worker process (set once per process by init_combination_worker())
+_combination_worker = None
+
 
 def generate_conformers(mol_list,
                         label,
@@ -454,30 +478,32 @@ def conformers_combinations_by_lowest_conformer(label, mol, base_xyz, multiple_t
     lowest_conf_i = None
     for i in range(max_combination_iterations):
         newest_conformers_dict, newest_conformer_list = dict(), list()  # conformers from the current iteration
+        # scan the sampling points of all torsions together, each combination only changes a single torsion
+        tor_dihedrals, new_dihedrals = list(), list()
         for tor, sampling_points in zip(multiple_tors, multiple_sampling_points):
-            xyzs, energies = change_dihedrals_and_force_field_it(label, mol, xyz=base_xyz, torsions=[tor],
-                                                                 new_dihedrals=[[sp] for sp in sampling_points],
-                                                                 force_field=force_field, optimize=False)
             newest_conformers_dict[tor] = list()  # keys are torsions for plotting
-            for xyz, energy, dihedral in zip(xyzs, energies, sampling_points):
-                exists = False
-                if any([converter.compare_confs(xyz, conf['xyz']) for conf in new_conformers + newest_conformer_list]):
-                    exists = True
-                if xyz is not None:
-                    conformer = {'index': len_conformers + len(new_conformers) + len(newest_conformer_list),
-                                 'xyz': xyz,
-                                 'FF energy': round(energy, 3),
-                                 'source': f'Changing dihedrals on most stable conformer, iteration {i}',
-                                 'torsion': tor,
-                                 'dihedral': round(dihedral, 2)}
-                    newest_conformers_dict[tor].append(conformer)
-                    if not exists:
-                        newest_conformer_list.append(conformer)
-                else:
-                    # if xyz is None, atoms have collided
-                    logger.debug(f'\n\natoms colliding in {label} for torsion {tor} and dihedral {dihedral}:')
-                    logger.debug(xyz)
-                    logger.debug('\n\n')
+            for sp in sampling_points:
+                tor_dihedrals.append((tor, sp))
+                new_dihedrals.append([sp if other_tor == tor else None for other_tor in multiple_tors])
+        results = scan_dihedral_combinations(label, mol, xyz=base_xyz, torsions=multiple_tors,
+                                             new_dihedrals=new_dihedrals, optimize=False, force_field=force_field)
+        for (tor, dihedral), (xyz, energy) in zip(tor_dihedrals, results):
+            if xyz is not None:
+                exists = any([converter.compare_confs(xyz, conf['xyz'])
+                              for conf in new_conformers + newest_conformer_list])
+                conformer = {'index': len_conformers + len(new_conformers) + len(newest_conformer_list),
+                             'xyz': xyz,
+                             'FF energy': round(energy, 3),
+                             'source': f'Changing dihedrals on most stable conformer, iteration {i}',
+                             'torsion': tor,
+                             'dihedral': round(dihedral, 2)}
+                newest_conformers_dict[tor].append(conformer)
+                if not exists:
+                    newest_conformer_list.append(conformer)
+            else:
+                # if xyz is None, the FF energy could not be determined
+                logger.debug(f'\n\nCould not determine the FF energy of {label} for torsion {tor} '
+                             f'and dihedral {dihedral}\n\n')
         new_conformers.extend(newest_conformer_list)
         if not newest_conformer_list:
             newest_conformer_list = [lowest_conf_i]
@@ -660,33 +686,182 @@ def change_dihedrals_and_force_field_it(label, mol, xyz, torsions, new_dihedrals
                                                force_field=force_field, suppress_warning=True)
         return xyz, energy
 
-    xyzs, energies = list(), list()
     # make sure new_dihedrals is a list of lists (or tuples):
     if isinstance(new_dihedrals, (int, float)):
         new_dihedrals = [[new_dihedrals]]
     if isinstance(new_dihedrals, list) and not isinstance(new_dihedrals[0], (list, tuple)):
         new_dihedrals = [new_dihedrals]
 
+    xyzs, energies = list(), list()
+    for xyz_, energy in scan_dihedral_combinations(label, mol, xyz=xyz, torsions=torsions,
+                                                   new_dihedrals=new_dihedrals, optimize=optimize,
+                                                   force_field=force_field):
+        if xyz_ is not None:
+            xyzs.append(xyz_)
+            energies.append(energy)
+    return xyzs, energies
+
+
+def scan_dihedral_combinations(label, mol, xyz, torsions, new_dihedrals, optimize=True, force_field='MMFF94s',
+                               num_processes=None):
+    """
+    Set the dihedrals of each combination on a base geometry and get the respective FF energies.
+    Large scans are split into chunks and distributed over a process pool. Each worker process builds
+    the RDKit molecule and the force field setup once, and all combinations of a chunk are
+    optimized together. The results are returned in the order of ``new_dihedrals``.
+
+    Args:
+        label (str): The species' label.
+        mol (Molecule): The RMG molecule with the connectivity information.
+        xyz (dict): The base 3D geometry to be changed.
+        torsions (list): Entries are torsion tuples for which the dihedral will be changed relative to xyz.
+        new_dihedrals (list): Entries are same size lists of dihedral angles (floats) corresponding to the torsions.
+                              A ``None`` angle leaves the respective torsion as in ``xyz``.
+        optimize (bool, optional): Whether to return the FF optimized coordinates. True to return them.
+        force_field (str, optional): The type of force field to use.
+        num_processes (int, optional): The number of processes to use (0 to use all available CPUs).
+                                       Defaults to ``COMBINATION_PROCESSES``.
+
+    Returns:
+        list: Entries are (xyz, energy) tuples corresponding to the entries of ``new_dihedrals``,
+              ``(None, None)`` if the FF energy of a combination could not be determined.
+    """
+    if not new_dihedrals:
+        return list()
+    num_processes = COMBINATION_PROCESSES if num_processes is None else num_processes
+    num_processes = num_processes or os.cpu_count() or 1
+    num_processes = min(num_processes, math.ceil(len(new_dihedrals) / MIN_PARALLEL_COMBINATIONS))
+    if num_processes > 1:
+        # several chunks per process to balance the load, executor.map() keeps the chunks in order
+        chunk_size = math.ceil(len(new_dihedrals) / (num_processes * 4))
+        chunks = [new_dihedrals[i:i + chunk_size] for i in range(0, len(new_dihedrals), chunk_size)]
+        try:
+            # this may run in the Scheduler process alongside its threads, which a forked worker could inherit
+            # mid-operation (e.g., holding a lock), workers are therefore started from a forkserver
+            with ProcessPoolExecutor(max_workers=num_processes,
+                                     mp_context=multiprocessing.get_context('forkserver'),
+                                     initializer=init_combination_worker,
+                                     initargs=(label, mol, xyz, torsions, force_field)) as executor:
+                results = list()
+                for chunk_results in executor.map(run_combination_worker, chunks, [optimize] * len(chunks)):
+                    results.extend(chunk_results)
+                return results
+        except (BrokenProcessPool, OSError, pickle.PicklingError) as e:
+            logger.warning(f'Could not scan dihedral combinations of {label} in parallel, got:\n{e}\n'
+                           f'Scanning them serially.')
+    worker = setup_combination_worker(label, mol, xyz, torsions, force_field, num_threads=FF_NUM_THREADS)
+    return scan_combinations_chunk(worker, new_dihedrals, optimize=optimize)
+
+
+def setup_combination_worker(label, mol, xyz, torsions, force_field='MMFF94s', num_threads=1):
+    """
+    Build the objects shared by all dihedral combinations of a scan: the RDKit molecule and its force field setup.
+
+    Args:
+        label (str): The species' label.
+        mol (Molecule): The RMG molecule with the connectivity information.
+        xyz (dict): The base 3D geometry to be changed.
+        torsions (list): Entries are 1-indexed torsion tuples for which the dihedral will be changed.
+        force_field (str, optional): The type of force field to use.
+        num_threads (int, optional): The number of threads to use for the FF optimization.
+
+    Returns:
+        dict: The worker state.
+    """
+    rd_mol = converter.to_rdkit_mol(mol=mol, remove_h=False)
+    mol_properties = None
+    if force_field.lower() in ['mmff94', 'mmff94s', 'uff']:
+        mol_properties = Chem.AllChem.MMFFGetMoleculeProperties(rd_mol, mmffVariant=force_field)
+    return {'label': label,
+            'mol': mol,
+            'xyz': xyz,
+            'torsions': [[index - 1 for index in torsion] for torsion in torsions],
+            'force_field': force_field,
+            'rd_mol': rd_mol,
+            'mol_properties': mol_properties,
+            'num_threads': num_threads,
+            }
+
+
+def scan_combinations_chunk(worker, new_dihedrals, optimize=True):
+    """
+    Set the dihedrals of each combination and optimize all resulting conformers together.
+
+    Args:
+        worker (dict): The worker state, generated by setup_combination_worker().
+        new_dihedrals (list): Entries are same size lists of dihedral angles corresponding to the worker's torsions.
+        optimize (bool, optional): Whether to return the FF optimized coordinates. True to return them.
+
+    Returns:
+        list: Entries are (xyz, energy) tuples corresponding to the entries of ``new_dihedrals``.
+    """
+    label, rd_mol, xyz = worker['label'], worker['rd_mol'], worker['xyz']
+    rd_mol.RemoveAllConformers()
     for dihedrals in new_dihedrals:
-        xyz_dihedrals = xyz
-        for torsion, dihedral in zip(torsions, dihedrals):
-            conf, rd_mol = converter.rdkit_conf_from_mol(mol, xyz_dihedrals)
-            if conf is not None:
-                torsion_0_indexed = [tor - 1 for tor in torsion]
-                xyz_dihedrals = converter.set_rdkit_dihedrals(conf, rd_mol, torsion_0_indexed, deg_abs=dihedral)
-        if force_field != 'gromacs':
-            xyz_, energy = get_force_field_energies(label, mol=mol, xyz=xyz_dihedrals, optimize=True,
-                                                    force_field=force_field, suppress_warning=True)
-            if energy and xyz_:
-                energies.append(energy[0])
-                if optimize:
-                    xyzs.append(xyz_[0])
-                else:
-                    xyzs.append(xyz_dihedrals)
+        rd_conf = Chem.Conformer(rd_mol.GetNumAtoms())
+        for i in range(rd_mol.GetNumAtoms()):
+            rd_conf.SetAtomPosition(i, xyz['coords'][i])
+        conf = rd_mol.GetConformer(rd_mol.AddConformer(rd_conf, assignId=True))
+        for torsion, dihedral in zip(worker['torsions'], dihedrals):
+            if dihedral is not None:
+                rdMT.SetDihedralDeg(conf, torsion[0], torsion[1], torsion[2], torsion[3], dihedral)
+    xyzs_dihedrals = read_rdkit_embedded_conformers(label, rd_mol)
+    if worker['force_field'] == 'gromacs':
+        return [(xyz_dihedrals, None) for xyz_dihedrals in xyzs_dihedrals]
+    if worker['mol_properties'] is not None:
+        xyzs, energies = rdkit_force_field(label, rd_mol, force_field=worker['force_field'], optimize=True,
+                                           num_threads=worker['num_threads'],
+                                           mol_properties=worker['mol_properties'])
+        return [(xyz_ if optimize else xyz_dihedrals, float(energy))
+                for xyz_, energy, xyz_dihedrals in zip(xyzs, energies, xyzs_dihedrals)]
+    # the force field could not be set up in RDKit, treat each conformer separately (falls back to OpenBabel)
+    results = list()
+    for xyz_dihedrals in xyzs_dihedrals:
+        xyzs, energies = get_force_field_energies(label, mol=worker['mol'], xyz=xyz_dihedrals, optimize=True,
+                                                  force_field=worker['force_field'], suppress_warning=True)
+        if energies and xyzs:
+            results.append((xyzs[0] if optimize else xyz_dihedrals, energies[0]))
         else:
-            energies.append(None)
-            xyzs.append(xyz_dihedrals)
-    return xyzs, energies
+            results.append((None, None))
+    return results
+
+
+def limit_force_field_to_single_cpu():
+    """
+    Run all force field computations of the current process on a single CPU.
+    Used in worker processes that generate conformers of different species in parallel.
+    """
+    global COMBINATION_PROCESSES, FF_NUM_THREADS
+    COMBINATION_PROCESSES, FF_NUM_THREADS = 1, 1
+
+
+def init_combination_worker(label, mol, xyz, torsions, force_field):
+    """
+    Initialize a dihedral combinations worker process (called once per process by the process pool).
+
+    Args:
+        label (str): The species' label.
+        mol (Molecule): The RMG molecule with the connectivity information.
+        xyz (dict): The base 3D geometry to be changed.
+        torsions (list): Entries are 1-indexed torsion tuples for which the dihedral will be changed.
+        force_field (str): The type of force field to use.
+    """
+    global _combination_worker
+    _combination_worker = setup_combination_worker(label, mol, xyz, torsions, force_field, num_threads=1)
+
+
+def run_combination_worker(new_dihedrals, optimize=True):
+    """
+    Scan a chunk of dihedral combinations in a worker process.
+
+    Args:
+        new_dihedrals (list): Entries are same size lists of dihedral angles corresponding to the torsions.
+        optimize (bool, optional): Whether to return the FF optimized coordinates. True to return them.
+
+    Returns:
+        list: Entries are (xyz, energy) tuples corresponding to the entries of ``new_dihedrals``.
+    """
+    return scan_combinations_chunk(_combination_worker, new_dihedrals, optimize=optimize)
 
 
 def determine_rotors(mol_list):
@@ -986,13 +1161,12 @@ def get_lowest_confs(label: str,
     conformer_list.sort(key=lambda conformer: conformer[energy], reverse=False)
     if e is not None:
         min_e = min([conf[energy] for conf in conformer_list])
-    lowest_confs = [conformer_list[0]]
-    for index in range(len(conformer_list)):
-        if (e is not None and conformer_list[index][energy] > min_e + e) or (n is not None and len(lowest_confs) >= n):
-            break
-        if index > 0 and not any([converter.compare_confs(lowest_conf['xyz'], conformer_list[index]['xyz'])
-                                  for lowest_conf in lowest_confs]):
-            lowest_confs.append(conformer_list[index])
+        conformer_list = [conf for conf in conformer_list if conf[energy] <= min_e + e]
+    if len(conformer_list) < 2 or n == 1:
+        return conformer_list[:1]
+    # compute the distance matrices of all candidates once, and deduplicate them in a vectorized manner
+    dists = converter.xyzs_to_distance_vectors([conformer['xyz'] for conformer in conformer_list])
+    lowest_confs = [conformer_list[i] for i in converter.find_distinct_confs(dists, max_num=n)]
     return lowest_confs
 
 
@@ -1058,6 +1232,7 @@ def get_force_field_energies(label: str,
     if force_field.lower() in ['mmff94', 'mmff94s', 'uff']:
         rd_mol = embed_rdkit(label, mol, num_confs=num_confs, xyz=xyz)
         xyzs, energies = rdkit_force_field(label, rd_mol, force_field=force_field, optimize=optimize)
+        energies = energies.tolist()
     if not len(xyzs) and force_field.lower() in ['gaff', 'mmff94', 'mmff94s', 'uff', 'ghemical'] and try_ob:
         if not suppress_warning:
             logger.warning(f'Using OpenBabel instead of RDKit as a fall back method to generate conformers for {label}. '
@@ -1359,35 +1534,54 @@ def read_rdkit_embedded_conformer_i(rd_mol, i, rd_index_map=None):
     return xyz_dict
 
 
-def rdkit_force_field(label, rd_mol, force_field='MMFF94s', optimize=True):
+def rdkit_force_field(label, rd_mol, force_field='MMFF94s', optimize=True, num_threads=None,
+                      mol_properties=None):
     """
     Optimize RDKit conformers using a force field (MMFF94 or MMFF94s are recommended).
+    All conformers are optimized together in a multi-threaded RDKit call,
+    and conformers which did not converge are then further optimized individually.
 
     Args:
         label (str): The species' label.
         rd_mol (RDKit RDMol): The RDKit molecule with embedded conformers to optimize.
         force_field (str, optional): The type of force field to use.
         optimize (bool, optional): Whether to first optimize the conformer using FF. True to optimize.
+        num_threads (int, optional): The number of threads to use for the optimization (0 to use all available CPUs).
+                                     Defaults to ``FF_NUM_THREADS``.
+        mol_properties (MMFFMolProperties, optional): The force field properties of ``rd_mol``, if already set up.
 
     Returns:
         list: Entries are optimized xyz's in a dictionary format.
     Returns:
-        list: Entries are float numbers representing the energies.
+        np.ndarray: Entries are float numbers representing the energies (empty if ``optimize`` is ``False``).
     """
-    xyzs, energies = list(), list()
-    for i in range(rd_mol.GetNumConformers()):
-        if optimize:
-            v, j = 1, 0
-            while v == 1 and j < 200:  # v == 1: continue, v == 0: enough steps, v == -1: unable to set up
-                v = Chem.AllChem.MMFFOptimizeMolecule(rd_mol, mmffVariant=force_field, confId=i,
-                                                      maxIters=500, ignoreInterfragInteractions=False)
-                j += 1
+    xyzs, energies = list(), np.array([], np.float64)
+    num_threads = FF_NUM_THREADS if num_threads is None else num_threads
+    if mol_properties is None:
         mol_properties = Chem.AllChem.MMFFGetMoleculeProperties(rd_mol, mmffVariant=force_field)
-        if mol_properties is not None:
-            ff = Chem.AllChem.MMFFGetMoleculeForceField(rd_mol, mol_properties, confId=i)
-            if optimize:
-                energies.append(ff.CalcEnergy())
-            xyzs.append(read_rdkit_embedded_conformer_i(rd_mol, i))
+    if mol_properties is None:
+        return xyzs, energies
+    num_confs = rd_mol.GetNumConformers()
+    if optimize and num_confs:
+        # convergence flags: 0: converged, 1: more iterations are needed, -1: unable to set up the force field
+        results = Chem.AllChem.MMFFOptimizeMoleculeConfs(rd_mol, numThreads=num_threads, maxIters=500,
+                                                         mmffVariant=force_field,
+                                                         ignoreInterfragInteractions=False)
+        # only conformers which did not converge are optimized in the following rounds
+        not_converged = [i for i, (flag, _) in enumerate(results) if flag == 1]
+        for _ in range(MAX_FF_OPTIMIZATION_ROUNDS - 1):
+            if not not_converged:
+                break
+            still_not_converged = list()
+            for i in not_converged:
+                ff = Chem.AllChem.MMFFGetMoleculeForceField(rd_mol, mol_properties, confId=i,
+                                                            ignoreInterfragInteractions=False)
+                if ff.Minimize(maxIts=500):
+                    still_not_converged.append(i)
+            not_converged = still_not_converged
+        energies = np.array([Chem.AllChem.MMFFGetMoleculeForceField(rd_mol, mol_properties, confId=i).CalcEnergy()
+                             for i in range(num_confs)], np.float64)
+    xyzs = [read_rdkit_embedded_conformer_i(rd_mol, i) for i in range(num_confs)]
     return xyzs, energies
 
 
@@ -5,8 +5,11 @@
 This module contains unit tests of the arc.species.conformers module
 """
 
+import threading
 import unittest
 
+import numpy as np
+
 from rdkit.Chem import rdMolTransforms as rdMT
 
 from rmgpy.molecule.atomtype import ATOMTYPES
@@ -627,6 +630,7 @@ O       1.40839617    0.14303696    0.00000000"""
         rd_mol = conformers.embed_rdkit(label='', mol=spc.mol, num_confs=3, xyz=xyz)
         xyzs, energies = conformers.rdkit_force_field(label='', rd_mol=rd_mol,
                                                       force_field='MMFF94s', optimize=True)
+        self.assertIsInstance(energies, np.ndarray)
         self.assertEqual(len(energies), 3)
         self.assertAlmostEqual(energies[0], 2.8820960262158292e-11, 5)
         self.assertAlmostEqual(energies[1], 4.496464369416183e-14, 5)
@@ -1485,6 +1489,42 @@ O       1.40839617    0.14303696    0.00000000"""
                                                                         new_dihedrals=[[0, 180], [90, -120]])
         self.assertEqual(len(energies), 2)
 
+        # a None dihedral leaves the torsion unchanged
+        results = conformers.scan_dihedral_combinations(label='NCC', mol=ncc_mol, xyz=ncc_xyz, torsions=[torsion],
+                                                        new_dihedrals=[[None]], optimize=False)
+        self.assertTrue(almost_equal_coords_lists(results[0][0], ncc_xyz))
+        self.assertAlmostEqual(results[0][1], -6.15026868, 5)
+
+        # scanning over a process pool returns the same results in the same order as a serial scan,
+        # also while another thread of this process holds a lock (as the Scheduler's thread pools may)
+        new_dihedrals = [[float(dihedral)] for dihedral in range(0, 360, 3)]
+        serial_results = conformers.scan_dihedral_combinations(label='NCC', mol=ncc_mol, xyz=ncc_xyz,
+                                                               torsions=[torsion], new_dihedrals=new_dihedrals,
+                                                               num_processes=1)
+        lock, lock_acquired, release_lock = threading.Lock(), threading.Event(), threading.Event()
+
+        def hold_lock():
+            with lock:
+                lock_acquired.set()
+                release_lock.wait()
+
+        thread = threading.Thread(target=hold_lock, daemon=True)
+        thread.start()
+        lock_acquired.wait()
+        try:
+            parallel_results = conformers.scan_dihedral_combinations(label='NCC', mol=ncc_mol, xyz=ncc_xyz,
+                                                                     torsions=[torsion], new_dihedrals=new_dihedrals,
+                                                                     num_processes=2)
+            self.assertTrue(thread.is_alive())
+        finally:
+            release_lock.set()
+            thread.join()
+        self.assertEqual(len(serial_results), 120)
+        self.assertEqual(len(parallel_results), 120)
+        for (xyz_1, energy_1), (xyz_2, energy_2) in zip(serial_results, parallel_results):
+            self.assertAlmostEqual(energy_1, energy_2, 5)
+            self.assertTrue(almost_equal_coords_lists(xyz_1, xyz_2))
+
     def test_determine_well_width_tolerance(self):
         """Test determining well width tolerance"""
         tols = list()
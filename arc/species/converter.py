@@ -2,8 +2,10 @@
 A module for performing various species-related format conversions.
 """
 
+import hashlib
 import numpy as np
 import os
+from collections import OrderedDict
 from typing import Dict, Iterable, List, Optional, Tuple, Union
 
 import pybel
@@ -19,20 +21,30 @@ from rmgpy.quantity import ArrayQuantity
 from rmgpy.species import Species
 from rmgpy.statmech import Conformer
 
-from arc.common import almost_equal_lists, get_atom_radius, get_logger, is_str_float
+from arc.common import determine_top_group_indices, get_atom_radius, get_logger, is_str_float
 from arc.exceptions import ConverterError, InputError, SanitizationError, SpeciesError
 from arc.species.xyz_to_2d import MolGraph
 from arc.species.zmat import (KEY_FROM_LEN,
                               _compare_zmats,
+                              compile_zmat,
+                              compiled_zmat_to_coords,
                               get_all_neighbors,
                               get_atom_indices_from_zmat_parameter,
+                              get_atom_order_from_mol_by_tops,
                               get_parameter_from_atom_indices,
+                              get_torsion_dihedral_signs,
                               zmat_to_coords,
                               xyz_to_zmat)
 
 
 logger = get_logger()
 
+# The maximal number of reference molecules for which isomorphism data (resonance structures, fingerprints) is cached
+ISOMORPHISM_CACHE_SIZE = 256
+
+_isomorphism_cache = OrderedDict()  # keys are reference molecule adjacency lists and flags, values are lists of
+                                    # (connectivity fingerprint, Molecule) tuples of the reference structures
+
 
 def str_to_xyz(xyz_str):
     """
@@ -950,6 +962,103 @@ def modify_coords(coords: Dict[str, tuple],
     return new_xyz
 
 
+def generate_dihedral_grid_xyzs(xyz: Dict[str, tuple],
+                                mol: Molecule,
+                                torsions: List[List[int]],
+                                dihedrals: List[Iterable[float]],
+                                index: int = 0,
+                                tolerance: float = 0.05,
+                                ) -> List[Dict[str, tuple]]:
+    """
+    Generate the geometries of a grid of dihedral angles (e.g., for a brute force directed scan) in a single batch.
+    The zmat is generated and compiled once, the dihedral angles of all grid points are translated into zmat dihedral
+    angles, and all geometries are generated by a vectorized SN-NeRF. As when setting dihedrals using RDKit,
+    each torsion rotates the top of its last atom, and atoms not rotated by any torsion keep their original coordinates.
+
+    Args:
+        xyz (dict): The cartesian coordinates.
+        mol (Molecule): The corresponding RMG Molecule with the connectivity information.
+        torsions (List[List[int]]): The four atom indices of each torsion.
+        dihedrals (List[Iterable[float]]): Entries are the absolute dihedral angles (in degrees) of all torsions
+                                           at each grid point, ordered as ``torsions``.
+        index (int, optional): Whether the atom indices in ``torsions`` are 0- or 1-indexed.
+        tolerance (float, optional): The maximal deviation (in degrees) allowed between a requested and a generated
+                                     dihedral angle.
+
+    Raises:
+        ConverterError: If a torsion is in a ring, or if the generated dihedral angles deviate from the requested ones.
+        ZMatError: If the zmat could not be generated, or cannot be used to rotate all torsion tops.
+
+    Returns:
+        List[Dict[str, tuple]]: The cartesian coordinates of each grid point.
+    """
+    torsions = [[atom - index for atom in torsion] for torsion in torsions]
+    dihedrals = np.array([list(grid_point) for grid_point in dihedrals], dtype=np.float64).reshape(-1, len(torsions))
+    coords = np.array(xyz['coords'], dtype=np.float64)
+    tops = list()
+    for torsion in torsions:
+        top = determine_top_group_indices(mol=mol, atom1=mol.atoms[torsion[1]], atom2=mol.atoms[torsion[2]],
+                                          index=0)[0]
+        if torsion[0] in top:
+            raise ConverterError(f'Cannot rotate torsion {torsion}, it is in a ring.')
+        tops.append([atom for atom in top if atom != torsion[2]])
+    atom_order = get_atom_order_from_mol_by_tops(mol=mol, tops=tops)
+    compiled = compile_zmat(xyz_to_zmat(xyz=xyz, mol=mol, consolidate=False, atom_order=atom_order))
+    signs = [get_torsion_dihedral_signs(compiled=compiled, torsion=torsion, top=top)
+             for torsion, top in zip(torsions, tops)]
+    zmat_dihedrals = np.tile(compiled['d'], (dihedrals.shape[0], 1))
+    fixed_atoms = set(range(len(xyz['symbols'])))
+    for t, (torsion, top) in enumerate(zip(torsions, tops)):
+        fixed_atoms -= set(top)
+        increments = dihedrals[:, t] - get_dihedral_angles(coords=coords[np.newaxis], torsion=torsion)[0]
+        zmat_dihedrals += increments[:, np.newaxis] * signs[t][np.newaxis, :]
+    grid_coords = compiled_zmat_to_coords(compiled=compiled, dihedrals=zmat_dihedrals)
+
+    # superimpose the atoms that are not rotated (or all atoms, if too few) onto their original coordinates (Kabsch)
+    anchors = sorted(fixed_atoms) if len(fixed_atoms) >= 3 else list(range(len(xyz['symbols'])))
+    reference = coords[anchors] - coords[anchors].mean(axis=0)
+    centroids = grid_coords[:, anchors].mean(axis=1)
+    covariance = np.einsum('pni,nj->pij', grid_coords[:, anchors] - centroids[:, np.newaxis], reference)
+    u, _, vt = np.linalg.svd(covariance)
+    reflection = np.sign(np.linalg.det(np.einsum('pij,pjk->pik', u, vt)))
+    u[:, :, -1] *= reflection[:, np.newaxis]
+    rotation = np.einsum('pij,pjk->pik', u, vt)
+    grid_coords = np.einsum('pni,pij->pnj', grid_coords - centroids[:, np.newaxis], rotation) \
+        + coords[anchors].mean(axis=0)
+
+    # verify the generated dihedral angles
+    for t, torsion in enumerate(torsions):
+        deviations = get_dihedral_angles(coords=grid_coords, torsion=torsion) - dihedrals[:, t]
+        deviations = np.abs((deviations + 180) % 360 - 180)
+        if np.any(deviations > tolerance):
+            raise ConverterError(f'Could not set the dihedral angles of torsion {torsion}, the maximal deviation '
+                                 f'is {np.max(deviations):.2f} degrees.')
+    return [xyz_from_data(coords=point_coords, symbols=xyz['symbols'], isotopes=xyz['isotopes'])
+            for point_coords in grid_coords]
+
+
+def get_dihedral_angles(coords: np.ndarray,
+                        torsion: List[int],
+                        ) -> np.ndarray:
+    """
+    Calculate a dihedral angle in a batch of geometries,
+    using the same convention as arc.species.vectors.calculate_dihedral_angle().
+
+    Args:
+        coords (np.ndarray): An (n_geometries, n_atoms, 3) array of coordinates.
+        torsion (List[int]): The 0-indexed atom indices of the four atoms defining the dihedral angle.
+
+    Returns:
+        np.ndarray: The dihedral angles in each geometry, in degrees in a 0-360 range.
+    """
+    v1, v2, v3 = [coords[:, torsion[i + 1]] - coords[:, torsion[i]] for i in range(3)]
+    v2_x_v1, v3_x_v2 = np.cross(v2, v1), np.cross(v3, v2)
+    v2_x_v1 /= np.linalg.norm(v2_x_v1, axis=1)[:, np.newaxis]
+    v3_x_v2 /= np.linalg.norm(v3_x_v2, axis=1)[:, np.newaxis]
+    dihedrals = np.degrees(np.arccos(np.clip(np.sum(v2_x_v1 * v3_x_v2, axis=1), -1, 1)))
+    return np.where(np.sum(v2_x_v1 * v3, axis=1) > 0, 360 - dihedrals, dihedrals)
+
+
 def get_most_common_isotope_for_element(element_symbol):
     """
     Get the most common isotope for a given element symbol.
@@ -1523,6 +1632,9 @@ def check_isomorphism(mol1, mol2, filter_structures=True, convert_to_single_bond
     Convert ``mol1`` and ``mol2`` to RMG Species objects, and generate resonance structures.
     Then check Species isomorphism.
     This function first makes copies of the molecules, since isIsomorphic() changes atom orders.
+    ``mol1`` is treated as the reference: its resonance structures and their fingerprints are cached, so repeatedly
+    checking conformers against the same species only generates resonance structures for ``mol2``, and only if
+    ``mol2`` itself is not isomorphic with any of the reference structures.
 
     Args:
         mol1 (Molecule): An RMG Molecule object.
@@ -1543,30 +1655,115 @@ def check_isomorphism(mol1, mol2, filter_structures=True, convert_to_single_bond
         return False
 
     mol1.reactive, mol2.reactive = True, True
+    reference_structures = get_isomorphism_reference(mol1, filter_structures=filter_structures,
+                                                     convert_to_single_bonds=convert_to_single_bonds)
     if convert_to_single_bonds:
-        mol1_copy = mol1.to_single_bonds(raise_atomtype_exception=False)
         mol2_copy = mol2.to_single_bonds(raise_atomtype_exception=False)
     else:
-        mol1_copy = mol1.copy(deep=True)
         mol2_copy = mol2.copy(deep=True)
-    spc1 = Species(molecule=[mol1_copy])
+
+    # fast path: only run a full graph isomorphism check against reference structures with the same fingerprint
+    fingerprint = get_connectivity_fingerprint(mol2_copy)
+    for reference_fingerprint, reference_mol in reference_structures:
+        if reference_fingerprint == fingerprint and reference_mol.is_isomorphic(mol2_copy, save_order=True):
+            return True
+
+    if convert_to_single_bonds:
+        return False
     spc2 = Species(molecule=[mol2_copy])
+    try:
+        spc2.generate_resonance_structures(keep_isomorphic=False, filter_structures=filter_structures)
+    except (AtomTypeError, ValueError):
+        pass
+    for molecule2 in spc2.molecule:
+        fingerprint = get_connectivity_fingerprint(molecule2)
+        for reference_fingerprint, reference_mol in reference_structures:
+            if reference_fingerprint == fingerprint and reference_mol.is_isomorphic(molecule2, save_order=True):
+                return True
+    return False
 
-    if not convert_to_single_bonds:
-        try:
-            spc1.generate_resonance_structures(keep_isomorphic=False, filter_structures=filter_structures)
-        except (AtomTypeError, ValueError):
-            pass
+
+def get_isomorphism_reference(mol, filter_structures=True, convert_to_single_bonds=False):
+    """
+    Get the structures to compare against when checking isomorphism with a reference molecule.
+    The resonance structures and their fingerprints are computed once per reference molecule and cached.
+
+    Args:
+        mol (Molecule): The reference RMG Molecule object.
+        filter_structures (bool, optional): Whether to apply the filtration algorithm when generating
+                                            resonance structures. ``True`` to apply.
+        convert_to_single_bonds (bool, optional): Whether to convert the molecule to single bonds
+                                                  (resonance structures will not be generated).
+
+    Returns:
+        list: Entries are (fingerprint, Molecule) tuples of the reference structures.
+    """
+    key = (mol.to_adjacency_list(), filter_structures, convert_to_single_bonds)
+    if key in _isomorphism_cache:
+        _isomorphism_cache.move_to_end(key)
+        return _isomorphism_cache[key]
+    if convert_to_single_bonds:
+        structures = [mol.to_single_bonds(raise_atomtype_exception=False)]
+    else:
+        spc = Species(molecule=[mol.copy(deep=True)])
         try:
-            spc2.generate_resonance_structures(keep_isomorphic=False, filter_structures=filter_structures)
+            spc.generate_resonance_structures(keep_isomorphic=False, filter_structures=filter_structures)
         except (AtomTypeError, ValueError):
             pass
+        structures = spc.molecule
+    reference_structures = [(get_connectivity_fingerprint(structure), structure) for structure in structures]
+    _isomorphism_cache[key] = reference_structures
+    if len(_isomorphism_cache) > ISOMORPHISM_CACHE_SIZE:
+        _isomorphism_cache.popitem(last=False)
+    return reference_structures
 
-    for molecule1 in spc1.molecule:
-        for molecule2 in spc2.molecule:
-            if molecule1.is_isomorphic(molecule2, save_order=True):
-                return True
-    return False
+
+def get_connectivity_fingerprint(mol, iterations=3):
+    """
+    Get a canonical fingerprint of a molecular graph (independent of the atom order).
+    Atoms are labeled by their element, charge, radical electrons and lone pairs, and the labels are iteratively
+    refined with the bond order labels and labels of their neighbors (Weisfeiler-Lehman refinement).
+    Isomorphic molecules always have the same fingerprint, but the converse is not guaranteed.
+
+    Args:
+        mol (Molecule): The RMG Molecule object.
+        iterations (int, optional): The number of label refinement iterations.
+
+    Returns:
+        str: The fingerprint.
+    """
+    atom_indices = {atom: i for i, atom in enumerate(mol.atoms)}
+    labels = [f'{atom.element.symbol},{atom.charge},{atom.radical_electrons},{atom.lone_pairs}' for atom in mol.atoms]
+    bond_labels = [[(get_bond_order_label(bond), atom_indices[atom2]) for atom2, bond in atom.edges.items()]
+                   for atom in mol.atoms]
+    for _ in range(iterations):
+        labels = [hashlib.md5(f'{labels[i]}:{sorted((order, labels[j]) for order, j in bond_labels[i])}'.encode())
+                  .hexdigest() for i in range(len(mol.atoms))]
+    return hashlib.md5('|'.join(sorted(labels)).encode()).hexdigest()
+
+
+def get_bond_order_label(bond):
+    """
+    Get a label of a bond order, identical for bond orders RMG considers equal (up to a numerical tolerance).
+
+    Args:
+        bond (Bond): The RMG Bond object.
+
+    Returns:
+        str: The bond order label, e.g., 'S', 'D', 'T', or 'B' for single, double, triple, or benzene bonds.
+    """
+    try:
+        return bond.get_order_str()
+    except ValueError:
+        # bond orders without a string representation (e.g., in TSs) are rounded to a tolerance wider than RMG's
+        return f'{round(bond.order, 3):.3f}'
+
+
+def clear_isomorphism_cache():
+    """
+    Clear the cached isomorphism reference structures.
+    """
+    _isomorphism_cache.clear()
 
 
 def get_center_of_mass(xyz):
@@ -1709,13 +1906,118 @@ def compare_confs(xyz1: dict,
             - If ``rmsd_score`` is ``True``: The RMSD score of two distance matrices.
     """
     xyz1, xyz2 = check_xyz_dict(xyz1), check_xyz_dict(xyz2)
-    dmat1, dmat2 = xyz_to_dmat(xyz1), xyz_to_dmat(xyz2)
+    if len(xyz1['coords']) != len(xyz2['coords']) and not rmsd_score:
+        return False
+    dists1, dists2 = xyzs_to_distance_vectors([xyz1, xyz2])
+    result = compare_distance_vectors(dists2, dists1[np.newaxis], rtol=rtol, atol=atol, rmsd_score=rmsd_score)[0]
+    return float(result) if rmsd_score else bool(result)
+
+
+def xyzs_to_distance_vectors(xyzs: Iterable[Union[dict, str]]) -> np.ndarray:
+    """
+    Stack conformers with the same atom order and compute all of their interatomic distances at once.
+    Only the upper triangle of each distance matrix is kept (the matrices are symmetric with a zero diagonal).
+
+    Args:
+        xyzs (Iterable): The conformers' Cartesian coordinates.
+
+    Raises:
+        ConverterError: If the conformers have different numbers of atoms.
+
+    Returns:
+        np.ndarray: An (n, num_atoms * (num_atoms - 1) / 2) array, rows are the flattened upper triangles
+                    of the conformers' distance matrices.
+    """
+    coords = [check_xyz_dict(xyz)['coords'] for xyz in xyzs]
+    if not coords:
+        return np.empty((0, 0), np.float64)
+    if len(set(len(coords_i) for coords_i in coords)) > 1:
+        raise ConverterError(f'Cannot stack conformers with different numbers of atoms, '
+                             f'got {sorted(set(len(coords_i) for coords_i in coords))}.')
+    coords = np.array(coords, np.float64)  # (n, num_atoms, 3)
+    rows, cols = np.triu_indices(coords.shape[1], k=1)
+    return np.linalg.norm(coords[:, rows, :] - coords[:, cols, :], axis=2)
+
+
+def compare_distance_vectors(dists: np.ndarray,
+                             dists_pool: np.ndarray,
+                             rtol: float = 1e-5,
+                             atol: float = 1e-5,
+                             rmsd_score: bool = False,
+                             ) -> np.ndarray:
+    """
+    Compare the distances of one conformer against those of a pool of conformers (see compare_confs()).
+
+    Args:
+        dists (np.ndarray): The upper-triangle distances of the conformer, as generated by xyzs_to_distance_vectors().
+        dists_pool (np.ndarray): The upper-triangle distances of the pool conformers, one row per conformer.
+        rtol (float): The relative tolerance parameter (relative to ``dists``).
+        atol (float): The absolute tolerance parameter.
+        rmsd_score (bool): Whether to output root-mean-square deviation scores of the distance matrices.
+
+    Returns:
+        np.ndarray:
+            - If ``rmsd_score`` is ``False`` (default): Booleans, ``True`` for pool conformers with almost equal
+              atom distances.
+            - If ``rmsd_score`` is ``True``: The RMSD scores of the distance matrices (as in calc_rmsd()).
+    """
+    deltas = dists_pool - dists
     if rmsd_score:
-        # distance matrix is symmetric, only need the upper triangular part to compute rmsd
-        rmsd = calc_rmsd(np.triu(dmat1), np.triu(dmat2))
-        return rmsd
+        num_atoms = int(round((1 + np.sqrt(1 + 8 * dists.shape[-1])) / 2))
+        return np.sqrt((deltas ** 2).sum(axis=1) / num_atoms)
+    return np.all(np.abs(deltas) <= atol + rtol * np.abs(dists), axis=1)
+
+
+def find_distinct_confs(dists: np.ndarray,
+                        rtol: float = 1e-5,
+                        atol: float = 1e-5,
+                        rmsd_threshold: Optional[float] = None,
+                        max_num: Optional[int] = None,
+                        ) -> List[int]:
+    """
+    Find structurally distinct conformers. Conformers are visited in order, and a conformer is kept
+    if it differs from all previously kept conformers. Each conformer is compared against all kept ones at once.
+    Since the distances of duplicates must have almost equal norms (triangle inequality), only kept conformers
+    with close norms are compared in full.
+
+    Args:
+        dists (np.ndarray): The upper-triangle distances of the conformers, as generated by xyzs_to_distance_vectors().
+        rtol (float, optional): The relative tolerance parameter for comparing distances.
+        atol (float, optional): The absolute tolerance parameter for comparing distances.
+        rmsd_threshold (float, optional): The minimum RMSD of distance matrices to consider two conformers as distinct.
+                                          If given, the tolerances are not used.
+        max_num (int, optional): The maximal number of conformers to keep.
+
+    Returns:
+        List[int]: The indices of the distinct conformers.
+    """
+    indices = list()
+    if not len(dists):
+        return indices
+    norms = np.linalg.norm(dists, axis=1)
+    if rmsd_threshold is not None:
+        num_atoms = int(round((1 + np.sqrt(1 + 8 * dists.shape[1])) / 2))
+        norm_tols = np.full(len(dists), rmsd_threshold * np.sqrt(num_atoms))
     else:
-        return almost_equal_lists(dmat1, dmat2, rtol=rtol, atol=atol)
+        norm_tols = np.linalg.norm(atol + rtol * np.abs(dists), axis=1)
+    kept_dists, kept_norms = np.empty_like(dists), np.empty_like(norms)
+    for i, dists_i in enumerate(dists):
+        if max_num is not None and len(indices) >= max_num:
+            break
+        close = np.abs(kept_norms[:len(indices)] - norms[i]) <= norm_tols[i]
+        if close.any():
+            if rmsd_threshold is None:
+                duplicate = compare_distance_vectors(dists_i, kept_dists[:len(indices)][close],
+                                                     rtol=rtol, atol=atol).any()
+            else:
+                duplicate = not (compare_distance_vectors(dists_i, kept_dists[:len(indices)][close],
+                                                          rmsd_score=True) > rmsd_threshold).all()
+            if duplicate:
+                continue
+        kept_dists[len(indices)], kept_norms[len(indices)] = dists_i, norms[i]
+        indices.append(i)
+    return indices
+
 
 def calc_rmsd(x: np.array,
               y: np.array,
@@ -1758,12 +2060,8 @@ def cluster_confs_by_rmsd(xyzs: Iterable[Dict[str, tuple]],
         Tuple[Dict[str, tuple]]: Conformers with distinctive geometries.
     """
     xyzs = tuple(xyzs)
-    distinct_xyzs = [xyzs[0]]
-    for xyz in xyzs:
-        rmsd_list = [compare_confs(xyz, distinct_xyz, rmsd_score=True) for distinct_xyz in tuple(distinct_xyzs)]
-        if all([rmsd > rmsd_threshold for rmsd in tuple(rmsd_list)]):
-            distinct_xyzs.append(xyz)
-    return tuple(distinct_xyzs)
+    dists = xyzs_to_distance_vectors(xyzs)
+    return tuple(xyzs[i] for i in find_distinct_confs(dists, rmsd_threshold=rmsd_threshold))
 
 def ics_to_scan_constraints(ics: list,
                             software: Optional[str] = 'gaussian',
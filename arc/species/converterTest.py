@@ -4132,6 +4132,55 @@ H      -0.81291200   -0.46933500   -0.31111876"""
         self.assertAlmostEqual(calculate_dihedral_angle(coords=new_xyz, torsion=indices, index=1), 200, places=4)
 
 
+    def test_generate_dihedral_grid_xyzs(self):
+        """Test generating the geometries of a dihedral grid in a batch"""
+        xyz = {'symbols': ('C', 'C', 'O', 'C', 'C', 'O', 'H', 'H', 'H', 'H', 'H', 'H', 'H', 'H'),
+               'isotopes': (12, 12, 16, 12, 12, 16, 1, 1, 1, 1, 1, 1, 1, 1),
+               'coords': ((-1.2713687423422115, -0.7423678681688866, -0.6322577211421921),
+                          (-0.08008635702808505, -0.40741599130374034, 0.2550353232234618),
+                          (-0.5452666768773297, -0.20159898814584978, 1.588840559327411),
+                          (0.6158080809151276, 0.8623086771891557, -0.21553636846891006),
+                          (1.9196775903993375, 1.0155396004927764, 0.5174563928754532),
+                          (3.0067486097953653, 1.0626738453913969, -0.05177300486677717),
+                          (-2.012827991034863, 0.06405231524730193, -0.6138583677564631),
+                          (-0.9611224758801538, -0.9119047827586647, -1.6677831987437075),
+                          (-1.7781253059828275, -1.6433798866337939, -0.27003123559560865),
+                          (0.6204384954940876, -1.2502614603989448, 0.2715082028581114),
+                          (-1.0190238747695064, -1.007069904421531, 1.8643494196872146),
+                          (0.014234510343435022, 1.753076784716312, -0.005169050775340246),
+                          (0.827317336700949, 0.8221266348378934, -1.2893801191974432),
+                          (1.8498494882204641, 1.107064846374729, 1.6152311353151314))}
+        spc = ARCSpecies(label='CC(O)CC=O', xyz=xyz)
+        torsions = [[1, 2, 4, 5], [2, 4, 5, 6]]
+        dihedrals = [(d1, d2) for d1 in [-180, -60, 60] for d2 in [-120, 0, 120]]
+        xyzs = converter.generate_dihedral_grid_xyzs(xyz=xyz, mol=spc.mol, torsions=torsions, dihedrals=dihedrals,
+                                                     index=1)
+        self.assertEqual(len(xyzs), 9)
+        dmat = converter.xyz_to_dmat(xyz)
+        for new_xyz, grid_point in zip(xyzs, dihedrals):
+            self.assertEqual(new_xyz['symbols'], xyz['symbols'])
+            for torsion, dihedral in zip(torsions, grid_point):
+                deviation = calculate_dihedral_angle(coords=new_xyz, torsion=torsion, index=1) - dihedral
+                self.assertAlmostEqual((deviation + 180) % 360 - 180, 0, places=2)
+            new_dmat = converter.xyz_to_dmat(new_xyz)
+            for atom_1, atom_2 in [(0, 1), (1, 3), (3, 4), (4, 5), (4, 13), (3, 11)]:
+                self.assertAlmostEqual(new_dmat[atom_1][atom_2], dmat[atom_1][atom_2], places=4)
+            # atoms that are not in any torsion top are not moved
+            np.testing.assert_allclose(np.array(new_xyz['coords'])[[0, 1, 2, 6, 7, 8, 9, 10]],
+                                       np.array(xyz['coords'])[[0, 1, 2, 6, 7, 8, 9, 10]], atol=1e-4)
+
+        # compare to setting a dihedral angle using RDKit
+        xyzs = converter.generate_dihedral_grid_xyzs(xyz=xyz, mol=spc.mol, torsions=[[1, 2, 4, 5]],
+                                                     dihedrals=[[75]], index=1)
+        spc.set_dihedral(scan=[1, 2, 4, 5], deg_abs=75, count=False, xyz=xyz, chk_rotor_list=False)
+        self.assertTrue(almost_equal_coords_lists(xyzs[0], spc.initial_xyz, atol=1e-4))
+
+        with self.assertRaises(ConverterError):
+            # a torsion in a ring
+            spc = ARCSpecies(label='cyclohexane', smiles='C1CCCCC1')
+            converter.generate_dihedral_grid_xyzs(xyz=spc.get_xyz(), mol=spc.mol, torsions=[[1, 2, 3, 4]],
+                                                  dihedrals=[[60]], index=1)
+
     def test_compare_zmats(self):
         """Test determining whether two conformers have almost equal internal coordinates (zmats)"""
         z_1 = {'symbols': ('N', 'N', 'H', 'H'),
@@ -4285,6 +4334,29 @@ H      -0.81291200   -0.46933500   -0.31111876"""
         mol2 = Molecule(smiles='[N-]=[N+]=O')
         self.assertTrue(converter.check_isomorphism(mol1, mol2))
 
+        converter.clear_isomorphism_cache()
+        mol3 = Molecule(smiles='CCO')
+        self.assertTrue(converter.check_isomorphism(mol3, Molecule(smiles='OCC')))
+        self.assertEqual(len(converter._isomorphism_cache), 1)
+        self.assertFalse(converter.check_isomorphism(mol3, Molecule(smiles='COC')))
+        self.assertEqual(len(converter._isomorphism_cache), 1)  # the reference structures were reused
+        self.assertTrue(converter.check_isomorphism(mol3, Molecule(smiles='OCC'), convert_to_single_bonds=True))
+        self.assertEqual(len(converter._isomorphism_cache), 2)
+
+    def test_get_connectivity_fingerprint(self):
+        """Test getting an atom-order independent fingerprint of a molecular graph"""
+        fingerprint_1 = converter.get_connectivity_fingerprint(Molecule(smiles='CCO'))
+        fingerprint_2 = converter.get_connectivity_fingerprint(Molecule(smiles='OCC'))
+        fingerprint_3 = converter.get_connectivity_fingerprint(Molecule(smiles='COC'))
+        fingerprint_4 = converter.get_connectivity_fingerprint(Molecule(smiles='C=CO'))
+        self.assertEqual(fingerprint_1, fingerprint_2)
+        self.assertNotEqual(fingerprint_1, fingerprint_3)
+        self.assertNotEqual(fingerprint_1, fingerprint_4)
+        mol = Molecule(smiles='c1ccccc1O')
+        mol.get_all_edges()[0].order += 1e-12  # bond orders RMG considers equal
+        self.assertEqual(converter.get_connectivity_fingerprint(mol),
+                         converter.get_connectivity_fingerprint(Molecule(smiles='Oc1ccccc1')))
+
     def test_calc_rmsd(self):
         """Test compute the root-mean-square deviation between two matrices."""
         a1 = np.array([1, 2, 3, 4])
@@ -4419,6 +4491,25 @@ H      -0.81291200   -0.46933500   -0.31111876"""
         xyzs3 = [nco_1, nco_2, nco_6, nco_7, nco_8, nco_9]
         self.assertEqual(len(converter.cluster_confs_by_rmsd(xyzs3)), 4)
 
+    def test_find_distinct_confs(self):
+        """Test finding distinct conformers using stacked distance matrices"""
+        xyzs = [converter.str_to_xyz('C 0 0 0\nO 1 0 0\nH 0 1 0'),
+                converter.str_to_xyz('C 0 0 0\nO 1.5 0 0\nH 0 1 0'),
+                converter.str_to_xyz('C 1 1 1\nO 2 1 1\nH 1 2 1'),  # a translation of the first conformer
+                converter.str_to_xyz('C 0 0 0\nO 1.5 0 0\nH 0 1.000001 0'),  # almost the second conformer
+                converter.str_to_xyz('C 0 0 0\nO 2 0 0\nH 0 1 0')]
+        dists = converter.xyzs_to_distance_vectors(xyzs)
+        self.assertEqual(dists.shape, (5, 3))
+        self.assertTrue(np.allclose(dists[0], [1, 1, 2 ** 0.5]))
+        self.assertEqual(converter.find_distinct_confs(dists), [0, 1, 4])
+        self.assertEqual(converter.find_distinct_confs(dists, max_num=2), [0, 1])
+        self.assertEqual(converter.find_distinct_confs(dists, rmsd_threshold=0.37), [0, 4])
+        rmsds = converter.compare_distance_vectors(dists[1], dists, rmsd_score=True)
+        for xyz, rmsd in zip(xyzs, rmsds):
+            self.assertAlmostEqual(rmsd, converter.compare_confs(xyzs[1], xyz, rmsd_score=True))
+        with self.assertRaises(ConverterError):
+            converter.xyzs_to_distance_vectors([xyzs[0], converter.str_to_xyz('C 0 0 0\nO 1 0 0')])
+
 
 if __name__ == '__main__':
     unittest.main(testRunner=unittest.TextTestRunner(verbosity=2))
@@ -901,37 +901,71 @@ class ARCSpecies(object):
                                        If None, the plot will not be shown (nor saved).
         """
         if not self.is_ts:
-            if not self.charge:
-                mol_list = self.mol_list
-            else:
-                mol_list = [self.mol]
-            if self.consider_all_diastereomers:
-                diastereomers = None
-            else:
-                xyz = self.get_xyz(generate=False)
-                diastereomers = [xyz] if xyz is not None else None
-            lowest_confs = conformers.generate_conformers(mol_list=mol_list,
-                                                          label=self.label,
-                                                          charge=self.charge,
-                                                          multiplicity=self.multiplicity,
-                                                          force_field=self.force_field,
-                                                          print_logs=False,
-                                                          n_confs=n_confs,
-                                                          e_confs=e_confs,
-                                                          return_all_conformers=False,
-                                                          plot_path=plot_path,
-                                                          diastereomers=diastereomers)
-            if len(lowest_confs):
-                self.conformers.extend([conf['xyz'] for conf in lowest_confs])
-                self.conformer_energies.extend([None] * len(lowest_confs))
-                if lowest_confs:
-                    lowest_conf = conformers.get_lowest_confs(label=self.label, confs=lowest_confs, n=1)[0]
-                    logger.debug(f'Most stable force field conformer for {self.label}:\n'
-                                 f'{xyz_to_str(lowest_conf["xyz"])}\n')
-            else:
-                xyz = self.get_xyz(generate=False)
-                if xyz is None or not xyz:
-                    logger.error(f'No 3D coordinates available for species {self.label}!')
+            lowest_confs = conformers.generate_conformers(**self.get_conformer_generation_args(n_confs=n_confs,
+                                                                                               e_confs=e_confs,
+                                                                                               plot_path=plot_path))
+            self.set_generated_conformers(lowest_confs)
+
+    def get_conformer_generation_args(self,
+                                      n_confs: int = 10,
+                                      e_confs: float = 5,
+                                      plot_path: str = None,
+                                      ) -> dict:
+        """
+        Get the arguments for generating conformers of this species using conformers.generate_conformers().
+        The arguments are picklable, so conformers could be generated in a different process.
+
+        Args:
+            n_confs (int, optional): The max number of conformers to store in the .conformers attribute
+                                            that will later be DFT'ed at the conformers_level.
+            e_confs (float, optional): The energy threshold in kJ/mol above the lowest energy conformer below which all
+                                       (unique) generated conformers will be stored in the .conformers attribute.
+            plot_path (str, optional): A folder path in which the plot will be saved.
+                                       If None, the plot will not be shown (nor saved).
+
+        Returns:
+            dict: The keyword arguments of conformers.generate_conformers().
+        """
+        if not self.charge:
+            mol_list = self.mol_list
+        else:
+            mol_list = [self.mol]
+        if self.consider_all_diastereomers:
+            diastereomers = None
+        else:
+            xyz = self.get_xyz(generate=False)
+            diastereomers = [xyz] if xyz is not None else None
+        return {'mol_list': mol_list,
+                'label': self.label,
+                'charge': self.charge,
+                'multiplicity': self.multiplicity,
+                'force_field': self.force_field,
+                'print_logs': False,
+                'n_confs': n_confs,
+                'e_confs': e_confs,
+                'return_all_conformers': False,
+                'plot_path': plot_path,
+                'diastereomers': diastereomers,
+                }
+
+    def set_generated_conformers(self, lowest_confs: list) -> None:
+        """
+        Store conformers generated by conformers.generate_conformers().
+
+        Args:
+            lowest_confs (list): Entries are conformer dictionaries.
+        """
+        if len(lowest_confs):
+            self.conformers.extend([conf['xyz'] for conf in lowest_confs])
+            self.conformer_energies.extend([None] * len(lowest_confs))
+            if lowest_confs:
+                lowest_conf = conformers.get_lowest_confs(label=self.label, confs=lowest_confs, n=1)[0]
+                logger.debug(f'Most stable force field conformer for {self.label}:\n'
+                             f'{xyz_to_str(lowest_conf["xyz"])}\n')
+        else:
+            xyz = self.get_xyz(generate=False)
+            if xyz is None or not xyz:
+                logger.error(f'No 3D coordinates available for species {self.label}!')
 
     def get_cheap_conformer(self):
         """
@@ -947,10 +981,8 @@ class ARCSpecies(object):
             rd_mol = conformers.embed_rdkit(label=self.label, mol=self.mol, num_confs=num_confs)
             xyzs, energies = conformers.rdkit_force_field(label=self.label, rd_mol=rd_mol,
                                                           force_field='MMFF94s')
-            if energies:
-                min_energy = min(energies)
-                min_energy_index = energies.index(min_energy)
-                self.cheap_conformer = xyzs[min_energy_index]
+            if len(energies):
+                self.cheap_conformer = xyzs[int(np.argmin(energies))]
             elif xyzs:
                 self.cheap_conformer = xyzs[0]
             else:
@@ -1961,22 +1993,13 @@ class TSGuess(object):
             _, mapped_product = self.arc_reaction.get_mapped_product_xyz()
             _, p_mol = rdkit_conf_from_mol(mapped_product.mol, mapped_product.get_xyz())
 
-            # write input files for GCN to the TS project folder
+            # the GCN input files are only written to the TS project folder if the GCN worker could not be used
             ts_path = os.path.join(self.project_dir, 'calcs', 'TSs', self.arc_reaction.ts_label, 'GCN')
-            os.makedirs(ts_path, exist_ok=True)
-
-            r_path = os.path.join(ts_path, 'reactant.sdf')
-            w = Chem.SDWriter(r_path)
-            w.write(r_mol)
-            w.close()
-
-            p_path = os.path.join(ts_path, 'product.sdf')
-            w = Chem.SDWriter(p_path)
-            w.write(p_mol)
-            w.close()
 
             start = time.time()
-            ts_xyz_dict = gcn.gcn(ts_path)
+            ts_xyz_dict = gcn.gcn(reactant=Chem.MolToMolBlock(r_mol) + '$$$$\n',
+                                  product=Chem.MolToMolBlock(p_mol) + '$$$$\n',
+                                  ts_path=ts_path)
             end = time.time()
             self.execution_time = end - start  # seconds
             self.success = False if ts_xyz_dict is None else True
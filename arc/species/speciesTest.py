@@ -1462,9 +1462,9 @@ class TestTSGuess(unittest.TestCase):
         ts_guess = TSGuess(arc_reaction=rxn, method='gcn', project_dir=project_dir)
         ts_guess.execute_ts_guess_method()
 
-        # verify that the method correctly create TS.xyz
-        ts_path = os.path.join(project_dir, 'calcs', 'TSs', rxn.ts_label, 'GCN')
-        ts_xyz_dict = str_to_xyz(os.path.join(ts_path, "TS.xyz"))
+        # verify that the method correctly generated a TS guess
+        ts_xyz_dict = ts_guess.initial_xyz
+        self.assertTrue(ts_guess.success)
         self.assertEqual(len(ts_xyz_dict['symbols']), 9)
         self.assertEqual(ts_xyz_dict['symbols'], ('C', 'C', 'N', 'O', 'N', 'N', 'H', 'H', 'H'))
 
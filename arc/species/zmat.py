@@ -57,6 +57,7 @@ def xyz_to_zmat(xyz: Dict[str, tuple],
                 consolidate: bool = True,
                 consolidation_tols: Dict[str, float] = None,
                 fragments: Optional[List[List[int]]] = None,
+                atom_order: Optional[List[int]] = None,
                 ) -> Dict[str, tuple]:
     """
     Generate a z-matrix from cartesian coordinates.
@@ -93,6 +94,8 @@ def xyz_to_zmat(xyz: Dict[str, tuple],
             Fragments represented by the species, i.e., as in a VdW well or a TS.
             Entries are atom index lists of all atoms in a fragment, each list represents a different fragment.
             indices are 0-indexed.
+        atom_order (List[int], optional): The 0-indexed order in which atoms are added to the zmat.
+                                          Determined by get_atom_order() if not given.
 
     Raises:
         ZMatError: If the zmat could not be generated.
@@ -106,7 +109,7 @@ def xyz_to_zmat(xyz: Dict[str, tuple],
         raise ZMatError(f'Cannot generate a constrained zmat without mol. Got mol=None and constraints=\n{constraints}')
     xyz = xyz.copy()
     zmat = {'symbols': list(), 'coords': list(), 'vars': dict(), 'map': dict()}
-    atom_order = get_atom_order(xyz=xyz, mol=mol, constraints_dict=constraints, fragments=fragments)
+    atom_order = atom_order or get_atom_order(xyz=xyz, mol=mol, constraints_dict=constraints, fragments=fragments)
     connectivity = get_connectivity(mol=mol) if mol is not None else None
     skipped_atoms = list()  # atoms for which constrains are applied
     for atom_index in atom_order:
@@ -1059,6 +1062,154 @@ def _add_nth_atom_to_coords(zmat, coords, i, coords_to_skip=None):
     return coords
 
 
+def compile_zmat(zmat: Dict[str, Union[dict, tuple]]) -> Dict[str, Union[tuple, np.ndarray]]:
+    """
+    Compile a zmat into arrays for a repeated (batched) generation of cartesian coordinates.
+    The parameter names are parsed once, so that many geometries differing only by dihedral angles
+    could be generated by compiled_zmat_to_coords() without any string or dictionary lookups.
+
+    The compiled zmat is a dictionary with the following keys:
+    - 'symbols': The zmat symbols (including dummy atoms).
+    - 'refs': An (n, 3) integer array, entries are the zmat indices of the distance, angle, and dihedral reference
+              atoms ("C", "B", and "A" in the SN-NeRF notation) of each zmat atom, -1 where undefined.
+    - 'r', 'a', 'd': Arrays of length n with the distance (Angstrom), angle and dihedral (degrees) values of each atom.
+    - 'order': An integer array with the zmat indices of the atoms ordered as in the original xyz (no dummy atoms).
+    - 'dummies': An integer array with the zmat indices of the dummy atoms.
+
+    Args:
+        zmat (dict): The zmat.
+
+    Raises:
+        ZMatError: If zmat if of wrong type, does not contain all keys, or has undefined variables.
+
+    Returns:
+        dict: The compiled zmat.
+    """
+    if not isinstance(zmat, dict):
+        raise ZMatError(f'zmat has to be a dictionary, got {type(zmat)}')
+    if 'symbols' not in zmat or 'coords' not in zmat or 'vars' not in zmat or 'map' not in zmat:
+        raise ZMatError(f'Expected to find symbols, coords, vars, and map in zmat, got instead: {list(zmat.keys())}.')
+    n = len(zmat['symbols'])
+    refs = np.full((n, 3), -1, dtype=np.int64)
+    values = np.zeros((3, n), dtype=np.float64)
+    for i, coords in enumerate(zmat['coords']):
+        for j, coord in enumerate(coords[:min(i, 3)]):
+            if coord not in zmat['vars']:
+                raise ZMatError(f'The parameter {coord} was not found in the "vars" section of the zmat:\n'
+                                f'{zmat["vars"]}')
+            values[j, i] = zmat['vars'][coord]
+        if i:
+            # take the reference atoms from the most specific parameter, as done in _add_nth_atom_to_coords()
+            indices = [indices for indices in get_atom_indices_from_zmat_parameter(coords[min(i, 3) - 1])
+                       if indices[0] == i][0]
+            refs[i, :len(indices) - 1] = indices[1:]
+    order = [key_by_val(zmat['map'], i) for i in range(len([symbol for symbol in zmat['symbols'] if symbol != 'X']))]
+    dummies = [key for key, val in zmat['map'].items() if 'X' in str(val)]
+    return {'symbols': tuple(zmat['symbols']),
+            'refs': refs,
+            'r': values[0],
+            'a': values[1],
+            'd': values[2],
+            'order': np.array(order, dtype=np.int64),
+            'dummies': np.array(dummies, dtype=np.int64),
+            }
+
+
+def compiled_zmat_to_coords(compiled: Dict[str, Union[tuple, np.ndarray]],
+                            dihedrals: Optional[np.ndarray] = None,
+                            keep_dummy: bool = False,
+                            ) -> np.ndarray:
+    """
+    Generate the cartesian coordinates of a batch of geometries from a compiled zmat using a vectorized SN-NeRF.
+    The geometries share the distances and angles of the compiled zmat, and may differ by their dihedral angles.
+    Each atom is placed for all geometries at once, see _add_nth_atom_to_coords() for the single geometry version.
+
+    Args:
+        compiled (dict): The compiled zmat, see compile_zmat().
+        dihedrals (np.ndarray, optional): An (n_geometries, n_zmat_atoms) array of dihedral angles in degrees.
+                                          The dihedrals of the compiled zmat are used (a single geometry) if not given.
+        keep_dummy (bool): Whether to keep dummy atoms ('X'), ``True`` to keep, default is ``False``.
+
+    Returns:
+        np.ndarray: An (n_geometries, n_atoms, 3) array of coordinates, atoms are ordered as in the original xyz
+                    (dummy atoms, if kept, are appended at the end).
+    """
+    dihedrals = np.radians(np.atleast_2d(dihedrals if dihedrals is not None else compiled['d']))
+    refs, r, n = compiled['refs'], compiled['r'], len(compiled['symbols'])
+    coords = np.zeros((dihedrals.shape[0], n, 3), dtype=np.float64)
+    if n > 1:
+        coords[:, 1, 2] = r[1]  # atom B is placed on axis Z, distant by the AB bond length
+    if n > 2:
+        alpha = compiled['a'][2]
+        alpha = math.radians(alpha if alpha < 180 else 360 - alpha)
+        b_z = coords[0, refs[2, 0], 2]
+        coords[:, 2, 1] = r[2] * math.sin(alpha)
+        coords[:, 2, 2] = b_z - r[2] * math.cos(alpha) if b_z else r[2] * math.cos(alpha)
+    angles = np.radians(compiled['a'])
+    for i in range(3, n):
+        c, b, a = coords[:, refs[i, 0]], coords[:, refs[i, 1]], coords[:, refs[i, 2]]
+        ubc = c - b
+        ubc /= np.linalg.norm(ubc, axis=1)[:, np.newaxis]
+        un = np.cross(b - a, ubc)
+        un /= np.linalg.norm(un, axis=1)[:, np.newaxis]
+        un_cross_ubc = np.cross(un, ubc)
+        # place atom D in the default coordinate system, and rotate it into the reference frame of A, B, C
+        d_x = - r[i] * math.cos(angles[i])
+        d_y = r[i] * math.sin(angles[i]) * np.cos(dihedrals[:, i])
+        d_z = r[i] * math.sin(angles[i]) * np.sin(dihedrals[:, i])
+        coords[:, i] = c + ubc * d_x + un_cross_ubc * d_y[:, np.newaxis] + un * d_z[:, np.newaxis]
+    order = np.concatenate([compiled['order'], compiled['dummies']]) if keep_dummy else compiled['order']
+    return coords[:, order]
+
+
+def get_torsion_dihedral_signs(compiled: Dict[str, Union[tuple, np.ndarray]],
+                               torsion: List[int],
+                               top: List[int],
+                               ) -> np.ndarray:
+    """
+    Determine how the dihedral angles of a compiled zmat change when a torsion top is rotated,
+    so that the torsion could be set by only modifying zmat dihedrals.
+    Rotating the top about the torsion axis by some increment changes the dihedral angles defined about the same axis
+    between an atom in the top and an atom out of it by the same increment (up to the sign),
+    and does not change any other zmat parameter, provided that no other parameter spans both sides of the axis.
+
+    Args:
+        compiled (dict): The compiled zmat, see compile_zmat().
+        torsion (List[int]): The 0-indexed atom indices (in the xyz) of the four atoms defining the torsion.
+        top (List[int]): The 0-indexed atom indices (in the xyz) of the atoms rotated by the torsion.
+
+    Raises:
+        ZMatError: If the zmat has a parameter spanning both sides of the torsion axis which is not a dihedral angle
+                   defined about it.
+
+    Returns:
+        np.ndarray: An array of length n_zmat_atoms with values of 1, -1, or 0, the multipliers of the torsion increment
+                    to be added to the dihedral angle of each zmat atom.
+    """
+    refs = compiled['refs']
+    axis = {int(compiled['order'][torsion[1]]), int(compiled['order'][torsion[2]])}
+    top = {int(compiled['order'][atom]) for atom in top}
+    sides = np.zeros(len(compiled['symbols']), dtype=np.int64)  # 1 for atoms in the top, 0 otherwise
+    signs = np.zeros(len(compiled['symbols']), dtype=np.int64)
+    for i in range(len(compiled['symbols'])):
+        i_refs = [int(ref) for ref in refs[i] if ref != -1]
+        if compiled['symbols'][i] == 'X':
+            # a dummy atom is rotated together with the atoms it is defined relative to
+            sides[i] = int(any(sides[ref] for ref in i_refs if ref not in axis))
+        else:
+            sides[i] = int(i in top and i not in axis)
+        atoms = [i] + i_refs
+        if len(atoms) == 4 and set(atoms[1:3]) == axis:
+            # a dihedral angle about the torsion axis, order it as the torsion (its last atom is rotated)
+            first, last = (atoms[3], atoms[0]) if atoms[1] == int(compiled['order'][torsion[2]]) else atoms[::3]
+            signs[i] = sides[last] - sides[first]
+            atoms = atoms[:3]  # the distance and the angle must not span the axis
+        if len({sides[atom] for atom in atoms if atom not in axis}) > 1:
+            raise ZMatError(f'The zmat parameters of atom {i} span both sides of the torsion {torsion}, '
+                            f'cannot rotate the torsion top using dihedral angles only.')
+    return signs
+
+
 def check_atom_r_constraints(atom_index, constraints):
     """
     Check distance constraints for an atom.
@@ -1505,6 +1656,40 @@ def get_atom_order_from_mol(mol: Molecule,
     return atom_order
 
 
+def get_atom_order_from_mol_by_tops(mol: Molecule,
+                                    tops: List[List[int]],
+                                    ) -> List[int]:
+    """
+    Get the order in which atoms should be added to the zmat so that the atoms of torsion tops are added
+    after all other atoms, and the atoms of a top nested in another top are added after the atoms of the outer top.
+    This way, the zmat parameters of atoms out of a top are not defined relative to atoms in the top.
+    Each atom (except for the first one) is bonded to an atom added before it,
+    and hydrogen atoms are added after the heavy atoms of the same top.
+
+    Args:
+        mol (Molecule): The Molecule object.
+        tops (List[List[int]]): Entries are 0-indexed atom indices of the atoms rotated by each torsion
+                                (not including the atoms on the torsion axes).
+
+    Returns:
+        List[int]: The atom order, 0-indexed.
+    """
+    levels = [sum(i in top for top in tops) for i in range(len(mol.atoms))]
+    connectivity = get_connectivity(mol=mol)
+    keys = [(levels[i], mol.atoms[i].is_hydrogen(), sum(mol.atoms[j].is_non_hydrogen() for j in connectivity[i]) > 1)
+            for i in range(len(mol.atoms))]
+    atom_order, frontier = list(), list()
+    while len(atom_order) < len(mol.atoms):
+        if not len(frontier):
+            # start (or start a new fragment) from a tail heavy atom with the lowest level
+            frontier = [min([i for i in range(len(mol.atoms)) if i not in atom_order], key=lambda i: keys[i])]
+        atom_index = min(frontier, key=lambda i: keys[i][:2])
+        frontier.remove(atom_index)
+        atom_order.append(atom_index)
+        frontier.extend(i for i in connectivity[atom_index] if i not in atom_order and i not in frontier)
+    return atom_order
+
+
 def get_atom_order_from_xyz(xyz: Dict[str, tuple],
                             fragment: Optional[List[int]] = None,
                             ) -> List[int]:
@@ -5,6 +5,7 @@
 This module contains unit tests of the arc.species.species module
 """
 
+import numpy as np
 import unittest
 
 import arc.species.zmat as zmat
@@ -439,6 +440,48 @@ class TestZMat(unittest.TestCase):
         atom_order = zmat.get_atom_order_from_xyz(self.n3h5)
         self.assertEqual(atom_order, [0, 3, 5, 1, 2, 4, 6, 7])
 
+    def test_get_atom_order_from_mol_by_tops(self):
+        """Test getting an atom order in which torsion tops are added last"""
+        mol = ARCSpecies(label='CCCO', smiles='CCCO').mol
+        top_1 = [atom for atom in zmat.determine_top_group_indices(mol, mol.atoms[1], mol.atoms[2], index=0)[0]
+                 if atom != 2]  # the C2-O3 side of the C1-C2 torsion
+        top_2 = [atom for atom in zmat.determine_top_group_indices(mol, mol.atoms[2], mol.atoms[3], index=0)[0]
+                 if atom != 3]  # the OH hydrogen
+        atom_order = zmat.get_atom_order_from_mol_by_tops(mol, tops=[top_1, top_2])
+        self.assertEqual(sorted(atom_order), list(range(len(mol.atoms))))
+        levels = [sum(atom in top for top in [top_1, top_2]) for atom in atom_order]
+        self.assertEqual(levels, sorted(levels))
+        for i, atom_index in enumerate(atom_order[1:]):
+            # each atom is bonded to a previously added atom
+            self.assertTrue(any(mol.atoms[previous] in mol.atoms[atom_index].edges for previous in atom_order[:i + 1]))
+
+    def test_compile_zmat(self):
+        """Test generating coordinates from a compiled zmat"""
+        for xyz in [self.n3h5, self.c3h3oh, self.linear_o_s, self.crazy]:
+            zmat_ = zmat.xyz_to_zmat(xyz)
+            compiled = zmat.compile_zmat(zmat_)
+            self.assertEqual(compiled['refs'].shape, (len(zmat_['symbols']), 3))
+            self.assertEqual(list(compiled['refs'][3]), list(zmat.get_atom_indices_from_zmat_parameter(
+                zmat_['coords'][3][2])[0][1:]))
+            coords, symbols = zmat.zmat_to_coords(zmat_, keep_dummy=True)
+            batch_coords = zmat.compiled_zmat_to_coords(compiled, keep_dummy=True)
+            self.assertEqual(batch_coords.shape, (1, len(symbols), 3))
+            np.testing.assert_allclose(batch_coords[0], coords, atol=1e-8)
+
+            # a batch with modified dihedral angles
+            modified_zmat = {'symbols': zmat_['symbols'], 'coords': zmat_['coords'], 'map': zmat_['map'],
+                             'vars': {key: val + 10 if key.startswith('D') else val
+                                      for key, val in zmat_['vars'].items()}}
+            coords = zmat.zmat_to_coords(modified_zmat)[0]
+            batch_coords = zmat.compiled_zmat_to_coords(compiled, dihedrals=np.array([compiled['d'],
+                                                                                    compiled['d'] + 10]))
+            self.assertEqual(batch_coords.shape, (2, len(xyz['symbols']), 3))
+            np.testing.assert_allclose(batch_coords[1], coords, atol=1e-8)
+
+        with self.assertRaises(ZMatError):
+            zmat.compile_zmat({'symbols': ('H', 'H'), 'coords': ((None, None, None), ('R_1_0', None, None)),
+                               'vars': {}, 'map': {0: 0, 1: 1}})
+
     def test_check_atom_r_constraints(self):
         """Test R constraints"""
         constraints = {'R_atom': [(5, 7), (0, 3)]}
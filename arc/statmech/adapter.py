@@ -31,3 +31,10 @@ class StatmechAdapter(ABC):
         Generate a high pressure rate coefficient for a reaction.
         """
         pass
+
+    def reset_global_state(self) -> None:
+        """
+        Reset any global state the statmech software keeps between calculations,
+        so that calculations which run one after the other in the same process don't interfere.
+        """
+        pass
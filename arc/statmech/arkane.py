@@ -55,6 +55,10 @@ class ArkaneAdapter(StatmechAdapter):
         three_params (bool, optional): Instruct Arkane to compute the high pressure kinetic rate coefficients in the
                                        modified three-parameter Arrhenius equation format (``True``, default) or
                                        classical two-parameter Arrhenius equation format (``False``).
+        statmech_cache (dict, optional): Species statmech results shared between adapters, so each species is only
+                                         processed once per level. Keys are generated by ``get_statmech_cache_key()``,
+                                         values are dictionaries with the 'arkane_species' (holding the conformer),
+                                         'e0', and 'thermo' results. ``None`` to not cache results.
     """
 
     def __init__(self,
@@ -70,6 +74,7 @@ class ArkaneAdapter(StatmechAdapter):
                  T_max: tuple = None,
                  T_count: int = 50,
                  three_params: bool = True,
+                 statmech_cache: Optional[dict] = None,
                  ):
         self.output_directory = output_directory
         self.output_dict = output_dict
@@ -83,6 +88,7 @@ class ArkaneAdapter(StatmechAdapter):
         self.T_max = T_max
         self.T_count = T_count
         self.three_params = three_params
+        self.statmech_cache = statmech_cache
 
         if not self.output_directory:
             raise InputError('A project directory was not provided.')
@@ -107,6 +113,14 @@ class ArkaneAdapter(StatmechAdapter):
         str_ += f'T_count={self.T_count})'
         return str_
 
+    def reset_global_state(self) -> None:
+        """
+        Reset the species, transition state, and reaction dictionaries Arkane keeps in its ``input`` module.
+        """
+        for dict_name in ['species_dict', 'transition_state_dict', 'reaction_dict']:
+            if hasattr(arkane.input, dict_name):
+                setattr(arkane.input, dict_name, dict())
+
     def compute_thermo(self,
                        kinetics_flag: bool = False,
                        e0_only: bool = False,
@@ -130,6 +144,9 @@ class ArkaneAdapter(StatmechAdapter):
         if self.species is None:
             raise InputError('Cannot not compute thermo without a species object.')
 
+        if self.load_cached_statmech(kinetics_flag=kinetics_flag, e0_only=e0_only):
+            return
+
         arkane_output_path = self.generate_arkane_species_file(species=self.species,
                                                                bac_type=self.bac_type)
 
@@ -153,16 +170,71 @@ class ArkaneAdapter(StatmechAdapter):
             if statmech_success:
                 self.species.e0 = arkane_species.conformer.E0.value_si * 0.001  # convert to kJ/mol
                 logger.debug(f'Assigned E0 to {self.species.label}: {self.species.e0:.2f} kJ/mol')
+                thermo = None
                 if not e0_only:
                     thermo_job = ThermoJob(arkane_species, 'NASA')
                     thermo_job.execute(output_directory=arkane_output_path, plot=True)
-                    self.species.thermo = arkane_species.get_thermo_data()
+                    thermo = self.species.thermo = arkane_species.get_thermo_data()
                     if not kinetics_flag:
                         plotter.log_thermo(self.species.label, path=arkane_output_path)
+                if self.statmech_cache is not None:
+                    self.statmech_cache[self.get_statmech_cache_key(bac_type=self.bac_type)] = \
+                        {'arkane_species': arkane_species, 'e0': self.species.e0, 'thermo': thermo}
             else:
                 logger.error(f'Could not run statmech job for species {self.species.label}')
         clean_output_directory(species_path=os.path.join(self.output_directory, 'Species', self.species.label))
 
+    def get_statmech_cache_key(self, bac_type: Optional[str]) -> tuple:
+        """
+        Get the key of the species statmech results in the statmech cache.
+        Results depend on the level of theory used for energy corrections, on the BAC type,
+        and on the frequencies scaling factor, in addition to the species itself.
+
+        Args:
+            bac_type (str): The bond additivity correction type, ``None`` if BAC are not used.
+
+        Returns:
+            tuple: The statmech cache key.
+        """
+        return self.species.label, str(self.sp_level) if self.sp_level is not None else None, bac_type, \
+            self.freq_scale_factor
+
+    def load_cached_statmech(self,
+                             kinetics_flag: bool = False,
+                             e0_only: bool = False,
+                             ) -> bool:
+        """
+        Assign previously computed statmech results of the species, if available in the statmech cache.
+        The cached Arkane species is registered in Arkane's species dictionary so it could be used in a rate
+        coefficient calculation.
+
+        Args:
+            kinetics_flag (bool, optional): Whether this call is used for generating species statmech
+                                            for a rate coefficient calculation.
+            e0_only (bool, optional): Whether only E0 is required.
+
+        Returns:
+            bool: Whether cached results were assigned, ``True`` if they were.
+        """
+        if self.statmech_cache is None:
+            return False
+        cached = self.statmech_cache.get(self.get_statmech_cache_key(bac_type=self.bac_type))
+        if cached is None or not e0_only and cached['thermo'] is None:
+            return False
+        logger.debug(f'Using the cached statmech results of species {self.species.label}')
+        arkane_species = cached['arkane_species']
+        arkane.input.species_dict[self.species.label] = arkane_species
+        self.species.rmg_species = Species(molecule=self.species.mol_list or [self.species.mol])
+        self.species.rmg_species.reactive = True
+        self.species.e0 = cached['e0']
+        if not e0_only:
+            self.species.thermo = cached['thermo']
+            if not kinetics_flag:
+                folder_name = 'rxns' if self.species.is_ts else 'Species'
+                plotter.log_thermo(self.species.label,
+                                   path=os.path.join(self.output_directory, folder_name, self.species.label, 'arkane'))
+        return True
+
     def compute_high_p_rate_coefficient(self) -> None:
         """
         Generate a high pressure rate coefficient for a reaction.
@@ -45,6 +45,7 @@ def statmech_factory(statmech_adapter_label: str,  # add everything that goes in
                      T_max: tuple = None,
                      T_count: int = 50,
                      three_params: bool = True,
+                     statmech_cache: Optional[dict] = None,
                      ) -> Type[StatmechAdapter]:
     """
     A factory generating a statmech adapter corresponding to ``statmech_adapter``.
@@ -67,6 +68,7 @@ def statmech_factory(statmech_adapter_label: str,  # add everything that goes in
         three_params (bool, optional): Compute rate coefficients using the modified three-parameter Arrhenius equation
                                        format (``True``, default) or classical two-parameter Arrhenius equation format
                                        (``False``).
+        statmech_cache (dict, optional): Species statmech results shared between adapters, ``None`` to not cache.
 
     Returns:
         StatmechAdapter: The requested StatmechAdapter instance, initialized with the respective arguments,
@@ -83,6 +85,7 @@ def statmech_factory(statmech_adapter_label: str,  # add everything that goes in
                                                               T_min=T_min,
                                                               T_max=T_max,
                                                               T_count=T_count,
-                                                              three_params=three_params
+                                                              three_params=three_params,
+                                                              statmech_cache=statmech_cache,
                                                               )
     return statmech_adapter_class
@@ -1,2 +1,6 @@
-import arc.ts.atst
-import arc.ts.gcn
+from arc.lazy import lazy_package_attributes
+
+__getattr__, __dir__ = lazy_package_attributes(
+    package=__name__,
+    submodules=['atst', 'gcn'],
+)
@@ -17,29 +17,207 @@ Notes for possible future developments:
 
 """
 
+import atexit
+import json
 import os
+import queue
 import subprocess
+import threading
+from concurrent.futures import Future
+from typing import List, Optional
 
 from arc.common import get_logger
 from arc.common import TS_GCN_PATH, TS_GCN_PYTHON
+from arc.imports import settings
 from arc.species.converter import str_to_xyz
 
 logger = get_logger()
 
+gcn_worker_timeout = settings['gcn_worker_timeout']
 
-def gcn(ts_path,
-        ):
+GCN_WORKER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'gcn_worker.py')
+
+# The persistent TS-GCN inference worker process (see gcn_worker.py), started on first use
+_gcn_worker = None
+_gcn_worker_lock = threading.RLock()
+# The lines the worker writes to its stdout, read by a separate thread so they can be awaited with a timeout
+_gcn_worker_responses = None
+# TS guess requests waiting to be sent to the worker, as (reaction, Future) tuples
+_gcn_queue = list()
+_gcn_queue_lock = threading.Lock()
+
+
+def gcn(reactant: str,
+        product: str,
+        ts_path: str,
+        ) -> Optional[dict]:
     """
     Generates a TS guess using the updated graph convolutional network originally published by Pattanaik et al.
     https://chemrxiv.org/articles/Genereting_Transition_States_of_Isomerization_Reactions_with_Deep_Learning/12302084
-    This function writes the TS guess as an xyz file to the corresponding TS directory.
+
+    Requests made concurrently from several threads are coalesced and sent to the GCN worker as a single batch.
+
+    Args:
+        reactant (str): The reactant in an SDF format.
+        product (str): The product in an SDF format, its atoms are mapped to the reactant atoms.
+        ts_path (str): The TS directory, used for the input and output files of the GCN only if the worker
+                       could not be used.
+
+    Returns:
+         ts_xyz_dict (dict): ARC xyz dictionary of TS guess
+    """
+    future = Future()
+    with _gcn_queue_lock:
+        _gcn_queue.append(({'reactant': reactant, 'product': product, 'ts_path': ts_path}, future))
+    with _gcn_worker_lock:
+        # whoever holds the worker sends everything queued so far, possibly including requests of other threads
+        with _gcn_queue_lock:
+            batch = list(_gcn_queue)
+            del _gcn_queue[:]
+        if batch:
+            try:
+                ts_xyz_dicts = gcn_batch([reaction for reaction, _ in batch])
+            except Exception as e:
+                for _, batch_future in batch:
+                    batch_future.set_exception(e)
+            else:
+                for (_, batch_future), ts_xyz_dict in zip(batch, ts_xyz_dicts):
+                    batch_future.set_result(ts_xyz_dict)
+    return future.result()
+
+
+def gcn_batch(reactions: List[dict],
+              ) -> List[Optional[dict]]:
+    """
+    Generates TS guesses for several reactions in a single round-trip to the persistent GCN inference worker,
+    which keeps the network in memory. Falls back to running the GCN separately for each reaction
+    if the worker could not be used.
+
+    Args:
+        reactions (List[dict]): Entries are dictionaries with the 'reactant' and the atom-mapped 'product'
+                                in an SDF format, and the 'ts_path' directory of the TS (see ``gcn()``).
+
+    Returns:
+        List[Optional[dict]]: ARC xyz dictionaries of the TS guesses, ordered as ``reactions``.
+                              Entries are ``None`` for reactions the GCN could not generate a TS guess for.
+    """
+    if not reactions:
+        return list()
+    with _gcn_worker_lock:
+        try:
+            results = run_gcn_worker_request([{'reactant': reaction['reactant'], 'product': reaction['product']}
+                                              for reaction in reactions])
+        except (OSError, ValueError) as e:
+            logger.warning(f'The GCN inference worker failed ({e}), running the GCN separately for each reaction.')
+            stop_gcn_worker()
+            return [run_gcn_subprocess(**reaction) for reaction in reactions]
+    ts_xyz_dicts = list()
+    for reaction, result in zip(reactions, results):
+        if result['xyz'] is not None:
+            ts_xyz_dicts.append(str_to_xyz(result['xyz']))
+        else:
+            logger.error(f'GCN did not generate a TS guess for {reaction["ts_path"]}:\n{result["error"]}')
+            ts_xyz_dicts.append(None)
+    return ts_xyz_dicts
+
+
+def start_gcn_worker():
+    """
+    Start the GCN inference worker, and a thread which collects the lines the worker writes to its stdout.
+    Must be called while holding ``_gcn_worker_lock``.
+    """
+    global _gcn_worker, _gcn_worker_responses
+    _gcn_worker = subprocess.Popen([TS_GCN_PYTHON, GCN_WORKER_PATH, TS_GCN_PATH],
+                                   stdin=subprocess.PIPE,
+                                   stdout=subprocess.PIPE,
+                                   universal_newlines=True,
+                                   bufsize=1,
+                                   )
+    _gcn_worker_responses = queue.Queue()
+
+    def read_responses(stdout=_gcn_worker.stdout, responses=_gcn_worker_responses):
+        for line in stdout:
+            responses.put(line)
+        responses.put('')  # the worker terminated
+
+    threading.Thread(target=read_responses, daemon=True).start()
+
+
+def run_gcn_worker_request(reactions: List[dict]) -> List[dict]:
+    """
+    Send a batch of reactions to the GCN inference worker and wait for its response.
+    The worker is started if it isn't running. Must be called while holding ``_gcn_worker_lock``.
+
+    Args:
+        reactions (List[dict]): Entries with the 'reactant' and 'product' of each reaction in an SDF format.
+
+    Raises:
+        OSError: If the worker could not be started, terminated unexpectedly, or did not respond in time
+                 (see ``gcn_worker_timeout`` in settings.py).
+        ValueError: If the worker response could not be interpreted.
+
+    Returns:
+        List[dict]: The 'xyz' and 'error' entries of each reaction, ordered as ``reactions``.
+    """
+    timeout = gcn_worker_timeout['per_reaction'] * len(reactions)
+    if _gcn_worker is None or _gcn_worker.poll() is not None:
+        start_gcn_worker()
+        timeout += gcn_worker_timeout['startup']
+    _gcn_worker.stdin.write(json.dumps({'reactions': reactions}) + '\n')
+    _gcn_worker.stdin.flush()
+    try:
+        line = _gcn_worker_responses.get(timeout=timeout)
+    except queue.Empty:
+        raise TimeoutError(f'the worker did not respond within {timeout} seconds')
+    if not line:
+        raise OSError(f'the worker terminated with return code {_gcn_worker.poll()}')
+    response = json.loads(line)
+    results = response.get('results')
+    if not isinstance(results, list) or len(results) != len(reactions):
+        raise ValueError(f'got an unexpected response from the worker: {response.get("error") or line.strip()}')
+    return results
+
+
+def stop_gcn_worker():
+    """
+    Stop the persistent GCN inference worker if it is running.
+    """
+    global _gcn_worker, _gcn_worker_responses
+    with _gcn_worker_lock:
+        if _gcn_worker is not None:
+            if _gcn_worker.poll() is None:
+                try:
+                    _gcn_worker.stdin.close()
+                    _gcn_worker.wait(timeout=10)
+                except (OSError, subprocess.TimeoutExpired):
+                    _gcn_worker.kill()
+            _gcn_worker, _gcn_worker_responses = None, None
+
+
+atexit.register(stop_gcn_worker)
+
+
+def run_gcn_subprocess(reactant: str,
+                       product: str,
+                       ts_path: str,
+                       ) -> Optional[dict]:
+    """
+    Generates a TS guess by running the GCN inference script in a new process, which loads the network
+    for this reaction only. This function writes the GCN input files and the TS guess xyz file
+    to the corresponding TS directory.
 
     Args:
-        ts_path (str): Path to the inputs for the network.
+        reactant (str): The reactant in an SDF format.
+        product (str): The product in an SDF format, its atoms are mapped to the reactant atoms.
+        ts_path (str): The TS directory.
 
     Returns:
          ts_xyz_dict (dict): ARC xyz dictionary of TS guess
     """
+    os.makedirs(ts_path, exist_ok=True)
+    for file_name, content in [('reactant.sdf', reactant), ('product.sdf', product)]:
+        with open(os.path.join(ts_path, file_name), 'w') as f:
+            f.write(content)
 
     # run the GCN as a subprocess
     p = subprocess.run(f'{TS_GCN_PYTHON} {os.path.join(TS_GCN_PATH, "inference.py")} '
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""
+A long-lived TS-GCN inference worker.
+This file is executed by the TS-GCN Python interpreter (``TS_GCN_PYTHON``), where ARC is not importable,
+so it only relies on the standard library and on the TS-GCN repository itself.
+
+TS-GCN's inference.py is a command line script without an importable API. The worker splits its statements into
+those that do not depend on the reaction (imports, building the network and loading its trained weights),
+which are executed once when the worker starts, and those that do, which are executed in memory for each reaction
+(see ``split_inference_script()``). The worker then serves batches of reactant/product pairs over stdin/stdout,
+one JSON object per line:
+
+    request:  {"reactions": [{"reactant": str, "product": str}, ...]}
+    response: {"results": [{"xyz": str or null, "error": str or null}, ...]}
+
+Reactants and products are atom-mapped SDF mol blocks, and ``xyz`` holds the coordinate lines of the TS guess.
+A malformed request (or any request if the network could not be loaded) is answered with
+{"results": null, "error": str}.
+
+Results are given in the order of the requested reactions. Since inference.py reads its input and writes its output
+by path, these paths point to a private scratch directory (in memory if /dev/shm is available).
+Anything else printed by the network code is redirected to stderr so it cannot corrupt the protocol.
+"""
+
+import argparse
+import ast
+import json
+import os
+import shutil
+import sys
+import tempfile
+import traceback
+
+# the inference.py arguments which depend on the reaction, and the respective scratch file names
+REACTION_ARGUMENTS = {'r_sdf_path': 'reactant.sdf', 'p_sdf_path': 'product.sdf', 'ts_xyz_path': 'TS.xyz'}
+# methods which modify the object they are called on
+MUTATING_METHODS = ['add', 'append', 'clear', 'extend', 'insert', 'pop', 'remove', 'setdefault', 'update']
+
+
+def parse_command_line_arguments(command_line_args=None):
+    """
+    Parse command-line arguments.
+    """
+    parser = argparse.ArgumentParser(description='TS-GCN inference worker')
+    parser.add_argument('ts_gcn_path', metavar='TS-GCN path', type=str, nargs=1,
+                        help='the path to the TS-GCN repository, where inference.py is located')
+    args = parser.parse_args(command_line_args)
+    args.ts_gcn_path = args.ts_gcn_path[0]
+    return args
+
+
+def get_names(statement, contexts):
+    """
+    Get the names used by a statement in the given contexts (e.g., ``ast.Store``).
+    Functions and classes defined by the statement are considered as stored names.
+    """
+    names = {node.id for node in ast.walk(statement)
+             if isinstance(node, ast.Name) and isinstance(node.ctx, contexts)}
+    if ast.Store in contexts and isinstance(statement, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+        names.add(statement.name)
+    return names
+
+
+def get_mutated_names(statement):
+    """
+    Get the names of objects a statement modifies in place,
+    e.g., ``data`` in ``data.append(mol)``, ``data[0] = mol``, or ``data.mol = mol``.
+    """
+    names = set()
+    for node in ast.walk(statement):
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) \
+                and node.func.attr in MUTATING_METHODS and isinstance(node.func.value, ast.Name):
+            names.add(node.func.value.id)
+        elif isinstance(node, (ast.Attribute, ast.Subscript)) and isinstance(node.ctx, ast.Store) \
+                and isinstance(node.value, ast.Name):
+            names.add(node.value.id)
+    return names
+
+
+def split_inference_script(source):
+    """
+    Split the top level statements of the TS-GCN inference script (or of its ``if __name__ == '__main__':`` block)
+    into statements which do not depend on the reaction, and statements which do.
+    A statement depends on the reaction if it uses one of the ``REACTION_ARGUMENTS``, if it uses a name assigned
+    by a statement that depends on the reaction, or if it assigns a name which such a statement modifies in place
+    (so that, e.g., a list of molecules is created anew for each reaction).
+
+    Args:
+        source (str): The source code of inference.py.
+
+    Returns:
+        Tuple[List[ast.stmt], List[ast.stmt]]: The statements which do not depend on the reaction,
+                                               and those which do, each in their original order.
+    """
+    statements = list()
+    for statement in ast.parse(source).body:
+        if isinstance(statement, ast.If) and isinstance(statement.test, ast.Compare) \
+                and isinstance(statement.test.left, ast.Name) and statement.test.left.id == '__name__':
+            statements.extend(statement.body)
+        else:
+            statements.append(statement)
+    per_reaction = [any(isinstance(node, ast.Attribute) and node.attr in REACTION_ARGUMENTS
+                        for node in ast.walk(statement)) for statement in statements]
+    changed = True
+    while changed:
+        changed = False
+        reaction_names, mutated_names = set(), set()
+        for i, statement in enumerate(statements):
+            if not per_reaction[i] and get_names(statement, (ast.Load,)) & reaction_names:
+                per_reaction[i] = changed = True
+            if per_reaction[i]:
+                reaction_names |= get_names(statement, (ast.Store, ast.Del))
+                mutated_names |= get_mutated_names(statement)
+        for i, statement in enumerate(statements):
+            if not per_reaction[i] and get_names(statement, (ast.Store,)) & mutated_names:
+                per_reaction[i] = changed = True
+    return ([statement for statement, reaction in zip(statements, per_reaction) if not reaction],
+            [statement for statement, reaction in zip(statements, per_reaction) if reaction])
+
+
+def load_inference_script(inference_path, paths):
+    """
+    Execute the statements of the TS-GCN inference script which do not depend on the reaction,
+    i.e., build the network and load its trained weights.
+
+    Args:
+        inference_path (str): The path to the TS-GCN inference.py script.
+        paths (dict): Keys are the ``REACTION_ARGUMENTS``, values are the respective scratch file paths.
+
+    Returns:
+        Tuple[dict, code]: The namespace of the script, and the compiled statements to execute for each reaction.
+    """
+    with open(inference_path, 'r') as f:
+        source = f.read()
+    setup_statements, reaction_statements = split_inference_script(source)
+    sys.argv = [inference_path]
+    for argument, path in paths.items():
+        sys.argv.extend([f'--{argument}', path])
+    namespace = {'__name__': '__main__', '__file__': inference_path}
+    exec(compile(ast.Module(body=setup_statements, type_ignores=list()), inference_path, 'exec'), namespace)
+    return namespace, compile(ast.Module(body=reaction_statements, type_ignores=list()), inference_path, 'exec')
+
+
+def run_inference(namespace, reaction_code, paths, reaction):
+    """
+    Generate a TS guess for a single reaction using the network loaded in this process.
+
+    Args:
+        namespace (dict): The namespace of the inference script after loading the network.
+        reaction_code (code): The compiled statements of the inference script which depend on the reaction.
+        paths (dict): Keys are the ``REACTION_ARGUMENTS``, values are the respective scratch file paths.
+        reaction (dict): The 'reactant' and 'product' SDF mol blocks of the reaction.
+
+    Returns:
+        dict: The coordinate lines of the TS guess (``None`` if it could not be generated), and the error message.
+    """
+    for path in paths.values():
+        if os.path.isfile(path):
+            os.remove(path)
+    for argument, mol_block in [('r_sdf_path', reaction['reactant']), ('p_sdf_path', reaction['product'])]:
+        with open(paths[argument], 'w') as f:
+            f.write(mol_block)
+    try:
+        # names assigned for one reaction are not carried over to the next, the network objects are shared
+        exec(reaction_code, dict(namespace))
+    except SystemExit as e:
+        if e.code not in [None, 0]:
+            return {'xyz': None, 'error': f'inference.py exited with code {e.code}'}
+    except Exception:
+        return {'xyz': None, 'error': traceback.format_exc()}
+    if not os.path.isfile(paths['ts_xyz_path']):
+        return {'xyz': None, 'error': 'inference.py did not write a TS guess'}
+    with open(paths['ts_xyz_path'], 'r') as f:
+        lines = f.readlines()
+    try:
+        # skip the number of atoms and the comment lines of the xyz file
+        xyz = ''.join(lines[2:2 + int(lines[0])])
+    except (IndexError, ValueError):
+        return {'xyz': None, 'error': f'inference.py wrote an invalid xyz file:\n{"".join(lines)}'}
+    return {'xyz': xyz, 'error': None}
+
+
+def main():
+    """
+    Load the network and serve TS-GCN inference requests until stdin is closed.
+    """
+    args = parse_command_line_arguments()
+    inference_path = os.path.join(args.ts_gcn_path, 'inference.py')
+
+    # keep a private handle of stdout for the protocol, and send everything else written to stdout to stderr
+    protocol = os.fdopen(os.dup(sys.stdout.fileno()), 'w')
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    sys.stdout = sys.stderr
+
+    # mimic running inference.py as a script, so its local imports are resolved
+    sys.path.insert(0, args.ts_gcn_path)
+    scratch_directory = tempfile.mkdtemp(prefix='ts_gcn_', dir='/dev/shm' if os.path.isdir('/dev/shm') else None)
+    paths = {argument: os.path.join(scratch_directory, file_name)
+             for argument, file_name in REACTION_ARGUMENTS.items()}
+    namespace, reaction_code, load_error = None, None, None
+    try:
+        namespace, reaction_code = load_inference_script(inference_path, paths)
+    except (Exception, SystemExit):
+        load_error = f'Could not load the TS-GCN network:\n{traceback.format_exc()}'
+
+    try:
+        for line in sys.stdin:
+            if not line.strip():
+                continue
+            if load_error is not None:
+                response = {'results': None, 'error': load_error}
+            else:
+                try:
+                    reactions = json.loads(line)['reactions']
+                    response = {'results': [run_inference(namespace, reaction_code, paths, reaction)
+                                            for reaction in reactions]}
+                except (ValueError, KeyError, TypeError):
+                    response = {'results': None, 'error': traceback.format_exc()}
+            protocol.write(json.dumps(response) + '\n')
+            protocol.flush()
+    finally:
+        shutil.rmtree(scratch_directory, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
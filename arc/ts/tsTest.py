@@ -5,13 +5,18 @@
 This module contains unit tests for TS guess generation methods
 """
 
+import ast
+import os
+import shutil
+import sys
+import tempfile
 import unittest
 
 from rmgpy.reaction import Reaction
 from rmgpy.species import Species
 
 from arc.species.converter import xyz_to_str
-from arc.ts import atst
+from arc.ts import atst, gcn, gcn_worker
 
 
 class TestAutoTST(unittest.TestCase):
@@ -95,5 +100,105 @@ class TestAutoTST(unittest.TestCase):
         #     atst.autotst(rmg_reaction=self.reaction3, reaction_family='H_Abstraction')
 
 
+class TestGCN(unittest.TestCase):
+    """
+    Contains unit tests for the GCN inference worker
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        A function run ONCE before all unit tests in this class.
+        Sets up a stand-in TS-GCN repository whose inference.py "loads a network" (recording each load),
+        and writes a one atom TS guess.
+        """
+        cls.maxDiff = None
+        cls.test_dir = tempfile.mkdtemp()
+        cls.ts_gcn_path = os.path.join(cls.test_dir, 'TS-GCN')
+        os.makedirs(cls.ts_gcn_path)
+        with open(os.path.join(cls.ts_gcn_path, 'inference.py'), 'w') as f:
+            f.write("""import argparse
+import os
+import time
+parser = argparse.ArgumentParser()
+parser.add_argument('--r_sdf_path')
+parser.add_argument('--p_sdf_path')
+parser.add_argument('--ts_xyz_path')
+args = parser.parse_args()
+with open(os.path.join(os.path.dirname(__file__), 'network_loads.txt'), 'a') as f:
+    f.write('loaded\\n')
+print('this should not reach the worker protocol')
+atoms = list()
+with open(args.r_sdf_path, 'r') as f:
+    reactant = f.read()
+if 'fail' in reactant:
+    raise ValueError('could not generate a TS guess')
+slow_path = os.path.join(os.path.dirname(__file__), 'slow')
+if 'slow' in reactant and os.path.isfile(slow_path):
+    os.remove(slow_path)
+    time.sleep(5)
+atoms.extend('H       0.00000000    0.00000000    0.00000000' for line in reactant.splitlines()[:1])
+with open(args.ts_xyz_path, 'w') as f:
+    f.write(f'{len(atoms)}\\n\\n' + '\\n'.join(atoms) + '\\n')
+""")
+        cls.reactions = list()
+        for i, reactant in enumerate(['ok', 'fail', 'ok']):
+            cls.reactions.append({'reactant': reactant, 'product': 'ok',
+                                  'ts_path': os.path.join(cls.test_dir, f'TS{i}')})
+        cls.original_paths = (gcn.TS_GCN_PATH, gcn.TS_GCN_PYTHON)
+        gcn.TS_GCN_PATH, gcn.TS_GCN_PYTHON = cls.ts_gcn_path, sys.executable
+
+    def get_network_loads(self):
+        """Get the number of times the stand-in network was loaded"""
+        with open(os.path.join(self.ts_gcn_path, 'network_loads.txt'), 'r') as f:
+            return len(f.readlines())
+
+    def test_split_inference_script(self):
+        """Test splitting the inference script into statements which do and do not depend on the reaction"""
+        with open(os.path.join(self.ts_gcn_path, 'inference.py'), 'r') as f:
+            setup, reaction = gcn_worker.split_inference_script(f.read())
+        self.assertEqual(len(setup), 11)  # imports, arguments, loading the "network", printing, the slow path
+        self.assertEqual(len(reaction), 6)
+        self.assertIsInstance(reaction[0], ast.Assign)
+        self.assertEqual(reaction[0].targets[0].id, 'atoms')  # modified for each reaction
+
+    def test_gcn_batch(self):
+        """Test generating several TS guesses in one round-trip to the GCN worker, which loads the network once"""
+        expected_xyz = {'symbols': ('H',), 'isotopes': (1,), 'coords': ((0.0, 0.0, 0.0),)}
+        ts_xyz_dicts = gcn.gcn_batch(self.reactions)
+        self.assertEqual(ts_xyz_dicts, [expected_xyz, None, expected_xyz])
+        worker_pid = gcn._gcn_worker.pid
+        self.assertEqual(gcn.gcn(**self.reactions[2]), expected_xyz)
+        self.assertEqual(gcn._gcn_worker.pid, worker_pid)  # the same worker serves all requests
+        self.assertEqual(self.get_network_loads(), 1)
+        self.assertFalse(any(os.path.exists(reaction['ts_path']) for reaction in self.reactions))  # no files
+        self.assertEqual(gcn.gcn_batch(list()), list())
+        gcn.stop_gcn_worker()
+        self.assertIsNone(gcn._gcn_worker)
+
+    def test_gcn_worker_timeout(self):
+        """Test falling back to running the GCN separately if the worker does not respond in time"""
+        expected_xyz = {'symbols': ('H',), 'isotopes': (1,), 'coords': ((0.0, 0.0, 0.0),)}
+        gcn_worker_timeout = gcn.gcn_worker_timeout
+        self.assertEqual(gcn.gcn_batch(self.reactions[:1]), [expected_xyz])  # start the worker
+        gcn.gcn_worker_timeout = {'startup': 0, 'per_reaction': 1}
+        open(os.path.join(self.ts_gcn_path, 'slow'), 'w').close()
+        reaction = {'reactant': 'slow', 'product': 'ok', 'ts_path': self.reactions[2]['ts_path']}
+        try:
+            self.assertEqual(gcn.gcn_batch([reaction]), [expected_xyz])
+        finally:
+            gcn.gcn_worker_timeout = gcn_worker_timeout
+        self.assertIsNone(gcn._gcn_worker)
+        self.assertTrue(os.path.isfile(os.path.join(self.reactions[2]['ts_path'], 'TS.xyz')))  # run separately
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        A function that is run ONCE after all unit tests in this class.
+        """
+        gcn.stop_gcn_worker()
+        gcn.TS_GCN_PATH, gcn.TS_GCN_PYTHON = cls.original_paths
+        shutil.rmtree(cls.test_dir, ignore_errors=True)
+
 if __name__ == '__main__':
     unittest.main(testRunner=unittest.TextTestRunner(verbosity=2))
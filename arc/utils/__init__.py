@@ -1,2 +1,6 @@
-import arc.utils.scale
-import arc.utils.delete
+from arc.lazy import lazy_package_attributes
+
+__getattr__, __dir__ = lazy_package_attributes(
+    package=__name__,
+    submodules=['delete', 'scale'],
+)
@@ -10,12 +10,10 @@ Use this only if you are certain in what you're doing to avoid deleting valuable
 """
 
 import argparse
-import csv
-import os
 
-from arc.common import arc_path
 from arc.exceptions import InputError
 from arc.imports import settings
+from arc.job.ledger import get_project_job_nums, get_project_of_job
 from arc.job.local import delete_all_local_arc_jobs
 from arc.job.ssh import delete_all_arc_jobs
 
@@ -66,24 +64,14 @@ def main():
 
     server_list = args.server if args.server else [server for server in servers.keys()]
 
-    csv_path = os.path.join(arc_path, 'initiated_jobs.csv')
-
     project, jobs = None, list()
     if args.project:
         project = args.project
     elif args.job:
-        with open(csv_path, 'r') as f:
-            reader = csv.reader(f, dialect='excel')
-            for row in reader:
-                if args.job == row[0]:
-                    project = row[1]
+        project = get_project_of_job(job_num=int(args.job))
 
     if project is not None:
-        with open(csv_path, 'r') as f:
-            reader = csv.reader(f, dialect='excel')
-            for row in reader:
-                if row[1] == project:
-                    jobs.append(f'a{row[0]}')
+        jobs = [f'a{job_num}' for job_num in get_project_job_nums(project=project)]
 
     if args.all:
         jobs = None
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""
+Benchmark the startup time of ARC, i.e., the time it takes to import ARC's packages and entry point modules.
+Each module is imported in a fresh Python interpreter, the best wall time of several runs is reported,
+as well as the slowest imports (cumulative, including their own imports) reported by ``python -X importtime``.
+
+Usage:
+    python devtools/benchmark_import_time.py [--modules arc arc.common arc.main] [--runs 5] [--top 5]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+ARC_PATH = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))
+DEFAULT_MODULES = ['arc', 'arc.common', 'arc.job.ledger', 'arc.utils.delete', 'arc.species', 'arc.main']
+
+
+def parse_command_line_arguments(command_line_args=None):
+    """
+    Parse command-line arguments.
+    """
+    parser = argparse.ArgumentParser(description='Benchmark the import time of ARC modules')
+    parser.add_argument('--modules', type=str, nargs='+', default=DEFAULT_MODULES, help='the modules to import')
+    parser.add_argument('--runs', type=int, default=5, help='the number of times to import each module')
+    parser.add_argument('--top', type=int, default=5, help='the number of slowest imports to report per module')
+    return parser.parse_args(command_line_args)
+
+
+def time_import(module, runs):
+    """
+    Import a module in fresh interpreters.
+
+    Returns:
+        Tuple[Optional[float], str]: The best wall time in seconds (``None`` if the import failed),
+                                     and the standard error of the last run (the ``-X importtime`` report).
+    """
+    best, stderr = None, ''
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        process = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                                 cwd=ARC_PATH, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+        wall_time = time.perf_counter() - t0
+        stderr = process.stderr
+        if process.returncode:
+            return None, stderr
+        best = wall_time if best is None else min(best, wall_time)
+    return best, stderr
+
+
+def slowest_imports(importtime_report, top):
+    """
+    Get the slowest imports from a ``-X importtime`` report.
+
+    Returns:
+        List[Tuple[float, str]]: The cumulative import times in seconds and the imported module names.
+    """
+    imports = list()
+    for line in importtime_report.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        imports.append((int(cumulative) * 1e-6, name.rstrip()))
+    return sorted(imports, reverse=True)[:top]
+
+
+def main():
+    """
+    Run the benchmark and report the import time of each module.
+    """
+    args = parse_command_line_arguments()
+    for module in args.modules:
+        wall_time, report = time_import(module, runs=args.runs)
+        if wall_time is None:
+            error = report.strip().splitlines()[-1] if report.strip() else 'unknown error'
+            print(f'{module}: import failed ({error})')
+            continue
+        print(f'{module}: {1000 * wall_time:.0f} ms (best of {args.runs} runs, including interpreter startup)')
+        for cumulative, name in slowest_imports(report, top=args.top):
+            print(f'    {1000 * cumulative:8.1f} ms  {name}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""
+Benchmark the Scheduler bookkeeping done in each pass of its main loop with many running jobs.
+No jobs are submitted and no server is queried: the jobs are assigned IDs, the server queue is simulated,
+and 1% of the jobs leave it per pass.
+
+A pass consists of a server queue check, a bulk harvest of the terminated jobs, a scan over the running jobs of each
+species looking for terminated jobs (as done by ``Scheduler.schedule_jobs()``), and ending the terminated jobs.
+
+Usage:
+    python devtools/benchmark_scheduler.py [--jobs 10000] [--species 10] [--passes 20]
+"""
+
+import argparse
+import os
+import time
+
+import arc.scheduler as scheduler_module
+from arc.job.job import Job
+from arc.level import Level
+from arc.scheduler import Scheduler
+
+ARC_PATH = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))
+
+
+def parse_command_line_arguments(command_line_args=None):
+    """
+    Parse command-line arguments.
+    """
+    parser = argparse.ArgumentParser(description='Benchmark the Scheduler bookkeeping')
+    parser.add_argument('--jobs', type=int, default=10000, help='the number of running jobs')
+    parser.add_argument('--species', type=int, default=10, help='the number of species the jobs are spread over')
+    parser.add_argument('--passes', type=int, default=20, help='the number of scheduler passes to time')
+    return parser.parse_args(command_line_args)
+
+
+def make_scheduler(num_jobs, num_species):
+    """
+    Make a Scheduler object which only has the bookkeeping attributes, tracking running jobs.
+    The jobs are not written or submitted (nothing is written to their project directory).
+
+    Returns:
+        Tuple[Scheduler, set]: The scheduler, and the IDs of the jobs in the simulated server queue.
+    """
+    sched = Scheduler.__new__(Scheduler)
+    sched.servers = ['local']
+    sched.running_jobs, sched.jobs_by_id = dict(), dict()
+    sched.servers_jobs_ids, sched.completed_jobs_ids, sched.harvested_jobs = set(), set(), dict()
+    level = Level(repr={'method': 'b3lyp', 'basis': '6-31g'})
+    xyz = {'symbols': ('C',), 'isotopes': (12,), 'coords': ((0.0, 0.0, 0.0),)}
+    for i in range(num_jobs):
+        label = f'spc{i % num_species}'
+        job = Job(project='benchmark_scheduler', ess_settings={'gaussian': ['local']}, species_name=label, xyz=xyz,
+                  job_type='opt', level=level, multiplicity=1, server='local', job_num=100000 + i, testing=True,
+                  project_directory=os.path.join(ARC_PATH, 'Projects', 'benchmark_scheduler'))
+        job.job_status[0], job.job_id = 'running', job.job_num
+        sched.running_jobs.setdefault(label, dict())[job.job_name] = job
+        sched.jobs_by_id[job.job_id] = {job.job_name: job}
+        sched.servers_jobs_ids.add(job.job_id)
+    return sched, set(sched.servers_jobs_ids)
+
+
+def run_pass(sched):
+    """
+    Run the bookkeeping of a single scheduler pass.
+    """
+    sched.get_servers_jobs_ids()
+    sched.harvest_terminated_jobs()
+    for label in list(sched.running_jobs.keys()):
+        for job_name, job in list(sched.running_jobs[label].items()):
+            if job.job_id not in sched.servers_jobs_ids:
+                sched.harvested_jobs.pop(job.job_name, None)
+                sched.remove_running_job(label=label, job_name=job_name)
+
+
+def main():
+    """
+    Run the benchmark and report the mean scheduler pass time.
+    """
+    args = parse_command_line_arguments()
+    sched, queue = make_scheduler(num_jobs=args.jobs, num_species=args.species)
+    # simulate the server queues, jobs leave the queue in the order they were submitted
+    scheduler_module.check_running_jobs_ids = lambda: queue
+    scheduler_module.harvest_jobs = lambda jobs: {job.job_name: None for job in jobs}
+    leaving_per_pass = max(args.jobs // 100, 1)
+    ordered_ids = sorted(queue)
+    pass_times = list()
+    for i in range(args.passes):
+        queue.difference_update(ordered_ids[i * leaving_per_pass:(i + 1) * leaving_per_pass])
+        t0 = time.perf_counter()
+        run_pass(sched)
+        pass_times.append(time.perf_counter() - t0)
+    running = sum(len(jobs) for jobs in sched.running_jobs.values())
+    print(f'{args.jobs} jobs over {args.species} species, {args.passes} passes '
+          f'({leaving_per_pass} jobs terminate per pass, {running} still running)')
+    print(f'mean pass time: {1000 * sum(pass_times) / len(pass_times):.2f} ms, '
+          f'max pass time: {1000 * max(pass_times):.2f} ms')
+
+
+if __name__ == '__main__':
+    main()